@@ -511,7 +511,8 @@ class Agent:
             )
 
         with self._create_agent_span() as span:
-            span.set_content_tag("haystack.agent.input", _deepcopy_with_exceptions(agent_inputs))
+            if span.is_recording_content():
+                span.set_content_tag("haystack.agent.input", _deepcopy_with_exceptions(agent_inputs))
 
             while exe_context.counter < self.max_agent_steps:
                 # Handle breakpoint and ChatGenerator call
@@ -671,7 +672,8 @@ class Agent:
             )
 
         with self._create_agent_span() as span:
-            span.set_content_tag("haystack.agent.input", _deepcopy_with_exceptions(agent_inputs))
+            if span.is_recording_content():
+                span.set_content_tag("haystack.agent.input", _deepcopy_with_exceptions(agent_inputs))
 
             while exe_context.counter < self.max_agent_steps:
                 # Handle breakpoint and ChatGenerator call
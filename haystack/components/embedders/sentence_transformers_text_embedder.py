@@ -234,3 +234,35 @@ class SentenceTransformersTextEmbedder:
             **(self.encode_kwargs if self.encode_kwargs else {}),
         )[0]
         return {"embedding": embedding}
+
+    def run_many(self, inputs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Embed the strings of several pipeline runs at once.
+
+        Used by `Pipeline.run_batch`: the strings are embedded together, in batches of `batch_size`.
+
+        :param inputs:
+            The inputs of `run` for each pipeline run.
+
+        :returns:
+            The outputs of `run` for each pipeline run, in the same order as `inputs`.
+        """
+        texts = [run_inputs["text"] for run_inputs in inputs]
+        if not all(isinstance(text, str) for text in texts):
+            raise TypeError(
+                "SentenceTransformersTextEmbedder expects a string as input."
+                "In case you want to embed a list of Documents, please use the SentenceTransformersDocumentEmbedder."
+            )
+        if self.embedding_backend is None:
+            raise RuntimeError("The embedding model has not been loaded. Please call warm_up() before running.")
+
+        texts_to_embed = [self.prefix + text + self.suffix for text in texts]
+        embeddings = self.embedding_backend.embed(
+            texts_to_embed,
+            batch_size=self.batch_size,
+            show_progress_bar=self.progress_bar,
+            normalize_embeddings=self.normalize_embeddings,
+            precision=self.precision,
+            **(self.encode_kwargs if self.encode_kwargs else {}),
+        )
+        return [{"embedding": embedding} for embedding in embeddings]
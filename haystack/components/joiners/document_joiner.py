@@ -10,6 +10,7 @@ from typing import Any, Optional, Union
 
 from haystack import Document, component, default_from_dict, default_to_dict, logging
 from haystack.core.component.types import Variadic
+from haystack.utils import top_k_items
 
 logger = logging.getLogger(__name__)
 
@@ -142,21 +143,20 @@ class DocumentJoiner:
         """
         documents = list(documents)
         output_documents = self.join_mode_function(documents)
+        top_k = top_k or self.top_k
 
         if self.sort_by_score:
-            output_documents = sorted(
-                output_documents, key=lambda doc: doc.score if doc.score is not None else -inf, reverse=True
-            )
             if any(doc.score is None for doc in output_documents):
                 logger.info(
                     "Some of the Documents DocumentJoiner got have score=None. It was configured to sort Documents by "
                     "score, so those with score=None were sorted as if they had a score of -infinity."
                 )
-
-        if top_k:
+            # only the top_k Documents are selected and sorted, instead of sorting all of them
+            output_documents = top_k_items(
+                output_documents, top_k or None, key=lambda doc: doc.score if doc.score is not None else -inf
+            )
+        elif top_k:
             output_documents = output_documents[:top_k]
-        elif self.top_k:
-            output_documents = output_documents[: self.top_k]
 
         return {"documents": output_documents}
 
@@ -8,6 +8,7 @@ from typing import Any, Callable, Literal, Optional
 from dateutil.parser import parse as date_parse
 
 from haystack import Document, component, logging
+from haystack.utils import top_k_items
 
 logger = logging.getLogger(__name__)
 
@@ -309,15 +310,15 @@ class MetaFieldRanker:
         sorted_by_meta = [doc for meta, doc in tuple_sorted_by_meta]
         if missing_meta == "bottom":
             sorted_documents = sorted_by_meta + docs_missing_meta_field
-            sorted_documents = self._merge_rankings(documents, sorted_documents, weight, ranking_mode)
+            sorted_documents = self._merge_rankings(documents, sorted_documents, weight, ranking_mode, top_k)
         elif missing_meta == "top":
             sorted_documents = docs_missing_meta_field + sorted_by_meta
-            sorted_documents = self._merge_rankings(documents, sorted_documents, weight, ranking_mode)
+            sorted_documents = self._merge_rankings(documents, sorted_documents, weight, ranking_mode, top_k)
         else:
             sorted_documents = sorted_by_meta
-            sorted_documents = self._merge_rankings(docs_with_meta_field, sorted_documents, weight, ranking_mode)
+            sorted_documents = self._merge_rankings(docs_with_meta_field, sorted_documents, weight, ranking_mode, top_k)
 
-        return {"documents": sorted_documents[:top_k]}
+        return {"documents": sorted_documents}
 
     def _parse_meta(
         self, docs_with_meta_field: list[Document], meta_value_type: Optional[Literal["float", "int", "date"]]
@@ -362,15 +363,18 @@ class MetaFieldRanker:
 
         return meta_values
 
-    def _merge_rankings(
+    def _merge_rankings(  # pylint: disable=too-many-positional-arguments
         self,
         documents: list[Document],
         sorted_documents: list[Document],
         weight: float,
         ranking_mode: Literal["reciprocal_rank_fusion", "linear_score"],
+        top_k: Optional[int] = None,
     ) -> list[Document]:
         """
         Merge the two different rankings for Documents sorted both by their content and by their meta field.
+
+        Only the `top_k` Documents with the highest merged score are returned, if provided.
         """
         scores_map: dict = defaultdict(int)
 
@@ -398,8 +402,7 @@ class MetaFieldRanker:
         for document in documents:
             document.score = scores_map[document.id]
 
-        new_sorted_documents = sorted(documents, key=lambda doc: doc.score if doc.score else -1, reverse=True)
-        return new_sorted_documents
+        return top_k_items(documents, top_k, key=lambda doc: doc.score if doc.score else -1)
 
     @staticmethod
     def _calculate_rrf(rank: int, k: int = 61) -> float:
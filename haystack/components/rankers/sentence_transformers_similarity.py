@@ -253,14 +253,7 @@ class SentenceTransformersSimilarityRanker:
             raise ValueError(f"top_k must be > 0, but got {top_k}")
 
         prepared_query = self.query_prefix + query
-        prepared_documents = []
-        for doc in documents:
-            meta_values_to_embed = [
-                str(doc.meta[key]) for key in self.meta_fields_to_embed if key in doc.meta and doc.meta[key]
-            ]
-            prepared_documents.append(
-                self.document_prefix + self.embedding_separator.join(meta_values_to_embed + [doc.content or ""])
-            )
+        prepared_documents = self._prepare_documents(documents)
 
         activation_fn = Sigmoid() if scale_score else Identity()
 
@@ -285,3 +278,80 @@ class SentenceTransformersSimilarityRanker:
             ranked_docs = [doc for doc in ranked_docs if doc.score >= score_threshold]
 
         return {"documents": ranked_docs[:top_k]}
+
+    def run_many(self, inputs: list[dict[str, Any]]) -> list[dict[str, list[Document]]]:
+        """
+        Ranks the documents of several pipeline runs at once.
+
+        Used by `Pipeline.run_batch`: the query-document pairs of all pipeline runs are scored together, in batches of
+        `batch_size`.
+
+        :param inputs:
+            The inputs of `run` for each pipeline run.
+        :returns:
+            The outputs of `run` for each pipeline run, in the same order as `inputs`.
+
+        :raises ValueError:
+            If `top_k` is not > 0.
+        :raises RuntimeError:
+            If the model is not loaded because `warm_up()` was not called before.
+        """
+        if self._cross_encoder is None:
+            raise RuntimeError(
+                "The component SentenceTransformersSimilarityRanker wasn't warmed up. "
+                "Run 'warm_up()' before calling 'run()'."
+            )
+
+        # The pairs of the pipeline runs are scored together if they use the same activation function
+        pairs_by_scale_score: dict[bool, list[list[str]]] = {False: [], True: []}
+        runs = []
+        for run_inputs in inputs:
+            documents = run_inputs["documents"]
+            top_k = run_inputs.get("top_k") or self.top_k
+            scale_score = bool(run_inputs.get("scale_score") or self.scale_score)
+            score_threshold = run_inputs.get("score_threshold") or self.score_threshold
+            if documents and top_k <= 0:
+                raise ValueError(f"top_k must be > 0, but got {top_k}")
+
+            pairs = pairs_by_scale_score[scale_score]
+            runs.append((documents, top_k, scale_score, score_threshold, len(pairs)))
+            prepared_query = self.query_prefix + run_inputs["query"]
+            pairs.extend([prepared_query, document] for document in self._prepare_documents(documents))
+
+        scores_by_scale_score = {
+            scale_score: self._cross_encoder.predict(
+                pairs,
+                batch_size=self.batch_size,
+                activation_fn=Sigmoid() if scale_score else Identity(),
+                convert_to_numpy=True,
+            )
+            if pairs
+            else []
+            for scale_score, pairs in pairs_by_scale_score.items()
+        }
+
+        results = []
+        for documents, top_k, scale_score, score_threshold, start in runs:
+            scores = scores_by_scale_score[scale_score][start : start + len(documents)]
+            ranked_docs = []
+            for index in sorted(range(len(documents)), key=lambda i: scores[i], reverse=True):
+                document = copy(documents[index])
+                document.score = float(scores[index])
+                ranked_docs.append(document)
+
+            if score_threshold is not None:
+                ranked_docs = [doc for doc in ranked_docs if doc.score >= score_threshold]
+
+            results.append({"documents": ranked_docs[:top_k]})
+        return results
+
+    def _prepare_documents(self, documents: list[Document]) -> list[str]:
+        prepared_documents = []
+        for doc in documents:
+            meta_values_to_embed = [
+                str(doc.meta[key]) for key in self.meta_fields_to_embed if key in doc.meta and doc.meta[key]
+            ]
+            prepared_documents.append(
+                self.document_prefix + self.embedding_separator.join(meta_values_to_embed + [doc.content or ""])
+            )
+        return prepared_documents
@@ -10,7 +10,12 @@ from lazy_imports import LazyImporter
 _import_structure = {
     "auto_merging_retriever": ["AutoMergingRetriever"],
     "filter_retriever": ["FilterRetriever"],
-    "in_memory": ["InMemoryBM25Retriever", "InMemoryEmbeddingRetriever"],
+    "in_memory": [
+        "InMemoryBM25Retriever",
+        "InMemoryEmbeddingRetriever",
+        "InMemoryHybridRetriever",
+        "InMemorySparseEmbeddingRetriever",
+    ],
     "sentence_window_retriever": ["SentenceWindowRetriever"],
 }
 
@@ -19,6 +24,8 @@ if TYPE_CHECKING:
     from .filter_retriever import FilterRetriever as FilterRetriever
     from .in_memory import InMemoryBM25Retriever as InMemoryBM25Retriever
     from .in_memory import InMemoryEmbeddingRetriever as InMemoryEmbeddingRetriever
+    from .in_memory import InMemoryHybridRetriever as InMemoryHybridRetriever
+    from .in_memory import InMemorySparseEmbeddingRetriever as InMemorySparseEmbeddingRetriever
     from .sentence_window_retriever import SentenceWindowRetriever as SentenceWindowRetriever
 
 else:
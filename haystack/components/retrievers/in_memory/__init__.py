@@ -7,11 +7,18 @@ from typing import TYPE_CHECKING
 
 from lazy_imports import LazyImporter
 
-_import_structure = {"bm25_retriever": ["InMemoryBM25Retriever"], "embedding_retriever": ["InMemoryEmbeddingRetriever"]}
+_import_structure = {
+    "bm25_retriever": ["InMemoryBM25Retriever"],
+    "embedding_retriever": ["InMemoryEmbeddingRetriever"],
+    "hybrid_retriever": ["InMemoryHybridRetriever"],
+    "sparse_embedding_retriever": ["InMemorySparseEmbeddingRetriever"],
+}
 
 if TYPE_CHECKING:
     from .bm25_retriever import InMemoryBM25Retriever as InMemoryBM25Retriever
     from .embedding_retriever import InMemoryEmbeddingRetriever as InMemoryEmbeddingRetriever
+    from .hybrid_retriever import InMemoryHybridRetriever as InMemoryHybridRetriever
+    from .sparse_embedding_retriever import InMemorySparseEmbeddingRetriever as InMemorySparseEmbeddingRetriever
 
 else:
     sys.modules[__name__] = LazyImporter(name=__name__, module_file=__file__, import_structure=_import_structure)
@@ -2,10 +2,10 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from haystack import DeserializationError, Document, component, default_from_dict, default_to_dict
-from haystack.document_stores.in_memory import InMemoryDocumentStore
+from haystack.document_stores.in_memory import InMemoryDocumentStore, ShardedInMemoryDocumentStore
 from haystack.document_stores.types import FilterPolicy
 
 
@@ -40,7 +40,7 @@ class InMemoryBM25Retriever:
 
     def __init__(  # pylint: disable=too-many-positional-arguments
         self,
-        document_store: InMemoryDocumentStore,
+        document_store: Union[InMemoryDocumentStore, ShardedInMemoryDocumentStore],
         filters: Optional[dict[str, Any]] = None,
         top_k: int = 10,
         scale_score: bool = False,
@@ -50,7 +50,8 @@ class InMemoryBM25Retriever:
         Create the InMemoryBM25Retriever component.
 
         :param document_store:
-            An instance of InMemoryDocumentStore where the retriever should search for relevant documents.
+            An instance of InMemoryDocumentStore or ShardedInMemoryDocumentStore where the retriever should search
+            for relevant documents.
         :param filters:
             A dictionary with filters to narrow down the retriever's search space in the document store.
         :param top_k:
@@ -66,7 +67,7 @@ class InMemoryBM25Retriever:
         :raises ValueError:
             If the specified `top_k` is not > 0.
         """
-        if not isinstance(document_store, InMemoryDocumentStore):
+        if not isinstance(document_store, (InMemoryDocumentStore, ShardedInMemoryDocumentStore)):
             raise ValueError("document_store must be an instance of InMemoryDocumentStore")
 
         self.document_store = document_store
@@ -119,7 +120,12 @@ class InMemoryBM25Retriever:
             raise DeserializationError("Missing 'type' in document store's serialization data")
         if "filter_policy" in init_params:
             init_params["filter_policy"] = FilterPolicy.from_str(init_params["filter_policy"])
-        data["init_parameters"]["document_store"] = InMemoryDocumentStore.from_dict(
+        document_store_class = (
+            ShardedInMemoryDocumentStore
+            if init_params["document_store"]["type"].endswith(".ShardedInMemoryDocumentStore")
+            else InMemoryDocumentStore
+        )
+        data["init_parameters"]["document_store"] = document_store_class.from_dict(
             data["init_parameters"]["document_store"]
         )
         return default_from_dict(cls, data)
@@ -201,3 +207,81 @@ class InMemoryBM25Retriever:
             query=query, filters=filters, top_k=top_k, scale_score=scale_score
         )
         return {"documents": docs}
+
+    def run_batch(
+        self,
+        queries: list[str],
+        filters: Optional[dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        scale_score: Optional[bool] = None,
+    ) -> dict[str, list[list[Document]]]:
+        """
+        Run the InMemoryBM25Retriever on several queries at once.
+
+        The filters are evaluated once for all the queries, which is faster than calling `run` for each query.
+
+        :param queries:
+            The query strings for the Retriever.
+        :param filters:
+            A dictionary with filters to narrow down the search space when retrieving documents for all the queries.
+        :param top_k:
+            The maximum number of documents to return for each query.
+        :param scale_score:
+            When `True`, scales the score of retrieved documents to a range of 0 to 1, where 1 means extremely relevant.
+            When `False`, uses raw similarity scores.
+        :returns:
+            A dictionary with the following keys:
+            - `documents`: The retrieved documents of each query, in the same order as `queries`.
+        """
+        if self.filter_policy == FilterPolicy.MERGE and filters:
+            filters = {**(self.filters or {}), **filters}
+        else:
+            filters = filters or self.filters
+        if top_k is None:
+            top_k = self.top_k
+        if scale_score is None:
+            scale_score = self.scale_score
+
+        docs = self.document_store.bm25_retrieval_batch(
+            queries=queries, filters=filters, top_k=top_k, scale_score=scale_score
+        )
+        return {"documents": docs}
+
+    async def run_batch_async(
+        self,
+        queries: list[str],
+        filters: Optional[dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        scale_score: Optional[bool] = None,
+    ) -> dict[str, list[list[Document]]]:
+        """
+        Run the InMemoryBM25Retriever on several queries at once.
+
+        The filters are evaluated once for all the queries, which is faster than calling `run_async` for each query.
+
+        :param queries:
+            The query strings for the Retriever.
+        :param filters:
+            A dictionary with filters to narrow down the search space when retrieving documents for all the queries.
+        :param top_k:
+            The maximum number of documents to return for each query.
+        :param scale_score:
+            When `True`, scales the score of retrieved documents to a range of 0 to 1, where 1 means extremely relevant.
+            When `False`, uses raw similarity scores.
+        :returns:
+            A dictionary with the following keys:
+            - `documents`: The retrieved documents of each query, in the same order as `queries`.
+        """
+        if self.filter_policy == FilterPolicy.MERGE and filters:
+            filters = {**(self.filters or {}), **filters}
+        else:
+            filters = filters or self.filters
+        if top_k is None:
+            top_k = self.top_k
+        if scale_score is None:
+            scale_score = self.scale_score
+
+        docs = await self.document_store.bm25_retrieval_batch_async(
+            queries=queries, filters=filters, top_k=top_k, scale_score=scale_score
+        )
+        return {"documents": docs}
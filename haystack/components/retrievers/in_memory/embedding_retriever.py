@@ -2,10 +2,10 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from haystack import DeserializationError, Document, component, default_from_dict, default_to_dict
-from haystack.document_stores.in_memory import InMemoryDocumentStore
+from haystack.document_stores.in_memory import InMemoryDocumentStore, ShardedInMemoryDocumentStore
 from haystack.document_stores.types import FilterPolicy
 
 
@@ -52,7 +52,7 @@ class InMemoryEmbeddingRetriever:
 
     def __init__(  # pylint: disable=too-many-positional-arguments
         self,
-        document_store: InMemoryDocumentStore,
+        document_store: Union[InMemoryDocumentStore, ShardedInMemoryDocumentStore],
         filters: Optional[dict[str, Any]] = None,
         top_k: int = 10,
         scale_score: bool = False,
@@ -63,7 +63,8 @@ class InMemoryEmbeddingRetriever:
         Create the InMemoryEmbeddingRetriever component.
 
         :param document_store:
-            An instance of InMemoryDocumentStore where the retriever should search for relevant documents.
+            An instance of InMemoryDocumentStore or ShardedInMemoryDocumentStore where the retriever should search
+            for relevant documents.
         :param filters:
             A dictionary with filters to narrow down the retriever's search space in the document store.
         :param top_k:
@@ -82,7 +83,7 @@ class InMemoryEmbeddingRetriever:
         :raises ValueError:
             If the specified top_k is not > 0.
         """
-        if not isinstance(document_store, InMemoryDocumentStore):
+        if not isinstance(document_store, (InMemoryDocumentStore, ShardedInMemoryDocumentStore)):
             raise ValueError("document_store must be an instance of InMemoryDocumentStore")
 
         self.document_store = document_store
@@ -137,7 +138,12 @@ class InMemoryEmbeddingRetriever:
             raise DeserializationError("Missing 'type' in document store's serialization data")
         if "filter_policy" in init_params:
             init_params["filter_policy"] = FilterPolicy.from_str(init_params["filter_policy"])
-        data["init_parameters"]["document_store"] = InMemoryDocumentStore.from_dict(
+        document_store_class = (
+            ShardedInMemoryDocumentStore
+            if init_params["document_store"]["type"].endswith(".ShardedInMemoryDocumentStore")
+            else InMemoryDocumentStore
+        )
+        data["init_parameters"]["document_store"] = document_store_class.from_dict(
             data["init_parameters"]["document_store"]
         )
         return default_from_dict(cls, data)
@@ -243,3 +249,105 @@ class InMemoryEmbeddingRetriever:
         )
 
         return {"documents": docs}
+
+    def run_batch(  # pylint: disable=too-many-positional-arguments
+        self,
+        query_embeddings: list[list[float]],
+        filters: Optional[dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        scale_score: Optional[bool] = None,
+        return_embedding: Optional[bool] = None,
+    ) -> dict[str, list[list[Document]]]:
+        """
+        Run the InMemoryEmbeddingRetriever on several query embeddings at once.
+
+        The queries are scored together with a single matrix product per batch of queries, which is faster than
+        calling `run` for each query.
+
+        :param query_embeddings:
+            Embeddings of the queries.
+        :param filters:
+            A dictionary with filters to narrow down the search space when retrieving documents for all the queries.
+        :param top_k:
+            The maximum number of documents to return for each query.
+        :param scale_score:
+            When `True`, scales the score of retrieved documents to a range of 0 to 1, where 1 means extremely relevant.
+            When `False`, uses raw similarity scores.
+        :param return_embedding:
+            When `True`, returns the embedding of the retrieved documents.
+            When `False`, returns just the documents, without their embeddings.
+        :returns:
+            A dictionary with the following keys:
+            - `documents`: The retrieved documents of each query, in the same order as `query_embeddings`.
+        """
+        if self.filter_policy == FilterPolicy.MERGE and filters:
+            filters = {**(self.filters or {}), **filters}
+        else:
+            filters = filters or self.filters
+        if top_k is None:
+            top_k = self.top_k
+        if scale_score is None:
+            scale_score = self.scale_score
+        if return_embedding is None:
+            return_embedding = self.return_embedding
+
+        docs = self.document_store.embedding_retrieval_batch(
+            query_embeddings=query_embeddings,
+            filters=filters,
+            top_k=top_k,
+            scale_score=scale_score,
+            return_embedding=return_embedding,
+        )
+
+        return {"documents": docs}
+
+    async def run_batch_async(  # pylint: disable=too-many-positional-arguments
+        self,
+        query_embeddings: list[list[float]],
+        filters: Optional[dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        scale_score: Optional[bool] = None,
+        return_embedding: Optional[bool] = None,
+    ) -> dict[str, list[list[Document]]]:
+        """
+        Run the InMemoryEmbeddingRetriever on several query embeddings at once.
+
+        The queries are scored together with a single matrix product per batch of queries, which is faster than
+        calling `run_async` for each query.
+
+        :param query_embeddings:
+            Embeddings of the queries.
+        :param filters:
+            A dictionary with filters to narrow down the search space when retrieving documents for all the queries.
+        :param top_k:
+            The maximum number of documents to return for each query.
+        :param scale_score:
+            When `True`, scales the score of retrieved documents to a range of 0 to 1, where 1 means extremely relevant.
+            When `False`, uses raw similarity scores.
+        :param return_embedding:
+            When `True`, returns the embedding of the retrieved documents.
+            When `False`, returns just the documents, without their embeddings.
+        :returns:
+            A dictionary with the following keys:
+            - `documents`: The retrieved documents of each query, in the same order as `query_embeddings`.
+        """
+        if self.filter_policy == FilterPolicy.MERGE and filters:
+            filters = {**(self.filters or {}), **filters}
+        else:
+            filters = filters or self.filters
+        if top_k is None:
+            top_k = self.top_k
+        if scale_score is None:
+            scale_score = self.scale_score
+        if return_embedding is None:
+            return_embedding = self.return_embedding
+
+        docs = await self.document_store.embedding_retrieval_batch_async(
+            query_embeddings=query_embeddings,
+            filters=filters,
+            top_k=top_k,
+            scale_score=scale_score,
+            return_embedding=return_embedding,
+        )
+
+        return {"documents": docs}
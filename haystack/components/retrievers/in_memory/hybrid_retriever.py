@@ -0,0 +1,277 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Any, Optional
+
+from haystack import DeserializationError, Document, component, default_from_dict, default_to_dict
+from haystack.document_stores.in_memory import InMemoryDocumentStore
+from haystack.document_stores.in_memory.fusion import FUSION_MODES, FusionMode
+from haystack.document_stores.types import FilterPolicy
+
+
+@component
+class InMemoryHybridRetriever:
+    """
+    Retrieves documents that are most relevant to the query by fusing keyword-based and semantic retrieval.
+
+    Use this retriever with the InMemoryDocumentStore.
+
+    It returns the same documents as an `InMemoryBM25Retriever` and an `InMemoryEmbeddingRetriever` whose results
+    are joined with a `DocumentJoiner`, but the document store evaluates the filters once for both retrievals
+    and only copies the documents it returns.
+
+    ### Usage example
+    ```python
+    from haystack import Document
+    from haystack.components.embedders import SentenceTransformersDocumentEmbedder, SentenceTransformersTextEmbedder
+    from haystack.components.retrievers.in_memory import InMemoryHybridRetriever
+    from haystack.document_stores.in_memory import InMemoryDocumentStore
+
+    docs = [
+        Document(content="Python is a popular programming language"),
+        Document(content="python ist eine beliebte Programmiersprache"),
+    ]
+    doc_embedder = SentenceTransformersDocumentEmbedder()
+    doc_embedder.warm_up()
+    docs_with_embeddings = doc_embedder.run(docs)["documents"]
+
+    doc_store = InMemoryDocumentStore()
+    doc_store.write_documents(docs_with_embeddings)
+    retriever = InMemoryHybridRetriever(doc_store, join_mode="reciprocal_rank_fusion")
+
+    query = "Programmiersprache"
+    text_embedder = SentenceTransformersTextEmbedder()
+    text_embedder.warm_up()
+    query_embedding = text_embedder.run(query)["embedding"]
+
+    result = retriever.run(query=query, query_embedding=query_embedding)
+
+    print(result["documents"])
+    ```
+    """
+
+    def __init__(  # pylint: disable=too-many-positional-arguments
+        self,
+        document_store: InMemoryDocumentStore,
+        filters: Optional[dict[str, Any]] = None,
+        top_k: int = 10,
+        scale_score: bool = False,
+        join_mode: FusionMode = "reciprocal_rank_fusion",
+        weights: Optional[list[float]] = None,
+        return_embedding: bool = False,
+        filter_policy: FilterPolicy = FilterPolicy.REPLACE,
+    ):
+        """
+        Create the InMemoryHybridRetriever component.
+
+        :param document_store:
+            An instance of InMemoryDocumentStore where the retriever should search for relevant documents.
+        :param filters:
+            A dictionary with filters to narrow down the retriever's search space in the document store.
+        :param top_k:
+            The maximum number of documents to retrieve with each retrieval method and to return.
+        :param scale_score:
+            When `True`, scales the BM25 and similarity scores to a range of 0 to 1 before fusing them.
+            When `False`, fuses the raw scores.
+        :param join_mode:
+            How the keyword-based and semantic rankings are fused:
+            - `reciprocal_rank_fusion` (default): Scores the documents by their ranks in each ranking.
+            - `merge`: Scores the documents with a weighted sum of their BM25 and similarity scores.
+            - `distribution_based_rank_fusion`: Scores the documents with the best of their BM25 and similarity
+            scores, scaled by the distribution of the scores of each ranking.
+        :param weights:
+            The importance of the keyword-based and semantic rankings, in that order.
+            Ignored by `distribution_based_rank_fusion`. Defaults to the same importance for both.
+        :param return_embedding:
+            When `True`, returns the embedding of the retrieved documents.
+            When `False`, returns just the documents, without their embeddings.
+        :param filter_policy: The filter policy to apply during retrieval.
+        Filter policy determines how filters are applied when retrieving documents. You can choose:
+        - `REPLACE` (default): Overrides the initialization filters with the filters specified at runtime.
+        Use this policy to dynamically change filtering for specific queries.
+        - `MERGE`: Combines runtime filters with initialization filters to narrow down the search.
+        :raises ValueError:
+            If the specified `top_k` is not > 0, or if `join_mode` or `weights` are not valid.
+        """
+        if not isinstance(document_store, InMemoryDocumentStore):
+            raise ValueError("document_store must be an instance of InMemoryDocumentStore")
+
+        self.document_store = document_store
+
+        if top_k <= 0:
+            raise ValueError(f"top_k must be greater than 0. Currently, top_k is {top_k}")
+        if join_mode not in FUSION_MODES:
+            raise ValueError(f"Unknown join mode '{join_mode}'. Supported modes are: {list(FUSION_MODES)}")
+        if weights is not None and len(weights) != 2:
+            raise ValueError("weights should contain two values, for the keyword-based and the semantic rankings.")
+
+        self.filters = filters
+        self.top_k = top_k
+        self.scale_score = scale_score
+        self.join_mode = join_mode
+        self.weights = weights
+        self.return_embedding = return_embedding
+        self.filter_policy = filter_policy
+
+    def _get_telemetry_data(self) -> dict[str, Any]:
+        """
+        Data that is sent to Posthog for usage analytics.
+        """
+        return {"document_store": type(self.document_store).__name__, "join_mode": self.join_mode}
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serializes the component to a dictionary.
+
+        :returns:
+            Dictionary with serialized data.
+        """
+        docstore = self.document_store.to_dict()
+        return default_to_dict(
+            self,
+            document_store=docstore,
+            filters=self.filters,
+            top_k=self.top_k,
+            scale_score=self.scale_score,
+            join_mode=self.join_mode,
+            weights=self.weights,
+            return_embedding=self.return_embedding,
+            filter_policy=self.filter_policy.value,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "InMemoryHybridRetriever":
+        """
+        Deserializes the component from a dictionary.
+
+        :param data:
+            The dictionary to deserialize from.
+        :returns:
+            The deserialized component.
+        """
+        init_params = data.get("init_parameters", {})
+        if "document_store" not in init_params:
+            raise DeserializationError("Missing 'document_store' in serialization data")
+        if "type" not in init_params["document_store"]:
+            raise DeserializationError("Missing 'type' in document store's serialization data")
+        if "filter_policy" in init_params:
+            init_params["filter_policy"] = FilterPolicy.from_str(init_params["filter_policy"])
+        data["init_parameters"]["document_store"] = InMemoryDocumentStore.from_dict(
+            data["init_parameters"]["document_store"]
+        )
+        return default_from_dict(cls, data)
+
+    @component.output_types(documents=list[Document])
+    def run(  # pylint: disable=too-many-positional-arguments
+        self,
+        query: str,
+        query_embedding: list[float],
+        filters: Optional[dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        scale_score: Optional[bool] = None,
+        return_embedding: Optional[bool] = None,
+    ):
+        """
+        Run the InMemoryHybridRetriever on the given input data.
+
+        :param query:
+            The query string for keyword-based retrieval.
+        :param query_embedding:
+            Embedding of the query for semantic retrieval.
+        :param filters:
+            A dictionary with filters to narrow down the search space when retrieving documents.
+        :param top_k:
+            The maximum number of documents to retrieve with each retrieval method and to return.
+        :param scale_score:
+            When `True`, scales the BM25 and similarity scores to a range of 0 to 1 before fusing them.
+            When `False`, fuses the raw scores.
+        :param return_embedding:
+            When `True`, returns the embedding of the retrieved documents.
+            When `False`, returns just the documents, without their embeddings.
+        :returns:
+            The retrieved documents.
+
+        :raises ValueError:
+            If the specified DocumentStore is not found or is not an InMemoryDocumentStore instance.
+        """
+        if self.filter_policy == FilterPolicy.MERGE and filters:
+            filters = {**(self.filters or {}), **filters}
+        else:
+            filters = filters or self.filters
+        if top_k is None:
+            top_k = self.top_k
+        if scale_score is None:
+            scale_score = self.scale_score
+        if return_embedding is None:
+            return_embedding = self.return_embedding
+
+        docs = self.document_store.hybrid_retrieval(
+            query=query,
+            query_embedding=query_embedding,
+            filters=filters,
+            top_k=top_k,
+            scale_score=scale_score,
+            join_mode=self.join_mode,
+            weights=self.weights,
+            return_embedding=return_embedding,
+        )
+
+        return {"documents": docs}
+
+    @component.output_types(documents=list[Document])
+    async def run_async(  # pylint: disable=too-many-positional-arguments
+        self,
+        query: str,
+        query_embedding: list[float],
+        filters: Optional[dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        scale_score: Optional[bool] = None,
+        return_embedding: Optional[bool] = None,
+    ):
+        """
+        Run the InMemoryHybridRetriever on the given input data.
+
+        :param query:
+            The query string for keyword-based retrieval.
+        :param query_embedding:
+            Embedding of the query for semantic retrieval.
+        :param filters:
+            A dictionary with filters to narrow down the search space when retrieving documents.
+        :param top_k:
+            The maximum number of documents to retrieve with each retrieval method and to return.
+        :param scale_score:
+            When `True`, scales the BM25 and similarity scores to a range of 0 to 1 before fusing them.
+            When `False`, fuses the raw scores.
+        :param return_embedding:
+            When `True`, returns the embedding of the retrieved documents.
+            When `False`, returns just the documents, without their embeddings.
+        :returns:
+            The retrieved documents.
+
+        :raises ValueError:
+            If the specified DocumentStore is not found or is not an InMemoryDocumentStore instance.
+        """
+        if self.filter_policy == FilterPolicy.MERGE and filters:
+            filters = {**(self.filters or {}), **filters}
+        else:
+            filters = filters or self.filters
+        if top_k is None:
+            top_k = self.top_k
+        if scale_score is None:
+            scale_score = self.scale_score
+        if return_embedding is None:
+            return_embedding = self.return_embedding
+
+        docs = await self.document_store.hybrid_retrieval_async(
+            query=query,
+            query_embedding=query_embedding,
+            filters=filters,
+            top_k=top_k,
+            scale_score=scale_score,
+            join_mode=self.join_mode,
+            weights=self.weights,
+            return_embedding=return_embedding,
+        )
+
+        return {"documents": docs}
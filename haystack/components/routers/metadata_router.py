@@ -7,7 +7,7 @@ from typing import Any, Union
 from haystack import Document, component, default_from_dict, default_to_dict
 from haystack.dataclasses import ByteStream
 from haystack.utils import deserialize_type, serialize_type
-from haystack.utils.filters import document_matches_filter
+from haystack.utils.filters import compile_filter
 
 
 @component
@@ -105,6 +105,8 @@ class MetadataRouter:
                 raise ValueError(
                     "Invalid filter syntax. See https://docs.haystack.deepset.ai/docs/metadata-filtering for details."
                 )
+        # The rules are compiled once, instead of being interpreted for every document
+        self._rule_predicates = {edge: compile_filter(rule) for edge, rule in self.rules.items()}
         component.set_output_types(self, unmatched=self.output_type, **dict.fromkeys(rules, self.output_type))
 
     def run(self, documents: Union[list[Document], list[ByteStream]]):
@@ -124,8 +126,8 @@ class MetadataRouter:
 
         for doc_or_bytestream in documents:
             current_obj_matched = False
-            for edge, rule in self.rules.items():
-                if document_matches_filter(filters=rule, document=doc_or_bytestream):
+            for edge, matches_rule in self._rule_predicates.items():
+                if matches_rule(doc_or_bytestream):
                     # we need to ignore the arg-type here because the underlying
                     # filter methods use type Union[Document, ByteStream]
                     output[edge].append(doc_or_bytestream)  # type: ignore[arg-type]
@@ -4,8 +4,11 @@
 
 from typing import Optional
 
+import numpy as np
+
 from haystack import Document, component, logging
 from haystack.lazy_imports import LazyImport
+from haystack.utils import top_k_indices
 
 logger = logging.getLogger(__name__)
 
@@ -88,18 +91,29 @@ class TopPSampler:
             logger.warning("No documents with scores found. Returning the original documents.")
             return {"documents": documents}
 
-        sorted_docs_with_scores = sorted(zip(documents_with_scores, scores), key=lambda x: x[1], reverse=True)
-        sorted_documents, sorted_scores = [list(t) for t in zip(*sorted_docs_with_scores)]
-
-        tensor_scores = torch.tensor(sorted_scores, dtype=torch.float32)
+        tensor_scores = torch.tensor(scores, dtype=torch.float32)
         probs = torch.nn.functional.softmax(tensor_scores, dim=-1)
-        cumulative_probs = torch.cumsum(probs, dim=-1)
 
-        # Check if the cumulative probabilities are close to top_p with a 1e-6 tolerance
-        close_to_top_p = torch.isclose(cumulative_probs, torch.tensor(top_p, device=cumulative_probs.device), atol=1e-6)
+        # The selected documents are the highest scoring ones, only as many documents as needed to reach top_p are
+        # sorted: the number of sorted documents is doubled until the cumulative probability exceeds top_p.
+        scores_array = np.asarray(scores)
+        n_sorted = max(self.min_top_k or 0, 1)
+        while True:
+            sorted_indices = top_k_indices(scores_array, n_sorted)
+            cumulative_probs = torch.cumsum(probs[torch.from_numpy(sorted_indices)], dim=-1)
+
+            # Check if the cumulative probabilities are close to top_p with a 1e-6 tolerance
+            close_to_top_p = torch.isclose(
+                cumulative_probs, torch.tensor(top_p, device=cumulative_probs.device), atol=1e-6
+            )
+
+            # Combine the close_to_top_p with original condition using logical OR
+            condition = (cumulative_probs <= top_p) | close_to_top_p
+            if n_sorted >= len(scores) or not condition[-1]:
+                break
+            n_sorted *= 2
 
-        # Combine the close_to_top_p with original condition using logical OR
-        condition = (cumulative_probs <= top_p) | close_to_top_p
+        sorted_documents = [documents_with_scores[i] for i in sorted_indices]
 
         # Find the indices with cumulative probabilities that exceed top_p
         top_p_indices = torch.where(torch.BoolTensor(condition))[0]
@@ -33,6 +33,7 @@ from haystack.core.pipeline.component_checks import (
     is_any_greedy_socket_ready,
     is_socket_lazy_variadic,
 )
+from haystack.core.pipeline.execution_plan import ExecutionPlan, compile_execution_plan
 from haystack.core.pipeline.utils import FIFOPriorityQueue, _deepcopy_with_exceptions, parse_connect_string
 from haystack.core.serialization import DeserializationCallbacks, component_from_dict, component_to_dict
 from haystack.core.type_utils import _type_name, _types_are_compatible
@@ -57,6 +58,7 @@ logger = logging.getLogger(__name__)
 _COMPONENT_INPUT = "haystack.component.input"
 _COMPONENT_OUTPUT = "haystack.component.output"
 _COMPONENT_VISITS = "haystack.component.visits"
+_COMPONENT_BATCH_SIZE = "haystack.component.batch_size"
 
 
 class ComponentPriority(IntEnum):
@@ -99,6 +101,9 @@ class PipelineBase:  # noqa: PLW1641
         self.graph = networkx.MultiDiGraph()
         self._max_runs_per_component = max_runs_per_component
         self._connection_type_validation = connection_type_validation
+        # The execution plan is compiled when the pipeline is warmed up, and again after the graph changes
+        self._execution_plan: Optional[ExecutionPlan] = None
+        self._is_execution_plan_compiled = False
 
     def __eq__(self, other: object) -> bool:
         """
@@ -374,6 +379,7 @@ class PipelineBase:  # noqa: PLW1641
             output_sockets=instance.__haystack_output__._sockets_dict,  # type: ignore[attr-defined]
             visits=0,
         )
+        self._is_execution_plan_compiled = False
 
     def remove_component(self, name: str) -> Component:
         """
@@ -402,6 +408,7 @@ class PipelineBase:  # noqa: PLW1641
 
         # Delete component from the graph, deleting all its connections
         self.graph.remove_node(name)
+        self._is_execution_plan_compiled = False
 
         # Reset the Component sockets' senders and receivers
         input_sockets = instance.__haystack_input__._sockets_dict  # type: ignore[attr-defined]
@@ -598,6 +605,7 @@ class PipelineBase:  # noqa: PLW1641
             to_socket=receiver_socket,
             mandatory=receiver_socket.is_mandatory,
         )
+        self._is_execution_plan_compiled = False
         return self
 
     def get_component(self, name: str) -> Component:
@@ -832,11 +840,27 @@ class PipelineBase:  # noqa: PLW1641
             if hasattr(self.graph.nodes[node]["instance"], "warm_up"):
                 logger.info("Warming up component {node}...", node=node)
                 self.graph.nodes[node]["instance"].warm_up()
+        self._get_execution_plan()
+
+    def _get_execution_plan(self) -> Optional[ExecutionPlan]:
+        """
+        Returns the execution plan of the pipeline, compiling it if the graph changed since it was last compiled.
+
+        :returns: The execution plan, or `None` if the topology of the pipeline isn't static.
+        """
+        if not self._is_execution_plan_compiled:
+            self._execution_plan = compile_execution_plan(self.graph)
+            self._is_execution_plan_compiled = True
+        return self._execution_plan
 
     @staticmethod
     def _create_component_span(
         component_name: str, instance: Component, inputs: dict[str, Any], parent_span: Optional[tracing.Span] = None
     ) -> ContextManager[tracing.Span]:
+        if not tracing.is_tracing_enabled():
+            # the tags would be discarded, so we don't compute them
+            return tracing.tracer.trace("haystack.component.run", parent_span=parent_span)
+
         return tracing.tracer.trace(
             "haystack.component.run",
             tags={
@@ -1076,7 +1100,11 @@ class PipelineBase:  # noqa: PLW1641
         return consumed_inputs
 
     def _fill_queue(
-        self, component_names: list[str], inputs: dict[str, Any], component_visits: dict[str, int]
+        self,
+        component_names: list[str],
+        inputs: dict[str, Any],
+        component_visits: dict[str, int],
+        cached_priorities: Optional[dict[str, ComponentPriority]] = None,
     ) -> FIFOPriorityQueue:
         """
         Calculates the execution priority for each component and inserts it into the priority queue.
@@ -1084,14 +1112,21 @@ class PipelineBase:  # noqa: PLW1641
         :param component_names: Names of the components to put into the queue.
         :param inputs: Inputs to the components.
         :param component_visits: Current state of component visits.
+        :param cached_priorities: Priorities of the components whose inputs and visits didn't change since they were
+            calculated. The priorities of the other components are calculated and added to it.
+            If `None`, the priorities of all components are calculated.
         :returns: A prioritized queue of component names.
         """
         priority_queue = FIFOPriorityQueue()
         for component_name in component_names:
-            component = self._get_component_with_graph_metadata_and_visits(
-                component_name, component_visits[component_name]
-            )
-            priority = self._calculate_priority(component, inputs.get(component_name, {}))
+            priority = None if cached_priorities is None else cached_priorities.get(component_name)
+            if priority is None:
+                component = self._get_component_with_graph_metadata_and_visits(
+                    component_name, component_visits[component_name]
+                )
+                priority = self._calculate_priority(component, inputs.get(component_name, {}))
+                if cached_priorities is not None:
+                    cached_priorities[component_name] = priority
             priority_queue.push(component_name, priority)
 
         return priority_queue
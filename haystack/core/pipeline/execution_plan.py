@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from dataclasses import dataclass
+from typing import Optional
+
+import networkx
+
+
+@dataclass(frozen=True)
+class ExecutionStep:
+    """
+    A component run of an `ExecutionPlan`.
+
+    :param component_name: The name of the component to run.
+    :param connections: The receiver name, the output socket name and the receiver's input socket name of each
+        connection of the component.
+    """
+
+    component_name: str
+    connections: tuple[tuple[str, str, str], ...]
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """
+    The order in which `Pipeline.run` runs the components of a pipeline with a static topology.
+
+    The components of a wave only receive inputs from the components of the previous waves, and each wave is sorted
+    by component name. This is the order in which the priority-based scheduler runs the components of such a pipeline
+    if every component sends an output to all its receivers.
+
+    :param waves: The steps of each wave, in the order in which they run.
+    """
+
+    waves: tuple[tuple[ExecutionStep, ...], ...]
+
+
+def compile_execution_plan(graph: networkx.MultiDiGraph) -> Optional[ExecutionPlan]:
+    """
+    Compiles the execution plan of a pipeline graph, if its topology is static.
+
+    The topology is static if the graph has no cycles and no variadic input sockets: every component then runs
+    exactly once, after all its predecessors, unless a component doesn't send an output to one of its receivers.
+
+    :param graph: The graph of the pipeline.
+    :returns: The execution plan, or `None` if the components must be scheduled dynamically.
+    """
+    if graph.number_of_nodes() == 0 or not networkx.is_directed_acyclic_graph(graph):
+        return None
+
+    for _, input_sockets in graph.nodes(data="input_sockets"):
+        if any(socket.is_variadic for socket in input_sockets.values()):
+            return None
+
+    # A component runs in the wave after the latest wave of its predecessors
+    wave_indices: dict[str, int] = {}
+    for component_name in networkx.topological_sort(graph):
+        wave_indices[component_name] = max(
+            (wave_indices[predecessor] + 1 for predecessor in graph.predecessors(component_name)), default=0
+        )
+
+    waves: list[list[ExecutionStep]] = [[] for _ in range(max(wave_indices.values()) + 1)]
+    for component_name in sorted(wave_indices):
+        connections = tuple(
+            (receiver_name, connection["from_socket"].name, connection["to_socket"].name)
+            for _, receiver_name, connection in graph.edges(nbunch=component_name, data=True)
+        )
+        waves[wave_indices[component_name]].append(ExecutionStep(component_name, connections))
+
+    return ExecutionPlan(waves=tuple(tuple(wave) for wave in waves))
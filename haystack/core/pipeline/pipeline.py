@@ -2,13 +2,19 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import contextvars
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from copy import deepcopy
+from dataclasses import dataclass, field
 from typing import Any, Mapping, Optional, Union
 
 from haystack import logging, tracing
 from haystack.core.component import Component
 from haystack.core.errors import BreakpointException, PipelineInvalidPipelineSnapshotError, PipelineRuntimeError
 from haystack.core.pipeline.base import (
+    _COMPONENT_BATCH_SIZE,
     _COMPONENT_INPUT,
     _COMPONENT_OUTPUT,
     _COMPONENT_VISITS,
@@ -22,7 +28,9 @@ from haystack.core.pipeline.breakpoint import (
     _validate_break_point_against_pipeline,
     _validate_pipeline_snapshot_against_pipeline,
 )
-from haystack.core.pipeline.utils import _deepcopy_with_exceptions
+from haystack.core.pipeline.component_checks import _NO_OUTPUT_PRODUCED
+from haystack.core.pipeline.execution_plan import ExecutionPlan
+from haystack.core.pipeline.utils import FIFOPriorityQueue, _deepcopy_with_exceptions
 from haystack.dataclasses.breakpoints import AgentBreakpoint, Breakpoint, PipelineSnapshot
 from haystack.telemetry import pipeline_running
 from haystack.utils import _deserialize_value_with_schema
@@ -31,6 +39,31 @@ from haystack.utils.misc import _get_output_dir
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _PlannedRun:
+    """
+    The state of a pipeline run that follows the execution plan of the pipeline.
+
+    :param data: Inputs to the pipeline, by component name and socket name.
+    :param inputs: Global inputs state, only updated if the plan can't be completed.
+    :param component_visits: Current state of component visits.
+    :param pipeline_outputs: Outputs of the pipeline.
+    """
+
+    data: dict[str, dict[str, Any]]
+    inputs: dict[str, Any]
+    component_visits: dict[str, int]
+    pipeline_outputs: dict[str, Any]
+    # Inputs received by the components that didn't run yet, by component name and socket name
+    received_inputs: dict[str, dict[str, Any]] = field(init=False)
+    # Names and outputs of the components that ran, in the order in which they ran
+    executed_components: list[tuple[str, Mapping[str, Any]]] = field(default_factory=list)
+    is_interrupted: bool = False
+
+    def __post_init__(self) -> None:
+        self.received_inputs = {component_name: dict(sockets) for component_name, sockets in self.data.items()}
+
+
 class Pipeline(PipelineBase):
     """
     Synchronous version of the orchestration engine.
@@ -65,7 +98,8 @@ class Pipeline(PipelineBase):
         ) as span:
             # We deepcopy the inputs otherwise we might lose that information
             # when we delete them in case they're sent to other Components
-            span.set_content_tag(_COMPONENT_INPUT, _deepcopy_with_exceptions(inputs))
+            if span.is_recording_content():
+                span.set_content_tag(_COMPONENT_INPUT, _deepcopy_with_exceptions(inputs))
             logger.info("Running component {component_name}", component_name=component_name)
 
             try:
@@ -97,6 +131,589 @@ class Pipeline(PipelineBase):
 
             return component_output
 
+    @staticmethod
+    def _run_component_many(
+        component_name: str,
+        component: dict[str, Any],
+        inputs: list[dict[str, Any]],
+        component_visits: list[dict[str, int]],
+        parent_span: Optional[tracing.Span] = None,
+    ) -> list[Mapping[str, Any]]:
+        """
+        Runs a Component once for several pipeline runs, with its `run_many` method.
+
+        :param component_name: Name of the Component.
+        :param component: Component with component metadata.
+        :param inputs: Inputs for the Component, for each pipeline run.
+        :param component_visits: Current state of component visits, for each pipeline run.
+        :param parent_span: The parent span to use for the newly created span.
+        :raises PipelineRuntimeError: If the Component fails or doesn't return a dictionary for each pipeline run.
+        :return: The output of the Component, for each pipeline run.
+        """
+        instance: Component = component["instance"]
+
+        with PipelineBase._create_component_span(
+            component_name=component_name, instance=instance, inputs=inputs[0], parent_span=parent_span
+        ) as span:
+            span.set_tag(_COMPONENT_BATCH_SIZE, len(inputs))
+            if span.is_recording_content():
+                span.set_content_tag(_COMPONENT_INPUT, _deepcopy_with_exceptions(inputs))
+            logger.info(
+                "Running component {component_name} for {batch_size} pipeline runs",
+                component_name=component_name,
+                batch_size=len(inputs),
+            )
+
+            try:
+                component_outputs = instance.run_many(inputs)  # type: ignore[attr-defined]
+            except PipelineRuntimeError as runtime_error:
+                raise runtime_error
+            except Exception as error:
+                raise PipelineRuntimeError.from_exception(component_name, instance.__class__, error) from error
+
+            if not isinstance(component_outputs, list) or len(component_outputs) != len(inputs):
+                msg = (
+                    f"The following component returned an invalid output:\n"
+                    f"Component name: '{component_name}'\n"
+                    f"Component type: '{instance.__class__.__name__}'\n"
+                    f"Expected a list of {len(inputs)} dictionaries from run_many, one for each pipeline run."
+                )
+                raise PipelineRuntimeError(component_name, instance.__class__, msg)
+            for output in component_outputs:
+                if not isinstance(output, Mapping):
+                    raise PipelineRuntimeError.from_invalid_output(component_name, instance.__class__, output)
+
+            for visits in component_visits:
+                visits[component_name] += 1
+
+            span.set_tag(_COMPONENT_VISITS, component_visits[0][component_name])
+            span.set_content_tag(_COMPONENT_OUTPUT, component_outputs)
+
+            return component_outputs
+
+    def _run_execution_plan(  # pylint: disable=too-many-positional-arguments
+        self,
+        execution_plan: ExecutionPlan,
+        runs: list[_PlannedRun],
+        ordered_component_names: list[str],
+        cached_receivers: dict[str, list[tuple]],
+        include_outputs_from: set[str],
+        parent_span: Optional[tracing.Span] = None,
+    ) -> None:
+        """
+        Runs the components in the order of the execution plan, passing their outputs directly to their receivers.
+
+        The plan assumes that every component sends an output to all its receivers. If a component doesn't, the
+        components of its wave still run, as they don't depend on it. Then the global inputs state of the pipeline run
+        is rebuilt, so that the priority-based scheduler runs the components left to run like if it had run the
+        pipeline from the start.
+
+        When there are several pipeline runs, the components that have a `run_many` method run once for all of them.
+
+        :param execution_plan: The execution plan of the pipeline.
+        :param runs: The pipeline runs that follow the plan.
+        :param ordered_component_names: Names of the components of the pipeline, sorted.
+        :param cached_receivers: Receivers of each component.
+        :param include_outputs_from: Names of the components whose outputs are always returned.
+        :param parent_span: The parent span of the component spans.
+        :raises PipelineRuntimeError: If a component fails or returns an output of an unsupported type.
+        """
+        for wave in execution_plan.waves:
+            for step in wave:
+                component_name = step.component_name
+                component = self.graph.nodes[component_name]
+                input_sockets = component["input_sockets"]
+                runs_inputs = []
+                for run in runs:
+                    received_inputs = run.received_inputs.pop(component_name, {})
+                    component_inputs = {
+                        name: received_inputs[name] for name in input_sockets if name in received_inputs
+                    }
+                    runs_inputs.append(self._add_missing_input_defaults(component_inputs, input_sockets))
+
+                if len(runs) > 1 and hasattr(component["instance"], "run_many"):
+                    runs_outputs = self._run_component_many(
+                        component_name=component_name,
+                        component=component,
+                        inputs=runs_inputs,
+                        component_visits=[run.component_visits for run in runs],
+                        parent_span=parent_span,
+                    )
+                else:
+                    runs_outputs = [
+                        self._run_planned_component(
+                            component_name=component_name,
+                            run=run,
+                            component_inputs=component_inputs,
+                            ordered_component_names=ordered_component_names,
+                            cached_receivers=cached_receivers,
+                            include_outputs_from=include_outputs_from,
+                            parent_span=parent_span,
+                        )
+                        for run, component_inputs in zip(runs, runs_inputs)
+                    ]
+
+                for run, component_outputs in zip(runs, runs_outputs):
+                    run.executed_components.append((component_name, component_outputs))
+                    consumed_outputs = set()
+                    for receiver_name, sender_socket_name, receiver_socket_name in step.connections:
+                        value = component_outputs.get(sender_socket_name, _NO_OUTPUT_PRODUCED)
+                        if value is _NO_OUTPUT_PRODUCED:
+                            run.is_interrupted = True
+                        else:
+                            run.received_inputs.setdefault(receiver_name, {})[receiver_socket_name] = value
+                        consumed_outputs.add(sender_socket_name)
+
+                    if component_name in include_outputs_from:
+                        component_pipeline_outputs = component_outputs
+                    else:
+                        component_pipeline_outputs = {
+                            key: value for key, value in component_outputs.items() if key not in consumed_outputs
+                        }
+                    if component_pipeline_outputs:
+                        run.pipeline_outputs[component_name] = deepcopy(component_pipeline_outputs)
+
+            for run in runs:
+                if run.is_interrupted:
+                    self._replay_component_runs(
+                        run.executed_components, run.inputs, cached_receivers, include_outputs_from
+                    )
+            runs = [run for run in runs if not run.is_interrupted]
+            if not runs:
+                return
+
+    def _run_planned_component(  # pylint: disable=too-many-positional-arguments
+        self,
+        component_name: str,
+        run: _PlannedRun,
+        component_inputs: dict[str, Any],
+        ordered_component_names: list[str],
+        cached_receivers: dict[str, list[tuple]],
+        include_outputs_from: set[str],
+        parent_span: Optional[tracing.Span] = None,
+    ) -> Mapping[str, Any]:
+        """
+        Runs a Component of the execution plan for a pipeline run.
+
+        If the Component fails, a snapshot of the pipeline run is attached to the error, like when the components
+        are scheduled by priority.
+
+        :param component_name: Name of the Component.
+        :param run: The pipeline run.
+        :param component_inputs: Inputs for the Component.
+        :param ordered_component_names: Names of the components of the pipeline, sorted.
+        :param cached_receivers: Receivers of each component.
+        :param include_outputs_from: Names of the components whose outputs are always returned.
+        :param parent_span: The parent span of the component span.
+        :raises PipelineRuntimeError: If the Component fails or returns an output of an unsupported type.
+        :return: The output of the Component.
+        """
+        component = self.graph.nodes[component_name]
+        try:
+            return self._run_component(
+                component_name=component_name,
+                component=component,
+                inputs=component_inputs,
+                component_visits=run.component_visits,
+                parent_span=parent_span,
+            )
+        except PipelineRuntimeError as error:
+            self._replay_component_runs(run.executed_components, run.inputs, cached_receivers, include_outputs_from)
+            self._consume_component_inputs(component_name=component_name, component=component, inputs=run.inputs)
+            self._attach_pipeline_snapshot(
+                error=error,
+                component_name=component_name,
+                inputs=run.inputs,
+                component_inputs=component_inputs,
+                component_visits=run.component_visits,
+                original_input_data=run.data,
+                ordered_component_names=ordered_component_names,
+                include_outputs_from=include_outputs_from,
+                pipeline_outputs=run.pipeline_outputs,
+            )
+            raise error
+
+    def _replay_component_runs(
+        self,
+        executed_components: list[tuple[str, Mapping[str, Any]]],
+        inputs: dict[str, Any],
+        cached_receivers: dict[str, list[tuple]],
+        include_outputs_from: set[str],
+    ) -> None:
+        """
+        Updates the global inputs state like the priority-based scheduler does when running the given components.
+
+        :param executed_components: Names and outputs of the components that ran, in the order in which they ran.
+        :param inputs: Global inputs state.
+        :param cached_receivers: Receivers of each component.
+        :param include_outputs_from: Names of the components whose outputs are always returned.
+        """
+        for component_name, component_outputs in executed_components:
+            self._consume_component_inputs(
+                component_name=component_name, component=self.graph.nodes[component_name], inputs=inputs
+            )
+            self._write_component_outputs(
+                component_name=component_name,
+                component_outputs=component_outputs,
+                inputs=inputs,
+                receivers=cached_receivers[component_name],
+                include_outputs_from=include_outputs_from,
+            )
+
+    @staticmethod
+    def _attach_pipeline_snapshot(  # pylint: disable=too-many-positional-arguments
+        error: PipelineRuntimeError,
+        component_name: str,
+        inputs: dict[str, Any],
+        component_inputs: dict[str, Any],
+        component_visits: dict[str, int],
+        original_input_data: dict[str, Any],
+        ordered_component_names: list[str],
+        include_outputs_from: set[str],
+        pipeline_outputs: dict[str, Any],
+    ) -> None:
+        """
+        Saves a snapshot of the state of the pipeline before a component failed and attaches it to the error.
+
+        :param error: The error raised when running the component.
+        :param component_name: Name of the component that failed.
+        :param inputs: Global inputs state.
+        :param component_inputs: Inputs of the component that failed.
+        :param component_visits: Current state of component visits.
+        :param original_input_data: Inputs to the pipeline.
+        :param ordered_component_names: Names of the components of the pipeline, sorted.
+        :param include_outputs_from: Names of the components whose outputs are always returned.
+        :param pipeline_outputs: Outputs of the pipeline so far.
+        """
+        # TODO Wrap creation of the pipeline snapshot with try-except in case it fails
+        #      (e.g. serialization issue)
+        out_dir = _get_output_dir("pipeline_snapshot")
+        break_point = Breakpoint(
+            component_name=component_name, visit_count=component_visits[component_name], snapshot_file_path=out_dir
+        )
+
+        # Create a snapshot of the state of the pipeline before the error occurred.
+        pipeline_snapshot = _create_pipeline_snapshot(
+            inputs=deepcopy(inputs),
+            component_inputs=deepcopy(component_inputs),
+            break_point=break_point,
+            component_visits=component_visits,
+            original_input_data=original_input_data,
+            ordered_component_names=ordered_component_names,
+            include_outputs_from=include_outputs_from,
+            pipeline_outputs=pipeline_outputs,
+        )
+
+        # If the pipeline_snapshot already exists it came from an Agent component.
+        # We take the agent snapshot and attach it to the pipeline snapshot we create here.
+        # We also update the break_point to be an AgentBreakpoint.
+        if error.pipeline_snapshot and error.pipeline_snapshot.agent_snapshot:
+            pipeline_snapshot.agent_snapshot = error.pipeline_snapshot.agent_snapshot
+            pipeline_snapshot.break_point = error.pipeline_snapshot.agent_snapshot.break_point
+
+        # Attach the pipeline snapshot to the error before re-raising
+        error.pipeline_snapshot = pipeline_snapshot
+        _save_pipeline_snapshot(pipeline_snapshot=pipeline_snapshot, raise_on_failure=False)
+
+    def _pop_independent_components(
+        self,
+        component_name: str,
+        priority_queue: FIFOPriorityQueue,
+        component_visits: dict[str, int],
+        cached_receivers: dict[str, list[tuple]],
+    ) -> list[tuple[ComponentPriority, str, dict[str, Any]]]:
+        """
+        Pops the components that run right after the given component and don't receive inputs from it, or each other.
+
+        The components that are ready to run when the queue is filled run one after the other, in the order of the
+        queue. The inputs of the popped components can't change before they run, so they can run concurrently with
+        the given component.
+
+        :param component_name: Name of the component that runs next.
+        :param priority_queue: Priority queue of component names.
+        :param component_visits: Current state of component visits.
+        :param cached_receivers: Receivers of each component.
+        :returns: The priority, the name and the metadata of each popped component, in the order in which they run.
+        """
+        receiver_names = {receiver_name for receiver_name, _, _ in cached_receivers[component_name]}
+        independent_components = []
+        while len(priority_queue) > 0:
+            priority, next_component_name = priority_queue.peek()
+            # A component that reached the maximum number of runs raises an error when it's its turn to run
+            if (
+                priority > ComponentPriority.READY
+                or next_component_name in receiver_names
+                or component_visits[next_component_name] > self._max_runs_per_component
+            ):
+                break
+            priority_queue.pop()
+            independent_components.append(
+                (
+                    ComponentPriority(priority),
+                    next_component_name,
+                    self._get_component_with_graph_metadata_and_visits(
+                        next_component_name, component_visits[next_component_name]
+                    ),
+                )
+            )
+            receiver_names.update(receiver_name for receiver_name, _, _ in cached_receivers[next_component_name])
+        return independent_components
+
+    def _submit_component_run(  # pylint: disable=too-many-positional-arguments
+        self,
+        executor: ThreadPoolExecutor,
+        component_name: str,
+        component: dict[str, Any],
+        inputs: dict[str, Any],
+        component_visits: dict[str, int],
+        parent_span: Optional[tracing.Span] = None,
+    ) -> "Future[Mapping[str, Any]]":
+        """
+        Runs a Component on the executor, without consuming its inputs from the global inputs state.
+
+        The inputs are consumed and the visit is counted when the outputs are used, so that the global state is the
+        same as if the component ran when it's its turn.
+
+        :param executor: The executor to run the Component on.
+        :param component_name: Name of the Component.
+        :param component: Component with component metadata.
+        :param inputs: Global inputs state.
+        :param component_visits: Current state of component visits.
+        :param parent_span: The parent span of the component span.
+        :returns: The future output of the Component.
+        """
+        component_inputs = self._consume_component_inputs(
+            component_name=component_name, component=component, inputs={component_name: inputs.get(component_name, {})}
+        )
+        component_inputs = self._add_missing_input_defaults(component_inputs, component["input_sockets"])
+        # contextvars, like the active tracing span, don't propagate to the threads of the executor
+        ctx = contextvars.copy_context()
+        return executor.submit(
+            ctx.run,
+            self._run_component,
+            component_name,
+            component,
+            component_inputs,
+            {component_name: component_visits[component_name]},
+            parent_span,
+        )
+
+    def _run_with_priority_queue(  # noqa: PLR0915, PLR0912, C901, pylint: disable=too-many-branches,too-many-positional-arguments
+        self,
+        data: dict[str, Any],
+        inputs: dict[str, Any],
+        component_visits: dict[str, int],
+        ordered_component_names: list[str],
+        cached_receivers: dict[str, list[tuple]],
+        include_outputs_from: set[str],
+        pipeline_outputs: dict[str, Any],
+        parent_span: Optional[tracing.Span] = None,
+        break_point: Optional[Union[Breakpoint, AgentBreakpoint]] = None,
+        pipeline_snapshot: Optional[PipelineSnapshot] = None,
+        is_pipeline_started: bool = False,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> None:
+        """
+        Runs the components that can run, one after the other, in the order given by their priorities.
+
+        :param data: Inputs to the pipeline, by component name and socket name.
+        :param inputs: Global inputs state.
+        :param component_visits: Current state of component visits.
+        :param ordered_component_names: Names of the components of the pipeline, sorted.
+        :param cached_receivers: Receivers of each component.
+        :param include_outputs_from: Names of the components whose outputs are always returned.
+        :param pipeline_outputs: Outputs of the pipeline, updated with the outputs of the components that run.
+        :param parent_span: The parent span of the component spans.
+        :param break_point: A breakpoint to stop the pipeline at, if any.
+        :param pipeline_snapshot: The snapshot the pipeline is resumed from, if any.
+        :param is_pipeline_started: Whether components already ran, in which case the pipeline isn't checked for
+            being blocked before running the components.
+        :param executor: If given, the components that run one after the other and don't receive inputs from each
+            other run concurrently on it. Their outputs are used in the same order as without an executor.
+            It must not be given with a breakpoint or a pipeline snapshot.
+        """
+        cached_topological_sort = None
+        # Components popped from the queue that run next, in order, and the runs submitted to the executor
+        scheduled_components: deque[tuple[ComponentPriority, str, dict[str, Any]]] = deque()
+        component_runs: dict[str, Future[Mapping[str, Any]]] = {}
+        # The priority of a component only depends on its own inputs and visits, so we only recalculate the
+        # priorities of the components that ran or received outputs since the queue was last filled.
+        cached_priorities: dict[str, ComponentPriority] = {}
+        priority_queue = self._fill_queue(ordered_component_names, inputs, component_visits, cached_priorities)
+
+        # check if pipeline is blocked before execution
+        if not is_pipeline_started:
+            self.validate_pipeline(priority_queue)
+
+        while True:
+            candidate: Optional[tuple[ComponentPriority, str, dict[str, Any]]]
+            if scheduled_components:
+                candidate = scheduled_components.popleft()
+            else:
+                candidate = self._get_next_runnable_component(priority_queue, component_visits)
+
+            # If there are no runnable components left, we can exit the loop
+            if candidate is None:
+                break
+
+            priority, component_name, component = candidate
+
+            # If the next component is blocked, we do a check to see if the pipeline is possibly blocked and raise
+            # a warning if it is.
+            if priority == ComponentPriority.BLOCKED:
+                if self._is_pipeline_possibly_blocked(current_pipeline_outputs=pipeline_outputs):
+                    # Pipeline is most likely blocked (most likely a configuration issue) so we raise a warning.
+                    logger.warning(
+                        "Cannot run pipeline - the next component that is meant to run is blocked.\n"
+                        "Component name: '{component_name}'\n"
+                        "Component type: '{component_type}'\n"
+                        "This typically happens when the component is unable to receive all of its required "
+                        "inputs.\nCheck the connections to this component and ensure all required inputs are "
+                        "provided.",
+                        component_name=component_name,
+                        component_type=component["instance"].__class__.__name__,
+                    )
+                # We always exit the loop since we cannot run the next component.
+                break
+
+            if len(priority_queue) > 0 and priority in [ComponentPriority.DEFER, ComponentPriority.DEFER_LAST]:
+                component_name, topological_sort = self._tiebreak_waiting_components(
+                    component_name=component_name,
+                    priority=priority,
+                    priority_queue=priority_queue,
+                    topological_sort=cached_topological_sort,
+                )
+
+                cached_topological_sort = topological_sort
+                component = self._get_component_with_graph_metadata_and_visits(
+                    component_name, component_visits[component_name]
+                )
+            elif executor is not None and component_name not in component_runs:
+                # The component runs in this thread, the components that would run after it on the executor
+                independent_components = self._pop_independent_components(
+                    component_name, priority_queue, component_visits, cached_receivers
+                )
+                for _, independent_component_name, independent_component in independent_components:
+                    component_runs[independent_component_name] = self._submit_component_run(
+                        executor=executor,
+                        component_name=independent_component_name,
+                        component=independent_component,
+                        inputs=inputs,
+                        component_visits=component_visits,
+                        parent_span=parent_span,
+                    )
+                scheduled_components.extend(independent_components)
+
+            if pipeline_snapshot:
+                if isinstance(pipeline_snapshot.break_point, AgentBreakpoint):
+                    name_to_check = pipeline_snapshot.break_point.agent_name
+                else:
+                    name_to_check = pipeline_snapshot.break_point.component_name
+                is_resume = name_to_check == component_name
+            else:
+                is_resume = False
+            component_inputs = self._consume_component_inputs(
+                component_name=component_name, component=component, inputs=inputs, is_resume=is_resume
+            )
+
+            # We need to add missing defaults using default values from input sockets because the run signature
+            # might not provide these defaults for components with inputs defined dynamically upon component
+            # initialization
+            component_inputs = self._add_missing_input_defaults(component_inputs, component["input_sockets"])
+
+            # Scenario 1: Pipeline snapshot is provided to resume the pipeline at a specific component
+            # Deserialize the component_inputs if they are passed in the pipeline_snapshot.
+            # this check will prevent other component_inputs generated at runtime from being deserialized
+            if pipeline_snapshot:
+                if component_name in pipeline_snapshot.pipeline_state.inputs.keys():
+                    for key, value in component_inputs.items():
+                        component_inputs[key] = _deserialize_value_with_schema(value)
+
+                # If we are resuming from an AgentBreakpoint, we inject the agent_snapshot into the Agents inputs
+                if (
+                    isinstance(pipeline_snapshot.break_point, AgentBreakpoint)
+                    and component_name == pipeline_snapshot.break_point.agent_name
+                ):
+                    component_inputs["snapshot"] = pipeline_snapshot.agent_snapshot
+                    component_inputs["break_point"] = None
+
+            # Scenario 2: A break point is provided to stop the pipeline at a specific component
+            component_break_point_triggered = (
+                break_point
+                and isinstance(break_point, Breakpoint)
+                and break_point.component_name == component_name
+                and break_point.visit_count == component_visits[component_name]
+            )
+            agent_break_point_triggered = (
+                break_point and isinstance(break_point, AgentBreakpoint) and component_name == break_point.agent_name
+            )
+            if break_point and (component_break_point_triggered or agent_break_point_triggered):
+                new_pipeline_snapshot = _create_pipeline_snapshot(
+                    inputs=deepcopy(inputs),
+                    component_inputs=deepcopy(component_inputs),
+                    break_point=break_point,
+                    component_visits=component_visits,
+                    original_input_data=data,
+                    ordered_component_names=ordered_component_names,
+                    include_outputs_from=include_outputs_from,
+                    pipeline_outputs=pipeline_outputs,
+                )
+
+                # An AgentBreakpoint is provided to stop the pipeline at an Agent component so we pass on the
+                # break point and snapshot to the Agent's inputs
+                if agent_break_point_triggered:
+                    component_inputs["break_point"] = break_point
+                    component_inputs["parent_snapshot"] = new_pipeline_snapshot
+
+                # trigger the break point if needed
+                if component_break_point_triggered:
+                    _trigger_break_point(pipeline_snapshot=new_pipeline_snapshot)
+
+            try:
+                if component_name in component_runs:
+                    component_outputs = component_runs.pop(component_name).result()
+                    component_visits[component_name] += 1
+                else:
+                    component_outputs = self._run_component(
+                        component_name=component_name,
+                        component=component,
+                        inputs=component_inputs,  # the inputs to the current component
+                        component_visits=component_visits,
+                        parent_span=parent_span,
+                    )
+            except PipelineRuntimeError as error:
+                self._attach_pipeline_snapshot(
+                    error=error,
+                    component_name=component_name,
+                    inputs=inputs,
+                    component_inputs=component_inputs,
+                    component_visits=component_visits,
+                    original_input_data=data,
+                    ordered_component_names=ordered_component_names,
+                    include_outputs_from=include_outputs_from,
+                    pipeline_outputs=pipeline_outputs,
+                )
+                raise error
+
+            # Updates global input state with component outputs and returns outputs that should go to
+            # pipeline outputs.
+            component_pipeline_outputs = self._write_component_outputs(
+                component_name=component_name,
+                component_outputs=component_outputs,
+                inputs=inputs,
+                receivers=cached_receivers[component_name],
+                include_outputs_from=include_outputs_from,
+            )
+
+            if component_pipeline_outputs:
+                pipeline_outputs[component_name] = deepcopy(component_pipeline_outputs)
+
+            cached_priorities.pop(component_name, None)
+            for receiver_name, _, _ in cached_receivers[component_name]:
+                cached_priorities.pop(receiver_name, None)
+            if not scheduled_components and self._is_queue_stale(priority_queue):
+                priority_queue = self._fill_queue(ordered_component_names, inputs, component_visits, cached_priorities)
+
     def run(  # noqa: PLR0915, PLR0912, C901, pylint: disable=too-many-branches
         self,
         data: dict[str, Any],
@@ -104,6 +721,7 @@ class Pipeline(PipelineBase):
         *,
         break_point: Optional[Union[Breakpoint, AgentBreakpoint]] = None,
         pipeline_snapshot: Optional[PipelineSnapshot] = None,
+        max_workers: Optional[int] = None,
     ) -> dict[str, Any]:
         """
         Runs the Pipeline with given input data.
@@ -186,6 +804,13 @@ class Pipeline(PipelineBase):
         :param pipeline_snapshot:
             A dictionary containing a snapshot of a previously saved pipeline execution.
 
+        :param max_workers:
+            If set, components that are ready to run and don't depend on each other run concurrently on a thread
+            pool with this maximum number of threads, for example the retrievers of independent branches.
+            The outputs, and the order in which they are passed on, are the same as when the components run one
+            after the other, but components running concurrently must not modify the inputs they share.
+            Components run one after the other when `break_point` or `pipeline_snapshot` is given.
+
         :returns:
             A dictionary where each entry corresponds to a component name
             and its output. If `include_outputs_from` is `None`, this dictionary
@@ -254,7 +879,6 @@ class Pipeline(PipelineBase):
             # also intermediate_outputs from the snapshot when resuming
             pipeline_outputs = pipeline_snapshot.pipeline_state.pipeline_outputs
 
-        cached_topological_sort = None
         # We need to access a component's receivers multiple times during a pipeline run.
         # We store them here for easy access.
         cached_receivers = {name: self._find_receivers_from(name) for name in ordered_component_names}
@@ -269,175 +893,44 @@ class Pipeline(PipelineBase):
             },
         ) as span:
             inputs = self._convert_to_internal_format(pipeline_inputs=data)
-            priority_queue = self._fill_queue(ordered_component_names, inputs, component_visits)
-
-            # check if pipeline is blocked before execution
-            self.validate_pipeline(priority_queue)
-
-            while True:
-                candidate = self._get_next_runnable_component(priority_queue, component_visits)
 
-                # If there are no runnable components left, we can exit the loop
-                if candidate is None:
-                    break
-
-                priority, component_name, component = candidate
-
-                # If the next component is blocked, we do a check to see if the pipeline is possibly blocked and raise
-                # a warning if it is.
-                if priority == ComponentPriority.BLOCKED:
-                    if self._is_pipeline_possibly_blocked(current_pipeline_outputs=pipeline_outputs):
-                        # Pipeline is most likely blocked (most likely a configuration issue) so we raise a warning.
-                        logger.warning(
-                            "Cannot run pipeline - the next component that is meant to run is blocked.\n"
-                            "Component name: '{component_name}'\n"
-                            "Component type: '{component_type}'\n"
-                            "This typically happens when the component is unable to receive all of its required "
-                            "inputs.\nCheck the connections to this component and ensure all required inputs are "
-                            "provided.",
-                            component_name=component_name,
-                            component_type=component["instance"].__class__.__name__,
+            is_concurrent = max_workers is not None and not break_point and not pipeline_snapshot
+            execution_plan = None if break_point or pipeline_snapshot or is_concurrent else self._get_execution_plan()
+            if execution_plan is not None:
+                # The topology of the pipeline is static, so we run the components in the precompiled order.
+                # The components left to run, if any, are scheduled dynamically below.
+                self._run_execution_plan(
+                    execution_plan=execution_plan,
+                    runs=[
+                        _PlannedRun(
+                            data=data,
+                            inputs=inputs,
+                            component_visits=component_visits,
+                            pipeline_outputs=pipeline_outputs,
                         )
-                    # We always exit the loop since we cannot run the next component.
-                    break
-
-                if len(priority_queue) > 0 and priority in [ComponentPriority.DEFER, ComponentPriority.DEFER_LAST]:
-                    component_name, topological_sort = self._tiebreak_waiting_components(
-                        component_name=component_name,
-                        priority=priority,
-                        priority_queue=priority_queue,
-                        topological_sort=cached_topological_sort,
-                    )
-
-                    cached_topological_sort = topological_sort
-                    component = self._get_component_with_graph_metadata_and_visits(
-                        component_name, component_visits[component_name]
-                    )
-
-                if pipeline_snapshot:
-                    if isinstance(pipeline_snapshot.break_point, AgentBreakpoint):
-                        name_to_check = pipeline_snapshot.break_point.agent_name
-                    else:
-                        name_to_check = pipeline_snapshot.break_point.component_name
-                    is_resume = name_to_check == component_name
-                else:
-                    is_resume = False
-                component_inputs = self._consume_component_inputs(
-                    component_name=component_name, component=component, inputs=inputs, is_resume=is_resume
-                )
-
-                # We need to add missing defaults using default values from input sockets because the run signature
-                # might not provide these defaults for components with inputs defined dynamically upon component
-                # initialization
-                component_inputs = self._add_missing_input_defaults(component_inputs, component["input_sockets"])
-
-                # Scenario 1: Pipeline snapshot is provided to resume the pipeline at a specific component
-                # Deserialize the component_inputs if they are passed in the pipeline_snapshot.
-                # this check will prevent other component_inputs generated at runtime from being deserialized
-                if pipeline_snapshot:
-                    if component_name in pipeline_snapshot.pipeline_state.inputs.keys():
-                        for key, value in component_inputs.items():
-                            component_inputs[key] = _deserialize_value_with_schema(value)
-
-                    # If we are resuming from an AgentBreakpoint, we inject the agent_snapshot into the Agents inputs
-                    if (
-                        isinstance(pipeline_snapshot.break_point, AgentBreakpoint)
-                        and component_name == pipeline_snapshot.break_point.agent_name
-                    ):
-                        component_inputs["snapshot"] = pipeline_snapshot.agent_snapshot
-                        component_inputs["break_point"] = None
-
-                # Scenario 2: A break point is provided to stop the pipeline at a specific component
-                component_break_point_triggered = (
-                    break_point
-                    and isinstance(break_point, Breakpoint)
-                    and break_point.component_name == component_name
-                    and break_point.visit_count == component_visits[component_name]
-                )
-                agent_break_point_triggered = (
-                    break_point
-                    and isinstance(break_point, AgentBreakpoint)
-                    and component_name == break_point.agent_name
+                    ],
+                    ordered_component_names=ordered_component_names,
+                    cached_receivers=cached_receivers,
+                    include_outputs_from=include_outputs_from,
+                    parent_span=span,
                 )
-                if break_point and (component_break_point_triggered or agent_break_point_triggered):
-                    new_pipeline_snapshot = _create_pipeline_snapshot(
-                        inputs=deepcopy(inputs),
-                        component_inputs=deepcopy(component_inputs),
-                        break_point=break_point,
-                        component_visits=component_visits,
-                        original_input_data=data,
-                        ordered_component_names=ordered_component_names,
-                        include_outputs_from=include_outputs_from,
-                        pipeline_outputs=pipeline_outputs,
-                    )
-
-                    # An AgentBreakpoint is provided to stop the pipeline at an Agent component so we pass on the
-                    # break point and snapshot to the Agent's inputs
-                    if agent_break_point_triggered:
-                        component_inputs["break_point"] = break_point
-                        component_inputs["parent_snapshot"] = new_pipeline_snapshot
 
-                    # trigger the break point if needed
-                    if component_break_point_triggered:
-                        _trigger_break_point(pipeline_snapshot=new_pipeline_snapshot)
-
-                try:
-                    component_outputs = self._run_component(
-                        component_name=component_name,
-                        component=component,
-                        inputs=component_inputs,  # the inputs to the current component
-                        component_visits=component_visits,
-                        parent_span=span,
-                    )
-                except PipelineRuntimeError as error:
-                    # TODO Wrap creation of the pipeline snapshot with try-except in case it fails
-                    #      (e.g. serialization issue)
-                    out_dir = _get_output_dir("pipeline_snapshot")
-                    break_point = Breakpoint(
-                        component_name=component_name,
-                        visit_count=component_visits[component_name],
-                        snapshot_file_path=out_dir,
-                    )
-
-                    # Create a snapshot of the state of the pipeline before the error occurred.
-                    pipeline_snapshot = _create_pipeline_snapshot(
-                        inputs=deepcopy(inputs),
-                        component_inputs=deepcopy(component_inputs),
-                        break_point=break_point,
-                        component_visits=component_visits,
-                        original_input_data=data,
-                        ordered_component_names=ordered_component_names,
-                        include_outputs_from=include_outputs_from,
-                        pipeline_outputs=pipeline_outputs,
-                    )
-
-                    # If the pipeline_snapshot already exists it came from an Agent component.
-                    # We take the agent snapshot and attach it to the pipeline snapshot we create here.
-                    # We also update the break_point to be an AgentBreakpoint.
-                    if error.pipeline_snapshot and error.pipeline_snapshot.agent_snapshot:
-                        pipeline_snapshot.agent_snapshot = error.pipeline_snapshot.agent_snapshot
-                        pipeline_snapshot.break_point = error.pipeline_snapshot.agent_snapshot.break_point
-
-                    # Attach the pipeline snapshot to the error before re-raising
-                    error.pipeline_snapshot = pipeline_snapshot
-                    _save_pipeline_snapshot(pipeline_snapshot=pipeline_snapshot, raise_on_failure=False)
-                    raise error
-
-                # Updates global input state with component outputs and returns outputs that should go to
-                # pipeline outputs.
-                component_pipeline_outputs = self._write_component_outputs(
-                    component_name=component_name,
-                    component_outputs=component_outputs,
+            with ThreadPoolExecutor(max_workers=max_workers) if is_concurrent else nullcontext() as executor:
+                self._run_with_priority_queue(
+                    data=data,
                     inputs=inputs,
-                    receivers=cached_receivers[component_name],
+                    component_visits=component_visits,
+                    ordered_component_names=ordered_component_names,
+                    cached_receivers=cached_receivers,
                     include_outputs_from=include_outputs_from,
+                    pipeline_outputs=pipeline_outputs,
+                    parent_span=span,
+                    break_point=break_point,
+                    pipeline_snapshot=pipeline_snapshot,
+                    is_pipeline_started=execution_plan is not None,
+                    executor=executor,
                 )
 
-                if component_pipeline_outputs:
-                    pipeline_outputs[component_name] = deepcopy(component_pipeline_outputs)
-                if self._is_queue_stale(priority_queue):
-                    priority_queue = self._fill_queue(ordered_component_names, inputs, component_visits)
-
             if isinstance(break_point, Breakpoint):
                 logger.warning(
                     "The given breakpoint {break_point} was never triggered. This is because:\n"
@@ -447,3 +940,102 @@ class Pipeline(PipelineBase):
                 )
 
             return pipeline_outputs
+
+    def run_batch(
+        self, data: list[dict[str, Any]], include_outputs_from: Optional[set[str]] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Runs the Pipeline once for each of the given input data.
+
+        The result is the same as calling `run` for each input data, but if the topology of the pipeline is static,
+        the pipeline runs advance together, component by component. Components that implement a `run_many` method
+        then run once for all pipeline runs, which is faster for components that process inputs in batches, like
+        embedders. `run_many` receives the inputs of each pipeline run and must return their outputs, in the same
+        order.
+
+        Usage:
+        ```python
+        results = pipeline.run_batch(
+            [
+                {"retriever": {"query": "Who lives in Paris?"}},
+                {"retriever": {"query": "Who lives in Berlin?"}},
+            ]
+        )
+        ```
+
+        :param data:
+            The input data of each pipeline run, in the format of the `data` parameter of `run`.
+        :param include_outputs_from:
+            Set of component names whose individual outputs are to be
+            included in the pipeline's output of each run.
+
+        :returns:
+            The outputs of each pipeline run, in the same order as `data`.
+
+        :raises ValueError:
+            If invalid inputs are provided to the pipeline.
+        :raises PipelineRuntimeError:
+            If the Pipeline contains cycles with unsupported connections that would cause
+            it to get stuck and fail running.
+            Or if a Component fails or returns output in an unsupported type.
+        :raises PipelineMaxComponentRuns:
+            If a Component reaches the maximum number of times it can be run in this Pipeline.
+        """
+        execution_plan = self._get_execution_plan()
+        if execution_plan is None or len(data) <= 1:
+            return [self.run(run_data, include_outputs_from=include_outputs_from) for run_data in data]
+
+        pipeline_running(self)
+        self.warm_up()
+
+        if include_outputs_from is None:
+            include_outputs_from = set()
+
+        ordered_component_names = sorted(self.graph.nodes.keys())
+        runs = []
+        for run_data in data:
+            run_data = self._prepare_component_input_data(run_data)
+            self.validate_input(run_data)
+            runs.append(
+                _PlannedRun(
+                    data=run_data,
+                    inputs=self._convert_to_internal_format(pipeline_inputs=run_data),
+                    component_visits=dict.fromkeys(ordered_component_names, 0),
+                    pipeline_outputs={},
+                )
+            )
+        cached_receivers = {name: self._find_receivers_from(name) for name in ordered_component_names}
+
+        with tracing.tracer.trace(
+            "haystack.pipeline.run_batch",
+            tags={
+                "haystack.pipeline.input_data": [run.data for run in runs],
+                "haystack.pipeline.output_data": [run.pipeline_outputs for run in runs],
+                "haystack.pipeline.metadata": self.metadata,
+                "haystack.pipeline.max_runs_per_component": self._max_runs_per_component,
+            },
+        ) as span:
+            self._run_execution_plan(
+                execution_plan=execution_plan,
+                runs=runs,
+                ordered_component_names=ordered_component_names,
+                cached_receivers=cached_receivers,
+                include_outputs_from=include_outputs_from,
+                parent_span=span,
+            )
+
+            # The pipeline runs that didn't complete the plan continue one after the other
+            for run in runs:
+                self._run_with_priority_queue(
+                    data=run.data,
+                    inputs=run.inputs,
+                    component_visits=run.component_visits,
+                    ordered_component_names=ordered_component_names,
+                    cached_receivers=cached_receivers,
+                    include_outputs_from=include_outputs_from,
+                    pipeline_outputs=run.pipeline_outputs,
+                    parent_span=span,
+                    is_pipeline_started=True,
+                )
+
+            return [run.pipeline_outputs for run in runs]
@@ -7,9 +7,15 @@ from typing import TYPE_CHECKING
 
 from lazy_imports import LazyImporter
 
-_import_structure = {"document_store": ["InMemoryDocumentStore"]}
+_import_structure = {
+    "bm25_tokenizer": ["BM25Tokenizer"],
+    "document_store": ["InMemoryDocumentStore"],
+    "sharded_document_store": ["ShardedInMemoryDocumentStore"],
+}
 
 if TYPE_CHECKING:
+    from .bm25_tokenizer import BM25Tokenizer as BM25Tokenizer
     from .document_store import InMemoryDocumentStore as InMemoryDocumentStore
+    from .sharded_document_store import ShardedInMemoryDocumentStore as ShardedInMemoryDocumentStore
 else:
     sys.modules[__name__] = LazyImporter(name=__name__, module_file=__file__, import_structure=_import_structure)
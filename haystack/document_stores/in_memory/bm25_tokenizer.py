@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+from functools import lru_cache
+from typing import Any, Optional
+
+from haystack import default_from_dict, default_to_dict
+from haystack.core.serialization import import_class_by_name
+from haystack.lazy_imports import LazyImport
+
+with LazyImport("Run 'pip install nltk>=3.9.1'") as nltk_imports:
+    from nltk.stem.snowball import SnowballStemmer
+
+
+class BM25Tokenizer:
+    """
+    Splits texts into the tokens used by InMemoryDocumentStore for BM25 retrieval.
+
+    The text is lowercased and split with a regular expression. Optionally, stop words are removed and the tokens
+    are stemmed with the NLTK Snowball stemmer. The tokens of the latest queries are cached, so that repeated queries
+    are not tokenized again.
+
+    To plug in another tokenization, subclass it and override `tokenize`, and `tokenize_batch` if texts can be
+    tokenized faster together. Subclasses are serialized with their type and the parameters returned by `to_dict`.
+
+    Usage example:
+    ```python
+    from haystack.document_stores.in_memory import BM25Tokenizer, InMemoryDocumentStore
+
+    tokenizer = BM25Tokenizer(stop_words=["the", "a", "of"], stemmer_language="english")
+    document_store = InMemoryDocumentStore(bm25_tokenizer=tokenizer)
+    ```
+    """
+
+    def __init__(
+        self,
+        regex: str = r"(?u)\b\w\w+\b",
+        lowercase: bool = True,
+        stop_words: Optional[list[str]] = None,
+        stemmer_language: Optional[str] = None,
+        query_cache_size: int = 1024,
+    ):
+        """
+        Creates a BM25Tokenizer.
+
+        :param regex: The regular expression matching the tokens.
+        :param lowercase: Whether to lowercase the text before splitting it.
+        :param stop_words: Tokens to remove, for example very frequent words that don't help ranking. They are
+            lowercased if `lowercase` is `True`.
+        :param stemmer_language: The language of the NLTK Snowball stemmer used to reduce the tokens to their stem,
+            for example "english". If `None` (default), the tokens are not stemmed.
+        :param query_cache_size: The number of queries whose tokens are cached. Set it to 0 to disable the cache.
+        """
+        if query_cache_size < 0:
+            raise ValueError("query_cache_size must be a non-negative integer.")
+        self.regex = regex
+        self.lowercase = lowercase
+        self.stop_words = stop_words
+        self.stemmer_language = stemmer_language
+        self.query_cache_size = query_cache_size
+        self._init_tokenization()
+
+    def _init_tokenization(self) -> None:
+        self._findall = re.compile(self.regex).findall
+        stop_words = self.stop_words or []
+        self._stop_words = frozenset(word.lower() for word in stop_words) if self.lowercase else frozenset(stop_words)
+        self._stemmer = None
+        if self.stemmer_language is not None:
+            nltk_imports.check()
+            self._stemmer = SnowballStemmer(self.stemmer_language)
+        # Stems of the tokens seen so far: the vocabulary is much smaller than the number of tokens to stem
+        self._stems: dict[str, str] = {}
+        self._tokenize_query = lru_cache(maxsize=self.query_cache_size)(self._tokenize_tuple)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # the caches are not sent to the tokenization processes, they are rebuilt empty
+        state = self.__dict__.copy()
+        for attribute in ("_findall", "_stemmer", "_stems", "_tokenize_query"):
+            state.pop(attribute, None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_tokenization()
+
+    def tokenize(self, text: str) -> list[str]:
+        """
+        Splits a text into tokens.
+
+        :param text: The text to tokenize.
+        :returns: The tokens of the text, in order.
+        """
+        tokens = self._findall(text.lower() if self.lowercase else text)
+        if self._stop_words:
+            tokens = [token for token in tokens if token not in self._stop_words]
+        if self._stemmer is not None:
+            tokens = [self._stem(token) for token in tokens]
+        return tokens
+
+    def tokenize_batch(self, texts: list[str]) -> list[list[str]]:
+        """
+        Splits several texts into tokens. Used to tokenize the Documents written to the store.
+
+        :param texts: The texts to tokenize.
+        :returns: The tokens of each text.
+        """
+        findall = self._findall
+        if type(self).tokenize is BM25Tokenizer.tokenize and not self._stop_words and self._stemmer is None:
+            # plain regex tokenization, without the overhead of a call to `tokenize` per text
+            return [findall(text.lower()) for text in texts] if self.lowercase else [findall(text) for text in texts]
+        tokenize = self.tokenize
+        return [tokenize(text) for text in texts]
+
+    def tokenize_query(self, query: str) -> list[str]:
+        """
+        Splits a query into tokens like `tokenize`, reusing the tokens of the latest queries.
+
+        :param query: The query to tokenize.
+        :returns: The tokens of the query, in order.
+        """
+        return list(self._tokenize_query(query))
+
+    def _tokenize_tuple(self, text: str) -> tuple[str, ...]:
+        # the cached tokens are immutable, so that callers can't modify them
+        return tuple(self.tokenize(text))
+
+    def _stem(self, token: str) -> str:
+        stem = self._stems.get(token)
+        if stem is None:
+            stem = self._stems[token] = self._stemmer.stem(token)  # type: ignore[union-attr]
+        return stem
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serializes the tokenizer to a dictionary.
+
+        :returns:
+            Dictionary with serialized data.
+        """
+        return default_to_dict(
+            self,
+            regex=self.regex,
+            lowercase=self.lowercase,
+            stop_words=self.stop_words,
+            stemmer_language=self.stemmer_language,
+            query_cache_size=self.query_cache_size,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BM25Tokenizer":
+        """
+        Deserializes the tokenizer from a dictionary.
+
+        :param data:
+            The dictionary to deserialize from.
+        :returns:
+            The deserialized tokenizer.
+        """
+        return default_from_dict(cls, data)
+
+
+def deserialize_bm25_tokenizer_in_init_params(init_params: dict[str, Any]) -> dict[str, Any]:
+    """
+    Deserializes the `bm25_tokenizer` of the init parameters of a document store, if any.
+
+    The tokenizer is deserialized with the `from_dict` of its type, so that subclasses can be used.
+
+    :param init_params: The init parameters of the document store. They are not modified.
+    :returns: The init parameters with the deserialized tokenizer.
+    """
+    tokenizer_data = init_params.get("bm25_tokenizer")
+    if tokenizer_data is None:
+        return init_params
+    tokenizer_class: Any = import_class_by_name(tokenizer_data["type"])
+    return {**init_params, "bm25_tokenizer": tokenizer_class.from_dict(tokenizer_data)}
@@ -5,22 +5,40 @@
 import asyncio
 import json
 import math
-import re
+import threading
 import uuid
+import warnings
 from collections import Counter
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from itertools import chain, count
 from pathlib import Path
-from typing import Any, Iterable, Literal, Optional
+from typing import Any, Callable, Collection, Iterable, Iterator, Literal, Optional
 
 import numpy as np
 
 from haystack import default_from_dict, default_to_dict, logging
-from haystack.dataclasses import Document
+from haystack.dataclasses import Document, SparseEmbedding
 from haystack.document_stores.errors import DocumentStoreError, DuplicateDocumentError
+from haystack.document_stores.in_memory.bm25_tokenizer import BM25Tokenizer, deserialize_bm25_tokenizer_in_init_params
+from haystack.document_stores.in_memory.embedding_matrix import EmbeddingMatrix
+from haystack.document_stores.in_memory.fusion import FUSION_MODES, FusionMode, fuse_scores
+from haystack.document_stores.in_memory.ivf_index import IVFIndex
+from haystack.document_stores.in_memory.metadata_index import MetadataIndex, MetadataIndexType
+from haystack.document_stores.in_memory.quantization import EmbeddingQuantizationType, EmbeddingQuantizer
+from haystack.document_stores.in_memory.read_write_lock import ReadWriteLock
+from haystack.document_stores.in_memory.snapshot import (
+    StoreSnapshot,
+    is_snapshot,
+    read_snapshot,
+    read_snapshot_manifest,
+    write_snapshot,
+)
+from haystack.document_stores.in_memory.sparse_embedding_index import SparseEmbeddingIndex
+from haystack.document_stores.in_memory.write_ahead_log import WriteAheadLog
 from haystack.document_stores.types import DuplicatePolicy
-from haystack.utils import expit
-from haystack.utils.filters import document_matches_filter
+from haystack.utils import expit, top_k_indices, top_k_items
+from haystack.utils.filters import compile_filter
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +52,19 @@ logger = logging.getLogger(__name__)
 BM25_SCALING_FACTOR = 8
 DOT_PRODUCT_SCALING_FACTOR = 100
 
+# Number of query embeddings scored together by batched embedding retrieval. Larger batches make better use of the
+# matrix product, but the scores of a whole batch against all the Documents are kept in memory at once.
+QUERY_BATCH_SIZE = 64
+
+# Minimum number of Documents written at once for them to be tokenized in several processes, below it starting the
+# tasks and sending the texts to the processes costs more than it saves.
+PARALLEL_TOKENIZATION_MIN_DOCUMENTS = 2048
+
+# Largest fraction of the embeddings matching the filters for filtered embedding retrieval to only score the matching
+# rows. Gathering scattered rows costs several times more per row than a product with the whole contiguous matrix,
+# so when more rows match, all of them are scored and the ones not matching the filters are masked out of the scores.
+PREFILTER_MAX_SELECTIVITY = 0.2
+
 
 @dataclass
 class BM25DocumentStats:
@@ -48,19 +79,57 @@ class BM25DocumentStats:
     doc_len: int
 
 
+def _count_tokens(tokenizer: BM25Tokenizer, texts: list[str]) -> list[Counter]:
+    # Same tokenization as InMemoryDocumentStore._count_bm25_tokens, run in the tokenization processes
+    return [Counter(tokens) for tokens in tokenizer.tokenize_batch(texts)]
+
+
+def bm25okapi_idf_floor(n_corpus: int, document_frequencies: Collection[int], epsilon: float) -> float:
+    """
+    Computes the IDF given by BM25Okapi to the tokens with a negative IDF: `epsilon` times the average IDF.
+
+    :param n_corpus: The number of documents in the corpus.
+    :param document_frequencies: The number of documents containing each token of the vocabulary.
+    :param epsilon: The fraction of the average IDF to use.
+    :returns: The IDF floor.
+    """
+    sum_idf = 0.0
+    for n in document_frequencies:
+        sum_idf += math.log((n_corpus - n + 0.5) / (n + 0.5))
+    return epsilon * sum_idf / len(document_frequencies)
+
+
 # Global storage for all InMemoryDocumentStore instances, indexed by the index name.
 _STORAGES: dict[str, dict[str, Document]] = {}
 _BM25_STATS_STORAGES: dict[str, dict[str, BM25DocumentStats]] = {}
 _AVERAGE_DOC_LEN_STORAGES: dict[str, float] = {}
 _FREQ_VOCAB_FOR_IDF_STORAGES: dict[str, Counter] = {}
+# Inverted index for BM25 retrieval: maps each token to the ids of the documents containing it and the
+# frequency of the token in each of those documents.
+_BM25_POSTINGS_STORAGES: dict[str, dict[str, dict[str, int]]] = {}
+_EMBEDDING_MATRIX_STORAGES: dict[str, EmbeddingMatrix] = {}
+_METADATA_INDEX_STORAGES: dict[str, MetadataIndex] = {}
+_SPARSE_EMBEDDING_INDEX_STORAGES: dict[str, SparseEmbeddingIndex] = {}
+# Lock guarding all the storages of an index, shared by all the instances using it.
+_LOCKS: dict[str, ReadWriteLock] = {}
+# Version of the Documents of each index, changed by every write and deletion to invalidate the values cached
+# by the instances using it. Versions are unique across indexes, so that a recreated index never reuses one.
+_CORPUS_VERSIONS: dict[str, int] = {}
+_NEXT_CORPUS_VERSION = count(1)
 
 
 class InMemoryDocumentStore:
     """
     Stores data in-memory. It's ephemeral and cannot be saved to disk.
+
+    The store is thread-safe: reads, such as filtering, counting and retrieval, run concurrently, while writes and
+    deletions run one at a time and exclusively of reads. A write or a deletion is applied atomically: concurrent
+    reads see the Documents and the BM25 and embedding statistics either as they were before the call or as they
+    are after it, never partially updated. Writers are preferred, so a steady flow of queries doesn't delay
+    ingestion indefinitely. The lock is shared by all the instances using the same index.
     """
 
-    def __init__(  # pylint: disable=too-many-positional-arguments
+    def __init__(  # noqa: PLR0913, PLR0915, PLR0917 # pylint: disable=too-many-positional-arguments
         self,
         bm25_tokenization_regex: str = r"(?u)\b\w\w+\b",
         bm25_algorithm: Literal["BM25Okapi", "BM25L", "BM25Plus"] = "BM25L",
@@ -69,6 +138,15 @@ class InMemoryDocumentStore:
         index: Optional[str] = None,
         async_executor: Optional[ThreadPoolExecutor] = None,
         return_embedding: bool = True,
+        embedding_index_type: Literal["flat", "ivf"] = "flat",
+        embedding_index_parameters: Optional[dict] = None,
+        metadata_indexes: Optional[dict[str, MetadataIndexType]] = None,
+        wal_directory: Optional[str] = None,
+        wal_compaction_threshold: int = 10000,
+        embedding_quantization: Optional[EmbeddingQuantizationType] = None,
+        embedding_quantization_parameters: Optional[dict] = None,
+        bm25_tokenization_workers: int = 1,
+        bm25_tokenizer: Optional[BM25Tokenizer] = None,
     ):
         """
         Initializes the DocumentStore.
@@ -87,20 +165,73 @@ class InMemoryDocumentStore:
             Optional ThreadPoolExecutor to use for async calls. If not provided, a single-threaded
             executor will be initialized and used.
         :param return_embedding: Whether to return the embedding of the retrieved Documents. Default is True.
+        :param embedding_index_type: The index used for embedding retrieval.
+            "flat" (default) compares the query with all the Document embeddings, returning exact results.
+            "ivf" partitions the embeddings into clusters with k-means and only compares the query with
+            the embeddings of the clusters closest to it. This is faster on large collections but approximate.
+            Retrieval with filters is always exact.
+        :param embedding_index_parameters: Parameters for the "ivf" embedding index in a dictionary format.
+            For example: `{'n_lists': 100, 'nprobe': 10, 'min_training_size': 3900}`
+            `n_lists` is the number of clusters, `nprobe` the number of clusters searched for each query:
+            increase it to improve recall at the cost of speed. The index is trained once the store
+            contains `min_training_size` embeddings (39 * `n_lists` by default), until then retrieval is exact.
+        :param metadata_indexes: Fields to index to speed up filtering, with the type of index to create.
+            "hash" indexes speed up the operators '==' and 'in', "sorted" indexes speed up '>', '>=', '<' and '<='
+            on numbers and ISO formatted dates.
+            For example: `{'meta.source_id': 'hash', 'meta.date': 'sorted'}`
+            Filters on indexed fields only evaluate the Documents returned by the indexes instead of all Documents.
+        :param wal_directory: A directory to persist the store to with a write-ahead log. If provided, every change
+            made by `write_documents`, `delete_documents`, `delete_by_filter` and `update_by_filter` is appended to a
+            log file in the directory and flushed to disk before being applied, and the log is periodically compacted
+            into a binary snapshot of the store. If the directory already
+            contains a log, the store is restored from it when initialized. Use `load_from_disk` with the
+            directory to load a store persisted this way.
+        :param wal_compaction_threshold: The number of Documents written or deleted since the latest snapshot
+            after which the write-ahead log is compacted into a new snapshot.
+        :param embedding_quantization: How the embedding index stores the Document embeddings used to score queries.
+            By default they're stored as float32. "float16" halves the memory they use, "int8" divides it by 4 by
+            mapping each dimension to 256 levels, and "binary" divides it by 32 by only keeping the sign of each
+            dimension. Scores computed on quantized embeddings are approximate, so by default the best candidates
+            are scored again with the original embeddings. The original embeddings are kept by the embedding index
+            instead of the stored Documents, and are still returned with the Documents.
+        :param embedding_quantization_parameters: Parameters for the embedding quantization in a dictionary format.
+            For example: `{'rescore_factor': 4, 'min_training_size': 1000, 'original_dtype': 'float32'}`
+            `rescore_factor` is the number of candidates scored again with the exact embeddings for each requested
+            Document, set it to `None` to return the approximate scores. "int8" learns the range of each dimension
+            once the store contains `min_training_size` embeddings, until then embeddings are not quantized.
+            `original_dtype` is the precision the original embeddings are kept with, "float32" or "float16".
+        :param bm25_tokenization_workers: The number of processes used to tokenize the Documents for BM25 when
+            writing at least `PARALLEL_TOKENIZATION_MIN_DOCUMENTS` Documents at once. With 1 (default), Documents
+            are tokenized in the calling thread. The processes are started on the first large write and stopped
+            by `shutdown`.
+        :param bm25_tokenizer: The tokenizer used to split the Documents and the queries into tokens for BM25,
+            for example a `BM25Tokenizer` removing stop words and stemming the tokens. If provided,
+            `bm25_tokenization_regex` is ignored. By default, a `BM25Tokenizer` with `bm25_tokenization_regex`
+            lowercases the text and splits it with the regex.
         """
         self.bm25_tokenization_regex = bm25_tokenization_regex
-        self.tokenizer = re.compile(bm25_tokenization_regex).findall
+        self.bm25_tokenizer = bm25_tokenizer
+        self._bm25_tokenizer = bm25_tokenizer or BM25Tokenizer(regex=bm25_tokenization_regex)
+        if bm25_tokenization_workers < 1:
+            raise ValueError("bm25_tokenization_workers must be a positive integer.")
+        self.bm25_tokenization_workers = bm25_tokenization_workers
+        self._tokenization_pool: Optional[ProcessPoolExecutor] = None
 
         if index is None:
             index = str(uuid.uuid4())
 
         self.index = index
+        if self.index not in _LOCKS:
+            _LOCKS[self.index] = ReadWriteLock()
         if self.index not in _STORAGES:
             _STORAGES[self.index] = {}
 
         self.bm25_algorithm = bm25_algorithm
         self.bm25_algorithm_inst = self._dispatch_bm25()
         self.bm25_parameters = bm25_parameters or {}
+        # IDF of the tokens of the vocabulary, and IDF floor of BM25Okapi, computed for a version of the corpus
+        self._idf_cache: tuple[int, dict[str, float]] = (0, {})
+        self._okapi_idf_floor_cache: tuple[int, float] = (0, 0.0)
         self.embedding_similarity_function = embedding_similarity_function
 
         # Per-document statistics
@@ -113,6 +244,44 @@ class InMemoryDocumentStore:
         if self.index not in _FREQ_VOCAB_FOR_IDF_STORAGES:
             _FREQ_VOCAB_FOR_IDF_STORAGES[self.index] = Counter()
 
+        if self.index not in _BM25_POSTINGS_STORAGES:
+            _BM25_POSTINGS_STORAGES[self.index] = {}
+
+        if self.index not in _EMBEDDING_MATRIX_STORAGES:
+            _EMBEDDING_MATRIX_STORAGES[self.index] = EmbeddingMatrix()
+
+        if self.index not in _SPARSE_EMBEDDING_INDEX_STORAGES:
+            _SPARSE_EMBEDDING_INDEX_STORAGES[self.index] = SparseEmbeddingIndex()
+
+        # the indexes are shared with the instances using the same index, which may be querying them concurrently
+        with self._lock.write():
+            if self.index not in _METADATA_INDEX_STORAGES:
+                metadata_index = MetadataIndex()
+                for document in self.storage.values():
+                    metadata_index.add(document)
+                _METADATA_INDEX_STORAGES[self.index] = metadata_index
+
+            self.metadata_indexes = metadata_indexes or {}
+            for field, index_type in self.metadata_indexes.items():
+                self._metadata_index.add_index(field, index_type, documents=self.storage.values())
+
+            if embedding_index_type not in ("flat", "ivf"):
+                raise ValueError(f"Embedding index type '{embedding_index_type}' is not supported.")
+            self.embedding_index_type = embedding_index_type
+            self.embedding_index_parameters = embedding_index_parameters or {}
+            if self.embedding_index_type == "ivf" and self._embedding_matrix.ivf is None:
+                self._embedding_matrix.set_ivf_index(
+                    IVFIndex(similarity=self.embedding_similarity_function, **self.embedding_index_parameters)
+                )
+
+            self.embedding_quantization = embedding_quantization
+            self.embedding_quantization_parameters = embedding_quantization_parameters or {}
+            if self.embedding_quantization is not None and self._embedding_matrix.quantizer is None:
+                self._embedding_matrix.set_quantizer(
+                    EmbeddingQuantizer(self.embedding_quantization, **self.embedding_quantization_parameters)
+                )
+                self._detach_embeddings(list(self.storage))
+
         # keep track of whether we own the executor if we created it we must also clean it up
         self._owns_executor = async_executor is None
         self.executor = (
@@ -122,19 +291,32 @@ class InMemoryDocumentStore:
         )
         self.return_embedding = return_embedding
 
+        self.wal_directory = wal_directory
+        self.wal_compaction_threshold = wal_compaction_threshold
+        self._wal: Optional[WriteAheadLog] = None
+        self._wal_compaction_lock = threading.Lock()
+        if self.wal_directory is not None:
+            with self._lock.write():
+                self._open_wal(self.wal_directory)
+
     def __del__(self):
         """
         Cleanup when the instance is being destroyed.
         """
         if hasattr(self, "_owns_executor") and self._owns_executor and hasattr(self, "executor"):
             self.executor.shutdown(wait=True)
+        if hasattr(self, "_tokenization_pool") and self._tokenization_pool is not None:
+            self._tokenization_pool.shutdown(wait=True)
 
     def shutdown(self):
         """
-        Explicitly shutdown the executor if we own it.
+        Explicitly shutdown the executor if we own it, and the BM25 tokenization processes if any.
         """
         if self._owns_executor:
             self.executor.shutdown(wait=True)
+        if self._tokenization_pool is not None:
+            self._tokenization_pool.shutdown(wait=True)
+            self._tokenization_pool = None
 
     @property
     def storage(self) -> dict[str, Document]:
@@ -143,10 +325,40 @@ class InMemoryDocumentStore:
         """
         return _STORAGES.get(self.index, {})
 
+    @property
+    def tokenizer(self) -> Callable[[str], list[str]]:
+        """
+        The function splitting a text into BM25 tokens.
+
+        Deprecated, use `bm25_tokenizer` or a custom `BM25Tokenizer` instead.
+        """
+        warnings.warn(
+            "`InMemoryDocumentStore.tokenizer` is deprecated and will be removed in a future release. "
+            "Pass a `BM25Tokenizer` with the `bm25_tokenizer` init parameter to customize the BM25 tokenization.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self._bm25_tokenizer.tokenize
+
+    @property
+    def _lock(self) -> ReadWriteLock:
+        return _LOCKS.setdefault(self.index, ReadWriteLock())
+
+    @property
+    def _corpus_version(self) -> int:
+        return _CORPUS_VERSIONS.get(self.index, 0)
+
+    def _bump_corpus_version(self) -> None:
+        _CORPUS_VERSIONS[self.index] = next(_NEXT_CORPUS_VERSION)
+
     @property
     def _bm25_attr(self) -> dict[str, BM25DocumentStats]:
         return _BM25_STATS_STORAGES.get(self.index, {})
 
+    @property
+    def _bm25_corpus_size(self) -> int:
+        return len(self._bm25_attr)
+
     @property
     def _avg_doc_len(self) -> float:
         return _AVERAGE_DOC_LEN_STORAGES.get(self.index, 0.0)
@@ -159,6 +371,25 @@ class InMemoryDocumentStore:
     def _freq_vocab_for_idf(self) -> Counter:
         return _FREQ_VOCAB_FOR_IDF_STORAGES.get(self.index, Counter())
 
+    @property
+    def _bm25_postings(self) -> dict[str, dict[str, int]]:
+        return _BM25_POSTINGS_STORAGES.get(self.index, {})
+
+    @property
+    def _metadata_index(self) -> MetadataIndex:
+        metadata_index = _METADATA_INDEX_STORAGES.get(self.index)
+        return metadata_index if metadata_index is not None else MetadataIndex()
+
+    @property
+    def _embedding_matrix(self) -> EmbeddingMatrix:
+        matrix = _EMBEDDING_MATRIX_STORAGES.get(self.index)
+        return matrix if matrix is not None else EmbeddingMatrix()
+
+    @property
+    def _sparse_embedding_index(self) -> SparseEmbeddingIndex:
+        sparse_embedding_index = _SPARSE_EMBEDDING_INDEX_STORAGES.get(self.index)
+        return sparse_embedding_index if sparse_embedding_index is not None else SparseEmbeddingIndex()
+
     def _dispatch_bm25(self):
         """
         Select the correct BM25 algorithm based on user specification.
@@ -174,45 +405,59 @@ class InMemoryDocumentStore:
 
     def _tokenize_bm25(self, text: str) -> list[str]:
         """
-        Tokenize text using the BM25 tokenization regex.
+        Tokenize a query with the BM25 tokenizer.
 
-        Here we explicitly create a tokenization method to encapsulate
-        all pre-processing logic used to create BM25 tokens, such as
-        lowercasing. This helps track the exact tokenization process
-        used for BM25 scoring at any given time.
+        The tokens of the latest queries are cached by the tokenizer, popular queries are not tokenized again.
 
         :param text:
             The text to tokenize.
         :returns:
             A list of tokens.
         """
-        text = text.lower()
-        return self.tokenizer(text)
+        return self._bm25_tokenizer.tokenize_query(text)
 
-    def _score_bm25l(self, query: str, documents: list[Document]) -> list[tuple[Document, float]]:
+    def _count_bm25_tokens(self, texts: list[str]) -> list[Counter]:
+        """
+        Tokenize texts and count their tokens, in several processes if the store is configured to.
+
+        :param texts:
+            The texts to tokenize.
+        :returns:
+            A Counter of the tokens of each text.
+        """
+        if self.bm25_tokenization_workers == 1 or len(texts) < PARALLEL_TOKENIZATION_MIN_DOCUMENTS:
+            return [Counter(tokens) for tokens in self._bm25_tokenizer.tokenize_batch(texts)]
+
+        if self._tokenization_pool is None:
+            self._tokenization_pool = ProcessPoolExecutor(max_workers=self.bm25_tokenization_workers)
+        # a few chunks per process balance the load without sending too many small tasks
+        chunk_size = math.ceil(len(texts) / (self.bm25_tokenization_workers * 4))
+        chunks = [texts[start : start + chunk_size] for start in range(0, len(texts), chunk_size)]
+        counted_chunks = self._tokenization_pool.map(_count_tokens, [self._bm25_tokenizer] * len(chunks), chunks)
+        return [freq_token for chunk in counted_chunks for freq_token in chunk]
+
+    def _score_bm25l(
+        self, query_tokens: list[str], documents: list[Document]
+    ) -> tuple[list[tuple[Document, float]], float]:
         """
         Calculate BM25L scores for the given query and filtered documents.
 
-        :param query:
-            The query string.
+        :param query_tokens:
+            The tokenized query.
         :param documents:
-            The list of documents to score, should be produced by
-            the filter_documents method; may be an empty list.
+            The list of documents to score, usually the documents that contain at least one of the query tokens;
+            may be an empty list.
         :returns:
-            A list of tuples, each containing a Document and its BM25L score.
+            A tuple with a list of tuples, each containing a Document and its BM25L score, and the score
+            of a document that contains none of the query tokens.
         """
         k = self.bm25_parameters.get("k1", 1.5)
         b = self.bm25_parameters.get("b", 0.75)
         delta = self.bm25_parameters.get("delta", 0.5)
 
-        def _compute_idf(tokens: list[str]) -> dict[str, float]:
-            """Per-token IDF computation for all tokens."""
-            idf = {}
-            n_corpus = len(self._bm25_attr)
-            for tok in tokens:
-                n = self._freq_vocab_for_idf.get(tok, 0)
-                idf[tok] = math.log((n_corpus + 1.0) / (n + 0.5)) * int(n != 0)
-            return idf
+        def _compute_idf(n_corpus: int, n: int) -> float:
+            """Per-token IDF computation."""
+            return math.log((n_corpus + 1.0) / (n + 0.5)) * int(n != 0)
 
         def _compute_tf(token: str, freq: dict[str, int], doc_len: int) -> float:
             """Per-token BM25L computation."""
@@ -220,57 +465,32 @@ class InMemoryDocumentStore:
             ctd = freq_term / (1 - b + b * doc_len / self._avg_doc_len)
             return (1.0 + k) * (ctd + delta) / (k + ctd + delta)
 
-        idf = _compute_idf(self._tokenize_bm25(query))
-        bm25_attr = {doc.id: self._bm25_attr[doc.id] for doc in documents}
-
-        ret = []
-        for doc in documents:
-            doc_stats = bm25_attr[doc.id]
-            freq = doc_stats.freq_token
-            doc_len = doc_stats.doc_len
-
-            score = 0.0
-            for tok in idf.keys():  # pylint: disable=consider-using-dict-items
-                score += idf[tok] * _compute_tf(tok, freq, doc_len)
-            ret.append((doc, score))
-
-        return ret
+        idf = self._cached_idf(query_tokens, _compute_idf)
+        return self._score_bm25_documents(idf, _compute_tf, documents)
 
-    def _score_bm25okapi(self, query: str, documents: list[Document]) -> list[tuple[Document, float]]:
+    def _score_bm25okapi(
+        self, query_tokens: list[str], documents: list[Document]
+    ) -> tuple[list[tuple[Document, float]], float]:
         """
         Calculate BM25Okapi scores for the given query and filtered documents.
 
-        :param query:
-            The query string.
+        :param query_tokens:
+            The tokenized query.
         :param documents:
-            The list of documents to score, should be produced by
-            the filter_documents method; may be an empty list.
+            The list of documents to score, usually the documents that contain at least one of the query tokens;
+            may be an empty list.
         :returns:
-            A list of tuples, each containing a Document and its BM25L score.
+            A tuple with a list of tuples, each containing a Document and its BM25Okapi score, and the score
+            of a document that contains none of the query tokens.
         """
         k = self.bm25_parameters.get("k1", 1.5)
         b = self.bm25_parameters.get("b", 0.75)
         epsilon = self.bm25_parameters.get("epsilon", 0.25)
 
-        def _compute_idf(tokens: list[str]) -> dict[str, float]:
-            """Per-token IDF computation for all tokens."""
-            sum_idf = 0.0
-            neg_idf_tokens = []
-
-            # Although this is a global statistic, we compute it here
-            # to make the computation more self-contained. And the
-            # complexity is O(vocab_size), which is acceptable.
-            idf = {}
-            for tok, n in self._freq_vocab_for_idf.items():
-                idf[tok] = math.log((len(self._bm25_attr) - n + 0.5) / (n + 0.5))
-                sum_idf += idf[tok]
-                if idf[tok] < 0:
-                    neg_idf_tokens.append(tok)
-
-            eps = epsilon * sum_idf / len(self._freq_vocab_for_idf)
-            for tok in neg_idf_tokens:
-                idf[tok] = eps
-            return {tok: idf.get(tok, 0.0) for tok in tokens}
+        def _compute_idf(n_corpus: int, n: int) -> float:
+            """Per-token IDF computation, negative IDFs are replaced by a fraction of the average IDF."""
+            idf = math.log((n_corpus - n + 0.5) / (n + 0.5))
+            return idf if idf >= 0 else self._okapi_idf_floor(epsilon)
 
         def _compute_tf(token: str, freq: dict[str, int], doc_len: int) -> float:
             """Per-token BM25L computation."""
@@ -278,49 +498,48 @@ class InMemoryDocumentStore:
             freq_norm = freq_term + k * (1 - b + b * doc_len / self._avg_doc_len)
             return freq_term * (1.0 + k) / freq_norm
 
-        idf = _compute_idf(self._tokenize_bm25(query))
-        bm25_attr = {doc.id: self._bm25_attr[doc.id] for doc in documents}
+        idf = self._cached_idf(query_tokens, _compute_idf)
+        return self._score_bm25_documents(idf, _compute_tf, documents)
 
-        ret = []
-        for doc in documents:
-            doc_stats = bm25_attr[doc.id]
-            freq = doc_stats.freq_token
-            doc_len = doc_stats.doc_len
+    def _okapi_idf_floor(self, epsilon: float) -> float:
+        """
+        Returns the IDF given to the tokens with a negative BM25Okapi IDF: `epsilon` times the average IDF.
 
-            score = 0.0
-            for tok in idf.keys():
-                score += idf[tok] * _compute_tf(tok, freq, doc_len)
-            ret.append((doc, score))
+        The average IDF is computed over the whole vocabulary once per version of the corpus.
+        """
+        version, idf_floor = self._okapi_idf_floor_cache
+        if version == self._corpus_version:
+            return idf_floor
 
-        return ret
+        idf_floor = bm25okapi_idf_floor(self._bm25_corpus_size, self._freq_vocab_for_idf.values(), epsilon)
+        self._okapi_idf_floor_cache = (self._corpus_version, idf_floor)
+        return idf_floor
 
-    def _score_bm25plus(self, query: str, documents: list[Document]) -> list[tuple[Document, float]]:
+    def _score_bm25plus(
+        self, query_tokens: list[str], documents: list[Document]
+    ) -> tuple[list[tuple[Document, float]], float]:
         """
         Calculate BM25+ scores for the given query and filtered documents.
 
         This implementation follows the document on BM25 Wikipedia page,
         which add 1 (smoothing factor) to document frequency when computing IDF.
 
-        :param query:
-            The query string.
+        :param query_tokens:
+            The tokenized query.
         :param documents:
-            The list of documents to score, should be produced by
-            the filter_documents method; may be an empty list.
+            The list of documents to score, usually the documents that contain at least one of the query tokens;
+            may be an empty list.
         :returns:
-            A list of tuples, each containing a Document and its BM25+ score.
+            A tuple with a list of tuples, each containing a Document and its BM25+ score, and the score
+            of a document that contains none of the query tokens.
         """
         k = self.bm25_parameters.get("k1", 1.5)
         b = self.bm25_parameters.get("b", 0.75)
         delta = self.bm25_parameters.get("delta", 1.0)
 
-        def _compute_idf(tokens: list[str]) -> dict[str, float]:
+        def _compute_idf(n_corpus: int, n: int) -> float:
             """Per-token IDF computation."""
-            idf = {}
-            n_corpus = len(self._bm25_attr)
-            for tok in tokens:
-                n = self._freq_vocab_for_idf.get(tok, 0)
-                idf[tok] = math.log(1 + (n_corpus - n + 0.5) / (n + 0.5)) * int(n != 0)
-            return idf
+            return math.log(1 + (n_corpus - n + 0.5) / (n + 0.5)) * int(n != 0)
 
         def _compute_tf(token: str, freq: dict[str, int], doc_len: float) -> float:
             """Per-token normalized term frequency."""
@@ -328,21 +547,76 @@ class InMemoryDocumentStore:
             freq_damp = k * (1 - b + b * doc_len / self._avg_doc_len)
             return freq_term * (1.0 + k) / (freq_term + freq_damp) + delta
 
-        idf = _compute_idf(self._tokenize_bm25(query))
-        bm25_attr = {doc.id: self._bm25_attr[doc.id] for doc in documents}
+        idf = self._cached_idf(query_tokens, _compute_idf)
+        return self._score_bm25_documents(idf, _compute_tf, documents)
+
+    def _cached_idf(self, tokens: list[str], compute_idf: Callable[[int, int], float]) -> dict[str, float]:
+        """
+        Returns the IDF of each token, computing it only for the tokens not seen since the corpus last changed.
+
+        :param tokens: The tokens to get the IDF of.
+        :param compute_idf: Computes the IDF of a token given the number of documents in the corpus
+            and the number of documents containing the token. Only called for tokens of the vocabulary.
+        :returns: The IDF of each token, 0 for tokens out of the vocabulary.
+        """
+        version, cache = self._idf_cache
+        if version != self._corpus_version:
+            # the cache is replaced rather than cleared, concurrent queries may be reading it
+            cache = {}
+            self._idf_cache = (self._corpus_version, cache)
+
+        idf = {}
+        n_corpus, freq_vocab_for_idf = self._bm25_corpus_size, self._freq_vocab_for_idf
+        for tok in tokens:
+            tok_idf = cache.get(tok)
+            if tok_idf is None:
+                if tok not in freq_vocab_for_idf:
+                    # tokens out of the vocabulary aren't cached, there's no bound on their number
+                    idf[tok] = 0.0
+                    continue
+                tok_idf = cache[tok] = compute_idf(n_corpus, freq_vocab_for_idf[tok])
+            idf[tok] = tok_idf
+        return idf
+
+    def _score_bm25_documents(
+        self, idf: dict[str, float], compute_tf: Callable[[str, dict[str, int], Any], float], documents: list[Document]
+    ) -> tuple[list[tuple[Document, float]], float]:
+        """
+        Score documents given the per-token IDF and the term frequency function of a BM25 variant.
+
+        The term frequency component of every BM25 variant doesn't depend on the document length
+        when the token doesn't occur in the document, so all the documents that contain none of the
+        query tokens share the same score. We return it along with the scored documents so that
+        the caller doesn't need to score them one by one.
 
+        :param idf: The IDF of each query token.
+        :param compute_tf: The term frequency function of the BM25 variant.
+        :param documents: The list of documents to score.
+        :returns:
+            A tuple with a list of tuples, each containing a Document and its score, and the score
+            of a document that contains none of the query tokens.
+        """
         ret = []
         for doc in documents:
-            doc_stats = bm25_attr[doc.id]
+            doc_stats = self._bm25_attr[doc.id]
             freq = doc_stats.freq_token
             doc_len = doc_stats.doc_len
 
             score = 0.0
-            for tok in idf.keys():  # pylint: disable=consider-using-dict-items
-                score += idf[tok] * _compute_tf(tok, freq, doc_len)
+            for tok, tok_idf in idf.items():
+                score += tok_idf * compute_tf(tok, freq, doc_len)
             ret.append((doc, score))
 
-        return ret
+        # Tokens with a zero IDF don't contribute to the score. When the average document length is 0, no Document
+        # has any token and the score is 0, computing it would divide by the average document length.
+        empty_doc_score = 0.0
+        if self._avg_doc_len == 0:
+            return ret, empty_doc_score
+        for tok, tok_idf in idf.items():
+            if tok_idf != 0.0:
+                empty_doc_score += tok_idf * compute_tf(tok, {}, self._avg_doc_len)
+
+        return ret, empty_doc_score
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -359,6 +633,15 @@ class InMemoryDocumentStore:
             embedding_similarity_function=self.embedding_similarity_function,
             index=self.index,
             return_embedding=self.return_embedding,
+            embedding_index_type=self.embedding_index_type,
+            embedding_index_parameters=self.embedding_index_parameters,
+            metadata_indexes=self.metadata_indexes,
+            wal_directory=self.wal_directory,
+            wal_compaction_threshold=self.wal_compaction_threshold,
+            embedding_quantization=self.embedding_quantization,
+            embedding_quantization_parameters=self.embedding_quantization_parameters,
+            bm25_tokenization_workers=self.bm25_tokenization_workers,
+            bm25_tokenizer=self.bm25_tokenizer.to_dict() if self.bm25_tokenizer is not None else None,
         )
 
     @classmethod
@@ -371,27 +654,66 @@ class InMemoryDocumentStore:
         :returns:
             The deserialized component.
         """
-        return default_from_dict(cls, data)
+        # the data is not modified, snapshots compare it with the tokenizer of the store they are restored to
+        init_params = deserialize_bm25_tokenizer_in_init_params(data.get("init_parameters", {}))
+        return default_from_dict(cls, {**data, "init_parameters": init_params})
 
-    def save_to_disk(self, path: str) -> None:
+    def save_to_disk(self, path: str, file_format: Literal["json", "binary"] = "json") -> None:
         """
-        Write the database and its' data to disk as a JSON file.
-
-        :param path: The path to the JSON file.
+        Write the database and its' data to disk.
+
+        :param path: The path to the JSON file, or to the directory of the binary snapshot.
+        :param file_format: The format to write the data in.
+            "json" (default) writes a single JSON file with the serialized Documents.
+            "binary" writes a snapshot directory where the embeddings are stored as a raw float32 array and the
+            BM25 statistics are persisted, so that loading the store doesn't need to parse the embeddings nor
+            tokenize the Documents again. Embeddings are stored with float32 precision.
         """
+        if file_format == "binary":
+            # the snapshot is taken under the lock, writing it to disk doesn't block writers
+            with self._lock.read():
+                snapshot = self._create_snapshot()
+            write_snapshot(path, snapshot)
+            return
+        if file_format != "json":
+            raise ValueError(f"File format '{file_format}' is not supported.")
+
         data: dict[str, Any] = self.to_dict()
-        data["documents"] = [doc.to_dict(flatten=False) for doc in self.storage.values()]
+        with self._lock.read():
+            data["documents"] = [self._with_embedding(doc).to_dict(flatten=False) for doc in self.storage.values()]
+            if self._embedding_matrix.ivf is not None:
+                data["embedding_index"] = self._embedding_matrix.ivf.to_dict()
+            if self._embedding_matrix.quantizer is not None:
+                data["embedding_quantization"] = self._embedding_matrix.quantizer.to_dict()
         with open(path, "w") as f:
             json.dump(data, f)
 
     @classmethod
     def load_from_disk(cls, path: str) -> "InMemoryDocumentStore":
         """
-        Load the database and its' data from disk as a JSON file.
+        Load the database and its' data from disk.
 
-        :param path: The path to the JSON file.
+        :param path: The path to the JSON file, to the directory of a binary snapshot, or to the `wal_directory`
+            of a store persisted with a write-ahead log. The format is detected automatically.
         :returns: The loaded InMemoryDocumentStore.
         """
+        if WriteAheadLog.exists(path):
+            # the store restores its data from the write-ahead log when initialized
+            snapshot_path = WriteAheadLog(path).latest_snapshot()
+            if snapshot_path is None:
+                raise DocumentStoreError(f"No snapshot found in the write-ahead log directory {path}.")
+            # only the manifest is read here, the store restores the whole snapshot when initialized
+            data = read_snapshot_manifest(snapshot_path)["store"]
+            data["init_parameters"]["wal_directory"] = str(path)
+            return cls.from_dict(data)
+
+        if is_snapshot(path):
+            snapshot = read_snapshot(path)
+            cls_object = cls.from_dict(snapshot.manifest["store"])
+            with cls_object._lock.write():
+                cls_object._restore_snapshot(snapshot)
+            return cls_object
+
         if Path(path).exists():
             try:
                 with open(path, "r") as f:
@@ -400,7 +722,10 @@ class InMemoryDocumentStore:
                 raise Exception(f"Error loading InMemoryDocumentStore from disk. error: {e}")
 
             documents = data.pop("documents")
-            cls_object = default_from_dict(cls, data)
+            embedding_index = data.pop("embedding_index", None)
+            embedding_quantization = data.pop("embedding_quantization", None)
+            cls_object = cls.from_dict(data)
+            cls_object._load_embedding_index_state(embedding_index, embedding_quantization)
             cls_object.write_documents(
                 documents=[Document(**doc) for doc in documents], policy=DuplicatePolicy.OVERWRITE
             )
@@ -409,11 +734,214 @@ class InMemoryDocumentStore:
         else:
             raise FileNotFoundError(f"File {path} not found.")
 
-    def count_documents(self) -> int:
+    def _load_embedding_index_state(
+        self, embedding_index: Optional[dict[str, Any]], embedding_quantization: Optional[dict[str, Any]] = None
+    ) -> None:
+        """
+        Restores the trained state of the IVF index and of the embedding quantizer, if any.
+
+        Restoring it before writing the Documents avoids training it again.
+        """
+        ivf = self._embedding_matrix.ivf
+        if embedding_index is not None and ivf is not None and not ivf.is_trained:
+            ivf.load_state(embedding_index)
+        quantizer = self._embedding_matrix.quantizer
+        if embedding_quantization is not None and quantizer is not None and not quantizer.is_trained:
+            quantizer.load_state(embedding_quantization)
+
+    def _create_snapshot(self) -> StoreSnapshot:
+        """
+        Creates a binary snapshot of the store.
+        """
+        documents = list(self.storage.values())
+        positions = {doc.id: position for position, doc in enumerate(documents)}
+
+        matrix = self._embedding_matrix
+        embedding_ids = [doc.id for doc in documents if doc.id in matrix]
+        # the quantized embeddings are lossy, the snapshot stores the original ones
+        embeddings = matrix.original_vectors(matrix.rows(embedding_ids))
+        embedding_rows = np.full(len(documents), -1, dtype=np.int64)
+        embedding_rows[[positions[doc_id] for doc_id in embedding_ids]] = np.arange(len(embedding_ids))
+
+        # the embeddings stored in the matrix are left out before serializing, instead of being copied and dropped
+        records = []
+        for doc in documents:
+            record_doc = replace(doc, embedding=None) if doc.embedding is not None and doc.id in matrix else doc
+            records.append(record_doc.to_dict(flatten=False))
+
+        # Tokens are saved in the order they were first seen, so the vocabulary of the loaded store is the same
+        # as if the Documents were written again.
+        tokens: dict[str, None] = {}
+        for doc in documents:
+            tokens.update(dict.fromkeys(self._bm25_attr[doc.id].freq_token))
+        postings = [self._bm25_postings.get(tok, {}) for tok in tokens]
+
+        return StoreSnapshot(
+            manifest={
+                "store": self.to_dict(),
+                "avg_doc_len": self._avg_doc_len,
+                "embedding_index": matrix.ivf.to_dict() if matrix.ivf is not None else None,
+                "embedding_quantization": matrix.quantizer.to_dict() if matrix.quantizer is not None else None,
+            },
+            records=records,
+            embeddings=embeddings,
+            embedding_rows=embedding_rows,
+            bm25_tokens=list(tokens),
+            bm25_doc_lens=np.array([self._bm25_attr[doc.id].doc_len for doc in documents], dtype=np.int64),
+            bm25_postings_offsets=np.cumsum([0] + [len(posting) for posting in postings], dtype=np.int64),
+            bm25_postings_documents=np.array(
+                [positions[doc_id] for posting in postings for doc_id in posting], dtype=np.int64
+            ),
+            bm25_postings_frequencies=np.array(
+                [freq for posting in postings for freq in posting.values()], dtype=np.int64
+            ),
+        )
+
+    def _restore_snapshot(self, snapshot: StoreSnapshot) -> None:
+        """
+        Restores the Documents of a binary snapshot.
+
+        The BM25 statistics and the embedding matrix are restored as they were saved. The embedding matrix uses the
+        memory-mapped embeddings of the snapshot, the restored Documents don't hold a copy of them: their embedding
+        is attached when they're returned. If the index of the store already contains Documents, or if it tokenizes
+        Documents differently, the Documents are written instead.
+        """
+        self._load_embedding_index_state(
+            snapshot.manifest.get("embedding_index"), snapshot.manifest.get("embedding_quantization")
+        )
+
+        documents = [Document.from_dict(record) for record in snapshot.records]
+
+        # the BM25 statistics of the snapshot can only be reused if the Documents are tokenized the same way
+        snapshot_parameters = snapshot.manifest["store"]["init_parameters"]
+        init_parameters = self.to_dict()["init_parameters"]
+        same_tokenization = all(
+            snapshot_parameters.get(parameter) == init_parameters[parameter]
+            for parameter in ("bm25_tokenization_regex", "bm25_tokenizer")
+        )
+        if self.storage or not same_tokenization:
+            for doc, row in zip(documents, snapshot.embedding_rows.tolist()):
+                if row >= 0:
+                    doc.embedding = snapshot.embeddings[row].tolist()
+            self.write_documents(documents=documents, policy=DuplicatePolicy.OVERWRITE)
+            return
+
+        doc_ids = [doc.id for doc in documents]
+        storage, metadata_index = self.storage, self._metadata_index
+        bm25_attr, bm25_postings = self._bm25_attr, self._bm25_postings
+        freq_vocab_for_idf = self._freq_vocab_for_idf
+        sparse_embedding_index = self._sparse_embedding_index
+        for doc, doc_len in zip(documents, snapshot.bm25_doc_lens.tolist()):
+            storage[doc.id] = doc
+            metadata_index.add(doc)
+            if doc.sparse_embedding is not None:
+                sparse_embedding_index.add(doc.id, doc.sparse_embedding)
+            bm25_attr[doc.id] = BM25DocumentStats({}, doc_len)
+
+        freq_tokens = [bm25_attr[doc_id].freq_token for doc_id in doc_ids]
+        offsets = snapshot.bm25_postings_offsets.tolist()
+        postings_documents = snapshot.bm25_postings_documents.tolist()
+        postings_frequencies = snapshot.bm25_postings_frequencies.tolist()
+        for i, tok in enumerate(snapshot.bm25_tokens):
+            start, end = offsets[i], offsets[i + 1]
+            postings = {}
+            for position, freq in zip(postings_documents[start:end], postings_frequencies[start:end]):
+                postings[doc_ids[position]] = freq
+                freq_tokens[position][tok] = freq
+            bm25_postings[tok] = postings
+            freq_vocab_for_idf[tok] = len(postings)
+        self._avg_doc_len = snapshot.manifest["avg_doc_len"]
+        self._bump_corpus_version()
+
+        matrix = self._embedding_matrix
+        rows = snapshot.embedding_rows
+        matrix.load([doc_ids[position] for position in np.flatnonzero(rows >= 0)], snapshot.embeddings)
+        for doc, row in zip(documents, rows.tolist()):
+            # embeddings whose size differs from the others are kept in the records
+            if row < 0 and doc.embedding is not None:
+                matrix.add(doc.id, doc.embedding)
+        matrix.train_ivf_index_if_needed()
+
+    def _open_wal(self, directory: str) -> None:
+        """
+        Restores the Documents persisted in a write-ahead log directory and starts logging to it.
+
+        The latest snapshot is restored and the operations logged after it are replayed. If the directory doesn't
+        contain a snapshot yet, one is written so that the store can be loaded with `load_from_disk`.
+        """
+        wal = WriteAheadLog(directory)
+        snapshot_path = wal.latest_snapshot()
+        if snapshot_path is not None:
+            self._restore_snapshot(read_snapshot(snapshot_path))
+        for entry in wal.entries():
+            if entry["operation"] == "write":
+                documents = [Document.from_dict(doc) for doc in entry["documents"]]
+                self.write_documents(documents, policy=DuplicatePolicy.OVERWRITE)
+            elif entry["operation"] == "delete":
+                self.delete_documents(entry["document_ids"])
+            elif entry["operation"] == "update":
+                with self._lock.write():
+                    self._update_documents(entry["document_ids"], entry["meta"])
+
+        self._wal = wal
+        if snapshot_path is None:
+            self._compact_wal()
+
+    def _log_to_wal(self, operation: str, **payload: Any) -> None:
+        """
+        Appends an operation to the write-ahead log, if any, and flushes it to disk.
+
+        Must be called under the write lock before the operation is applied, so that an operation that fails to be
+        logged is not applied either.
+        """
+        if self._wal is None:
+            return
+        self._wal.append(operation, **payload)
+
+    def _compact_wal_if_needed(self) -> None:
+        """
+        Compacts the write-ahead log once enough Documents have been written or deleted since the latest snapshot.
+
+        Called after the write lock is released, the snapshot is then taken under the read lock.
+        """
+        if self._wal is not None and self._wal.pending_changes >= self.wal_compaction_threshold:
+            self._compact_wal()
+
+    def _compact_wal(self) -> None:
+        """
+        Writes a snapshot of the store including all the logged operations and truncates the write-ahead log.
+
+        The snapshot is taken under the read lock, so it doesn't block readers, and is written to disk without
+        holding the lock. Operations logged meanwhile are kept in the log. If another thread is already compacting
+        the log, this call returns right away.
+        """
+        if self._wal is None or not self._wal_compaction_lock.acquire(blocking=False):
+            return
+        try:
+            with self._lock.read():
+                sequence = self._wal.sequence
+                snapshot = self._create_snapshot()
+            write_snapshot(self._wal.snapshot_path(sequence), snapshot)
+            self._wal.compacted(sequence)
+        finally:
+            self._wal_compaction_lock.release()
+
+    def count_documents(self, filters: Optional[dict[str, Any]] = None) -> int:
         """
         Returns the number of how many documents are present in the DocumentStore.
+
+        :param filters: If provided, only the documents that match the filters are counted. They are counted without
+            creating the list of matching Documents, using the metadata indexes if possible.
+        :returns: The number of documents.
         """
-        return len(self.storage.keys())
+        if filters and "operator" not in filters and "conditions" not in filters:
+            raise ValueError(
+                "Invalid filter syntax. See https://docs.haystack.deepset.ai/docs/metadata-filtering for details."
+            )
+        with self._lock.read():
+            if filters:
+                return len(self._filter_document_ids(filters))
+            return len(self.storage.keys())
 
     def filter_documents(self, filters: Optional[dict[str, Any]] = None) -> list[Document]:
         """
@@ -430,15 +958,84 @@ class InMemoryDocumentStore:
                 raise ValueError(
                     "Invalid filter syntax. See https://docs.haystack.deepset.ai/docs/metadata-filtering for details."
                 )
-            docs = [doc for doc in self.storage.values() if document_matches_filter(filters=filters, document=doc)]
-        else:
-            docs = list(self.storage.values())
+            with self._lock.read():
+                docs = self._filter_documents(filters)
+                return self._documents_to_return(docs)
+        with self._lock.read():
+            return self._documents_to_return(list(self.storage.values()))
+
+    def _documents_to_return(self, documents: list[Document]) -> list[Document]:
+        """
+        Returns the stored Documents with their embedding if `return_embedding` is set, and without it otherwise.
+
+        The stored Documents are only copied if their embedding must be attached or left out.
+        """
+        if self.return_embedding:
+            return [self._with_embedding(doc) for doc in documents]
+        return [doc if doc.embedding is None else replace(doc, embedding=None) for doc in documents]
 
-        if not self.return_embedding:
-            for doc in docs:
-                doc.embedding = None
+    def _with_embedding(self, document: Document) -> Document:
+        """
+        Returns a stored Document with its embedding.
+
+        When the embeddings are quantized, the original embedding of a Document is only kept by the embedding
+        matrix, the Document is then copied to attach it.
+        """
+        if document.embedding is None and document.id in self._embedding_matrix:
+            return replace(document, embedding=self._embedding_matrix.embedding(document.id))
+        return document
 
-        return docs
+    def _detach_embeddings(self, document_ids: Iterable[str]) -> None:
+        """
+        Replaces the stored Documents whose embedding is kept by a quantized embedding matrix with copies without it.
+
+        Their embedding is attached again by `_with_embedding` when they're returned.
+        """
+        storage, matrix = self.storage, self._embedding_matrix
+        if not matrix.is_quantized:
+            return
+        for doc_id in document_ids:
+            document = storage[doc_id]
+            if document.embedding is not None and doc_id in matrix:
+                storage[doc_id] = replace(document, embedding=None)
+
+    def _filter_documents(self, filters: dict[str, Any]) -> list[Document]:
+        """
+        Returns the stored documents that match the filters, in the order they were written.
+
+        When the filters involve indexed fields, only the documents returned by the metadata indexes are evaluated,
+        and not even those the indexes know to match.
+
+        :param filters: The filters to apply.
+        :returns: A list of Documents that match the given filters.
+        """
+        matches_filters = compile_filter(filters)
+        plan = self._metadata_index.plan(filters)
+        if plan is None:
+            return [doc for doc in self.storage.values() if matches_filters(doc)]
+        candidate_ids, unverified_ids = plan
+        documents = (self.storage[doc_id] for doc_id in self._metadata_index.sort(candidate_ids))
+        return [doc for doc in documents if doc.id not in unverified_ids or matches_filters(doc)]
+
+    def _filter_document_ids(self, filters: dict[str, Any]) -> list[str]:
+        """
+        Returns the ids of the stored documents that match the filters, in no particular order.
+
+        Cheaper than `_filter_documents` when the order doesn't matter, the candidates returned by the metadata
+        indexes don't need to be sorted.
+
+        :param filters: The filters to apply.
+        :returns: A list with the ids of the Documents that match the given filters.
+        """
+        matches_filters = compile_filter(filters)
+        plan = self._metadata_index.plan(filters)
+        if plan is None:
+            return [doc_id for doc_id, doc in self.storage.items() if matches_filters(doc)]
+        candidate_ids, unverified_ids = plan
+        if not unverified_ids:
+            return list(candidate_ids)
+        storage = self.storage
+        return [doc_id for doc_id in candidate_ids if doc_id not in unverified_ids or matches_filters(storage[doc_id])]
 
     def write_documents(self, documents: list[Document], policy: DuplicatePolicy = DuplicatePolicy.NONE) -> int:
         """
@@ -456,32 +1053,86 @@ class InMemoryDocumentStore:
         if policy == DuplicatePolicy.NONE:
             policy = DuplicatePolicy.FAIL
 
-        written_documents = len(documents)
-        for document in documents:
-            if policy != DuplicatePolicy.OVERWRITE and document.id in self.storage.keys():
-                if policy == DuplicatePolicy.FAIL:
-                    raise DuplicateDocumentError(f"ID '{document.id}' already exists.")
-                if policy == DuplicatePolicy.SKIP:
-                    logger.warning("ID '{document_id}' already exists", document_id=document.id)
-                    written_documents -= 1
-                    continue
-
-            # Since the statistics are updated in an incremental manner,
-            # we need to explicitly remove the existing document to revert
-            # the statistics before updating them with the new document.
-            if document.id in self.storage.keys():
-                self.delete_documents([document.id])
+        # Tokenizing is the most expensive part of writing, it's done before acquiring the lock
+        counted_texts = iter(
+            self._count_bm25_tokens([document.content for document in documents if document.content is not None])
+        )
+        freq_tokens = [next(counted_texts) if document.content is not None else Counter() for document in documents]
 
-            tokens = []
-            if document.content is not None:
-                tokens = self._tokenize_bm25(document.content)
+        with self._lock.write():
+            written_documents = len(documents)
+            # Documents to write, with their token frequencies, and stored Documents they overwrite
+            pending: dict[str, tuple[Document, Counter]] = {}
+            overwritten_ids: list[str] = []
+            try:
+                for document, freq_token in zip(documents, freq_tokens):
+                    exists = document.id in pending or document.id in self.storage
+                    if policy != DuplicatePolicy.OVERWRITE and exists:
+                        if policy == DuplicatePolicy.FAIL:
+                            raise DuplicateDocumentError(f"ID '{document.id}' already exists.")
+                        if policy == DuplicatePolicy.SKIP:
+                            logger.warning("ID '{document_id}' already exists", document_id=document.id)
+                            written_documents -= 1
+                            continue
+
+                    if document.id in pending:
+                        # the latest version is written after the other Documents, like a stored Document would be
+                        del pending[document.id]
+                    elif document.id in self.storage:
+                        overwritten_ids.append(document.id)
+                    pending[document.id] = (document, freq_token)
+            finally:
+                # Documents before a failure are written, they're logged before being added to the store
+                if pending and self._wal is not None:
+                    self._log_to_wal("write", documents=[doc.to_dict(flatten=False) for doc, _ in pending.values()])
+                if pending:
+                    self._add_documents(list(pending.values()), overwritten_ids)
+        self._compact_wal_if_needed()
+        return written_documents
 
-            self.storage[document.id] = document
+    def _add_documents(self, documents: list[tuple[Document, Counter]], overwritten_ids: list[str]) -> None:
+        """
+        Adds Documents to the store and updates the BM25 statistics once for all of them.
 
-            self._bm25_attr[document.id] = BM25DocumentStats(Counter(tokens), len(tokens))
-            self._freq_vocab_for_idf.update(set(tokens))
-            self._avg_doc_len = (len(tokens) + self._avg_doc_len * len(self._bm25_attr)) / (len(self._bm25_attr) + 1)
-        return written_documents
+        :param documents: The Documents to add with the frequency of their tokens. Their ids must not be stored,
+            except for the ones in `overwritten_ids`.
+        :param overwritten_ids: The ids of the stored Documents to replace.
+        """
+        # Since the statistics are updated in an incremental manner,
+        # we need to explicitly remove the existing documents to revert
+        # the statistics before updating them with the new documents.
+        self._delete_documents(overwritten_ids)
+
+        storage, metadata_index = self.storage, self._metadata_index
+        embedding_matrix, sparse_embedding_index = self._embedding_matrix, self._sparse_embedding_index
+        bm25_attr, bm25_postings = self._bm25_attr, self._bm25_postings
+        n_documents = len(bm25_attr)
+        was_quantized = embedding_matrix.is_quantized
+        for document, freq_token in documents:
+            storage[document.id] = document
+            metadata_index.add(document)
+            if document.embedding is not None:
+                embedding_matrix.add(document.id, document.embedding)
+            if document.sparse_embedding is not None:
+                sparse_embedding_index.add(document.id, document.sparse_embedding)
+
+            bm25_attr[document.id] = BM25DocumentStats(freq_token, sum(freq_token.values()))
+            for tok, freq in freq_token.items():
+                postings = bm25_postings.get(tok)
+                if postings is None:
+                    bm25_postings[tok] = {document.id: freq}
+                else:
+                    postings[document.id] = freq
+
+        # the IVF index is trained by writers, under the write lock, so that queries only read it
+        embedding_matrix.train_ivf_index_if_needed()
+        # once quantized, the embedding matrix is the only copy of the embeddings, including the ones written before
+        self._detach_embeddings([document.id for document, _ in documents] if was_quantized else list(storage))
+        self._bump_corpus_version()
+        # the document frequencies of the batch are merged into the vocabulary at once
+        self._freq_vocab_for_idf.update(Counter(chain.from_iterable(freq_token for _, freq_token in documents)))
+        total_len = sum(bm25_attr[document.id].doc_len for document, _ in documents)
+        self._avg_doc_len = (self._avg_doc_len * n_documents + total_len) / (n_documents + len(documents))
 
     def delete_documents(self, document_ids: list[str]) -> None:
         """
@@ -489,21 +1140,131 @@ class InMemoryDocumentStore:
 
         :param document_ids: The object_ids to delete.
         """
+        with self._lock.write():
+            if document_ids:
+                self._log_to_wal("delete", document_ids=list(document_ids))
+            self._delete_documents(document_ids)
+        self._compact_wal_if_needed()
+
+    def _delete_documents(self, document_ids: Iterable[str]) -> None:
+        """
+        Deletes the documents with matching document_ids and reverts the BM25 statistics once for all of them.
+
+        :param document_ids: The object_ids to delete.
+        """
+        storage, metadata_index = self.storage, self._metadata_index
+        embedding_matrix, sparse_embedding_index = self._embedding_matrix, self._sparse_embedding_index
+        bm25_attr, bm25_postings = self._bm25_attr, self._bm25_postings
+        deleted_stats: list[BM25DocumentStats] = []
         for doc_id in document_ids:
-            if doc_id not in self.storage.keys():
+            if doc_id not in storage:
                 continue
-            del self.storage[doc_id]
+            del storage[doc_id]
+            metadata_index.remove(doc_id)
+            embedding_matrix.remove(doc_id)
+            sparse_embedding_index.remove(doc_id)
+
+            doc_stats = bm25_attr.pop(doc_id)
+            deleted_stats.append(doc_stats)
+            for tok in doc_stats.freq_token:
+                postings = bm25_postings.get(tok)
+                if postings is None:
+                    continue
+                postings.pop(doc_id, None)
+                if not postings:
+                    del bm25_postings[tok]
+
+        if not deleted_stats:
+            return
+        embedding_matrix.train_ivf_index_if_needed()
+        self._bump_corpus_version()
+        # the document frequencies of the deleted Documents are removed from the vocabulary at once
+        deleted_freq = Counter(chain.from_iterable(stats.freq_token for stats in deleted_stats))
+        freq_vocab_for_idf = self._freq_vocab_for_idf
+        freq_vocab_for_idf.subtract(deleted_freq)
+        # tokens left in no Document are removed, they must not count as part of the vocabulary
+        for tok in deleted_freq:
+            if freq_vocab_for_idf[tok] <= 0:
+                del freq_vocab_for_idf[tok]
+        n_documents = len(bm25_attr)
+        if n_documents == 0:
+            self._avg_doc_len = 0.0
+        else:
+            total_len = self._avg_doc_len * (n_documents + len(deleted_stats))
+            self._avg_doc_len = (total_len - sum(stats.doc_len for stats in deleted_stats)) / n_documents
 
-            # Update statistics accordingly
-            doc_stats = self._bm25_attr.pop(doc_id)
-            freq = doc_stats.freq_token
-            doc_len = doc_stats.doc_len
+    def delete_by_filter(self, filters: dict[str, Any]) -> int:
+        """
+        Deletes the documents that match the filters.
 
-            self._freq_vocab_for_idf.subtract(Counter(freq.keys()))
-            try:
-                self._avg_doc_len = (self._avg_doc_len * (len(self._bm25_attr) + 1) - doc_len) / len(self._bm25_attr)
-            except ZeroDivisionError:
-                self._avg_doc_len = 0
+        The matching documents are found and deleted in a single pass under the write lock, using the metadata
+        indexes if possible, and the BM25 statistics are updated once for all of them.
+
+        For a detailed specification of the filters, refer to the DocumentStore.filter_documents() protocol
+        documentation.
+
+        :param filters: The filters to apply to select the documents to delete.
+        :returns: The number of deleted documents.
+        """
+        if not filters or ("operator" not in filters and "conditions" not in filters):
+            raise ValueError(
+                "Invalid filter syntax. See https://docs.haystack.deepset.ai/docs/metadata-filtering for details."
+            )
+        with self._lock.write():
+            document_ids = self._filter_document_ids(filters)
+            if document_ids:
+                self._log_to_wal("delete", document_ids=document_ids)
+            self._delete_documents(document_ids)
+        self._compact_wal_if_needed()
+        return len(document_ids)
+
+    def update_by_filter(self, filters: dict[str, Any], meta: dict[str, Any]) -> int:
+        """
+        Updates the metadata of the documents that match the filters.
+
+        The keys of `meta` are added to the metadata of the matching documents, replacing the existing values.
+        The documents keep their ids and their position in the store, and as only the metadata changes, the BM25
+        statistics and the embedding indexes are left untouched.
+
+        For a detailed specification of the filters, refer to the DocumentStore.filter_documents() protocol
+        documentation.
+
+        :param filters: The filters to apply to select the documents to update.
+        :param meta: The metadata fields to set on the matching documents.
+        :returns: The number of updated documents.
+        """
+        if not filters or ("operator" not in filters and "conditions" not in filters):
+            raise ValueError(
+                "Invalid filter syntax. See https://docs.haystack.deepset.ai/docs/metadata-filtering for details."
+            )
+        if not isinstance(meta, dict):
+            raise ValueError("meta must be a dictionary.")
+        with self._lock.write():
+            document_ids = self._filter_document_ids(filters)
+            if document_ids:
+                self._log_to_wal("update", document_ids=document_ids, meta=meta)
+            self._update_documents(document_ids, meta)
+        self._compact_wal_if_needed()
+        return len(document_ids)
+
+    def _update_documents(self, document_ids: Iterable[str], meta: dict[str, Any]) -> None:
+        """
+        Updates the metadata of the documents with matching document_ids.
+
+        The stored Documents are replaced with updated copies, so that the Documents previously returned by
+        `filter_documents` are not modified.
+
+        :param document_ids: The object_ids to update.
+        :param meta: The metadata fields to set.
+        """
+        storage, metadata_index = self.storage, self._metadata_index
+        for doc_id in document_ids:
+            document = storage.get(doc_id)
+            if document is None:
+                continue
+            updated = replace(document, meta={**document.meta, **meta})
+            storage[doc_id] = updated
+            metadata_index.update(updated)
 
     def bm25_retrieval(
         self, query: str, filters: Optional[dict[str, Any]] = None, top_k: int = 10, scale_score: bool = False
@@ -520,30 +1281,112 @@ class InMemoryDocumentStore:
         if not query:
             raise ValueError("Query should be a non-empty string")
 
+        with self._lock.read():
+            candidate_documents = self._bm25_candidate_documents(filters)
+            return self._bm25_retrieval(query, candidate_documents, top_k, scale_score)
+
+    def bm25_retrieval_batch(
+        self, queries: list[str], filters: Optional[dict[str, Any]] = None, top_k: int = 10, scale_score: bool = False
+    ) -> list[list[Document]]:
+        """
+        Retrieves the documents that are most relevant to each query using BM25 algorithm.
+
+        The filters are evaluated once for all the queries.
+
+        :param queries: The query strings.
+        :param filters: A dictionary with filters to narrow down the search space of all the queries.
+        :param top_k: The number of top documents to retrieve for each query. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved documents. Default is False.
+        :returns: A list with the top_k documents most relevant to each query, in the same order as `queries`.
+        """
+        if not all(queries):
+            raise ValueError("Query should be a non-empty string")
+
+        with self._lock.read():
+            candidate_documents = self._bm25_candidate_documents(filters)
+            return [self._bm25_retrieval(query, candidate_documents, top_k, scale_score) for query in queries]
+
+    def _bm25_candidate_documents(self, filters: Optional[dict[str, Any]]) -> Optional[list[Document]]:
+        """
+        Returns the documents with content matching the filters, or `None` if there are no filters.
+        """
+        if not filters:
+            return None
+        if "operator" not in filters:
+            raise ValueError(
+                "Invalid filter syntax. See https://docs.haystack.deepset.ai/docs/metadata-filtering for details."
+            )
         content_type_filter = {"field": "content", "operator": "!=", "value": None}
-        if filters:
-            if "operator" not in filters:
-                raise ValueError(
-                    "Invalid filter syntax. See https://docs.haystack.deepset.ai/docs/metadata-filtering for details."
-                )
-            filters = {"operator": "AND", "conditions": [content_type_filter, filters]}
+        return self._filter_documents(filters={"operator": "AND", "conditions": [content_type_filter, filters]})
+
+    def _bm25_retrieval(
+        self, query: str, filtered_documents: Optional[list[Document]], top_k: int, scale_score: bool
+    ) -> list[Document]:
+        """
+        Retrieves the documents that are most relevant to the query among the filtered documents.
+
+        :param filtered_documents: The documents matching the filters, or `None` to search all documents with content.
+        """
+        changes: dict[str, Any] = {} if self.return_embedding else {"embedding": None}
+        return [
+            self._copy_with_score(doc, score, **changes)
+            for doc, score in self._bm25_top_documents(query, filtered_documents, top_k, scale_score)
+        ]
+
+    def _bm25_top_documents(
+        self, query: str, filtered_documents: Optional[list[Document]], top_k: int, scale_score: bool
+    ) -> list[tuple[Document, float]]:
+        """
+        Finds the stored documents most relevant to the query among the filtered documents, without copying them.
+
+        :param filtered_documents: The documents matching the filters, or `None` to search all documents with content.
+        :returns: The top_k stored documents with their BM25 score, from the most relevant.
+        """
+        candidate_documents: Iterable[Document]
+        if filtered_documents is not None:
+            candidate_documents = filtered_documents
         else:
-            filters = content_type_filter
+            candidate_documents = (doc for doc in self.storage.values() if doc.content is not None)
 
-        all_documents = self.filter_documents(filters=filters)
-        if len(all_documents) == 0:
-            logger.info("No documents found for BM25 retrieval. Returning empty list.")
-            return []
+        query_tokens = self._tokenize_bm25(query)
+
+        # Only the documents containing at least one query token need to be scored individually,
+        # we look them up in the inverted index instead of scoring the whole corpus.
+        matching_ids: dict[str, None] = {}
+        for tok in query_tokens:
+            matching_ids.update(dict.fromkeys(self._bm25_postings.get(tok, {})))
+        if filtered_documents is not None:
+            matching_documents = [doc for doc in filtered_documents if doc.id in matching_ids]
+        else:
+            matching_documents = [self.storage[doc_id] for doc_id in matching_ids]
 
-        results = sorted(self.bm25_algorithm_inst(query, all_documents), key=lambda x: x[1], reverse=True)[:top_k]
+        scored_documents, non_matching_score = self.bm25_algorithm_inst(query_tokens, matching_documents)
+        # only the top_k best scoring documents can make it to the results, the others don't need to be sorted
+        scored_documents = top_k_items(scored_documents, top_k, key=lambda x: x[1])
 
         # BM25Okapi can return meaningful negative values, so they should not be filtered out when scale_score is False.
         # It's the only algorithm supported by rank_bm25 at the time of writing (2024) that can return negative scores.
         # see https://github.com/deepset-ai/haystack/pull/6889 for more context.
         negatives_are_valid = self.bm25_algorithm == "BM25Okapi" and not scale_score
 
-        # Create documents with the BM25 score to return them
-        return_documents = []
+        # Documents without any query token all share the same score, they only end up in the results
+        # if there aren't enough matching documents scoring at least as high and if their score is not discarded.
+        results = [(doc, score) for doc, score in scored_documents if score >= non_matching_score][:top_k]
+        if len(results) < top_k and (scale_score or negatives_are_valid or non_matching_score > 0.0):
+            non_matching_documents = (doc for doc in candidate_documents if doc.id not in matching_ids)
+            for doc in non_matching_documents:
+                if len(results) == top_k:
+                    break
+                results.append((doc, non_matching_score))
+            results.extend(
+                [(doc, score) for doc, score in scored_documents if score < non_matching_score][: top_k - len(results)]
+            )
+
+        if len(results) == 0:
+            logger.info("No documents found for BM25 retrieval. Returning empty list.")
+            return []
+
+        top_documents = []
         for doc, score in results:
             if scale_score:
                 score = expit(score / BM25_SCALING_FACTOR)
@@ -551,17 +1394,86 @@ class InMemoryDocumentStore:
             if not negatives_are_valid and score <= 0.0:
                 continue
 
-            doc_fields = doc.to_dict()
-            doc_fields["score"] = score
+            top_documents.append((doc, score))
 
-            if not self.return_embedding and "embedding" in doc_fields:
-                doc_fields.pop("embedding")
+        return top_documents
 
-            return_document = Document.from_dict(doc_fields)
+    def hybrid_retrieval(  # pylint: disable=too-many-positional-arguments
+        self,
+        query: str,
+        query_embedding: list[float],
+        filters: Optional[dict[str, Any]] = None,
+        top_k: int = 10,
+        scale_score: bool = False,
+        join_mode: FusionMode = "reciprocal_rank_fusion",
+        weights: Optional[list[float]] = None,
+        return_embedding: Optional[bool] = False,
+    ) -> list[Document]:
+        """
+        Retrieves the documents most relevant to the query by fusing BM25 and embedding retrieval.
 
-            return_documents.append(return_document)
+        The results are the same as joining the results of `bm25_retrieval` and `embedding_retrieval`, both with the
+        same `top_k`, with a `DocumentJoiner` using the same join mode and weights. The filters are only evaluated
+        once for both retrievals, and only the fused top_k Documents are copied.
+
+        :param query: The query string, used for BM25 retrieval.
+        :param query_embedding: Embedding of the query, used for embedding retrieval.
+        :param filters: A dictionary with filters to narrow down the search space.
+        :param top_k: The number of top documents retrieved by each retrieval and returned. Default is 10.
+        :param scale_score: Whether to scale the BM25 and similarity scores before fusing them. Default is False.
+        :param join_mode: How the BM25 and embedding rankings are fused:
+            - `reciprocal_rank_fusion` (default): Scores the Documents by their ranks in each ranking.
+            - `merge`: Scores the Documents with a weighted sum of their BM25 and similarity scores.
+            - `distribution_based_rank_fusion`: Scores the Documents with the best of their BM25 and similarity scores,
+            scaled by the distribution of the scores of each ranking.
+        :param weights: The importance of the BM25 and embedding rankings, in that order. Ignored by
+            `distribution_based_rank_fusion`. Defaults to the same importance for both.
+        :param return_embedding: Whether to return the embedding of the retrieved Documents.
+            If not provided, the value of the `return_embedding` parameter set at component
+            initialization will be used. Default is False.
+        :returns: A list of the top_k documents most relevant to the query, with their fused score.
+        """
+        if not query:
+            raise ValueError("Query should be a non-empty string")
+        if len(query_embedding) == 0 or not isinstance(query_embedding[0], float):
+            raise ValueError("query_embedding should be a non-empty list of floats.")
+        if join_mode not in FUSION_MODES:
+            raise ValueError(f"Unknown join mode '{join_mode}'. Supported modes are: {list(FUSION_MODES)}")
+        if weights is not None and len(weights) != 2:
+            raise ValueError("weights should contain two values, for the BM25 and the embedding rankings.")
+        if filters and "operator" not in filters:
+            raise ValueError(
+                "Invalid filter syntax. See https://docs.haystack.deepset.ai/docs/metadata-filtering for details."
+            )
 
-        return return_documents
+        with self._lock.read():
+            matching_ids = None
+            candidate_documents = None
+            if filters:
+                matching_ids = self._filter_document_ids(filters)
+                candidate_documents = [
+                    doc
+                    for doc in (self.storage[doc_id] for doc_id in self._metadata_index.sort(matching_ids))
+                    if doc.content is not None
+                ]
+
+            bm25_results = self._bm25_top_documents(query, candidate_documents, top_k, scale_score)
+            embedding_documents, embedding_scores = self._embedding_top_documents(
+                [query_embedding], matching_ids, top_k, scale_score
+            )[0]
+            rankings = [
+                [(doc.id, score) for doc, score in bm25_results],
+                [(doc.id, score) for doc, score in zip(embedding_documents, embedding_scores)],
+            ]
+            documents = {doc.id: doc for doc in chain((doc for doc, _ in bm25_results), embedding_documents)}
+            fused_scores = fuse_scores(rankings, join_mode, weights)
+
+            resolved_return_embedding = self.return_embedding if return_embedding is None else return_embedding
+            changes: dict[str, Any] = {"embedding": None} if resolved_return_embedding is False else {}
+            return [
+                self._copy_with_score(documents[doc_id], score, **changes)
+                for doc_id, score in top_k_items(fused_scores.items(), top_k, key=lambda item: item[1])
+            ]
 
     def embedding_retrieval(  # pylint: disable=too-many-positional-arguments
         self,
@@ -586,25 +1498,299 @@ class InMemoryDocumentStore:
         if len(query_embedding) == 0 or not isinstance(query_embedding[0], float):
             raise ValueError("query_embedding should be a non-empty list of floats.")
 
+        with self._lock.read():
+            return self._embedding_retrieval([query_embedding], filters, top_k, scale_score, return_embedding)[0]
+
+    def embedding_retrieval_batch(  # pylint: disable=too-many-positional-arguments
+        self,
+        query_embeddings: list[list[float]],
+        filters: Optional[dict[str, Any]] = None,
+        top_k: int = 10,
+        scale_score: bool = False,
+        return_embedding: Optional[bool] = False,
+    ) -> list[list[Document]]:
+        """
+        Retrieves the documents that are most similar to each query embedding using a vector similarity metric.
+
+        The filters are evaluated once for all the queries, and the queries are scored together with a single
+        matrix product per batch of queries instead of one scan of the Documents per query.
+
+        :param query_embeddings: Embeddings of the queries.
+        :param filters: A dictionary with filters to narrow down the search space of all the queries.
+        :param top_k: The number of top documents to retrieve for each query. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved Documents. Default is False.
+        :param return_embedding: Whether to return the embedding of the retrieved Documents.
+            If not provided, the value of the `return_embedding` parameter set at component
+            initialization will be used. Default is False.
+        :returns: A list with the top_k documents most relevant to each query, in the same order as
+            `query_embeddings`.
+        """
+        for query_embedding in query_embeddings:
+            if len(query_embedding) == 0 or not isinstance(query_embedding[0], float):
+                raise ValueError("query_embedding should be a non-empty list of floats.")
+
+        with self._lock.read():
+            return self._embedding_retrieval(query_embeddings, filters, top_k, scale_score, return_embedding)
+
+    def _embedding_retrieval(  # pylint: disable=too-many-positional-arguments
+        self,
+        query_embeddings: list[list[float]],
+        filters: Optional[dict[str, Any]],
+        top_k: int,
+        scale_score: bool,
+        return_embedding: Optional[bool],
+    ) -> list[list[Document]]:
+        """
+        Retrieves the documents that are most similar to each query embedding.
+        """
+        matching_ids = None
         if filters:
             if "operator" not in filters and "conditions" not in filters:
                 raise ValueError(
                     "Invalid filter syntax. See https://docs.haystack.deepset.ai/docs/metadata-filtering for details."
                 )
-            all_documents = [
-                doc for doc in self.storage.values() if document_matches_filter(filters=filters, document=doc)
-            ]
-        else:
-            all_documents = list(self.storage.values())
+            matching_ids = self._filter_document_ids(filters)
+        return [
+            self._build_embedding_retrieval_results(top_documents, top_scores, return_embedding)
+            for top_documents, top_scores in self._embedding_top_documents(
+                query_embeddings, matching_ids, top_k, scale_score
+            )
+        ]
 
-        documents_with_embeddings = [doc for doc in all_documents if doc.embedding is not None]
-        if len(documents_with_embeddings) == 0:
+    def _embedding_top_documents(
+        self, query_embeddings: list[list[float]], matching_ids: Optional[list[str]], top_k: int, scale_score: bool
+    ) -> list[tuple[list[Document], list[float]]]:
+        """
+        Finds the stored documents that are most similar to each query embedding, without copying them.
+
+        :param query_embeddings: Embeddings of the queries.
+        :param matching_ids: The ids of the documents matching the filters, or `None` to search all the documents.
+        :param top_k: The number of top documents to find for each query.
+        :param scale_score: Whether to scale the similarity scores.
+        :returns: The top_k stored documents of each query and their similarity scores, from the most similar.
+        """
+        matrix = self._embedding_matrix
+        rows: Optional[np.ndarray] = None
+        mask: Optional[np.ndarray] = None
+        if matching_ids is not None:
+            if not matrix.mismatched_ids.isdisjoint(matching_ids):
+                all_documents = [self.storage[doc_id] for doc_id in self._metadata_index.sort(matching_ids)]
+                return [
+                    self._embedding_top_documents_from_documents(query_embedding, all_documents, top_k, scale_score)
+                    for query_embedding in query_embeddings
+                ]
+            # the filters select rows of the embedding matrix, no Document list or embedding array is built
+            mask = matrix.mask(matching_ids)
+            n_documents = len(matching_ids)
+            n_documents_with_embeddings = int(np.count_nonzero(mask))
+            if n_documents_with_embeddings <= PREFILTER_MAX_SELECTIVITY * len(matrix):
+                # pre-filtering: few rows match, only they are scored
+                rows, mask = np.flatnonzero(mask), None
+        else:
+            if matrix.mismatched_ids:
+                all_documents = list(self.storage.values())
+                return [
+                    self._embedding_top_documents_from_documents(query_embedding, all_documents, top_k, scale_score)
+                    for query_embedding in query_embeddings
+                ]
+            n_documents = len(self.storage)
+            n_documents_with_embeddings = len(matrix)
+
+        if n_documents_with_embeddings == 0:
             logger.warning(
                 "No Documents found with embeddings. Returning empty list. "
                 "To generate embeddings, use a DocumentEmbedder."
             )
-            return []
-        elif len(documents_with_embeddings) < len(all_documents):
+            return [([], []) for _ in query_embeddings]
+        elif n_documents_with_embeddings < n_documents:
+            logger.info(
+                "Skipping some Documents that don't have an embedding. To generate embeddings, use a DocumentEmbedder."
+            )
+
+        results = []
+        rescore = matrix.is_quantized and matrix.quantizer is not None and matrix.quantizer.rescore_factor is not None
+        scored_queries = zip(query_embeddings, self._embedding_similarity_scores(query_embeddings, rows, mask))
+        for query_embedding, (scores, scored_rows) in scored_queries:
+            n_candidates = n_documents_with_embeddings if scored_rows is None else len(scored_rows)
+            if rescore:
+                top_positions, top_scores_array = self._rescore_quantized_candidates(
+                    query_embedding, scores, scored_rows, top_k, n_candidates
+                )
+            else:
+                # a stable selection keeps Documents with the same score in the order they were written
+                top_positions = top_k_indices(scores, min(top_k, n_candidates))
+                top_scores_array = scores[top_positions]
+            top_rows = top_positions if scored_rows is None else scored_rows[top_positions]
+            top_scores = top_scores_array.tolist()
+            if scale_score:
+                top_scores = self._scale_embedding_similarity_scores(top_scores)
+
+            results.append(([self.storage[doc_id] for doc_id in matrix.ids(top_rows)], top_scores))
+        return results
+
+    def _rescore_quantized_candidates(  # pylint: disable=too-many-positional-arguments
+        self,
+        query_embedding: list[float],
+        scores: np.ndarray,
+        rows: Optional[np.ndarray],
+        top_k: int,
+        n_candidates: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Scores the best candidates found with quantized embeddings again with their original embeddings.
+
+        :param query_embedding: Embedding of the query.
+        :param scores: The approximate scores computed on the quantized embeddings.
+        :param rows: The rows `scores` are aligned with, or `None` if they're aligned with all the rows.
+        :param top_k: The number of Documents to retrieve.
+        :param n_candidates: The number of live rows that were scored.
+        :returns: The positions in `scores` of the top_k candidates and their exact scores.
+        """
+        matrix = self._embedding_matrix
+        rescore_factor = matrix.quantizer.rescore_factor if matrix.quantizer is not None else None
+        n_rescored = min(top_k * (rescore_factor or 1), n_candidates)
+        # candidates are put back in row order, so the stable selection on the exact scores keeps Documents with the
+        # same score in the order they were written
+        candidates = np.sort(top_k_indices(scores, n_rescored))
+        candidate_rows = candidates if rows is None else rows[candidates]
+        exact_scores = matrix.exact_similarity_scores(
+            query_embedding, self.embedding_similarity_function, candidate_rows
+        )
+        best = top_k_indices(exact_scores, min(top_k, len(candidates)))
+        return candidates[best], exact_scores[best]
+
+    def _embedding_similarity_scores(
+        self, query_embeddings: list[list[float]], rows: Optional[np.ndarray], mask: Optional[np.ndarray] = None
+    ) -> Iterator[tuple[np.ndarray, Optional[np.ndarray]]]:
+        """
+        Yields the unscaled similarity scores of each query with the embedding matrix, and the rows they belong to.
+
+        Queries are scored by batches of `QUERY_BATCH_SIZE` with a single matrix product, except when the IVF index
+        is used, since each query is then only scored against the rows in the clusters closest to it.
+
+        :param query_embeddings: Embeddings of the queries.
+        :param rows: Rows to score, or `None` to score all the rows of the matrix.
+        :param mask: When scoring all the rows, the rows matching the filters, if any. The other rows are given a score
+            of `-inf`. With the IVF index, more clusters are searched to make up for the rows filtered out.
+        """
+        matrix = self._embedding_matrix
+        similarity = self.embedding_similarity_function
+        if rows is None and self._uses_ivf_index():
+            nprobe = None
+            if mask is not None and matrix.ivf is not None:
+                # oversampling: the clusters are expected to hold as many matching rows as without filters
+                selectivity = max(int(np.count_nonzero(mask)), 1) / len(matrix)
+                nprobe = min(math.ceil(matrix.ivf.nprobe / selectivity), matrix.ivf.n_lists)
+            # approximate search: only the rows in the clusters closest to the query are scored
+            for query_embedding in query_embeddings:
+                query_rows = matrix.ann_rows(query_embedding, nprobe=nprobe)
+                if mask is not None and query_rows is not None:
+                    query_rows = query_rows[mask[query_rows]]
+                scores = matrix.similarity_scores(query_embedding, similarity=similarity, rows=query_rows)
+                if mask is not None and query_rows is None:
+                    scores[~mask] = -np.inf
+                yield scores, query_rows
+        elif len(query_embeddings) == 1:
+            scores = matrix.similarity_scores(query_embeddings[0], similarity=similarity, rows=rows)
+            if mask is not None:
+                scores[~mask] = -np.inf
+            yield scores, rows
+        else:
+            for start in range(0, len(query_embeddings), QUERY_BATCH_SIZE):
+                batch = query_embeddings[start : start + QUERY_BATCH_SIZE]
+                batch_scores = matrix.similarity_scores_batch(batch, similarity=similarity, rows=rows)
+                if mask is not None:
+                    batch_scores[:, ~mask] = -np.inf
+                for scores in batch_scores:
+                    yield scores, rows
+
+    def sparse_embedding_retrieval(  # pylint: disable=too-many-positional-arguments
+        self,
+        query_sparse_embedding: SparseEmbedding,
+        filters: Optional[dict[str, Any]] = None,
+        top_k: int = 10,
+        scale_score: bool = False,
+        return_embedding: Optional[bool] = False,
+    ) -> list[Document]:
+        """
+        Retrieves documents that are most similar to the query sparse embedding using the dot product.
+
+        Only the Documents sharing at least one non-zero dimension with the query are scored, they are looked up in
+        an inverted index over the dimensions of the Document sparse embeddings.
+
+        :param query_sparse_embedding: Sparse embedding of the query.
+        :param filters: A dictionary with filters to narrow down the search space.
+        :param top_k: The number of top documents to retrieve. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved Documents. Default is False.
+        :param return_embedding: Whether to return the dense and sparse embeddings of the retrieved Documents.
+            If not provided, the value of the `return_embedding` parameter set at component
+            initialization will be used. Default is False.
+        :returns: A list of the top_k documents most relevant to the query.
+        """
+        if not query_sparse_embedding.indices:
+            raise ValueError("query_sparse_embedding should be a non-empty SparseEmbedding.")
+        if filters and "operator" not in filters and "conditions" not in filters:
+            raise ValueError(
+                "Invalid filter syntax. See https://docs.haystack.deepset.ai/docs/metadata-filtering for details."
+            )
+
+        with self._lock.read():
+            sparse_embedding_index = self._sparse_embedding_index
+            doc_ids = None
+            if filters:
+                doc_ids = set(self._filter_document_ids(filters))
+
+            if len(sparse_embedding_index) == 0:
+                logger.warning(
+                    "No Documents found with sparse embeddings. Returning empty list. "
+                    "To generate sparse embeddings, use a sparse Document Embedder, "
+                    "such as SentenceTransformersSparseDocumentEmbedder."
+                )
+                return []
+
+            scores = sparse_embedding_index.dot_product_scores(query_sparse_embedding, doc_ids=doc_ids)
+            # selecting from a list in write order keeps Documents with the same score in the order they were written
+            ranked_ids = top_k_items(self._metadata_index.sort(scores), top_k, key=scores.__getitem__)
+
+            resolved_return_embedding = self.return_embedding if return_embedding is None else return_embedding
+            changes: dict[str, Any] = {}
+            if resolved_return_embedding is False:
+                changes = {"embedding": None, "sparse_embedding": None}
+            top_documents = []
+            for doc_id in ranked_ids:
+                score = scores[doc_id]
+                if scale_score:
+                    score = expit(score / DOT_PRODUCT_SCALING_FACTOR)
+                top_documents.append(self._copy_with_score(self.storage[doc_id], score, **changes))
+            return top_documents
+
+    def _uses_ivf_index(self) -> bool:
+        """
+        Whether embedding retrieval can use the IVF index of the embedding matrix.
+
+        The IVF index is shared by all the instances using the same index, it can't be used by instances
+        with a different similarity function than the one it was built for.
+        """
+        ivf = self._embedding_matrix.ivf
+        return (
+            self.embedding_index_type == "ivf"
+            and ivf is not None
+            and ivf.similarity == self.embedding_similarity_function
+        )
+
+    def _embedding_top_documents_from_documents(
+        self, query_embedding: list[float], all_documents: list[Document], top_k: int, scale_score: bool
+    ) -> tuple[list[Document], list[float]]:
+        """
+        Finds the most similar Documents and their scores by building the embedding array from the given Documents.
+
+        Used when the embeddings of the Documents don't all have the same size, so they can't be stored in the
+        embedding matrix of the index.
+        """
+        documents_with_embeddings = [
+            doc for doc in map(self._with_embedding, all_documents) if doc.embedding is not None
+        ]
+        if len(documents_with_embeddings) < len(all_documents):
             logger.info(
                 "Skipping some Documents that don't have an embedding. To generate embeddings, use a DocumentEmbedder."
             )
@@ -613,18 +1799,50 @@ class InMemoryDocumentStore:
             embedding=query_embedding, documents=documents_with_embeddings, scale_score=scale_score
         )
 
+        top_documents, top_scores = [], []
+        for doc, score in top_k_items(zip(documents_with_embeddings, scores), top_k, key=lambda x: x[1]):
+            top_documents.append(doc)
+            top_scores.append(score)
+        return top_documents, top_scores
+
+    def _build_embedding_retrieval_results(
+        self, documents: list[Document], scores: list[float], return_embedding: Optional[bool]
+    ) -> list[Document]:
+        """
+        Creates the Documents returned by embedding retrieval, with their similarity score.
+        """
         resolved_return_embedding = self.return_embedding if return_embedding is None else return_embedding
+        changes: dict[str, Any] = {"embedding": None} if resolved_return_embedding is False else {}
 
-        # create Documents with the similarity score for the top k results
-        top_documents = []
-        for doc, score in sorted(zip(documents_with_embeddings, scores), key=lambda x: x[1], reverse=True)[:top_k]:
-            doc_fields = doc.to_dict()
-            doc_fields["score"] = score
-            if resolved_return_embedding is False:
-                doc_fields["embedding"] = None
-            top_documents.append(Document.from_dict(doc_fields))
+        return [self._copy_with_score(doc, score, **changes) for doc, score in zip(documents, scores)]
 
-        return top_documents
+    def _copy_with_score(self, document: Document, score: float, **changes: Any) -> Document:
+        """
+        Creates a copy of a stored Document with the given score, to be returned by retrieval.
+
+        The copy is shallow: unlike a `to_dict`/`from_dict` round trip, the content, blob and embeddings are shared
+        with the stored Document instead of being copied. The meta dictionary is copied, so that adding or removing
+        keys in the meta of the copy doesn't modify the stored Document. An embedding only kept by the embedding
+        matrix is attached to the copy.
+
+        :param document: The stored Document.
+        :param score: The retrieval score.
+        :param changes: Other fields to replace, for example `embedding=None` to leave out the embedding.
+        :returns: The copy of the Document.
+        """
+        if "embedding" not in changes and document.embedding is None and document.id in self._embedding_matrix:
+            changes["embedding"] = self._embedding_matrix.embedding(document.id)
+        return replace(document, score=score, meta=document.meta.copy(), **changes)
+
+    def _scale_embedding_similarity_scores(self, scores: list[float]) -> list[float]:
+        """
+        Scales similarity scores to values between 0 and 1, depending on the similarity function.
+        """
+        if self.embedding_similarity_function == "dot_product":
+            return [expit(float(score / DOT_PRODUCT_SCALING_FACTOR)) for score in scores]
+        if self.embedding_similarity_function == "cosine":
+            return [(score + 1) / 2 for score in scores]
+        return scores
 
     def _compute_query_embedding_similarity_scores(
         self, embedding: list[float], documents: list[Document], scale_score: bool = False
@@ -670,18 +1888,20 @@ class InMemoryDocumentStore:
             raise e
 
         if scale_score:
-            if self.embedding_similarity_function == "dot_product":
-                scores = [expit(float(score / DOT_PRODUCT_SCALING_FACTOR)) for score in scores]
-            elif self.embedding_similarity_function == "cosine":
-                scores = [(score + 1) / 2 for score in scores]
+            scores = self._scale_embedding_similarity_scores(scores)
 
         return scores
 
-    async def count_documents_async(self) -> int:
+    async def count_documents_async(self, filters: Optional[dict[str, Any]] = None) -> int:
         """
         Returns the number of how many documents are present in the DocumentStore.
+
+        :param filters: If provided, only the documents that match the filters are counted.
+        :returns: The number of documents.
         """
-        return len(self.storage.keys())
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, lambda: self.count_documents(filters=filters)
+        )
 
     async def filter_documents_async(self, filters: Optional[dict[str, Any]] = None) -> list[Document]:
         """
@@ -719,6 +1939,29 @@ class InMemoryDocumentStore:
             self.executor, lambda: self.delete_documents(document_ids=document_ids)
         )
 
+    async def delete_by_filter_async(self, filters: dict[str, Any]) -> int:
+        """
+        Deletes the documents that match the filters.
+
+        :param filters: The filters to apply to select the documents to delete.
+        :returns: The number of deleted documents.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, lambda: self.delete_by_filter(filters=filters)
+        )
+
+    async def update_by_filter_async(self, filters: dict[str, Any], meta: dict[str, Any]) -> int:
+        """
+        Updates the metadata of the documents that match the filters.
+
+        :param filters: The filters to apply to select the documents to update.
+        :param meta: The metadata fields to set on the matching documents.
+        :returns: The number of updated documents.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, lambda: self.update_by_filter(filters=filters, meta=meta)
+        )
+
     async def bm25_retrieval_async(
         self, query: str, filters: Optional[dict[str, Any]] = None, top_k: int = 10, scale_score: bool = False
     ) -> list[Document]:
@@ -736,6 +1979,93 @@ class InMemoryDocumentStore:
             lambda: self.bm25_retrieval(query=query, filters=filters, top_k=top_k, scale_score=scale_score),
         )
 
+    async def sparse_embedding_retrieval_async(  # pylint: disable=too-many-positional-arguments
+        self,
+        query_sparse_embedding: SparseEmbedding,
+        filters: Optional[dict[str, Any]] = None,
+        top_k: int = 10,
+        scale_score: bool = False,
+        return_embedding: bool = False,
+    ) -> list[Document]:
+        """
+        Retrieves documents that are most similar to the query sparse embedding using the dot product.
+
+        :param query_sparse_embedding: Sparse embedding of the query.
+        :param filters: A dictionary with filters to narrow down the search space.
+        :param top_k: The number of top documents to retrieve. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved Documents. Default is False.
+        :param return_embedding: Whether to return the dense and sparse embeddings of the retrieved Documents.
+            Default is False.
+        :returns: A list of the top_k documents most relevant to the query.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor,
+            lambda: self.sparse_embedding_retrieval(
+                query_sparse_embedding=query_sparse_embedding,
+                filters=filters,
+                top_k=top_k,
+                scale_score=scale_score,
+                return_embedding=return_embedding,
+            ),
+        )
+
+    async def bm25_retrieval_batch_async(
+        self, queries: list[str], filters: Optional[dict[str, Any]] = None, top_k: int = 10, scale_score: bool = False
+    ) -> list[list[Document]]:
+        """
+        Retrieves the documents that are most relevant to each query using BM25 algorithm.
+
+        The filters are evaluated once for all the queries.
+
+        :param queries: The query strings.
+        :param filters: A dictionary with filters to narrow down the search space of all the queries.
+        :param top_k: The number of top documents to retrieve for each query. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved documents. Default is False.
+        :returns: A list with the top_k documents most relevant to each query, in the same order as `queries`.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor,
+            lambda: self.bm25_retrieval_batch(queries=queries, filters=filters, top_k=top_k, scale_score=scale_score),
+        )
+
+    async def hybrid_retrieval_async(  # pylint: disable=too-many-positional-arguments
+        self,
+        query: str,
+        query_embedding: list[float],
+        filters: Optional[dict[str, Any]] = None,
+        top_k: int = 10,
+        scale_score: bool = False,
+        join_mode: FusionMode = "reciprocal_rank_fusion",
+        weights: Optional[list[float]] = None,
+        return_embedding: Optional[bool] = False,
+    ) -> list[Document]:
+        """
+        Retrieves the documents most relevant to the query by fusing BM25 and embedding retrieval.
+
+        :param query: The query string, used for BM25 retrieval.
+        :param query_embedding: Embedding of the query, used for embedding retrieval.
+        :param filters: A dictionary with filters to narrow down the search space.
+        :param top_k: The number of top documents retrieved by each retrieval and returned. Default is 10.
+        :param scale_score: Whether to scale the BM25 and similarity scores before fusing them. Default is False.
+        :param join_mode: How the BM25 and embedding rankings are fused, see `hybrid_retrieval`.
+        :param weights: The importance of the BM25 and embedding rankings, in that order.
+        :param return_embedding: Whether to return the embedding of the retrieved Documents. Default is False.
+        :returns: A list of the top_k documents most relevant to the query, with their fused score.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor,
+            lambda: self.hybrid_retrieval(
+                query=query,
+                query_embedding=query_embedding,
+                filters=filters,
+                top_k=top_k,
+                scale_score=scale_score,
+                join_mode=join_mode,
+                weights=weights,
+                return_embedding=return_embedding,
+            ),
+        )
+
     async def embedding_retrieval_async(  # pylint: disable=too-many-positional-arguments
         self,
         query_embedding: list[float],
@@ -764,3 +2094,33 @@ class InMemoryDocumentStore:
                 return_embedding=return_embedding,
             ),
         )
+
+    async def embedding_retrieval_batch_async(  # pylint: disable=too-many-positional-arguments
+        self,
+        query_embeddings: list[list[float]],
+        filters: Optional[dict[str, Any]] = None,
+        top_k: int = 10,
+        scale_score: bool = False,
+        return_embedding: bool = False,
+    ) -> list[list[Document]]:
+        """
+        Retrieves the documents that are most similar to each query embedding using a vector similarity metric.
+
+        :param query_embeddings: Embeddings of the queries.
+        :param filters: A dictionary with filters to narrow down the search space of all the queries.
+        :param top_k: The number of top documents to retrieve for each query. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved Documents. Default is False.
+        :param return_embedding: Whether to return the embedding of the retrieved Documents. Default is False.
+        :returns: A list with the top_k documents most relevant to each query, in the same order as
+            `query_embeddings`.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor,
+            lambda: self.embedding_retrieval_batch(
+                query_embeddings=query_embeddings,
+                filters=filters,
+                top_k=top_k,
+                scale_score=scale_score,
+                return_embedding=return_embedding,
+            ),
+        )
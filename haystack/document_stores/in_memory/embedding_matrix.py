@@ -0,0 +1,440 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Literal, Optional
+
+import numpy as np
+
+from haystack.document_stores.errors import DocumentStoreError
+from haystack.document_stores.in_memory.ivf_index import IVFIndex
+from haystack.document_stores.in_memory.quantization import EmbeddingQuantizer
+
+# number of rows assigned to IVF clusters at once when the embeddings are quantized and must be decoded first
+_ASSIGN_BLOCK_SIZE = 65536
+
+
+class EmbeddingMatrix:
+    """
+    A contiguous float32 matrix holding the Document embeddings of an InMemoryDocumentStore index.
+
+    Rows are appended in write order, so the row order always matches the order of the Documents in the store.
+    Capacity grows geometrically to amortize the cost of writes. Deleted rows are tombstoned and
+    reclaimed by compacting the matrix once they make up more than half of it.
+    The norm of each row is computed on write, so cosine similarity doesn't need to normalize the
+    Document embeddings at query time.
+    An optional IVFIndex can be attached to restrict the search to the rows of the clusters closest to the query.
+    An optional EmbeddingQuantizer can be attached to store compressed embeddings instead of float32 ones.
+    The original embeddings are then kept in a separate array, so that the matrix remains the only copy of the
+    embeddings of the store.
+    """
+
+    def __init__(self, initial_capacity: int = 1024):
+        """
+        Creates an empty EmbeddingMatrix.
+
+        :param initial_capacity: Number of rows allocated when the first embedding is added.
+        """
+        self._initial_capacity = initial_capacity
+        self._data = np.empty((0, 0), dtype=np.float32)
+        self._norms = np.empty(0, dtype=np.float32)
+        self._alive = np.empty(0, dtype=bool)
+        # IVF cluster of each row, only meaningful once the IVF index is trained
+        self._lists = np.empty(0, dtype=np.int32)
+        self._ids: list[Optional[str]] = []
+        self._rows: dict[str, int] = {}
+        self.dim: Optional[int] = None
+        self.ivf: Optional[IVFIndex] = None
+        self.quantizer: Optional[EmbeddingQuantizer] = None
+        # whether the rows hold the codes of the quantizer instead of float32 embeddings
+        self.is_quantized = False
+        # original embeddings of the rows once they hold the codes of the quantizer
+        self._originals: Optional[np.ndarray] = None
+        # Ids of the Documents whose embedding can't be stored in the matrix because its size differs
+        # from the size of the other embeddings.
+        self.mismatched_ids: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._rows
+
+    @property
+    def size(self) -> int:
+        """
+        Number of rows in use, including tombstoned ones.
+        """
+        return len(self._ids)
+
+    def add(self, doc_id: str, embedding: list[float]) -> None:
+        """
+        Appends the embedding of a Document to the matrix.
+
+        :param doc_id: The id of the Document. Must not be already stored in the matrix.
+        :param embedding: The embedding of the Document.
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        if self.dim is None and vector.ndim == 1 and vector.shape[0] > 0:
+            self.dim = vector.shape[0]
+            self._data = np.empty((0, self.dim), dtype=np.float32)
+        if vector.shape != (self.dim,):
+            self.mismatched_ids.add(doc_id)
+            return
+
+        if self.size == self._data.shape[0]:
+            self._grow()
+
+        row = self.size
+        self._data[row] = self._encode(vector[None, :])[0]
+        if self._originals is not None:
+            self._originals[row] = vector
+        self._norms[row] = np.linalg.norm(vector)
+        self._alive[row] = True
+        if self.ivf is not None and self.ivf.is_trained:
+            self._lists[row] = self.ivf.assign(vector[None, :])[0]
+        self._ids.append(doc_id)
+        self._rows[doc_id] = row
+        self._quantize_if_needed()
+
+    def load(self, doc_ids: list[str], embeddings: np.ndarray) -> None:
+        """
+        Fills an empty matrix with the given embeddings at once.
+
+        The array is used as is, without copying it, so it can be a memory-mapped file. It must be writable,
+        since deletions compact it in place: memory-map files copy-on-write to leave them untouched.
+        If a quantizer is attached, the embeddings are quantized instead.
+
+        :param doc_ids: The ids of the Documents, in row order.
+        :param embeddings: A 2D float32 array with one row per Document.
+        """
+        if self._ids:
+            raise ValueError("Embeddings can only be loaded into an empty EmbeddingMatrix.")
+        if not doc_ids:
+            return
+
+        n_rows = len(doc_ids)
+        self.dim = embeddings.shape[1]
+        self._data = embeddings
+        self._norms = np.linalg.norm(embeddings, axis=1).astype(np.float32)
+        self._alive = np.ones(n_rows, dtype=bool)
+        self._lists = np.zeros(n_rows, dtype=np.int32)
+        if self.ivf is not None and self.ivf.is_trained:
+            self._lists[:] = self.ivf.assign(embeddings)
+        self._ids = list(doc_ids)
+        self._rows = {doc_id: row for row, doc_id in enumerate(doc_ids)}
+        self._quantize_if_needed()
+
+    def remove(self, doc_id: str) -> None:
+        """
+        Removes the embedding of a Document from the matrix, if present.
+
+        :param doc_id: The id of the Document.
+        """
+        self.mismatched_ids.discard(doc_id)
+        row = self._rows.pop(doc_id, None)
+        if row is None:
+            return
+
+        self._alive[row] = False
+        self._ids[row] = None
+        if not self._rows:
+            self.dim = None
+            self._data = np.empty((0, 0), dtype=np.float32)
+            self._norms = np.empty(0, dtype=np.float32)
+            self._alive = np.empty(0, dtype=bool)
+            self._lists = np.empty(0, dtype=np.int32)
+            self._ids = []
+            self.is_quantized = False
+            self._originals = None
+            if self.quantizer is not None:
+                self.quantizer.reset()
+        elif len(self._rows) < self.size // 2:
+            self._compact()
+
+    def rows(self, doc_ids: list[str]) -> np.ndarray:
+        """
+        Returns the rows of the given Documents, skipping the ones that are not stored in the matrix.
+
+        :param doc_ids: The ids of the Documents.
+        :returns: An array of row indices, in the same order as `doc_ids`.
+        """
+        return np.fromiter((self._rows[doc_id] for doc_id in doc_ids if doc_id in self._rows), dtype=np.int64)
+
+    def mask(self, doc_ids: list[str]) -> np.ndarray:
+        """
+        Returns a boolean mask over the rows in use, selecting the rows of the given Documents.
+
+        :param doc_ids: The ids of the Documents. The ones that are not stored in the matrix are skipped.
+        :returns: A boolean array aligned with the row order, `True` for the rows of the given Documents.
+        """
+        mask = np.zeros(self.size, dtype=bool)
+        mask[self.rows(doc_ids)] = True
+        return mask
+
+    def ids(self, rows: np.ndarray) -> list[str]:
+        """
+        Returns the Document ids stored in the given rows.
+
+        :param rows: Row indices of live rows.
+        :returns: The ids of the Documents, in the same order as `rows`.
+        """
+        return [self._ids[row] for row in rows]
+
+    def vectors(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Returns the embeddings stored in the given rows.
+
+        :param rows: Row indices of live rows.
+        :returns: A 2D float32 array with one embedding per row, in the same order as `rows`. If the embeddings
+            are quantized, they are approximated from their codes.
+        """
+        if self.dim is None:
+            return np.empty((0, 0), dtype=np.float32)
+        if self.quantizer is not None and self.is_quantized:
+            return self.quantizer.decode(self._data[rows], self.dim, self._norms[rows])
+        return self._data[rows]
+
+    def original_vectors(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Returns the original embeddings stored in the given rows, even if the rows hold quantized codes.
+
+        :param rows: Row indices of live rows.
+        :returns: A 2D float32 array with one embedding per row, in the same order as `rows`.
+        """
+        if self.dim is None:
+            return np.empty((len(rows), 0), dtype=np.float32)
+        originals = self._originals if self._originals is not None else self._data
+        return originals[rows].astype(np.float32, copy=False)
+
+    def embedding(self, doc_id: str) -> list[float]:
+        """
+        Returns the original embedding of a Document as a list.
+
+        :param doc_id: The id of the Document. Must be stored in the matrix.
+        :returns: The embedding of the Document.
+        """
+        return self.original_vectors(np.array([self._rows[doc_id]]))[0].tolist()
+
+    def set_ivf_index(self, ivf: IVFIndex) -> None:
+        """
+        Attaches an IVF index to the matrix, training it if needed and assigning the existing rows to their clusters.
+
+        :param ivf: The IVF index.
+        """
+        self.ivf = ivf
+        if ivf.needs_training(len(self)):
+            self.train_ivf_index_if_needed()
+        elif ivf.is_trained and self.size > 0:
+            self._assign_lists()
+
+    def train_ivf_index_if_needed(self) -> None:
+        """
+        Trains, or retrains, the IVF index once there are enough embeddings and assigns the rows to their clusters.
+
+        Modifies the index and the cluster of every row, so it must be called by the writers of the matrix:
+        readers only probe the index.
+        """
+        if self.ivf is None or self.dim is None or not self.ivf.needs_training(len(self)):
+            return
+        live_rows = np.flatnonzero(self._alive[: self.size])
+        self.ivf.train(self.vectors(live_rows))
+        self._assign_lists()
+
+    def set_quantizer(self, quantizer: EmbeddingQuantizer) -> None:
+        """
+        Attaches a quantizer to the matrix, quantizing the existing rows if the quantizer is trained.
+
+        :param quantizer: The quantizer.
+        """
+        self.quantizer = quantizer
+        self._quantize_if_needed()
+
+    def ann_rows(self, query_embedding: list[float], nprobe: Optional[int] = None) -> Optional[np.ndarray]:
+        """
+        Returns the live rows in the IVF clusters closest to the query.
+
+        The IVF index is only read: it's trained by `train_ivf_index_if_needed` when the embeddings are written.
+
+        :param query_embedding: Embedding of the query.
+        :param nprobe: Number of clusters to search. If not provided, the default of the IVF index is used.
+        :returns: The rows to score, or `None` if there's no trained IVF index and all the rows must be scored.
+        """
+        if self.ivf is None or self.dim is None or len(query_embedding) != self.dim:
+            return None
+
+        if not self.ivf.is_trained:
+            return None
+
+        probed_lists = self.ivf.probe(np.asarray(query_embedding, dtype=np.float32), nprobe=nprobe)
+        mask = np.isin(self._lists[: self.size], probed_lists) & self._alive[: self.size]
+        return np.flatnonzero(mask)
+
+    def similarity_scores(
+        self,
+        query_embedding: list[float],
+        similarity: Literal["dot_product", "cosine"],
+        rows: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Computes the similarity between the query embedding and the stored embeddings.
+
+        :param query_embedding: Embedding of the query.
+        :param similarity: The similarity function, either "dot_product" or "cosine".
+        :param rows: Rows to score. If not provided, all the rows in use are scored and the tombstoned ones get a
+            score of `-inf`.
+        :returns: An array of unscaled scores, aligned with `rows` if provided and with the row order otherwise.
+        """
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.shape != (self.dim,):
+            raise DocumentStoreError(
+                "The embedding size of the query should be the same as the embedding size of the Documents. "
+                "Please make sure that the query has been embedded with the same model as the Documents."
+            )
+
+        data, norms = (
+            (self._data[: self.size], self._norms[: self.size])
+            if rows is None
+            else (self._data[rows], self._norms[rows])
+        )
+        if self.quantizer is not None and self.is_quantized:
+            scores = self.quantizer.dot_products(data, query[None, :], norms)[0]
+        else:
+            scores = data @ query
+
+        if similarity == "cosine":
+            # cosine similarity is a normed dot product
+            scores /= np.linalg.norm(query) * norms
+
+        if rows is None:
+            scores[~self._alive[: self.size]] = -np.inf
+        return scores
+
+    def similarity_scores_batch(
+        self,
+        query_embeddings: list[list[float]],
+        similarity: Literal["dot_product", "cosine"],
+        rows: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Computes the similarity between several query embeddings and the stored embeddings with one matrix product.
+
+        :param query_embeddings: Embeddings of the queries.
+        :param similarity: The similarity function, either "dot_product" or "cosine".
+        :param rows: Rows to score. If not provided, all the rows in use are scored and the tombstoned ones get a
+            score of `-inf`.
+        :returns: A 2D array of unscaled scores with one row per query, whose columns are aligned with `rows` if
+            provided and with the row order otherwise.
+        """
+        if any(len(query_embedding) != self.dim for query_embedding in query_embeddings):
+            raise DocumentStoreError(
+                "The embedding size of the query should be the same as the embedding size of the Documents. "
+                "Please make sure that the query has been embedded with the same model as the Documents."
+            )
+        queries = np.asarray(query_embeddings, dtype=np.float32).reshape(len(query_embeddings), -1)
+
+        data, norms = (
+            (self._data[: self.size], self._norms[: self.size])
+            if rows is None
+            else (self._data[rows], self._norms[rows])
+        )
+        if self.quantizer is not None and self.is_quantized:
+            scores = self.quantizer.dot_products(data, queries, norms)
+        else:
+            scores = queries @ data.T
+
+        if similarity == "cosine":
+            scores /= np.linalg.norm(queries, axis=1)[:, None] * norms[None, :]
+
+        if rows is None:
+            scores[:, ~self._alive[: self.size]] = -np.inf
+        return scores
+
+    def exact_similarity_scores(
+        self, query_embedding: list[float], similarity: Literal["dot_product", "cosine"], rows: np.ndarray
+    ) -> np.ndarray:
+        """
+        Computes the similarity between the query embedding and the original embeddings of the given rows.
+
+        Used to rescore the best candidates found with quantized embeddings.
+
+        :param query_embedding: Embedding of the query.
+        :param similarity: The similarity function, either "dot_product" or "cosine".
+        :param rows: Row indices of live rows.
+        :returns: An array of unscaled scores, aligned with `rows`.
+        """
+        query = np.asarray(query_embedding, dtype=np.float32)
+        scores = self.original_vectors(rows) @ query
+        if similarity == "cosine":
+            scores /= np.linalg.norm(query) * self._norms[rows]
+        return scores
+
+    def _quantize_if_needed(self) -> None:
+        """
+        Replaces the float32 rows with the codes of the quantizer, training it first if needed.
+
+        The float32 rows are kept as the original embeddings, converted to the precision set by the quantizer.
+        """
+        if self.quantizer is None or self.is_quantized or self.dim is None:
+            return
+        if self.quantizer.needs_training(len(self)):
+            self.quantizer.train(self._data[np.flatnonzero(self._alive[: self.size])])
+        if not self.quantizer.is_trained:
+            return
+
+        codes: np.ndarray = np.empty(
+            (self._data.shape[0], self.quantizer.code_size(self.dim)), dtype=self.quantizer.dtype
+        )
+        for start in range(0, self.size, _ASSIGN_BLOCK_SIZE):
+            end = min(start + _ASSIGN_BLOCK_SIZE, self.size)
+            codes[start:end] = self.quantizer.encode(np.asarray(self._data[start:end], dtype=np.float32))
+        self._originals = self._data.astype(self.quantizer.original_dtype, copy=False)
+        self._data = codes
+        self.is_quantized = True
+
+    def _encode(self, vectors: np.ndarray) -> np.ndarray:
+        """
+        Converts float32 embeddings to the representation of the rows, quantizing them if needed.
+        """
+        if self.quantizer is not None and self.is_quantized:
+            return self.quantizer.encode(vectors)
+        return vectors
+
+    def _assign_lists(self) -> None:
+        """
+        Assigns all the rows in use to their IVF cluster.
+        """
+        if self.ivf is None:
+            return
+        for start in range(0, self.size, _ASSIGN_BLOCK_SIZE):
+            rows = np.arange(start, min(start + _ASSIGN_BLOCK_SIZE, self.size))
+            self._lists[rows] = self.ivf.assign(self.vectors(rows))
+
+    def _grow(self) -> None:
+        capacity = max(self._initial_capacity, 2 * self._data.shape[0])
+        data = np.empty((capacity, self._data.shape[1]), dtype=self._data.dtype)
+        data[: self.size] = self._data[: self.size]
+        norms = np.empty(capacity, dtype=np.float32)
+        norms[: self.size] = self._norms[: self.size]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[: self.size] = self._alive[: self.size]
+        lists = np.zeros(capacity, dtype=np.int32)
+        lists[: self.size] = self._lists[: self.size]
+        self._data, self._norms, self._alive, self._lists = data, norms, alive, lists
+        if self._originals is not None:
+            originals = np.empty((capacity, self._originals.shape[1]), dtype=self._originals.dtype)
+            originals[: self.size] = self._originals[: self.size]
+            self._originals = originals
+
+    def _compact(self) -> None:
+        keep = np.flatnonzero(self._alive[: self.size])
+        n_rows = len(keep)
+        self._data[:n_rows] = self._data[keep]
+        self._norms[:n_rows] = self._norms[keep]
+        self._lists[:n_rows] = self._lists[keep]
+        if self._originals is not None:
+            self._originals[:n_rows] = self._originals[keep]
+        self._alive[:n_rows] = True
+        self._alive[n_rows:] = False
+        self._ids = [self._ids[row] for row in keep]
+        self._rows = {doc_id: row for row, doc_id in enumerate(self._ids)}  # type: ignore[misc]
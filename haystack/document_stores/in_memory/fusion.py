@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Literal, Optional
+
+FusionMode = Literal["reciprocal_rank_fusion", "merge", "distribution_based_rank_fusion"]
+
+FUSION_MODES = ("reciprocal_rank_fusion", "merge", "distribution_based_rank_fusion")
+
+# constant of reciprocal rank fusion: 60 as suggested by the original paper, plus 1 as ranks are 0-based
+_RRF_K = 61
+
+
+def fuse_scores(
+    rankings: list[list[tuple[str, float]]], mode: FusionMode, weights: Optional[list[float]] = None
+) -> dict[str, float]:
+    """
+    Fuses several rankings of Documents into a single score per Document.
+
+    The scores are the ones `DocumentJoiner` gives to the Documents with the join mode of the same name:
+    - `reciprocal_rank_fusion`: A weighted sum of the reciprocal ranks, normalized so that a Document ranked first in
+      all the rankings gets a score of 1.
+    - `merge`: A weighted sum of the scores, a Document missing from a ranking counting as a score of 0.
+    - `distribution_based_rank_fusion`: The best of the scores, after scaling the scores of each ranking by their
+      distribution. Weights are ignored.
+
+    :param rankings: For each ranking, the ids of the Documents and their scores, from the best.
+    :param mode: How the rankings are fused.
+    :param weights: The importance of each ranking, normalized to sum to 1. Defaults to the same for all.
+    :returns: The fused score of each Document, in the order the Documents first appear in the rankings.
+    """
+    if mode not in FUSION_MODES:
+        raise ValueError(f"Unknown fusion mode '{mode}'. Supported modes are: {list(FUSION_MODES)}")
+    if weights is not None and len(weights) != len(rankings):
+        raise ValueError(f"Expected {len(rankings)} weights, one for each ranking, got {len(weights)}.")
+    if not rankings:
+        return {}
+
+    normalized_weights = [w / sum(weights) for w in weights] if weights else [1 / len(rankings)] * len(rankings)
+    fused: dict[str, float] = {}
+    if mode == "reciprocal_rank_fusion":
+        for ranking, weight in zip(rankings, normalized_weights):
+            for rank, (doc_id, _) in enumerate(ranking):
+                fused[doc_id] = fused.get(doc_id, 0.0) + weight * len(rankings) / (_RRF_K + rank)
+        # len(rankings) / _RRF_K is the score of a Document ranked first in all the rankings
+        return {doc_id: score / (len(rankings) / _RRF_K) for doc_id, score in fused.items()}
+
+    if mode == "merge":
+        for ranking, weight in zip(rankings, normalized_weights):
+            for doc_id, score in ranking:
+                fused[doc_id] = fused.get(doc_id, 0.0) + score * weight
+        return fused
+
+    for ranking in rankings:
+        if not ranking:
+            continue
+        scores = [score for _, score in ranking]
+        mean_score = sum(scores) / len(scores)
+        std_dev = (sum((x - mean_score) ** 2 for x in scores) / len(scores)) ** 0.5
+        min_score = mean_score - 3 * std_dev
+        max_score = mean_score + 3 * std_dev
+        delta_score = max_score - min_score
+        for doc_id, score in ranking:
+            # if all the Documents have the same score, the ranking is uninformative
+            scaled_score = (score - min_score) / delta_score if delta_score != 0.0 else 0.0
+            fused[doc_id] = max(fused.get(doc_id, scaled_score), scaled_score)
+    return fused
@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Any, Literal, Optional
+
+import numpy as np
+
+
+class IVFIndex:
+    """
+    An inverted file (IVF) index used for approximate nearest neighbour search over an EmbeddingMatrix.
+
+    The embeddings are partitioned into `n_lists` clusters with k-means. At query time only the embeddings
+    assigned to the `nprobe` clusters closest to the query are scored, trading recall for speed.
+    For cosine similarity the clusters are computed on normalized embeddings (spherical k-means).
+    """
+
+    def __init__(  # pylint: disable=too-many-positional-arguments
+        self,
+        similarity: Literal["dot_product", "cosine"],
+        n_lists: int = 100,
+        nprobe: int = 10,
+        min_training_size: Optional[int] = None,
+        n_iter: int = 20,
+        seed: int = 42,
+    ):
+        """
+        Creates an untrained IVFIndex.
+
+        :param similarity: The similarity function the index is built for, either "dot_product" or "cosine".
+        :param n_lists: Number of clusters the embeddings are partitioned into.
+        :param nprobe: Default number of clusters scored at query time.
+        :param min_training_size: Minimum number of embeddings required to train the index. Until then, retrieval
+            is exact. Defaults to `39 * n_lists`, so that each cluster is trained on enough embeddings.
+        :param n_iter: Number of k-means iterations.
+        :param seed: Seed of the random generator used to initialize k-means.
+        """
+        if n_lists < 1 or nprobe < 1:
+            raise ValueError("n_lists and nprobe must be positive integers.")
+
+        self.similarity = similarity
+        self.n_lists = n_lists
+        self.nprobe = nprobe
+        self.min_training_size = 39 * n_lists if min_training_size is None else min_training_size
+        self.n_iter = n_iter
+        self.seed = seed
+        self.centroids: Optional[np.ndarray] = None
+        # number of embeddings the index was trained on, used to decide when to retrain
+        self.trained_size = 0
+
+    @property
+    def is_trained(self) -> bool:
+        """
+        Whether the centroids of the clusters have been computed.
+        """
+        return self.centroids is not None
+
+    def needs_training(self, n_embeddings: int) -> bool:
+        """
+        Whether the index should be (re)trained given the current number of embeddings.
+
+        The index is trained once enough embeddings are available and retrained whenever the number of
+        embeddings doubles, so that the clusters keep up with the data.
+
+        :param n_embeddings: Current number of embeddings.
+        """
+        if n_embeddings < max(self.min_training_size, self.n_lists):
+            return False
+        return not self.is_trained or n_embeddings >= 2 * self.trained_size
+
+    def train(self, embeddings: np.ndarray) -> None:
+        """
+        Computes the cluster centroids with k-means.
+
+        :param embeddings: A 2D array of embeddings to train on.
+        """
+        rng = np.random.default_rng(self.seed)
+        vectors = self._prepare(embeddings)
+        # k-means converges well on a sample, there's no need to use all the embeddings
+        max_samples = 256 * self.n_lists
+        if len(vectors) > max_samples:
+            vectors = vectors[rng.choice(len(vectors), size=max_samples, replace=False)]
+
+        centroids = vectors[rng.choice(len(vectors), size=self.n_lists, replace=False)].copy()
+        for _ in range(self.n_iter):
+            assignments = self._nearest_centroids(vectors, centroids)
+            counts = np.bincount(assignments, minlength=self.n_lists)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, vectors)
+
+            empty = counts == 0
+            centroids[~empty] = sums[~empty] / counts[~empty, None]
+            # re-seed empty clusters with random embeddings
+            if empty.any():
+                centroids[empty] = vectors[rng.choice(len(vectors), size=int(empty.sum()), replace=False)]
+            if self.similarity == "cosine":
+                centroids = self._normalize(centroids)
+
+        self.centroids = centroids
+        self.trained_size = len(embeddings)
+
+    def assign(self, embeddings: np.ndarray) -> np.ndarray:
+        """
+        Returns the cluster of each embedding.
+
+        :param embeddings: A 2D array of embeddings.
+        :returns: An array with the cluster index of each embedding.
+        """
+        if self.centroids is None:
+            raise ValueError("The IVF index must be trained before assigning embeddings to clusters.")
+        return self._nearest_centroids(self._prepare(embeddings), self.centroids)
+
+    def probe(self, query_embedding: np.ndarray, nprobe: Optional[int] = None) -> np.ndarray:
+        """
+        Returns the clusters to search for the given query.
+
+        :param query_embedding: A 1D query embedding.
+        :param nprobe: Number of clusters to return. If not provided, the default of the index is used.
+        :returns: An array with the indices of the closest clusters.
+        """
+        if self.centroids is None:
+            raise ValueError("The IVF index must be trained before probing it.")
+        nprobe = min(nprobe or self.nprobe, self.n_lists)
+        distances = self._distances(self._prepare(query_embedding[None, :]), self.centroids)[0]
+        return np.argpartition(distances, nprobe - 1)[:nprobe]
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serializes the trained state of the index.
+        """
+        return {
+            "centroids": self.centroids.tolist() if self.centroids is not None else None,
+            "trained_size": self.trained_size,
+        }
+
+    def load_state(self, data: dict[str, Any]) -> None:
+        """
+        Restores the trained state of the index serialized with `to_dict`.
+
+        :param data: The serialized state.
+        """
+        if data.get("centroids") is not None:
+            self.centroids = np.asarray(data["centroids"], dtype=np.float32)
+        self.trained_size = data.get("trained_size", 0)
+
+    def _prepare(self, embeddings: np.ndarray) -> np.ndarray:
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if self.similarity == "cosine":
+            return self._normalize(embeddings)
+        return embeddings
+
+    def _nearest_centroids(self, vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        return np.argmin(self._distances(vectors, centroids), axis=1)
+
+    def _distances(self, vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        # squared L2 distance without the norm of the vectors, which doesn't change the ranking of the centroids.
+        # For normalized vectors this ranks the centroids by cosine similarity.
+        return (centroids * centroids).sum(axis=1)[None, :] - 2 * vectors @ centroids.T
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
@@ -0,0 +1,443 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+from bisect import bisect_left, bisect_right
+from dataclasses import fields
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Literal, Optional
+
+from haystack.dataclasses import Document
+from haystack.utils.filters import COMPARISON_OPERATORS, LOGICAL_OPERATORS, _parse_date
+
+# Dates are indexed by their wall clock time, while the filters compare aware dates by their absolute time.
+# Widening the searched range by more than the largest possible UTC offset difference makes sure no match is missed.
+_DATE_TOLERANCE = timedelta(days=2)
+
+_DOCUMENT_FIELDS = {f.name for f in fields(Document)}
+
+MetadataIndexType = Literal["hash", "sorted"]
+
+
+def normalize_field_name(field: str) -> str:
+    """
+    Returns the canonical name of a filter field.
+
+    Fields that are neither Document fields nor prefixed with `meta.` are legacy metadata fields,
+    see `haystack.utils.filters`.
+    """
+    if "." not in field and field not in _DOCUMENT_FIELDS:
+        return f"meta.{field}"
+    return field
+
+
+def get_field_value(document: Document, field: str) -> Any:
+    """
+    Returns the value of a field of a Document, resolving it the same way the filters do.
+
+    :param document: The Document.
+    :param field: The canonical name of the field, see `normalize_field_name`.
+    :returns: The value of the field, or `None` if the Document doesn't have it.
+    """
+    parts = field.split(".")
+    value = getattr(document, parts[0])
+    for part in parts[1:]:
+        if part not in value:
+            return None
+        value = value[part]
+    return value
+
+
+def _is_nan(value: Any) -> bool:
+    return isinstance(value, float) and math.isnan(value)
+
+
+class _SortedKeys:
+    """
+    Sorted (key, document id) pairs supporting range lookups.
+    """
+
+    def __init__(self):
+        self._keys: list[Any] = []
+        self._ids: list[str] = []
+
+    def add(self, key: Any, doc_id: str) -> None:
+        pos = bisect_right(self._keys, key)
+        self._keys.insert(pos, key)
+        self._ids.insert(pos, doc_id)
+
+    def remove(self, key: Any, doc_id: str) -> None:
+        lo, hi = bisect_left(self._keys, key), bisect_right(self._keys, key)
+        pos = self._ids.index(doc_id, lo, hi)
+        del self._keys[pos]
+        del self._ids[pos]
+
+    def range(
+        self, low: Any = None, high: Any = None, include_low: bool = True, include_high: bool = True
+    ) -> list[str]:
+        """
+        Returns the ids of the Documents with a key between `low` and `high`. A `None` bound is unbounded.
+        """
+        start = 0 if low is None else (bisect_left if include_low else bisect_right)(self._keys, low)
+        end = len(self._keys) if high is None else (bisect_right if include_high else bisect_left)(self._keys, high)
+        return self._ids[start:end]
+
+    def ids(self) -> list[str]:
+        """
+        Returns the ids of all the indexed Documents.
+        """
+        return list(self._ids)
+
+
+class HashFieldIndex:
+    """
+    Maps the values of a field to the ids of the Documents having them, for equality lookups.
+
+    Documents whose value is not hashable are not indexed, they are returned with every lookup
+    so that the filters can evaluate them.
+    """
+
+    def __init__(self):
+        self._values: dict[Any, set[str]] = {}
+        self._doc_values: dict[str, Any] = {}
+        self._unindexed: set[str] = set()
+
+    def add(self, doc_id: str, value: Any) -> None:
+        """
+        Indexes the value of the field for a Document.
+        """
+        try:
+            if _is_nan(value):
+                # NaN is not equal to itself, but it would be found by a dictionary lookup
+                raise TypeError("NaN can't be indexed")
+            self._values.setdefault(value, set()).add(doc_id)
+            self._doc_values[doc_id] = value
+        except TypeError:
+            self._unindexed.add(doc_id)
+
+    def remove(self, doc_id: str) -> None:
+        """
+        Removes a Document from the index.
+        """
+        self._unindexed.discard(doc_id)
+        if doc_id not in self._doc_values:
+            return
+        value = self._doc_values.pop(doc_id)
+        ids = self._values[value]
+        ids.discard(doc_id)
+        if not ids:
+            del self._values[value]
+
+    def candidates(self, operator: str, filter_value: Any) -> Optional[set[str]]:
+        """
+        Returns the ids of the Documents that may match the condition, or `None` if the index can't be used for it.
+        """
+        if operator == "==":
+            filter_values = [filter_value]
+        elif operator == "in" and isinstance(filter_value, list):
+            filter_values = filter_value
+        else:
+            return None
+
+        ids = set(self._unindexed)
+        for value in filter_values:
+            try:
+                if _is_nan(value):
+                    return None
+                ids.update(self._values.get(value, ()))
+            except TypeError:
+                return None
+        return ids
+
+    def unverified(self, operator: str, filter_value: Any) -> Optional[set[str]]:
+        """
+        Returns the candidates of the condition that may not match it, or `None` if none of them is known to match.
+
+        Only meaningful if `candidates` returned the candidates of the condition. The other candidates hold a value
+        equal to the filter value, they match the condition.
+        """
+        return set(self._unindexed)
+
+
+class SortedFieldIndex:
+    """
+    Keeps the values of a field sorted, for range lookups with the operators '>', '>=', '<' and '<='.
+
+    Numbers and ISO formatted dates are indexed separately. Documents with other values are not indexed,
+    they are returned with every lookup so that the filters can evaluate them and raise the same errors.
+    Documents without a value for the field are never returned, as `None` never matches range operators.
+    """
+
+    def __init__(self):
+        self._numbers = _SortedKeys()
+        self._dates = _SortedKeys()
+        self._doc_keys: dict[str, tuple[str, Any]] = {}
+        self._unindexed: set[str] = set()
+
+    def add(self, doc_id: str, value: Any) -> None:
+        """
+        Indexes the value of the field for a Document.
+        """
+        if value is None:
+            return
+        if isinstance(value, (int, float)) and not _is_nan(value):
+            self._numbers.add(value, doc_id)
+            self._doc_keys[doc_id] = ("number", value)
+            return
+        if isinstance(value, str):
+            # Only ISO formatted dates are indexed: other formats may be parsed relative to the current date,
+            # so their key could change over time.
+            try:
+                key = datetime.fromisoformat(value).replace(tzinfo=None)
+            except ValueError:
+                pass
+            else:
+                self._dates.add(key, doc_id)
+                self._doc_keys[doc_id] = ("date", key)
+                return
+        self._unindexed.add(doc_id)
+
+    def remove(self, doc_id: str) -> None:
+        """
+        Removes a Document from the index.
+        """
+        self._unindexed.discard(doc_id)
+        if doc_id not in self._doc_keys:
+            return
+        kind, key = self._doc_keys.pop(doc_id)
+        (self._numbers if kind == "number" else self._dates).remove(key, doc_id)
+
+    def candidates(self, operator: str, filter_value: Any) -> Optional[set[str]]:
+        """
+        Returns the ids of the Documents that may match the condition, or `None` if the index can't be used for it.
+        """
+        if operator not in (">", ">=", "<", "<="):
+            return None
+        if filter_value is None:
+            return set()
+
+        lower = operator in (">", ">=")
+        inclusive = operator in (">=", "<=")
+        if isinstance(filter_value, (int, float)) and not _is_nan(filter_value):
+            if lower:
+                ids = self._numbers.range(low=filter_value, include_low=inclusive)
+            else:
+                ids = self._numbers.range(high=filter_value, include_high=inclusive)
+            # strings always fail to compare with numbers, the filters must evaluate them to raise the error
+            return set(ids) | set(self._dates.ids()) | self._unindexed
+
+        if isinstance(filter_value, str):
+            try:
+                key = _parse_date(filter_value).replace(tzinfo=None)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # the filters raise the error when evaluating the Documents
+                return None
+            if lower:
+                ids = self._dates.range(low=key - _DATE_TOLERANCE)
+            else:
+                ids = self._dates.range(high=key + _DATE_TOLERANCE)
+            # numbers always fail to compare with dates, the filters must evaluate them to raise the error
+            return set(ids) | set(self._numbers.ids()) | self._unindexed
+
+        return None
+
+    def unverified(self, operator: str, filter_value: Any) -> Optional[set[str]]:
+        """
+        Returns the candidates of the condition that may not match it, or `None` if none of them is known to match.
+
+        Only meaningful if `candidates` returned the candidates of the condition. Numbers in the range of a number
+        filter value match the condition, while dates are looked up in a widened range.
+        """
+        if filter_value is None:
+            return set()
+        if isinstance(filter_value, (int, float)) and not _is_nan(filter_value):
+            return set(self._dates.ids()) | self._unindexed
+        return None
+
+
+class MetadataIndex:
+    """
+    Secondary indexes over Document fields, used to narrow down the Documents that must be evaluated by filters.
+
+    The candidates returned by the index are a superset of the Documents matching a filter, they still need
+    to be checked against it.
+    """
+
+    def __init__(self):
+        self._indexes: dict[str, dict[str, Any]] = {}
+        # Position of each Document in the store, to return the candidates in the store order
+        self._positions: dict[str, int] = {}
+        self._next_position = 0
+
+    @property
+    def fields(self) -> dict[str, list[str]]:
+        """
+        The indexed fields with the types of their indexes.
+        """
+        return {field: list(indexes.keys()) for field, indexes in self._indexes.items()}
+
+    def add_index(self, field: str, index_type: MetadataIndexType, documents: Iterable[Document]) -> None:
+        """
+        Creates an index on a field if it doesn't exist yet, indexing the given Documents.
+
+        :param field: The field to index, for example "meta.source_id".
+        :param index_type: "hash" for the operators '==' and 'in', "sorted" for '>', '>=', '<' and '<='.
+        :param documents: The Documents already in the store.
+        """
+        if index_type not in ("hash", "sorted"):
+            raise ValueError(f"Metadata index type '{index_type}' is not supported.")
+        field = normalize_field_name(field)
+        indexes = self._indexes.setdefault(field, {})
+        if index_type in indexes:
+            return
+
+        index = HashFieldIndex() if index_type == "hash" else SortedFieldIndex()
+        for document in documents:
+            index.add(document.id, self._field_value(document, field))
+        indexes[index_type] = index
+
+    def add(self, document: Document) -> None:
+        """
+        Indexes a Document. It must not be indexed already.
+        """
+        self._positions[document.id] = self._next_position
+        self._next_position += 1
+        for field, indexes in self._indexes.items():
+            value = self._field_value(document, field)
+            for index in indexes.values():
+                index.add(document.id, value)
+
+    def update(self, document: Document) -> None:
+        """
+        Re-indexes a Document whose fields changed, keeping its position in the store order.
+        """
+        for field, indexes in self._indexes.items():
+            value = self._field_value(document, field)
+            for index in indexes.values():
+                index.remove(document.id)
+                index.add(document.id, value)
+
+    def remove(self, doc_id: str) -> None:
+        """
+        Removes a Document from the indexes.
+        """
+        self._positions.pop(doc_id, None)
+        for indexes in self._indexes.values():
+            for index in indexes.values():
+                index.remove(doc_id)
+
+    def sort(self, doc_ids: Iterable[str]) -> list[str]:
+        """
+        Sorts Document ids in the order the Documents were written to the store.
+        """
+        return sorted(doc_ids, key=self._positions.__getitem__)
+
+    def candidates(self, filters: dict[str, Any]) -> Optional[set[str]]:
+        """
+        Returns the ids of the Documents that may match the filters.
+
+        :param filters: The filters.
+        :returns: A superset of the ids of the matching Documents, or `None` if the indexes can't narrow them down.
+        """
+        plan = self.plan(filters)
+        return None if plan is None else plan[0]
+
+    def plan(self, filters: dict[str, Any]) -> Optional[tuple[set[str], set[str]]]:
+        """
+        Returns the ids of the Documents that may match the filters, and the ones among them that must be evaluated.
+
+        The candidates that don't need to be evaluated are known to match the filters, and evaluating the filters
+        on them wouldn't raise any error.
+
+        :param filters: The filters.
+        :returns: A superset of the ids of the matching Documents and the subset of them that may not match,
+            or `None` if the indexes can't narrow them down.
+        """
+        if not self._indexes or not self._is_valid(filters):
+            return None
+        return self._plan(filters)
+
+    def _plan(self, condition: dict[str, Any]) -> Optional[tuple[set[str], set[str]]]:
+        if "field" in condition:
+            indexes = self._indexes.get(normalize_field_name(condition["field"]), {})
+            for index in indexes.values():
+                ids = index.candidates(condition["operator"], condition["value"])
+                if ids is not None:
+                    unverified = index.unverified(condition["operator"], condition["value"])
+                    return ids, ids if unverified is None else unverified
+            return None
+
+        planned = [self._plan(sub_condition) for sub_condition in condition["conditions"]]
+        if condition["operator"] == "AND":
+            planned_ids = [plan for plan in planned if plan is not None]
+            if not planned_ids:
+                return None
+            planned_ids.sort(key=lambda plan: len(plan[0]))
+            ids = planned_ids[0][0].intersection(*(plan[0] for plan in planned_ids[1:]))
+            if len(planned_ids) < len(planned):
+                # the conditions the indexes can't narrow down must be evaluated on every candidate
+                return ids, ids
+            # a candidate is known to match if it's known to match every condition
+            return ids, ids.intersection(set().union(*(plan[1] for plan in planned_ids)))
+        if condition["operator"] == "OR" and planned and all(plan is not None for plan in planned):
+            # a candidate of a condition may raise an error in another one, evaluated first
+            return (
+                set().union(*(plan[0] for plan in planned)),  # type: ignore[index]
+                set().union(*(plan[1] for plan in planned)),  # type: ignore[index]
+            )
+        return None
+
+    def _is_valid(self, condition: Any) -> bool:
+        # Invalid filters are evaluated on every Document so that they raise the same errors as without indexes,
+        # even if the indexes would leave no Document to evaluate
+        if not isinstance(condition, dict):
+            return False
+        if "field" in condition:
+            return (
+                isinstance(condition["field"], str)
+                and isinstance(condition.get("operator"), str)
+                and condition["operator"] in COMPARISON_OPERATORS
+                and "value" in condition
+                and self._is_valid_value(condition["operator"], condition["value"])
+            )
+        return (
+            isinstance(condition.get("operator"), str)
+            and condition["operator"] in LOGICAL_OPERATORS
+            and isinstance(condition.get("conditions"), list)
+            and all(self._is_valid(sub_condition) for sub_condition in condition["conditions"])
+        )
+
+    @staticmethod
+    def _is_valid_value(operator: str, filter_value: Any) -> bool:
+        # The filters only raise errors for these values when evaluating a Document
+        if operator in ("in", "not in"):
+            return isinstance(filter_value, list)
+        if operator in (">", ">=", "<", "<="):
+            if isinstance(filter_value, list):
+                return False
+            if isinstance(filter_value, str):
+                try:
+                    _parse_date(filter_value)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    return False
+        return True
+
+    @staticmethod
+    def _field_value(document: Document, field: str) -> Any:
+        try:
+            return get_field_value(document, field)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # The filters raise when evaluating this field, the Document must be evaluated to raise the same error
+            return _UNRESOLVABLE
+
+
+class _Unresolvable:
+    """
+    Marker for field values that can't be resolved, never indexed.
+    """
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+_UNRESOLVABLE = _Unresolvable()
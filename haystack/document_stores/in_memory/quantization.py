@@ -0,0 +1,204 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Any, Literal, Optional
+
+import numpy as np
+
+EmbeddingQuantizationType = Literal["float16", "int8", "binary"]
+
+# number of rows decoded at once when scoring quantized embeddings, to bound the memory used by the float32 copies
+_BLOCK_SIZE = 16384
+# number of bits set in each byte value
+_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+class EmbeddingQuantizer:
+    """
+    Compresses the embeddings stored in an EmbeddingMatrix.
+
+    - "float16" stores each dimension with half precision, using 2 bytes per dimension.
+    - "int8" maps each dimension linearly from the range of its values to 256 levels, using 1 byte per dimension.
+      The range of each dimension is learned from the embeddings once there are `min_training_size` of them,
+      values outside of it are clipped.
+    - "binary" only stores the sign of each dimension, using 1 bit per dimension. The angle between two embeddings
+      is estimated from the number of dimensions whose sign differs.
+
+    Scores computed on quantized embeddings are approximate. The `rescore_factor` best candidates for each
+    requested result can be scored again with the original embeddings, which the EmbeddingMatrix keeps next to the
+    codes with `original_dtype` precision.
+    """
+
+    def __init__(
+        self,
+        method: EmbeddingQuantizationType,
+        rescore_factor: Optional[int] = 4,
+        min_training_size: int = 1000,
+        original_dtype: Literal["float32", "float16"] = "float32",
+    ):
+        """
+        Creates an EmbeddingQuantizer.
+
+        :param method: The quantization method, one of "float16", "int8" or "binary".
+        :param rescore_factor: Number of candidates scored again with the original embeddings for each result,
+            or `None` to return the approximate scores.
+        :param min_training_size: Number of embeddings used to learn the range of each dimension for "int8".
+            Until then, embeddings are not quantized.
+        :param original_dtype: The precision the original embeddings are kept with, "float32" or "float16".
+            They're used to rescore candidates, to save snapshots and to return the embeddings of the Documents.
+        """
+        if method not in ("float16", "int8", "binary"):
+            raise ValueError(f"Embedding quantization '{method}' is not supported.")
+        if rescore_factor is not None and rescore_factor < 1:
+            raise ValueError("rescore_factor must be a positive integer or None.")
+        if original_dtype not in ("float32", "float16"):
+            raise ValueError(f"Original embeddings can't be kept as '{original_dtype}'.")
+
+        self.method = method
+        self.rescore_factor = rescore_factor
+        self.min_training_size = min_training_size
+        self.original_dtype = original_dtype
+        # int8 scalar quantization parameters: value = offset + scale * code
+        self.offset: Optional[np.ndarray] = None
+        self.scale: Optional[np.ndarray] = None
+
+    @property
+    def is_trained(self) -> bool:
+        """
+        Whether embeddings can be quantized. Only "int8" needs to be trained.
+        """
+        return self.method != "int8" or self.offset is not None
+
+    @property
+    def dtype(self) -> type:
+        """
+        The type of the quantized codes.
+        """
+        return np.float16 if self.method == "float16" else np.uint8
+
+    def code_size(self, dim: int) -> int:
+        """
+        Number of codes used to store an embedding of size `dim`.
+        """
+        return (dim + 7) // 8 if self.method == "binary" else dim
+
+    def needs_training(self, n_embeddings: int) -> bool:
+        """
+        Whether the quantizer should be trained given the current number of embeddings.
+        """
+        return not self.is_trained and n_embeddings >= self.min_training_size
+
+    def train(self, embeddings: np.ndarray) -> None:
+        """
+        Learns the range of each dimension for "int8" quantization.
+
+        :param embeddings: A 2D float32 array of embeddings.
+        """
+        if self.method != "int8":
+            return
+        low, high = embeddings.min(axis=0), embeddings.max(axis=0)
+        self.offset = low.astype(np.float32)
+        self.scale = np.where(high > low, (high - low) / 255, 1).astype(np.float32)
+
+    def reset(self) -> None:
+        """
+        Forgets the learned ranges, for example when all the embeddings are removed.
+        """
+        self.offset = None
+        self.scale = None
+
+    def encode(self, embeddings: np.ndarray) -> np.ndarray:
+        """
+        Quantizes embeddings.
+
+        :param embeddings: A 2D float32 array of embeddings.
+        :returns: A 2D array of codes with one row per embedding.
+        """
+        if self.method == "float16":
+            return embeddings.astype(np.float16)
+        if self.method == "binary":
+            return np.packbits(embeddings > 0, axis=1)
+        offset, scale = self._int8_parameters()
+        return np.clip(np.rint((embeddings - offset) / scale), 0, 255).astype(np.uint8)
+
+    def decode(self, codes: np.ndarray, dim: int, norms: np.ndarray) -> np.ndarray:
+        """
+        Approximates the original embeddings from their codes.
+
+        :param codes: A 2D array of codes.
+        :param dim: The size of the embeddings.
+        :param norms: The norm of the original embeddings, used to scale binary codes.
+        :returns: A 2D float32 array of embeddings.
+        """
+        if self.method == "float16":
+            return codes.astype(np.float32)
+        if self.method == "binary":
+            signs = np.unpackbits(codes, axis=1, count=dim).astype(np.float32) * 2 - 1
+            return signs * (norms / np.sqrt(dim))[:, None]
+        offset, scale = self._int8_parameters()
+        return offset + codes.astype(np.float32) * scale
+
+    def dot_products(self, codes: np.ndarray, queries: np.ndarray, norms: np.ndarray) -> np.ndarray:
+        """
+        Approximates the dot products between queries and quantized embeddings.
+
+        :param codes: A 2D array of codes with one row per embedding.
+        :param queries: A 2D float32 array of query embeddings.
+        :param norms: The norm of the original embeddings.
+        :returns: A 2D float32 array with one row of scores per query.
+        """
+        if self.method == "binary":
+            return self._binary_dot_products(codes, queries, norms)
+
+        bias = None
+        if self.method == "int8":
+            # (offset + scale * code) . query = offset . query + code . (scale * query)
+            offset, scale = self._int8_parameters()
+            bias = queries @ offset
+            queries = queries * scale
+        scores = np.empty((len(queries), len(codes)), dtype=np.float32)
+        for start in range(0, len(codes), _BLOCK_SIZE):
+            block = codes[start : start + _BLOCK_SIZE].astype(np.float32)
+            scores[:, start : start + _BLOCK_SIZE] = queries @ block.T
+        if bias is not None:
+            scores += bias[:, None]
+        return scores
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serializes the trained state of the quantizer.
+        """
+        return {
+            "offset": self.offset.tolist() if self.offset is not None else None,
+            "scale": self.scale.tolist() if self.scale is not None else None,
+        }
+
+    def load_state(self, data: dict[str, Any]) -> None:
+        """
+        Restores the trained state of the quantizer serialized with `to_dict`.
+
+        :param data: The serialized state.
+        """
+        if self.method == "int8" and data.get("offset") is not None:
+            self.offset = np.asarray(data["offset"], dtype=np.float32)
+            self.scale = np.asarray(data["scale"], dtype=np.float32)
+
+    def _int8_parameters(self) -> tuple[np.ndarray, np.ndarray]:
+        if self.offset is None or self.scale is None:
+            raise ValueError("The int8 quantizer must be trained before quantizing embeddings.")
+        return self.offset, self.scale
+
+    def _binary_dot_products(self, codes: np.ndarray, queries: np.ndarray, norms: np.ndarray) -> np.ndarray:
+        # The fraction of dimensions whose sign differs estimates the angle between the vectors divided by pi
+        dim = queries.shape[1]
+        query_codes = np.packbits(queries > 0, axis=1)
+        query_norms = np.linalg.norm(queries, axis=1)
+        scores = np.empty((len(queries), len(codes)), dtype=np.float32)
+        for i, query_code in enumerate(query_codes):
+            for start in range(0, len(codes), _BLOCK_SIZE):
+                block = codes[start : start + _BLOCK_SIZE]
+                hamming = _POPCOUNT[block ^ query_code].sum(axis=1, dtype=np.int64)
+                scores[i, start : start + _BLOCK_SIZE] = np.cos(np.pi * hamming / dim)
+            scores[i] *= query_norms[i] * norms
+        return scores
@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+class ReadWriteLock:
+    """
+    A lock letting any number of readers or a single writer access a resource.
+
+    Writers are preferred: once a writer waits for the lock, new readers wait until it's done, so a steady flow of
+    readers can't starve writers. The lock is reentrant: a thread holding it can acquire it again, for reading or
+    writing if it's the writer, and for reading if it's a reader. A reader can't acquire the lock for writing.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._waiting_writers = 0
+        self._writer: Optional[int] = None
+        # number of times each thread holds the lock for reading
+        self._local = threading.local()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """
+        Holds the lock for reading while the context is active.
+        """
+        if self._writer == threading.get_ident():
+            # the writer already excludes everyone else
+            yield
+            return
+
+        depth = getattr(self._local, "depth", 0)
+        with self._condition:
+            # a thread already reading doesn't wait for writers, they're waiting for it to finish
+            if depth == 0:
+                self._condition.wait_for(lambda: self._writer is None and self._waiting_writers == 0)
+            self._readers += 1
+        self._local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+            with self._condition:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """
+        Holds the lock for writing while the context is active.
+
+        :raises RuntimeError: If the thread holds the lock for reading.
+        """
+        if self._writer == threading.get_ident():
+            yield
+            return
+        if getattr(self._local, "depth", 0) > 0:
+            raise RuntimeError("A thread reading can't acquire the lock for writing.")
+
+        with self._condition:
+            self._waiting_writers += 1
+            try:
+                self._condition.wait_for(lambda: self._writer is None and self._readers == 0)
+            finally:
+                self._waiting_writers -= 1
+            self._writer = threading.get_ident()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = None
+                self._condition.notify_all()
@@ -0,0 +1,819 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import threading
+import zlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import chain, count
+from multiprocessing.connection import Connection
+from typing import Any, Iterable, Literal, Optional
+
+from haystack import default_from_dict, default_to_dict, logging
+from haystack.dataclasses import Document, SparseEmbedding
+from haystack.document_stores.errors import DocumentStoreError
+from haystack.document_stores.in_memory.bm25_tokenizer import BM25Tokenizer, deserialize_bm25_tokenizer_in_init_params
+from haystack.document_stores.in_memory.document_store import InMemoryDocumentStore, bm25okapi_idf_floor
+from haystack.document_stores.in_memory.metadata_index import MetadataIndexType
+from haystack.document_stores.in_memory.quantization import EmbeddingQuantizationType
+from haystack.document_stores.types import DuplicatePolicy
+from haystack.utils import top_k_items
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _BM25Statistics:
+    """
+    BM25 statistics of the Documents of all the shards, used by each shard to score its own Documents.
+
+    :param version: Identifies the state of the corpus the statistics were computed for.
+    :param n_documents: The number of Documents of all the shards.
+    :param avg_doc_len: The average number of tokens of the Documents of all the shards.
+    :param document_frequencies: The number of Documents containing each query token, for the tokens of the
+        vocabulary.
+    :param okapi_idf_floor: The IDF given to the tokens with a negative IDF by BM25Okapi, if needed.
+    """
+
+    version: int
+    n_documents: int
+    avg_doc_len: float
+    document_frequencies: dict[str, int]
+    okapi_idf_floor: Optional[float] = None
+
+
+class _ShardDocumentStore(InMemoryDocumentStore):
+    """
+    An InMemoryDocumentStore holding the Documents of a shard, run in a worker process.
+
+    BM25 scores depend on the statistics of the whole corpus: when retrieving Documents for the
+    ShardedInMemoryDocumentStore, the shard uses the statistics of all the shards instead of its own ones,
+    so that its scores can be compared with the ones of the other shards.
+    """
+
+    def __init__(self, **init_parameters: Any):
+        self._bm25_statistics: Optional[_BM25Statistics] = None
+        super().__init__(**init_parameters)
+
+    @property
+    def _corpus_version(self) -> int:
+        if self._bm25_statistics is not None:
+            # negative, so that it never matches a version of the shard itself
+            return -self._bm25_statistics.version
+        return super()._corpus_version
+
+    @property
+    def _bm25_corpus_size(self) -> int:
+        if self._bm25_statistics is not None:
+            return self._bm25_statistics.n_documents
+        return super()._bm25_corpus_size
+
+    @property
+    def _avg_doc_len(self) -> float:
+        if self._bm25_statistics is not None:
+            return self._bm25_statistics.avg_doc_len
+        return super()._avg_doc_len
+
+    @_avg_doc_len.setter
+    def _avg_doc_len(self, value: float) -> None:
+        InMemoryDocumentStore._avg_doc_len.fset(self, value)  # type: ignore[attr-defined]
+
+    @property
+    def _freq_vocab_for_idf(self) -> Counter:
+        if self._bm25_statistics is not None:
+            return Counter(self._bm25_statistics.document_frequencies)
+        return super()._freq_vocab_for_idf
+
+    def _okapi_idf_floor(self, epsilon: float) -> float:
+        if self._bm25_statistics is not None and self._bm25_statistics.okapi_idf_floor is not None:
+            return self._bm25_statistics.okapi_idf_floor
+        return super()._okapi_idf_floor(epsilon)
+
+    def bm25_statistics(self, queries: list[str]) -> tuple[int, float, list[dict[str, int]]]:
+        """
+        Returns the number of Documents, their average length and the document frequency of each query token.
+        """
+        freq_vocab_for_idf = self._freq_vocab_for_idf
+        document_frequencies = [
+            {tok: freq_vocab_for_idf[tok] for tok in self._tokenize_bm25(query) if tok in freq_vocab_for_idf}
+            for query in queries
+        ]
+        return self._bm25_corpus_size, self._avg_doc_len, document_frequencies
+
+    def document_frequencies(self) -> Counter:
+        """
+        Returns the number of Documents containing each token of the vocabulary.
+        """
+        return self._freq_vocab_for_idf
+
+    def bm25_retrieval_with_statistics(  # pylint: disable=too-many-positional-arguments
+        self,
+        queries: list[str],
+        statistics: list[_BM25Statistics],
+        filters: Optional[dict[str, Any]],
+        top_k: int,
+        scale_score: bool,
+    ) -> list[list[Document]]:
+        """
+        Retrieves the Documents of the shard most relevant to each query, scored with the given statistics.
+        """
+        if not all(queries):
+            raise ValueError("Query should be a non-empty string")
+
+        with self._lock.read():
+            candidate_documents = self._bm25_candidate_documents(filters)
+            results = []
+            for query, query_statistics in zip(queries, statistics):
+                self._bm25_statistics = query_statistics
+                try:
+                    results.append(self._bm25_retrieval(query, candidate_documents, top_k, scale_score))
+                finally:
+                    self._bm25_statistics = None
+            return results
+
+
+def _run_shard(connection: Connection, init_parameters: dict[str, Any]) -> None:
+    """
+    Serves the calls of a ShardedInMemoryDocumentStore to a shard until it receives `None`.
+    """
+    store = _ShardDocumentStore(**init_parameters)
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+        method, args, kwargs = message
+        try:
+            connection.send((True, getattr(store, method)(*args, **kwargs)))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            try:
+                connection.send((False, e))
+            except Exception:  # pylint: disable=broad-exception-caught
+                # the exception can't be pickled
+                connection.send((False, DocumentStoreError(f"{type(e).__name__}: {e}")))
+    store.shutdown()
+    connection.close()
+
+
+class ShardedInMemoryDocumentStore:
+    """
+    Stores data in-memory, partitioned across several worker processes to use multiple CPU cores.
+
+    Each Document is assigned to a shard based on its id. Every shard is an InMemoryDocumentStore running in its
+    own process, which holds the Documents, the BM25 statistics and the embedding matrix of its partition.
+    Retrieval and filtering run on all the shards in parallel, and the best Documents of each shard are merged.
+    BM25 scores are computed with the statistics of all the shards, so they're the same as with a single
+    InMemoryDocumentStore containing all the Documents.
+
+    Documents are copied when they're sent to and from the worker processes. Filtering returns the Documents
+    grouped by shard, in the order they were written within each shard. Calls from several threads are run
+    one after the other, each of them using all the shards.
+    """
+
+    def __init__(  # noqa: PLR0913 # pylint: disable=too-many-positional-arguments
+        self,
+        n_shards: Optional[int] = None,
+        bm25_tokenization_regex: str = r"(?u)\b\w\w+\b",
+        bm25_algorithm: Literal["BM25Okapi", "BM25L", "BM25Plus"] = "BM25L",
+        bm25_parameters: Optional[dict] = None,
+        embedding_similarity_function: Literal["dot_product", "cosine"] = "dot_product",
+        async_executor: Optional[ThreadPoolExecutor] = None,
+        return_embedding: bool = True,
+        embedding_index_type: Literal["flat", "ivf"] = "flat",
+        embedding_index_parameters: Optional[dict] = None,
+        metadata_indexes: Optional[dict[str, MetadataIndexType]] = None,
+        embedding_quantization: Optional[EmbeddingQuantizationType] = None,
+        embedding_quantization_parameters: Optional[dict] = None,
+        bm25_tokenizer: Optional[BM25Tokenizer] = None,
+    ):
+        """
+        Initializes the DocumentStore and starts the worker processes of the shards.
+
+        :param n_shards: The number of shards, each of them run in a worker process.
+            If not specified, the number of CPUs is used.
+        :param async_executor:
+            Optional ThreadPoolExecutor to use for async calls. If not provided, a single-threaded
+            executor will be initialized and used.
+
+        The other parameters are the ones of `InMemoryDocumentStore`, they're used to initialize every shard.
+        """
+        self.n_shards = n_shards or os.cpu_count() or 1
+        if self.n_shards < 1:
+            raise ValueError("n_shards must be a positive integer.")
+        self.bm25_tokenization_regex = bm25_tokenization_regex
+        self.bm25_algorithm = bm25_algorithm
+        self.bm25_parameters = bm25_parameters or {}
+        self.embedding_similarity_function = embedding_similarity_function
+        self.return_embedding = return_embedding
+        self.embedding_index_type = embedding_index_type
+        self.embedding_index_parameters = embedding_index_parameters or {}
+        self.metadata_indexes = metadata_indexes or {}
+        self.embedding_quantization = embedding_quantization
+        self.embedding_quantization_parameters = embedding_quantization_parameters or {}
+        self.bm25_tokenizer = bm25_tokenizer
+
+        # validates the parameters before starting the worker processes
+        shard_init_parameters: dict[str, Any] = {
+            "bm25_tokenization_regex": self.bm25_tokenization_regex,
+            "bm25_algorithm": self.bm25_algorithm,
+            "bm25_parameters": self.bm25_parameters,
+            "embedding_similarity_function": self.embedding_similarity_function,
+            "return_embedding": self.return_embedding,
+            "embedding_index_type": self.embedding_index_type,
+            "embedding_index_parameters": self.embedding_index_parameters,
+            "metadata_indexes": self.metadata_indexes,
+            "embedding_quantization": self.embedding_quantization,
+            "embedding_quantization_parameters": self.embedding_quantization_parameters,
+            "bm25_tokenizer": self.bm25_tokenizer,
+        }
+        InMemoryDocumentStore(**shard_init_parameters).shutdown()
+
+        # The worker processes are used by one call at a time. The lock is reentrant so that it can be held across
+        # the calls that must see the same corpus, like the version bump and the write, or the two BM25 phases.
+        self._lock = threading.RLock()
+        # changed by every write and deletion, identifies the BM25 statistics of the corpus
+        self._version = 0
+        self._next_version = count(1)
+        self._okapi_idf_floor_cache: tuple[int, Optional[float]] = (-1, None)
+
+        self._connections: list[Connection] = []
+        self._processes: list[multiprocessing.Process] = []
+        for shard in range(self.n_shards):
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_run_shard,
+                args=(worker_connection, shard_init_parameters),
+                name=f"inmemory-docstore-shard-{shard}-{id(self)}",
+                daemon=True,
+            )
+            process.start()
+            worker_connection.close()
+            self._connections.append(connection)
+            self._processes.append(process)
+
+        # keep track of whether we own the executor if we created it we must also clean it up
+        self._owns_executor = async_executor is None
+        self.executor = (
+            ThreadPoolExecutor(thread_name_prefix=f"async-sharded-inmemory-docstore-executor-{id(self)}", max_workers=1)
+            if async_executor is None
+            else async_executor
+        )
+
+    def __del__(self):
+        """
+        Cleanup when the instance is being destroyed.
+        """
+        if getattr(self, "_processes", None):
+            try:  # noqa: SIM105
+                self.shutdown()
+            except Exception:  # pylint: disable=broad-exception-caught
+                # at interpreter exit the modules may already be torn down,
+                # multiprocessing terminates the daemon worker processes itself
+                pass
+
+    def shutdown(self):
+        """
+        Stops the worker processes of the shards, and the executor if we own it.
+        """
+        with self._lock:
+            for connection, process in zip(self._connections, self._processes):
+                # the worker process may have died already
+                with contextlib.suppress(OSError):
+                    connection.send(None)
+                process.join()
+                connection.close()
+            self._connections, self._processes = [], []
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serializes the component to a dictionary.
+
+        :returns:
+            Dictionary with serialized data.
+        """
+        return default_to_dict(
+            self,
+            n_shards=self.n_shards,
+            bm25_tokenization_regex=self.bm25_tokenization_regex,
+            bm25_algorithm=self.bm25_algorithm,
+            bm25_parameters=self.bm25_parameters,
+            embedding_similarity_function=self.embedding_similarity_function,
+            return_embedding=self.return_embedding,
+            embedding_index_type=self.embedding_index_type,
+            embedding_index_parameters=self.embedding_index_parameters,
+            metadata_indexes=self.metadata_indexes,
+            embedding_quantization=self.embedding_quantization,
+            embedding_quantization_parameters=self.embedding_quantization_parameters,
+            bm25_tokenizer=self.bm25_tokenizer.to_dict() if self.bm25_tokenizer is not None else None,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ShardedInMemoryDocumentStore":
+        """
+        Deserializes the component from a dictionary.
+
+        :param data:
+            The dictionary to deserialize from.
+        :returns:
+            The deserialized component.
+        """
+        init_params = deserialize_bm25_tokenizer_in_init_params(data.get("init_parameters", {}))
+        return default_from_dict(cls, {**data, "init_parameters": init_params})
+
+    def _shard(self, doc_id: str) -> int:
+        # the built-in hash of strings differs between processes, it can't be used to assign the shards
+        return zlib.crc32(doc_id.encode("utf-8")) % self.n_shards
+
+    def _call(self, calls: dict[int, tuple[str, tuple, dict[str, Any]]]) -> dict[int, Any]:
+        """
+        Calls a method of several shards in parallel.
+
+        :param calls: The method to call on each shard, with its positional and keyword arguments.
+        :returns: The result of the call of each shard.
+        :raises Exception: The first exception raised by a shard, once all the shards are done.
+        """
+        with self._lock:
+            if not self._processes:
+                raise DocumentStoreError("The ShardedInMemoryDocumentStore has been shut down.")
+            for shard, call in calls.items():
+                self._connections[shard].send(call)
+            replies = {}
+            for shard in calls:
+                # every reply is received, even after a failure, so that the next call doesn't get it
+                try:
+                    replies[shard] = self._connections[shard].recv()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    replies[shard] = (False, DocumentStoreError(f"Shard {shard} failed: {e!r}"))
+
+        for success, result in replies.values():
+            if not success:
+                raise result
+        return {shard: result for shard, (_, result) in replies.items()}
+
+    def _call_all(self, method: str, *args: Any, **kwargs: Any) -> list[Any]:
+        """
+        Calls a method of all the shards in parallel and returns their results in the order of the shards.
+        """
+        results = self._call(dict.fromkeys(range(self.n_shards), (method, args, kwargs)))
+        return [results[shard] for shard in range(self.n_shards)]
+
+    def count_documents(self, filters: Optional[dict[str, Any]] = None) -> int:
+        """
+        Returns the number of how many documents are present in the DocumentStore.
+
+        :param filters: If provided, only the documents that match the filters are counted.
+        :returns: The number of documents.
+        """
+        return sum(self._call_all("count_documents", filters=filters))
+
+    def filter_documents(self, filters: Optional[dict[str, Any]] = None) -> list[Document]:
+        """
+        Returns the documents that match the filters provided.
+
+        For a detailed specification of the filters, refer to the DocumentStore.filter_documents() protocol
+        documentation.
+
+        :param filters: The filters to apply to the document list.
+        :returns: A list of Documents that match the given filters, grouped by shard.
+        """
+        return list(chain.from_iterable(self._call_all("filter_documents", filters=filters)))
+
+    def write_documents(self, documents: list[Document], policy: DuplicatePolicy = DuplicatePolicy.NONE) -> int:
+        """
+        Refer to the DocumentStore.write_documents() protocol documentation.
+
+        If `policy` is set to `DuplicatePolicy.NONE` defaults to `DuplicatePolicy.FAIL`.
+        The write isn't atomic: with `DuplicatePolicy.FAIL`, a shard writes the Documents preceding its first
+        duplicate before raising `DuplicateDocumentError`, and the other shards still write all of theirs.
+        """
+        if not isinstance(documents, list) or any(not isinstance(doc, Document) for doc in documents):
+            raise ValueError("Please provide a list of Documents.")
+
+        shard_documents: dict[int, list[Document]] = {}
+        for document in documents:
+            shard_documents.setdefault(self._shard(document.id), []).append(document)
+        with self._lock:
+            self._version = next(self._next_version)
+            results = self._call(
+                {
+                    shard: ("write_documents", (), {"documents": docs, "policy": policy})
+                    for shard, docs in shard_documents.items()
+                }
+            )
+        return sum(results.values())
+
+    def delete_documents(self, document_ids: list[str]) -> None:
+        """
+        Deletes all documents with matching document_ids from the DocumentStore.
+
+        :param document_ids: The object_ids to delete.
+        """
+        shard_ids: dict[int, list[str]] = {}
+        for doc_id in document_ids:
+            shard_ids.setdefault(self._shard(doc_id), []).append(doc_id)
+        with self._lock:
+            self._version = next(self._next_version)
+            self._call({shard: ("delete_documents", (), {"document_ids": ids}) for shard, ids in shard_ids.items()})
+
+    def delete_by_filter(self, filters: dict[str, Any]) -> int:
+        """
+        Deletes the documents that match the filters.
+
+        :param filters: The filters to apply to select the documents to delete.
+        :returns: The number of deleted documents.
+        """
+        with self._lock:
+            self._version = next(self._next_version)
+            return sum(self._call_all("delete_by_filter", filters=filters))
+
+    def update_by_filter(self, filters: dict[str, Any], meta: dict[str, Any]) -> int:
+        """
+        Updates the metadata of the documents that match the filters.
+
+        :param filters: The filters to apply to select the documents to update.
+        :param meta: The metadata fields to set on the matching documents.
+        :returns: The number of updated documents.
+        """
+        return sum(self._call_all("update_by_filter", filters=filters, meta=meta))
+
+    def bm25_retrieval(
+        self, query: str, filters: Optional[dict[str, Any]] = None, top_k: int = 10, scale_score: bool = False
+    ) -> list[Document]:
+        """
+        Retrieves documents that are most relevant to the query using BM25 algorithm.
+
+        :param query: The query string.
+        :param filters: A dictionary with filters to narrow down the search space.
+        :param top_k: The number of top documents to retrieve. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved documents. Default is False.
+        :returns: A list of the top_k documents most relevant to the query.
+        """
+        if not query:
+            raise ValueError("Query should be a non-empty string")
+        return self.bm25_retrieval_batch([query], filters=filters, top_k=top_k, scale_score=scale_score)[0]
+
+    def bm25_retrieval_batch(
+        self, queries: list[str], filters: Optional[dict[str, Any]] = None, top_k: int = 10, scale_score: bool = False
+    ) -> list[list[Document]]:
+        """
+        Retrieves the documents that are most relevant to each query using BM25 algorithm.
+
+        :param queries: The query strings.
+        :param filters: A dictionary with filters to narrow down the search space of all the queries.
+        :param top_k: The number of top documents to retrieve for each query. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved documents. Default is False.
+        :returns: A list with the top_k documents most relevant to each query, in the same order as `queries`.
+        """
+        if not all(queries):
+            raise ValueError("Query should be a non-empty string")
+
+        # no write can happen between the two phases, the shards are scored with the statistics of their corpus
+        with self._lock:
+            statistics = self._bm25_statistics(queries)
+            results = self._call_all(
+                "bm25_retrieval_with_statistics",
+                queries,
+                statistics,
+                filters=filters,
+                top_k=top_k,
+                scale_score=scale_score,
+            )
+        return [self._merge(query_results, top_k) for query_results in zip(*results)]
+
+    def _bm25_statistics(self, queries: list[str]) -> list[_BM25Statistics]:
+        """
+        Collects the BM25 statistics of all the shards needed to score the queries.
+
+        Must be called with the lock held, so that the statistics match the version of the corpus.
+        """
+        version = self._version
+        shard_statistics = self._call_all("bm25_statistics", queries)
+        n_documents = sum(n for n, _, _ in shard_statistics)
+        total_len = sum(n * avg_doc_len for n, avg_doc_len, _ in shard_statistics)
+        avg_doc_len = total_len / n_documents if n_documents else 0.0
+
+        statistics = []
+        for i in range(len(queries)):
+            document_frequencies: Counter = Counter()
+            for _, _, query_document_frequencies in shard_statistics:
+                document_frequencies.update(query_document_frequencies[i])
+            okapi_idf_floor = None
+            # BM25Okapi replaces negative IDFs, of tokens in more than half of the Documents, by a floor
+            # derived from the whole vocabulary
+            if self.bm25_algorithm == "BM25Okapi" and any(n > n_documents / 2 for n in document_frequencies.values()):
+                okapi_idf_floor = self._okapi_idf_floor(version, n_documents)
+            statistics.append(
+                _BM25Statistics(version, n_documents, avg_doc_len, dict(document_frequencies), okapi_idf_floor)
+            )
+        return statistics
+
+    def _okapi_idf_floor(self, version: int, n_documents: int) -> float:
+        """
+        Computes the BM25Okapi IDF floor over the vocabulary of all the shards, once per version of the corpus.
+        """
+        cached_version, idf_floor = self._okapi_idf_floor_cache
+        if cached_version == version and idf_floor is not None:
+            return idf_floor
+
+        vocabulary: Counter = Counter()
+        for shard_vocabulary in self._call_all("document_frequencies"):
+            vocabulary.update(shard_vocabulary)
+        idf_floor = bm25okapi_idf_floor(n_documents, vocabulary.values(), self.bm25_parameters.get("epsilon", 0.25))
+        self._okapi_idf_floor_cache = (version, idf_floor)
+        return idf_floor
+
+    def embedding_retrieval(  # pylint: disable=too-many-positional-arguments
+        self,
+        query_embedding: list[float],
+        filters: Optional[dict[str, Any]] = None,
+        top_k: int = 10,
+        scale_score: bool = False,
+        return_embedding: Optional[bool] = False,
+    ) -> list[Document]:
+        """
+        Retrieves documents that are most similar to the query embedding using a vector similarity metric.
+
+        :param query_embedding: Embedding of the query.
+        :param filters: A dictionary with filters to narrow down the search space.
+        :param top_k: The number of top documents to retrieve. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved Documents. Default is False.
+        :param return_embedding: Whether to return the embedding of the retrieved Documents.
+            If not provided, the value of the `return_embedding` parameter set at component
+            initialization will be used. Default is False.
+        :returns: A list of the top_k documents most relevant to the query.
+        """
+        results = self._call_all(
+            "embedding_retrieval",
+            query_embedding=query_embedding,
+            filters=filters,
+            top_k=top_k,
+            scale_score=scale_score,
+            return_embedding=return_embedding,
+        )
+        return self._merge(results, top_k)
+
+    def embedding_retrieval_batch(  # pylint: disable=too-many-positional-arguments
+        self,
+        query_embeddings: list[list[float]],
+        filters: Optional[dict[str, Any]] = None,
+        top_k: int = 10,
+        scale_score: bool = False,
+        return_embedding: Optional[bool] = False,
+    ) -> list[list[Document]]:
+        """
+        Retrieves the documents that are most similar to each query embedding using a vector similarity metric.
+
+        :param query_embeddings: Embeddings of the queries.
+        :param filters: A dictionary with filters to narrow down the search space of all the queries.
+        :param top_k: The number of top documents to retrieve for each query. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved Documents. Default is False.
+        :param return_embedding: Whether to return the embedding of the retrieved Documents.
+            If not provided, the value of the `return_embedding` parameter set at component
+            initialization will be used. Default is False.
+        :returns: A list with the top_k documents most relevant to each query, in the same order as
+            `query_embeddings`.
+        """
+        results = self._call_all(
+            "embedding_retrieval_batch",
+            query_embeddings=query_embeddings,
+            filters=filters,
+            top_k=top_k,
+            scale_score=scale_score,
+            return_embedding=return_embedding,
+        )
+        return [self._merge(query_results, top_k) for query_results in zip(*results)]
+
+    def sparse_embedding_retrieval(  # pylint: disable=too-many-positional-arguments
+        self,
+        query_sparse_embedding: SparseEmbedding,
+        filters: Optional[dict[str, Any]] = None,
+        top_k: int = 10,
+        scale_score: bool = False,
+        return_embedding: Optional[bool] = False,
+    ) -> list[Document]:
+        """
+        Retrieves documents that are most similar to the query sparse embedding using the dot product.
+
+        :param query_sparse_embedding: Sparse embedding of the query.
+        :param filters: A dictionary with filters to narrow down the search space.
+        :param top_k: The number of top documents to retrieve. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved Documents. Default is False.
+        :param return_embedding: Whether to return the dense and sparse embeddings of the retrieved Documents.
+            If not provided, the value of the `return_embedding` parameter set at component
+            initialization will be used. Default is False.
+        :returns: A list of the top_k documents most relevant to the query.
+        """
+        results = self._call_all(
+            "sparse_embedding_retrieval",
+            query_sparse_embedding=query_sparse_embedding,
+            filters=filters,
+            top_k=top_k,
+            scale_score=scale_score,
+            return_embedding=return_embedding,
+        )
+        return self._merge(results, top_k)
+
+    @staticmethod
+    def _merge(results: Iterable[list[Document]], top_k: int) -> list[Document]:
+        # Documents with the same score are kept in the order of the shards
+        return top_k_items(chain.from_iterable(results), top_k, key=lambda doc: doc.score)
+
+    async def count_documents_async(self, filters: Optional[dict[str, Any]] = None) -> int:
+        """
+        Returns the number of how many documents are present in the DocumentStore.
+
+        :param filters: If provided, only the documents that match the filters are counted.
+        :returns: The number of documents.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, lambda: self.count_documents(filters=filters)
+        )
+
+    async def filter_documents_async(self, filters: Optional[dict[str, Any]] = None) -> list[Document]:
+        """
+        Returns the documents that match the filters provided.
+
+        For a detailed specification of the filters, refer to the DocumentStore.filter_documents() protocol
+        documentation.
+
+        :param filters: The filters to apply to the document list.
+        :returns: A list of Documents that match the given filters, grouped by shard.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, lambda: self.filter_documents(filters=filters)
+        )
+
+    async def write_documents_async(
+        self, documents: list[Document], policy: DuplicatePolicy = DuplicatePolicy.NONE
+    ) -> int:
+        """
+        Refer to the DocumentStore.write_documents() protocol documentation.
+
+        If `policy` is set to `DuplicatePolicy.NONE` defaults to `DuplicatePolicy.FAIL`.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, lambda: self.write_documents(documents=documents, policy=policy)
+        )
+
+    async def delete_documents_async(self, document_ids: list[str]) -> None:
+        """
+        Deletes all documents with matching document_ids from the DocumentStore.
+
+        :param document_ids: The object_ids to delete.
+        """
+        await asyncio.get_event_loop().run_in_executor(
+            self.executor, lambda: self.delete_documents(document_ids=document_ids)
+        )
+
+    async def delete_by_filter_async(self, filters: dict[str, Any]) -> int:
+        """
+        Deletes the documents that match the filters.
+
+        :param filters: The filters to apply to select the documents to delete.
+        :returns: The number of deleted documents.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, lambda: self.delete_by_filter(filters=filters)
+        )
+
+    async def update_by_filter_async(self, filters: dict[str, Any], meta: dict[str, Any]) -> int:
+        """
+        Updates the metadata of the documents that match the filters.
+
+        :param filters: The filters to apply to select the documents to update.
+        :param meta: The metadata fields to set on the matching documents.
+        :returns: The number of updated documents.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, lambda: self.update_by_filter(filters=filters, meta=meta)
+        )
+
+    async def bm25_retrieval_async(
+        self, query: str, filters: Optional[dict[str, Any]] = None, top_k: int = 10, scale_score: bool = False
+    ) -> list[Document]:
+        """
+        Retrieves documents that are most relevant to the query using BM25 algorithm.
+
+        :param query: The query string.
+        :param filters: A dictionary with filters to narrow down the search space.
+        :param top_k: The number of top documents to retrieve. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved documents. Default is False.
+        :returns: A list of the top_k documents most relevant to the query.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor,
+            lambda: self.bm25_retrieval(query=query, filters=filters, top_k=top_k, scale_score=scale_score),
+        )
+
+    async def bm25_retrieval_batch_async(
+        self, queries: list[str], filters: Optional[dict[str, Any]] = None, top_k: int = 10, scale_score: bool = False
+    ) -> list[list[Document]]:
+        """
+        Retrieves the documents that are most relevant to each query using BM25 algorithm.
+
+        :param queries: The query strings.
+        :param filters: A dictionary with filters to narrow down the search space of all the queries.
+        :param top_k: The number of top documents to retrieve for each query. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved documents. Default is False.
+        :returns: A list with the top_k documents most relevant to each query, in the same order as `queries`.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor,
+            lambda: self.bm25_retrieval_batch(queries=queries, filters=filters, top_k=top_k, scale_score=scale_score),
+        )
+
+    async def embedding_retrieval_async(  # pylint: disable=too-many-positional-arguments
+        self,
+        query_embedding: list[float],
+        filters: Optional[dict[str, Any]] = None,
+        top_k: int = 10,
+        scale_score: bool = False,
+        return_embedding: bool = False,
+    ) -> list[Document]:
+        """
+        Retrieves documents that are most similar to the query embedding using a vector similarity metric.
+
+        :param query_embedding: Embedding of the query.
+        :param filters: A dictionary with filters to narrow down the search space.
+        :param top_k: The number of top documents to retrieve. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved Documents. Default is False.
+        :param return_embedding: Whether to return the embedding of the retrieved Documents. Default is False.
+        :returns: A list of the top_k documents most relevant to the query.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor,
+            lambda: self.embedding_retrieval(
+                query_embedding=query_embedding,
+                filters=filters,
+                top_k=top_k,
+                scale_score=scale_score,
+                return_embedding=return_embedding,
+            ),
+        )
+
+    async def embedding_retrieval_batch_async(  # pylint: disable=too-many-positional-arguments
+        self,
+        query_embeddings: list[list[float]],
+        filters: Optional[dict[str, Any]] = None,
+        top_k: int = 10,
+        scale_score: bool = False,
+        return_embedding: bool = False,
+    ) -> list[list[Document]]:
+        """
+        Retrieves the documents that are most similar to each query embedding using a vector similarity metric.
+
+        :param query_embeddings: Embeddings of the queries.
+        :param filters: A dictionary with filters to narrow down the search space of all the queries.
+        :param top_k: The number of top documents to retrieve for each query. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved Documents. Default is False.
+        :param return_embedding: Whether to return the embedding of the retrieved Documents. Default is False.
+        :returns: A list with the top_k documents most relevant to each query, in the same order as
+            `query_embeddings`.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor,
+            lambda: self.embedding_retrieval_batch(
+                query_embeddings=query_embeddings,
+                filters=filters,
+                top_k=top_k,
+                scale_score=scale_score,
+                return_embedding=return_embedding,
+            ),
+        )
+
+    async def sparse_embedding_retrieval_async(  # pylint: disable=too-many-positional-arguments
+        self,
+        query_sparse_embedding: SparseEmbedding,
+        filters: Optional[dict[str, Any]] = None,
+        top_k: int = 10,
+        scale_score: bool = False,
+        return_embedding: bool = False,
+    ) -> list[Document]:
+        """
+        Retrieves documents that are most similar to the query sparse embedding using the dot product.
+
+        :param query_sparse_embedding: Sparse embedding of the query.
+        :param filters: A dictionary with filters to narrow down the search space.
+        :param top_k: The number of top documents to retrieve. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved Documents. Default is False.
+        :param return_embedding: Whether to return the dense and sparse embeddings of the retrieved Documents.
+            Default is False.
+        :returns: A list of the top_k documents most relevant to the query.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor,
+            lambda: self.sparse_embedding_retrieval(
+                query_sparse_embedding=query_sparse_embedding,
+                filters=filters,
+                top_k=top_k,
+                scale_score=scale_score,
+                return_embedding=return_embedding,
+            ),
+        )
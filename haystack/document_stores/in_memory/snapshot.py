@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Union
+
+import numpy as np
+
+from haystack.document_stores.errors import DocumentStoreError
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+_MANIFEST_FILE = "manifest.json"
+_DOCUMENTS_FILE = "documents.jsonl"
+_EMBEDDINGS_FILE = "embeddings.npy"
+_EMBEDDING_ROWS_FILE = "embedding_rows.npy"
+_BM25_TOKENS_FILE = "bm25_tokens.json"
+_BM25_DOC_LENS_FILE = "bm25_doc_lens.npy"
+_BM25_POSTINGS_OFFSETS_FILE = "bm25_postings_offsets.npy"
+_BM25_POSTINGS_DOCUMENTS_FILE = "bm25_postings_documents.npy"
+_BM25_POSTINGS_FREQUENCIES_FILE = "bm25_postings_frequencies.npy"
+
+
+@dataclass
+class StoreSnapshot:  # pylint: disable=too-many-instance-attributes
+    """
+    The content of an InMemoryDocumentStore in the layout of the binary snapshot format.
+
+    Documents are referred to by their position in `records`, which is the order they were written to the store.
+
+    :param manifest: The serialized store and the statistics that are not stored in arrays.
+    :param records: The serialized Documents. Embeddings stored in `embeddings` are removed from the records.
+    :param embeddings: A 2D float32 array with the Document embeddings.
+    :param embedding_rows: The row of `embeddings` of each Document, or -1 if its embedding is in its record.
+    :param bm25_tokens: The BM25 vocabulary.
+    :param bm25_doc_lens: The number of BM25 tokens of each Document.
+    :param bm25_postings_offsets: The postings of the token `i` of `bm25_tokens` are stored between the offsets
+        `i` and `i + 1` of `bm25_postings_documents` and `bm25_postings_frequencies`.
+    :param bm25_postings_documents: The position of the Documents containing each token.
+    :param bm25_postings_frequencies: The frequency of the token in each of those Documents.
+    """
+
+    manifest: dict[str, Any]
+    records: list[dict[str, Any]]
+    embeddings: np.ndarray
+    embedding_rows: np.ndarray
+    bm25_tokens: list[str]
+    bm25_doc_lens: np.ndarray
+    bm25_postings_offsets: np.ndarray
+    bm25_postings_documents: np.ndarray
+    bm25_postings_frequencies: np.ndarray
+
+
+def is_snapshot(path: Union[str, Path]) -> bool:
+    """
+    Whether the path is a directory containing a binary snapshot.
+    """
+    return (Path(path) / _MANIFEST_FILE).is_file()
+
+
+def sync_to_disk(path: Union[str, Path]) -> None:
+    """
+    Flushes a file, or the entries of a directory, to disk.
+
+    Directories can't be opened on Windows, where the entries of a directory don't need to be flushed.
+    """
+    if os.name == "nt" and Path(path).is_dir():
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_snapshot(path: Union[str, Path], snapshot: StoreSnapshot) -> None:
+    """
+    Writes a snapshot to a directory, creating it if needed.
+
+    The manifest is written last, once the other files are flushed to disk, so an interrupted write doesn't leave
+    a directory that looks like a valid snapshot. The snapshot is on disk when the function returns.
+
+    :param path: The directory to write the snapshot to.
+    :param snapshot: The snapshot.
+    """
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / _MANIFEST_FILE).unlink(missing_ok=True)
+
+    with open(directory / _DOCUMENTS_FILE, "w") as f:
+        for record in snapshot.records:
+            f.write(json.dumps(record))
+            f.write("\n")
+    np.save(directory / _EMBEDDINGS_FILE, np.ascontiguousarray(snapshot.embeddings, dtype=np.float32))
+    np.save(directory / _EMBEDDING_ROWS_FILE, snapshot.embedding_rows.astype(np.int64))
+    with open(directory / _BM25_TOKENS_FILE, "w") as f:
+        json.dump(snapshot.bm25_tokens, f)
+    np.save(directory / _BM25_DOC_LENS_FILE, snapshot.bm25_doc_lens.astype(np.int64))
+    np.save(directory / _BM25_POSTINGS_OFFSETS_FILE, snapshot.bm25_postings_offsets.astype(np.int64))
+    np.save(directory / _BM25_POSTINGS_DOCUMENTS_FILE, snapshot.bm25_postings_documents.astype(np.int64))
+    np.save(directory / _BM25_POSTINGS_FREQUENCIES_FILE, snapshot.bm25_postings_frequencies.astype(np.int64))
+    for file in directory.iterdir():
+        sync_to_disk(file)
+
+    with open(directory / _MANIFEST_FILE, "w") as f:
+        json.dump({**snapshot.manifest, "format_version": SNAPSHOT_FORMAT_VERSION}, f)
+        f.flush()
+        os.fsync(f.fileno())
+    sync_to_disk(directory)
+    sync_to_disk(directory.parent)
+
+
+def read_snapshot_manifest(path: Union[str, Path]) -> dict[str, Any]:
+    """
+    Reads the manifest of a snapshot, without reading the Documents.
+
+    :param path: The directory containing the snapshot.
+    :returns: The manifest, with the serialized store.
+    """
+    with open(Path(path) / _MANIFEST_FILE, "r") as f:
+        manifest = json.load(f)
+    if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+        raise DocumentStoreError(
+            f"Unsupported InMemoryDocumentStore snapshot format version '{manifest.get('format_version')}'."
+        )
+    return manifest
+
+
+def read_snapshot(path: Union[str, Path]) -> StoreSnapshot:
+    """
+    Reads a snapshot written with `write_snapshot`.
+
+    The embeddings are memory-mapped copy-on-write instead of being read in memory: pages are loaded lazily by
+    the OS and modifications are never written back to the file.
+
+    :param path: The directory containing the snapshot.
+    :returns: The snapshot.
+    """
+    directory = Path(path)
+    manifest = read_snapshot_manifest(directory)
+    with open(directory / _DOCUMENTS_FILE, "r") as f:
+        records = [json.loads(line) for line in f]
+    with open(directory / _BM25_TOKENS_FILE, "r") as f:
+        bm25_tokens = json.load(f)
+
+    return StoreSnapshot(
+        manifest=manifest,
+        records=records,
+        embeddings=np.load(directory / _EMBEDDINGS_FILE, mmap_mode="c"),
+        embedding_rows=np.load(directory / _EMBEDDING_ROWS_FILE),
+        bm25_tokens=bm25_tokens,
+        bm25_doc_lens=np.load(directory / _BM25_DOC_LENS_FILE),
+        bm25_postings_offsets=np.load(directory / _BM25_POSTINGS_OFFSETS_FILE),
+        bm25_postings_documents=np.load(directory / _BM25_POSTINGS_DOCUMENTS_FILE),
+        bm25_postings_frequencies=np.load(directory / _BM25_POSTINGS_FREQUENCIES_FILE),
+    )
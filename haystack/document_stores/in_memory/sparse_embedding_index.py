@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Optional
+
+from haystack.dataclasses import SparseEmbedding
+
+
+def _aggregate(sparse_embedding: SparseEmbedding) -> dict[int, float]:
+    # Repeated indices contribute to the dot product as if their values were summed
+    values: dict[int, float] = {}
+    for index, value in zip(sparse_embedding.indices, sparse_embedding.values):
+        values[index] = values.get(index, 0.0) + value
+    return values
+
+
+class SparseEmbeddingIndex:
+    """
+    An inverted index over the sparse embeddings of the Documents of an InMemoryDocumentStore index.
+
+    Maps each dimension to the Documents having a value for it, so that the dot product with a query only needs
+    to look at the Documents sharing at least one dimension with it.
+    """
+
+    def __init__(self):
+        self._postings: dict[int, dict[str, float]] = {}
+        self._doc_indices: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._doc_indices)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_indices
+
+    def add(self, doc_id: str, sparse_embedding: SparseEmbedding) -> None:
+        """
+        Indexes the sparse embedding of a Document.
+
+        :param doc_id: The id of the Document. Must not be indexed already.
+        :param sparse_embedding: The sparse embedding of the Document.
+        """
+        values = _aggregate(sparse_embedding)
+        for index, value in values.items():
+            self._postings.setdefault(index, {})[doc_id] = value
+        self._doc_indices[doc_id] = list(values)
+
+    def remove(self, doc_id: str) -> None:
+        """
+        Removes the sparse embedding of a Document from the index, if present.
+
+        :param doc_id: The id of the Document.
+        """
+        for index in self._doc_indices.pop(doc_id, []):
+            postings = self._postings[index]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[index]
+
+    def dot_product_scores(
+        self, query_sparse_embedding: SparseEmbedding, doc_ids: Optional[set[str]] = None
+    ) -> dict[str, float]:
+        """
+        Computes the dot product between the query and the Documents sharing at least one dimension with it.
+
+        :param query_sparse_embedding: The sparse embedding of the query.
+        :param doc_ids: If provided, only these Documents are scored.
+        :returns: The score of each Document sharing at least one dimension with the query.
+        """
+        scores: dict[str, float] = {}
+        for index, query_value in _aggregate(query_sparse_embedding).items():
+            for doc_id, value in self._postings.get(index, {}).items():
+                if doc_ids is None or doc_id in doc_ids:
+                    scores[doc_id] = scores.get(doc_id, 0.0) + query_value * value
+        return scores
@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+from haystack import logging
+from haystack.document_stores.in_memory.snapshot import is_snapshot, sync_to_disk
+
+logger = logging.getLogger(__name__)
+
+_LOG_FILE = "wal.jsonl"
+_SNAPSHOT_PREFIX = "snapshot-"
+
+
+class WriteAheadLog:
+    """
+    An append-only log of the operations applied to an InMemoryDocumentStore, stored in a directory.
+
+    Each operation is appended to the log as a JSON line with an increasing sequence number and flushed to disk
+    before the operation returns. The log is periodically compacted into a binary snapshot of the store,
+    stored in the same directory as `snapshot-<sequence>` where `<sequence>` is the last operation it includes.
+    The state of the store is the latest snapshot with the operations logged after it replayed on top.
+    Operations can be appended while the log is compacted by another thread.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Opens the log in a directory, creating it if needed.
+
+        :param directory: The directory of the log and of its snapshots.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._log_path = self.directory / _LOG_FILE
+        # serializes the appends and the compactions of the log file
+        self._lock = threading.Lock()
+        self._discard_incomplete_entry()
+        snapshot = self.latest_snapshot()
+        self.snapshot_sequence = int(snapshot.name[len(_SNAPSHOT_PREFIX) :]) if snapshot is not None else 0
+        self.sequence = self.snapshot_sequence
+        # number of Documents written or deleted by the operations logged since the latest snapshot
+        self.pending_changes = 0
+        for entry in self.entries():
+            self.sequence = entry["sequence"]
+            self.pending_changes += self._changes(entry)
+
+    @staticmethod
+    def exists(directory: Union[str, Path]) -> bool:
+        """
+        Whether the directory contains a write-ahead log or its snapshots.
+        """
+        directory = Path(directory)
+        if not directory.is_dir():
+            return False
+        return (directory / _LOG_FILE).is_file() or any(
+            path.name.startswith(_SNAPSHOT_PREFIX) for path in directory.iterdir()
+        )
+
+    def latest_snapshot(self) -> Optional[Path]:
+        """
+        Returns the directory of the latest complete snapshot, if any.
+        """
+        snapshots = [
+            path
+            for path in self.directory.glob(f"{_SNAPSHOT_PREFIX}*")
+            if path.name[len(_SNAPSHOT_PREFIX) :].isdigit() and is_snapshot(path)
+        ]
+        return max(snapshots, key=lambda path: int(path.name[len(_SNAPSHOT_PREFIX) :]), default=None)
+
+    def append(self, operation: str, **payload: Any) -> None:
+        """
+        Appends an operation to the log and flushes it to disk.
+
+        :param operation: The operation, either "write", "delete" or "update".
+        :param payload: The arguments of the operation: "documents" for "write", "document_ids" for "delete",
+            "document_ids" and "meta" for "update".
+        """
+        entry = {"sequence": self.sequence + 1, "operation": operation, **payload}
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            with open(self._log_path, "a") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self.sequence += 1
+            self.pending_changes += self._changes(entry)
+
+    def entries(self) -> Iterator[dict[str, Any]]:
+        """
+        Yields the operations logged after the latest snapshot, in order.
+        """
+        if not self._log_path.is_file():
+            return
+        with open(self._log_path, "r") as f:
+            for line in f:
+                entry = json.loads(line)
+                if entry["sequence"] > self.snapshot_sequence:
+                    yield entry
+
+    def snapshot_path(self, sequence: int) -> Path:
+        """
+        Returns the directory of the snapshot including the operations up to `sequence`.
+        """
+        return self.directory / f"{_SNAPSHOT_PREFIX}{sequence}"
+
+    def compacted(self, sequence: int) -> None:
+        """
+        Truncates the log once a snapshot including the operations up to `sequence` has been written.
+
+        The operations logged after the snapshot are written to a temporary file that replaces the log once it's
+        flushed to disk, so the log is never left partially written. The previous snapshots are removed.
+
+        :param sequence: The sequence number of the last operation included in the new snapshot.
+        """
+        with self._lock:
+            self.snapshot_sequence = sequence
+            remaining = list(self.entries())
+            temporary_path = self._log_path.with_name(_LOG_FILE + ".tmp")
+            with open(temporary_path, "w") as f:
+                f.writelines(json.dumps(entry) + "\n" for entry in remaining)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporary_path, self._log_path)
+            sync_to_disk(self.directory)
+            self.pending_changes = sum(self._changes(entry) for entry in remaining)
+
+        for path in self.directory.glob(f"{_SNAPSHOT_PREFIX}*"):
+            if path != self.snapshot_path(sequence):
+                # snapshots may still be memory-mapped, failing to remove them is not an error
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _discard_incomplete_entry(self) -> None:
+        # The last entry is incomplete if the process stopped while appending it, the operation never returned
+        if not self._log_path.is_file():
+            return
+        valid_size = 0
+        with open(self._log_path, "rb+") as f:
+            for line in f:
+                try:
+                    json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                valid_size += len(line)
+            if valid_size < self._log_path.stat().st_size:
+                logger.warning("Discarding an incomplete entry at the end of the write-ahead log {path}", path=f.name)
+                f.truncate(valid_size)
+
+    @staticmethod
+    def _changes(entry: dict[str, Any]) -> int:
+        return len(entry.get("documents", entry.get("document_ids", [])))
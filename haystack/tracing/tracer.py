@@ -69,6 +69,17 @@ class Span(abc.ABC):
         if tracer.is_content_tracing_enabled:
             self.set_tag(key, value)
 
+    def is_recording_content(self) -> bool:
+        """
+        Return whether the content tags set with `set_content_tag` are recorded.
+
+        Use this to skip computing content tags that are expensive to compute, like copies of large inputs, when they
+        would be discarded.
+
+        :return: `True` if content tracing is enabled or if the span overrides `set_content_tag`, `False` otherwise.
+        """
+        return tracer.is_content_tracing_enabled or type(self).set_content_tag is not Span.set_content_tag
+
     def get_correlation_data_for_logs(self) -> dict[str, Any]:
         """
         Return a dictionary with correlation data for logs.
@@ -140,6 +151,10 @@ class NullSpan(Span):
         """Set a single tag on the span."""
         pass
 
+    def is_recording_content(self) -> bool:
+        """Return whether the content tags are recorded, which they never are."""
+        return False
+
 
 class NullTracer(Tracer):
     """A no-op implementation of the `Tracer` interface. This is used when tracing is disabled."""
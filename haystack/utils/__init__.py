@@ -14,10 +14,10 @@ _import_structure = {
     "callable_serialization": ["deserialize_callable", "serialize_callable"],
     "device": ["ComponentDevice", "Device", "DeviceMap", "DeviceType"],
     "deserialization": ["deserialize_document_store_in_init_params_inplace", "deserialize_chatgenerator_inplace"],
-    "filters": ["document_matches_filter", "raise_on_invalid_filter_syntax"],
+    "filters": ["compile_filter", "document_matches_filter", "raise_on_invalid_filter_syntax"],
     "jinja2_extensions": ["Jinja2TimeExtension"],
     "jupyter": ["is_in_jupyter"],
-    "misc": ["expit", "expand_page_range"],
+    "misc": ["expit", "expand_page_range", "top_k_indices", "top_k_items"],
     "requests_utils": ["request_with_retry", "async_request_with_retry"],
     "type_serialization": ["deserialize_type", "serialize_type"],
 }
@@ -38,12 +38,15 @@ if TYPE_CHECKING:
     from .device import Device as Device
     from .device import DeviceMap as DeviceMap
     from .device import DeviceType as DeviceType
+    from .filters import compile_filter as compile_filter
     from .filters import document_matches_filter as document_matches_filter
     from .filters import raise_on_invalid_filter_syntax as raise_on_invalid_filter_syntax
     from .jinja2_extensions import Jinja2TimeExtension as Jinja2TimeExtension
     from .jupyter import is_in_jupyter as is_in_jupyter
     from .misc import expand_page_range as expand_page_range
     from .misc import expit as expit
+    from .misc import top_k_indices as top_k_indices
+    from .misc import top_k_items as top_k_items
     from .requests_utils import async_request_with_retry as async_request_with_retry
     from .requests_utils import request_with_retry as request_with_retry
     from .type_serialization import deserialize_type as deserialize_type
@@ -2,9 +2,11 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import math
 from dataclasses import fields
 from datetime import datetime
-from typing import Any, Optional, Union
+from functools import partial
+from typing import Any, Callable, Optional, Union
 
 import dateutil.parser
 
@@ -206,3 +208,189 @@ def _comparison_condition(condition: dict[str, Any], document: Union[Document, B
     operator: str = condition["operator"]
     filter_value: Any = condition["value"]
     return COMPARISON_OPERATORS[operator](filter_value=filter_value, value=document_value)
+
+
+def compile_filter(filters: dict[str, Any]) -> Callable[[Union[Document, ByteStream]], bool]:
+    """
+    Compile `filters` into a predicate returning whether they match a Document or a ByteStream.
+
+    The predicate behaves like `document_matches_filter`, but the filters are validated, the operators resolved,
+    the field paths split and the filter values parsed only once, so it's much cheaper to apply it to
+    many Documents.
+
+    For a detailed specification of the filters, refer to the
+    `DocumentStore.filter_documents()` protocol documentation.
+
+    :param filters: The filters to compile.
+    :returns: A callable taking a Document or a ByteStream and returning whether the filters match it.
+    :raises FilterError: If the filters are malformed.
+    """
+    if "field" in filters:
+        return _compile_comparison_condition(filters)
+    return _compile_logic_condition(filters)
+
+
+def _compile_logic_condition(condition: dict[str, Any]) -> Callable[[Union[Document, ByteStream]], bool]:
+    if "operator" not in condition:
+        msg = f"'operator' key missing in {condition}"
+        raise FilterError(msg)
+    if "conditions" not in condition:
+        msg = f"'conditions' key missing in {condition}"
+        raise FilterError(msg)
+    operator: str = condition["operator"]
+    if operator not in LOGICAL_OPERATORS:
+        msg = f"Unknown logical operator '{operator}' in {condition}"
+        raise FilterError(msg)
+
+    predicates = [_compile_comparison_condition(sub_condition) for sub_condition in condition["conditions"]]
+    if operator == "AND":
+        return lambda document: all(predicate(document) for predicate in predicates)
+    if operator == "OR":
+        return lambda document: any(predicate(document) for predicate in predicates)
+    return lambda document: not all(predicate(document) for predicate in predicates)
+
+
+def _compile_comparison_condition(condition: dict[str, Any]) -> Callable[[Union[Document, ByteStream]], bool]:
+    if "field" not in condition:
+        # 'field' key is only found in comparison dictionaries.
+        # We assume this is a logic dictionary since it's not present.
+        return _compile_logic_condition(condition)
+
+    if "operator" not in condition:
+        msg = f"'operator' key missing in {condition}"
+        raise FilterError(msg)
+    if "value" not in condition:
+        msg = f"'value' key missing in {condition}"
+        raise FilterError(msg)
+    operator: str = condition["operator"]
+    if operator not in COMPARISON_OPERATORS:
+        msg = f"Unknown comparison operator '{operator}' in {condition}"
+        raise FilterError(msg)
+
+    get_value = _compile_field_getter(condition["field"])
+    compare = _compile_comparison(operator, condition["value"])
+    return lambda document: compare(get_value(document))
+
+
+def _compile_field_getter(field: str) -> Callable[[Union[Document, ByteStream]], Any]:
+    if "." in field:
+        # Handles fields formatted like so:
+        # 'meta.person.name'
+        attribute, *parts = field.split(".")
+
+        def get_nested_value(document: Union[Document, ByteStream]) -> Any:
+            value = getattr(document, attribute)
+            for part in parts:
+                if part not in value:
+                    # If a field is not found we treat it as None
+                    return None
+                value = value[part]
+            return value
+
+        return get_nested_value
+
+    def get_value(document: Union[Document, ByteStream]) -> Any:
+        # Fields that are not actual fields of the Document or ByteStream are converted legacy filters,
+        # see `_comparison_condition`.
+        if field in _field_names(type(document)):
+            return getattr(document, field)
+        return document.meta.get(field)
+
+    return get_value
+
+
+_FIELD_NAMES: dict[type, frozenset[str]] = {}
+
+
+def _field_names(cls: type) -> frozenset[str]:
+    if cls not in _FIELD_NAMES:
+        _FIELD_NAMES[cls] = frozenset(f.name for f in fields(cls))
+    return _FIELD_NAMES[cls]
+
+
+def _compile_comparison(operator: str, filter_value: Any) -> Callable[[Any], bool]:
+    if operator == "==":
+        return partial(_equal, filter_value=filter_value)
+    if operator == "!=":
+        return partial(_not_equal, filter_value=filter_value)
+    if operator in ("in", "not in"):
+        contains = _compile_contains(filter_value)
+        return contains if operator == "in" else lambda value: not contains(value)
+    if filter_value is None:
+        # We can't compare None values reliably using operators '>', '>=', '<', '<='
+        return lambda value: False
+
+    greater_than = _compile_greater_than(filter_value)
+    comparisons: dict[str, Callable[[Any], bool]] = {
+        ">": greater_than,
+        ">=": lambda value: value is not None and (value == filter_value or greater_than(value)),
+        "<": lambda value: value is not None and not (value == filter_value or greater_than(value)),
+        "<=": lambda value: value is not None and not greater_than(value),
+    }
+    return comparisons[operator]
+
+
+def _compile_contains(filter_value: Any) -> Callable[[Any], bool]:
+    if not isinstance(filter_value, list):
+        msg = (
+            f"Filter value must be a `list` when using operator 'in' or 'not in', received type '{type(filter_value)}'"
+        )
+
+        def raise_error(_: Any) -> bool:
+            raise FilterError(msg)
+
+        return raise_error
+
+    def contains_any(value: Any) -> bool:
+        return any(_equal(e, value) for e in filter_value)
+
+    try:
+        # NaN is not equal to itself, but a set lookup would find it
+        if any(isinstance(e, float) and math.isnan(e) for e in filter_value):
+            return contains_any
+        filter_set = frozenset(filter_value)
+    except TypeError:
+        # Unhashable filter values can only be compared one by one
+        return contains_any
+
+    def contains(value: Any) -> bool:
+        try:
+            return value in filter_set
+        except TypeError:
+            return contains_any(value)
+
+    return contains
+
+
+def _compile_greater_than(filter_value: Any) -> Callable[[Any], bool]:
+    if not isinstance(filter_value, str):
+
+        def greater_than(value: Any) -> bool:
+            if value is None:
+                return False
+            if isinstance(value, str):
+                return _greater_than(value=value, filter_value=filter_value)
+            if isinstance(filter_value, list):
+                msg = f"Filter value can't be of type {type(filter_value)} using operators '>', '>=', '<', '<='"
+                raise FilterError(msg)
+            return value > filter_value
+
+        return greater_than
+
+    try:
+        filter_date: Optional[datetime] = _parse_date(filter_value)
+        filter_error: Optional[FilterError] = None
+    except FilterError as exc:
+        # Like `document_matches_filter`, the error is only raised for Documents having a value
+        filter_date, filter_error = None, exc
+
+    def greater_than_date(value: Any) -> bool:
+        if value is None:
+            return False
+        value = _parse_date(value)
+        if filter_error is not None:
+            raise filter_error
+        value, parsed_filter_value = _ensure_both_dates_naive_or_aware(value, filter_date)  # type: ignore[arg-type]
+        return value > parsed_filter_value
+
+    return greater_than_date
@@ -2,13 +2,17 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import heapq
 import mimetypes
 import tempfile
 from pathlib import Path
-from typing import Any, Optional, Union, overload
+from typing import Any, Callable, Iterable, Optional, TypeVar, Union, overload
 
+import numpy as np
 from numpy import exp, ndarray
 
+T = TypeVar("T")
+
 CUSTOM_MIMETYPES = {
     # we add markdown because it is not added by the mimetypes module
     # see https://github.com/python/cpython/pull/17995
@@ -70,6 +74,48 @@ def expit(x: Union[float, ndarray[Any, Any]]) -> Union[float, ndarray[Any, Any]]
     return 1 / (1 + exp(-x))
 
 
+def top_k_indices(scores: ndarray[Any, Any], top_k: Optional[int]) -> ndarray[Any, Any]:
+    """
+    Returns the indices of the `top_k` highest scores, from the highest to the lowest.
+
+    Equivalent to a stable descending sort of all the scores truncated to `top_k`, so equal scores keep their
+    order, but only the scores that can make it to the top are sorted. The others are discarded in linear time.
+
+    :param scores: A 1D array of scores.
+    :param top_k: The number of indices to return. If `None`, all the indices are returned.
+    :returns: An array of indices into `scores`.
+    """
+    negated_scores = -scores
+    if top_k is None or top_k >= len(scores):
+        return np.argsort(negated_scores, kind="stable")
+    if top_k <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    threshold = np.partition(negated_scores, top_k - 1)[top_k - 1]
+    if np.isnan(threshold):
+        return np.argsort(negated_scores, kind="stable")[:top_k]
+    # all the scores at least as high as the k-th one, in their original order so ties are kept stable
+    candidates = np.flatnonzero(negated_scores <= threshold)
+    return candidates[np.argsort(negated_scores[candidates], kind="stable")[:top_k]]
+
+
+def top_k_items(items: Iterable[T], top_k: Optional[int], key: Callable[[T], Any]) -> list[T]:
+    """
+    Returns the `top_k` items with the highest key, from the highest to the lowest.
+
+    Equivalent to `sorted(items, key=key, reverse=True)[:top_k]`, but uses a heap of size `top_k`
+    instead of sorting all the items.
+
+    :param items: The items to select from.
+    :param top_k: The number of items to return. If `None`, all the items are returned.
+    :param key: A function returning the value to rank each item by.
+    :returns: The selected items.
+    """
+    if top_k is None:
+        return sorted(items, key=key, reverse=True)
+    return heapq.nlargest(top_k, items, key=key)
+
+
 def _guess_mime_type(path: Path) -> Optional[str]:
     """
     Guess the MIME type of the provided file path.
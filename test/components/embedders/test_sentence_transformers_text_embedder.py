@@ -279,6 +279,29 @@ class TestSentenceTransformersTextEmbedder:
         with pytest.raises(TypeError, match="SentenceTransformersTextEmbedder expects a string as input"):
             embedder.run(text=list_integers_input)
 
+    def test_run_many(self):
+        embedder = SentenceTransformersTextEmbedder(model="model", prefix="query: ", batch_size=8)
+        embedder.embedding_backend = MagicMock()
+        embedder.embedding_backend.embed.return_value = [[0.1, 0.2], [0.3, 0.4]]
+
+        results = embedder.run_many([{"text": "first text"}, {"text": "second text"}])
+
+        assert results == [{"embedding": [0.1, 0.2]}, {"embedding": [0.3, 0.4]}]
+        embedder.embedding_backend.embed.assert_called_once_with(
+            ["query: first text", "query: second text"],
+            batch_size=8,
+            show_progress_bar=True,
+            normalize_embeddings=False,
+            precision="float32",
+        )
+
+    def test_run_many_wrong_input_format(self):
+        embedder = SentenceTransformersTextEmbedder(model="model")
+        embedder.embedding_backend = MagicMock()
+
+        with pytest.raises(TypeError, match="SentenceTransformersTextEmbedder expects a string as input"):
+            embedder.run_many([{"text": "a text"}, {"text": [1, 2, 3]}])
+
     def test_embed_encode_kwargs(self):
         embedder = SentenceTransformersTextEmbedder(model="model", encode_kwargs={"task": "retrieval.query"})
         embedder.embedding_backend = MagicMock()
@@ -369,6 +369,47 @@ class TestSentenceTransformersSimilarityRanker:
         for d in out["documents"]:
             assert isinstance(d.score, float)
 
+    def test_run_many(self):
+        mock_cross_encoder = MagicMock()
+        ranker = SentenceTransformersSimilarityRanker(model="model", query_prefix="query: ", top_k=2)
+        ranker._cross_encoder = mock_cross_encoder
+
+        mock_cross_encoder.predict.return_value = np.array([0.1, 0.9, 0.5, 0.7], dtype=np.float32)
+
+        first_documents = [Document(content="doc 0"), Document(content="doc 1")]
+        second_documents = [Document(content="doc 2"), Document(content="doc 3")]
+        results = ranker.run_many(
+            [
+                {"query": "first", "documents": first_documents},
+                {"query": "second", "documents": []},
+                {"query": "third", "documents": second_documents, "top_k": 1},
+            ]
+        )
+
+        mock_cross_encoder.predict.assert_called_once()
+        args, kwargs = mock_cross_encoder.predict.call_args
+        assert args[0] == [
+            ["query: first", "doc 0"],
+            ["query: first", "doc 1"],
+            ["query: third", "doc 2"],
+            ["query: third", "doc 3"],
+        ]
+        assert isinstance(kwargs["activation_fn"], torch.nn.Sigmoid)
+
+        assert [doc.content for doc in results[0]["documents"]] == ["doc 1", "doc 0"]
+        assert results[0]["documents"][0].score == pytest.approx(0.9)
+        assert isinstance(results[0]["documents"][0].score, float)
+        assert results[1] == {"documents": []}
+        assert [doc.content for doc in results[2]["documents"]] == ["doc 3"]
+
+    def test_run_many_invalid_top_k(self):
+        ranker = SentenceTransformersSimilarityRanker(model="model")
+        ranker._cross_encoder = MagicMock()
+
+        with pytest.raises(ValueError, match="top_k must be > 0, but got -3"):
+            ranker.run_many([{"query": "test", "documents": [Document(content="doc")], "top_k": -3}])
+        ranker._cross_encoder.predict.assert_not_called()
+
     @pytest.mark.integration
     @pytest.mark.slow
     def test_run(self):
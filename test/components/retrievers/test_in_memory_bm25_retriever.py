@@ -132,6 +132,31 @@ class TestMemoryBM25Retriever:
         assert len(result["documents"]) == 5
         assert result["documents"][0].content == "PHP is a popular programming language"
 
+    def test_retriever_valid_run_batch(self, mock_docs):
+        ds = InMemoryDocumentStore()
+        ds.write_documents(mock_docs)
+
+        retriever = InMemoryBM25Retriever(ds, top_k=2)
+        result = retriever.run_batch(queries=["PHP", "Ruby"])
+
+        assert len(result["documents"]) == 2
+        assert [len(docs) for docs in result["documents"]] == [2, 2]
+        assert result["documents"][0][0].content == "PHP is a popular programming language"
+        assert result["documents"][1][0].content == "Ruby is a popular programming language"
+
+    @pytest.mark.asyncio
+    async def test_retriever_valid_run_batch_async(self, mock_docs):
+        ds = InMemoryDocumentStore()
+        ds.write_documents(mock_docs)
+
+        retriever = InMemoryBM25Retriever(ds, filters={"field": "content", "operator": "!=", "value": "x"})
+        result = await retriever.run_batch_async(queries=["PHP", "Ruby"], top_k=1)
+
+        assert [[doc.content for doc in docs] for docs in result["documents"]] == [
+            ["PHP is a popular programming language"],
+            ["Ruby is a popular programming language"],
+        ]
+
     def test_invalid_run_wrong_store_type(self):
         SomeOtherDocumentStore = document_store_class("SomeOtherDocumentStore")
         with pytest.raises(ValueError, match="document_store must be an instance of InMemoryDocumentStore"):
@@ -137,6 +137,43 @@ class TestMemoryEmbeddingRetriever:
         assert len(result["documents"]) == top_k
         assert result["documents"][0].embedding == [1.0, 1.0, 1.0, 1.0]
 
+    def test_valid_run_batch(self):
+        ds = InMemoryDocumentStore(embedding_similarity_function="cosine")
+        docs = [
+            Document(content="my document", embedding=[0.1, 0.2, 0.3, 0.4]),
+            Document(content="another document", embedding=[1.0, 1.0, 1.0, 1.0]),
+            Document(content="third document", embedding=[0.5, 0.7, 0.5, 0.7]),
+        ]
+        ds.write_documents(docs)
+
+        retriever = InMemoryEmbeddingRetriever(ds, top_k=2)
+        result = retriever.run_batch(query_embeddings=[[0.1, 0.1, 0.1, 0.1], [0.1, 0.2, 0.3, 0.4]])
+
+        assert [[doc.content for doc in docs] for docs in result["documents"]] == [
+            ["another document", "third document"],
+            ["my document", "third document"],
+        ]
+        assert result["documents"][0][0].embedding is None
+
+    @pytest.mark.asyncio
+    async def test_valid_run_batch_async(self):
+        ds = InMemoryDocumentStore(embedding_similarity_function="cosine")
+        docs = [
+            Document(content="my document", embedding=[0.1, 0.2, 0.3, 0.4]),
+            Document(content="another document", embedding=[1.0, 1.0, 1.0, 1.0]),
+        ]
+        ds.write_documents(docs)
+
+        retriever = InMemoryEmbeddingRetriever(ds, top_k=1)
+        result = await retriever.run_batch_async(
+            query_embeddings=[[0.1, 0.1, 0.1, 0.1], [0.1, 0.2, 0.3, 0.4]], return_embedding=True
+        )
+
+        assert [[doc.embedding for doc in docs] for docs in result["documents"]] == [
+            [[1.0, 1.0, 1.0, 1.0]],
+            [[0.1, 0.2, 0.3, 0.4]],
+        ]
+
     def test_invalid_run_wrong_store_type(self):
         SomeOtherDocumentStore = document_store_class("SomeOtherDocumentStore")
         with pytest.raises(ValueError, match="document_store must be an instance of InMemoryDocumentStore"):
@@ -0,0 +1,166 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Any
+
+import pytest
+
+from haystack import DeserializationError, Pipeline
+from haystack.components.retrievers.in_memory.hybrid_retriever import InMemoryHybridRetriever
+from haystack.dataclasses import Document
+from haystack.document_stores.in_memory import InMemoryDocumentStore
+from haystack.document_stores.types import FilterPolicy
+from haystack.testing.factory import document_store_class
+
+
+@pytest.fixture
+def document_store():
+    ds = InMemoryDocumentStore(embedding_similarity_function="cosine")
+    ds.write_documents(
+        [
+            Document(content="my document", embedding=[0.1, 0.2, 0.3, 0.4], meta={"year": 2020}),
+            Document(content="another document", embedding=[1.0, 1.0, 1.0, 1.0], meta={"year": 2021}),
+            Document(content="third text", embedding=[0.5, 0.7, 0.5, 0.7], meta={"year": 2022}),
+        ]
+    )
+    return ds
+
+
+class TestMemoryHybridRetriever:
+    def test_init_default(self):
+        retriever = InMemoryHybridRetriever(InMemoryDocumentStore())
+        assert retriever.filters is None
+        assert retriever.top_k == 10
+        assert retriever.scale_score is False
+        assert retriever.join_mode == "reciprocal_rank_fusion"
+        assert retriever.weights is None
+
+    def test_init_with_parameters(self):
+        retriever = InMemoryHybridRetriever(
+            InMemoryDocumentStore(),
+            filters={"name": "test.txt"},
+            top_k=5,
+            scale_score=True,
+            join_mode="merge",
+            weights=[0.3, 0.7],
+        )
+        assert retriever.filters == {"name": "test.txt"}
+        assert retriever.top_k == 5
+        assert retriever.scale_score
+        assert retriever.join_mode == "merge"
+        assert retriever.weights == [0.3, 0.7]
+
+    def test_init_with_invalid_parameters(self):
+        with pytest.raises(ValueError, match="top_k must be greater than 0"):
+            InMemoryHybridRetriever(InMemoryDocumentStore(), top_k=-2)
+        with pytest.raises(ValueError, match="Unknown join mode"):
+            InMemoryHybridRetriever(InMemoryDocumentStore(), join_mode="concatenate")  # type: ignore
+        with pytest.raises(ValueError, match="weights should contain two values"):
+            InMemoryHybridRetriever(InMemoryDocumentStore(), weights=[0.1, 0.2, 0.7])
+
+    def test_to_dict(self):
+        MyFakeStore = document_store_class("MyFakeStore", bases=(InMemoryDocumentStore,))
+        document_store = MyFakeStore()
+        document_store.to_dict = lambda: {"type": "test_module.MyFakeStore", "init_parameters": {}}
+        component = InMemoryHybridRetriever(document_store=document_store, join_mode="merge", weights=[0.3, 0.7])
+
+        data = component.to_dict()
+        assert data == {
+            "type": "haystack.components.retrievers.in_memory.hybrid_retriever.InMemoryHybridRetriever",
+            "init_parameters": {
+                "document_store": {"type": "test_module.MyFakeStore", "init_parameters": {}},
+                "filters": None,
+                "top_k": 10,
+                "scale_score": False,
+                "join_mode": "merge",
+                "weights": [0.3, 0.7],
+                "return_embedding": False,
+                "filter_policy": "replace",
+            },
+        }
+
+    def test_from_dict(self):
+        data = {
+            "type": "haystack.components.retrievers.in_memory.hybrid_retriever.InMemoryHybridRetriever",
+            "init_parameters": {
+                "document_store": {
+                    "type": "haystack.document_stores.in_memory.document_store.InMemoryDocumentStore",
+                    "init_parameters": {},
+                },
+                "filters": {"name": "test.txt"},
+                "top_k": 5,
+                "join_mode": "distribution_based_rank_fusion",
+                "filter_policy": "merge",
+            },
+        }
+        component = InMemoryHybridRetriever.from_dict(data)
+        assert isinstance(component.document_store, InMemoryDocumentStore)
+        assert component.filters == {"name": "test.txt"}
+        assert component.top_k == 5
+        assert component.join_mode == "distribution_based_rank_fusion"
+        assert component.filter_policy == FilterPolicy.MERGE
+
+    def test_from_dict_without_docstore(self):
+        data = {
+            "type": "haystack.components.retrievers.in_memory.hybrid_retriever.InMemoryHybridRetriever",
+            "init_parameters": {},
+        }
+        with pytest.raises(DeserializationError, match="Missing 'document_store' in serialization data"):
+            InMemoryHybridRetriever.from_dict(data)
+
+    def test_from_dict_without_docstore_type(self):
+        data = {
+            "type": "haystack.components.retrievers.in_memory.hybrid_retriever.InMemoryHybridRetriever",
+            "init_parameters": {"document_store": {"init_parameters": {}}},
+        }
+        with pytest.raises(DeserializationError):
+            InMemoryHybridRetriever.from_dict(data)
+
+    def test_valid_run(self, document_store):
+        retriever = InMemoryHybridRetriever(document_store, top_k=2)
+        result = retriever.run(query="document", query_embedding=[0.1, 0.1, 0.1, 0.1], return_embedding=True)
+
+        assert [doc.content for doc in result["documents"]] == ["another document", "my document"]
+        assert result["documents"][0].embedding == [1.0, 1.0, 1.0, 1.0]
+
+    def test_run_with_filters(self, document_store):
+        retriever = InMemoryHybridRetriever(
+            document_store, filters={"field": "meta.year", "operator": ">", "value": 2020}
+        )
+        result = retriever.run(query="document", query_embedding=[0.1, 0.1, 0.1, 0.1])
+        assert {doc.content for doc in result["documents"]} == {"another document", "third text"}
+
+        result = retriever.run(
+            query="document",
+            query_embedding=[0.1, 0.1, 0.1, 0.1],
+            filters={"field": "meta.year", "operator": "<", "value": 2021},
+        )
+        assert [doc.content for doc in result["documents"]] == ["my document"]
+
+    @pytest.mark.asyncio
+    async def test_valid_run_async(self, document_store):
+        retriever = InMemoryHybridRetriever(document_store, top_k=1, join_mode="merge", weights=[0.0, 1.0])
+        result = await retriever.run_async(query="text", query_embedding=[0.1, 0.2, 0.3, 0.4])
+
+        assert [doc.content for doc in result["documents"]] == ["my document"]
+        assert result["documents"][0].embedding is None
+
+    def test_invalid_run_wrong_store_type(self):
+        SomeOtherDocumentStore = document_store_class("SomeOtherDocumentStore")
+        with pytest.raises(ValueError, match="document_store must be an instance of InMemoryDocumentStore"):
+            InMemoryHybridRetriever(SomeOtherDocumentStore())
+
+    @pytest.mark.integration
+    def test_run_with_pipeline(self, document_store):
+        retriever = InMemoryHybridRetriever(document_store, top_k=2)
+
+        pipeline = Pipeline()
+        pipeline.add_component("retriever", retriever)
+        result: dict[str, Any] = pipeline.run(
+            data={"retriever": {"query": "text", "query_embedding": [0.1, 0.1, 0.1, 0.1]}}
+        )
+
+        results_docs = result["retriever"]["documents"]
+        assert len(results_docs) == 2
+        assert {doc.content for doc in results_docs} == {"another document", "third text"}
@@ -0,0 +1,198 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Any
+
+import pytest
+
+from haystack import DeserializationError, Pipeline
+from haystack.components.retrievers.in_memory.sparse_embedding_retriever import InMemorySparseEmbeddingRetriever
+from haystack.dataclasses import Document, SparseEmbedding
+from haystack.document_stores.in_memory import InMemoryDocumentStore
+from haystack.document_stores.types import FilterPolicy
+from haystack.testing.factory import document_store_class
+
+
+class TestMemorySparseEmbeddingRetriever:
+    def test_init_default(self):
+        retriever = InMemorySparseEmbeddingRetriever(InMemoryDocumentStore())
+        assert retriever.filters is None
+        assert retriever.top_k == 10
+        assert retriever.scale_score is False
+
+    def test_init_with_parameters(self):
+        retriever = InMemorySparseEmbeddingRetriever(
+            InMemoryDocumentStore(), filters={"name": "test.txt"}, top_k=5, scale_score=True
+        )
+        assert retriever.filters == {"name": "test.txt"}
+        assert retriever.top_k == 5
+        assert retriever.scale_score
+
+    def test_init_with_invalid_top_k_parameter(self):
+        with pytest.raises(ValueError):
+            InMemorySparseEmbeddingRetriever(InMemoryDocumentStore(), top_k=-2)
+
+    def test_to_dict(self):
+        MyFakeStore = document_store_class("MyFakeStore", bases=(InMemoryDocumentStore,))
+        document_store = MyFakeStore()
+        document_store.to_dict = lambda: {"type": "test_module.MyFakeStore", "init_parameters": {}}
+        component = InMemorySparseEmbeddingRetriever(document_store=document_store)
+
+        data = component.to_dict()
+        assert data == {
+            "type": (
+                "haystack.components.retrievers.in_memory.sparse_embedding_retriever.InMemorySparseEmbeddingRetriever"
+            ),
+            "init_parameters": {
+                "document_store": {"type": "test_module.MyFakeStore", "init_parameters": {}},
+                "filters": None,
+                "top_k": 10,
+                "scale_score": False,
+                "return_embedding": False,
+                "filter_policy": "replace",
+            },
+        }
+
+    def test_to_dict_with_custom_init_parameters(self):
+        MyFakeStore = document_store_class("MyFakeStore", bases=(InMemoryDocumentStore,))
+        document_store = MyFakeStore()
+        document_store.to_dict = lambda: {"type": "test_module.MyFakeStore", "init_parameters": {}}
+        component = InMemorySparseEmbeddingRetriever(
+            document_store=document_store,
+            filters={"name": "test.txt"},
+            top_k=5,
+            scale_score=True,
+            return_embedding=True,
+        )
+        data = component.to_dict()
+        assert data == {
+            "type": (
+                "haystack.components.retrievers.in_memory.sparse_embedding_retriever.InMemorySparseEmbeddingRetriever"
+            ),
+            "init_parameters": {
+                "document_store": {"type": "test_module.MyFakeStore", "init_parameters": {}},
+                "filters": {"name": "test.txt"},
+                "top_k": 5,
+                "scale_score": True,
+                "return_embedding": True,
+                "filter_policy": "replace",
+            },
+        }
+
+    def test_from_dict(self):
+        data = {
+            "type": (
+                "haystack.components.retrievers.in_memory.sparse_embedding_retriever.InMemorySparseEmbeddingRetriever"
+            ),
+            "init_parameters": {
+                "document_store": {
+                    "type": "haystack.document_stores.in_memory.document_store.InMemoryDocumentStore",
+                    "init_parameters": {},
+                },
+                "filters": {"name": "test.txt"},
+                "top_k": 5,
+                "filter_policy": "merge",
+            },
+        }
+        component = InMemorySparseEmbeddingRetriever.from_dict(data)
+        assert isinstance(component.document_store, InMemoryDocumentStore)
+        assert component.filters == {"name": "test.txt"}
+        assert component.top_k == 5
+        assert component.scale_score is False
+        assert component.filter_policy == FilterPolicy.MERGE
+
+    def test_from_dict_without_docstore(self):
+        data = {
+            "type": (
+                "haystack.components.retrievers.in_memory.sparse_embedding_retriever.InMemorySparseEmbeddingRetriever"
+            ),
+            "init_parameters": {},
+        }
+        with pytest.raises(DeserializationError, match="Missing 'document_store' in serialization data"):
+            InMemorySparseEmbeddingRetriever.from_dict(data)
+
+    def test_from_dict_without_docstore_type(self):
+        data = {
+            "type": (
+                "haystack.components.retrievers.in_memory.sparse_embedding_retriever.InMemorySparseEmbeddingRetriever"
+            ),
+            "init_parameters": {"document_store": {"init_parameters": {}}},
+        }
+        with pytest.raises(DeserializationError):
+            InMemorySparseEmbeddingRetriever.from_dict(data)
+
+    def test_from_dict_nonexisting_docstore(self):
+        data = {
+            "type": (
+                "haystack.components.retrievers.in_memory.sparse_embedding_retriever.InMemorySparseEmbeddingRetriever"
+            ),
+            "init_parameters": {"document_store": {"type": "Nonexisting.Docstore", "init_parameters": {}}},
+        }
+        with pytest.raises(DeserializationError):
+            InMemorySparseEmbeddingRetriever.from_dict(data)
+
+    def test_valid_run(self):
+        top_k = 2
+        ds = InMemoryDocumentStore()
+        docs = [
+            Document(content="my document", sparse_embedding=SparseEmbedding(indices=[0, 2], values=[0.1, 0.2])),
+            Document(content="another document", sparse_embedding=SparseEmbedding(indices=[1, 2], values=[1.0, 1.0])),
+            Document(content="third document", sparse_embedding=SparseEmbedding(indices=[3], values=[0.5])),
+        ]
+        ds.write_documents(docs)
+
+        retriever = InMemorySparseEmbeddingRetriever(ds, top_k=top_k)
+        result = retriever.run(
+            query_sparse_embedding=SparseEmbedding(indices=[1, 2], values=[0.5, 0.5]), return_embedding=True
+        )
+
+        assert "documents" in result
+        assert [doc.content for doc in result["documents"]] == ["another document", "my document"]
+        assert [doc.score for doc in result["documents"]] == pytest.approx([1.0, 0.1])
+        assert result["documents"][0].sparse_embedding == SparseEmbedding(indices=[1, 2], values=[1.0, 1.0])
+
+    @pytest.mark.asyncio
+    async def test_valid_run_async(self):
+        ds = InMemoryDocumentStore()
+        docs = [
+            Document(content="my document", sparse_embedding=SparseEmbedding(indices=[0, 2], values=[0.1, 0.2])),
+            Document(content="another document", sparse_embedding=SparseEmbedding(indices=[1, 2], values=[1.0, 1.0])),
+        ]
+        ds.write_documents(docs)
+
+        retriever = InMemorySparseEmbeddingRetriever(ds)
+        result = await retriever.run_async(query_sparse_embedding=SparseEmbedding(indices=[0], values=[1.0]))
+
+        assert [doc.content for doc in result["documents"]] == ["my document"]
+        assert result["documents"][0].sparse_embedding is None
+
+    def test_invalid_run_wrong_store_type(self):
+        SomeOtherDocumentStore = document_store_class("SomeOtherDocumentStore")
+        with pytest.raises(ValueError, match="document_store must be an instance of InMemoryDocumentStore"):
+            InMemorySparseEmbeddingRetriever(SomeOtherDocumentStore())
+
+    @pytest.mark.integration
+    def test_run_with_pipeline(self):
+        ds = InMemoryDocumentStore()
+        top_k = 2
+        docs = [
+            Document(content="my document", sparse_embedding=SparseEmbedding(indices=[0, 2], values=[0.1, 0.2])),
+            Document(content="another document", sparse_embedding=SparseEmbedding(indices=[1, 2], values=[1.0, 1.0])),
+            Document(content="third document", sparse_embedding=SparseEmbedding(indices=[2, 3], values=[0.5, 0.5])),
+        ]
+        ds.write_documents(docs)
+        retriever = InMemorySparseEmbeddingRetriever(ds, top_k=top_k)
+
+        pipeline = Pipeline()
+        pipeline.add_component("retriever", retriever)
+        result: dict[str, Any] = pipeline.run(
+            data={"retriever": {"query_sparse_embedding": SparseEmbedding(indices=[2], values=[1.0])}}
+        )
+
+        assert result
+        assert "retriever" in result
+        results_docs = result["retriever"]["documents"]
+        assert results_docs
+        assert len(results_docs) == top_k
+        assert results_docs[0].content == "another document"
@@ -78,6 +78,15 @@ class TestSentenceWindowRetriever:
                         "embedding_similarity_function": "dot_product",
                         "index": ANY,
                         "return_embedding": True,
+                        "embedding_index_type": "flat",
+                        "embedding_index_parameters": {},
+                        "metadata_indexes": {},
+                        "wal_directory": None,
+                        "wal_compaction_threshold": 10000,
+                        "embedding_quantization": None,
+                        "embedding_quantization_parameters": {},
+                        "bm25_tokenization_workers": 1,
+                        "bm25_tokenizer": None,
                     },
                 },
                 "window_size": 3,
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from haystack.components.joiners import BranchJoiner
+from haystack.core.pipeline import Pipeline
+from haystack.core.pipeline.execution_plan import ExecutionStep, compile_execution_plan
+from haystack.testing.sample_components import AddFixedValue, Double, Sum
+
+
+class TestCompileExecutionPlan:
+    def test_waves_are_sorted_by_name(self):
+        pipeline = Pipeline()
+        pipeline.add_component("source", AddFixedValue())
+        pipeline.add_component("b_double", Double())
+        pipeline.add_component("a_add", AddFixedValue())
+        pipeline.add_component("last", AddFixedValue())
+        pipeline.connect("source.result", "b_double.value")
+        pipeline.connect("source.result", "last.add")
+        pipeline.connect("b_double.value", "a_add.value")
+        pipeline.connect("a_add.result", "last.value")
+
+        plan = compile_execution_plan(pipeline.graph)
+
+        assert plan is not None
+        assert plan.waves == (
+            (ExecutionStep("source", (("b_double", "result", "value"), ("last", "result", "add"))),),
+            (ExecutionStep("b_double", (("a_add", "value", "value"),)),),
+            (ExecutionStep("a_add", (("last", "result", "value"),)),),
+            (ExecutionStep("last", ()),),
+        )
+
+    def test_independent_components_are_in_the_same_wave(self):
+        pipeline = Pipeline()
+        pipeline.add_component("second", AddFixedValue())
+        pipeline.add_component("first", Double())
+
+        plan = compile_execution_plan(pipeline.graph)
+
+        assert plan is not None
+        assert [[step.component_name for step in wave] for wave in plan.waves] == [["first", "second"]]
+
+    def test_no_plan_for_dynamic_topologies(self):
+        assert compile_execution_plan(Pipeline().graph) is None
+
+        pipeline = Pipeline()
+        pipeline.add_component("joiner", BranchJoiner(type_=int))
+        pipeline.add_component("double", Double())
+        pipeline.connect("joiner.value", "double.value")
+        assert compile_execution_plan(pipeline.graph) is None
+
+        pipeline = Pipeline()
+        pipeline.add_component("sum", Sum())
+        assert compile_execution_plan(pipeline.graph) is None
+
+        pipeline = Pipeline()
+        pipeline.add_component("first", AddFixedValue())
+        pipeline.add_component("second", AddFixedValue())
+        pipeline.connect("first.result", "second.value")
+        pipeline.connect("second.result", "first.add")
+        assert compile_execution_plan(pipeline.graph) is None
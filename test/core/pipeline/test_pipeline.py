@@ -2,14 +2,20 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import threading
 from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from unittest.mock import patch
 
 import pytest
 
 from haystack.components.joiners import BranchJoiner
 from haystack.core.component import component
+from haystack.core.component.types import Variadic
 from haystack.core.errors import PipelineRuntimeError
 from haystack.core.pipeline import Pipeline
+from haystack.core.pipeline.base import PipelineBase
+from haystack.testing.sample_components import AddFixedValue, Double
 
 
 class TestPipeline:
@@ -123,3 +129,254 @@ class TestPipeline:
                 component_visits={"erroring_component": 0},
             )
         assert "Component name: 'erroring_component'" in str(exc_info.value)
+
+    def test_run_only_recalculates_priorities_of_changed_components(self):
+        @component
+        class AddOne:
+            @component.output_types(value=int)
+            def run(self, value: int):
+                return {"value": value + 1}
+
+        pp = Pipeline()
+        component_names = ["first", "second", "third", "fourth"]
+        # the variadic socket of the joiner makes the pipeline scheduled dynamically
+        pp.add_component("first", BranchJoiner(type_=int))
+        for name in component_names[1:]:
+            pp.add_component(name, AddOne())
+        for sender, receiver in zip(component_names, component_names[1:]):
+            pp.connect(f"{sender}.value", f"{receiver}.value")
+
+        with patch.object(
+            PipelineBase, "_calculate_priority", wraps=PipelineBase._calculate_priority
+        ) as calculate_priority:
+            result = pp.run({"first": {"value": 0}})
+
+        assert result == {"fourth": {"value": 3}}
+        # All the priorities are calculated once, then only the ones of the component that ran and of its receiver
+        assert calculate_priority.call_count == len(component_names) + 2 * (len(component_names) - 1) + 1
+
+    @staticmethod
+    def _pipeline_with_optional_branch(min_value: int) -> Pipeline:
+        @component
+        class SkipSmallValues:
+            @component.output_types(small=int, large=int)
+            def run(self, value: int):
+                return {"large": value} if value >= min_value else {"small": value}
+
+        pp = Pipeline()
+        pp.add_component("source", AddFixedValue())
+        pp.add_component("router", SkipSmallValues())
+        pp.add_component("double", Double())
+        pp.add_component("add_small", AddFixedValue(add=10))
+        pp.add_component("add_large", AddFixedValue(add=100))
+        pp.add_component("last", AddFixedValue())
+        pp.connect("source.result", "router.value")
+        pp.connect("source.result", "double.value")
+        pp.connect("router.small", "add_small.value")
+        pp.connect("router.large", "add_large.value")
+        pp.connect("add_large.result", "last.value")
+        pp.connect("double.value", "last.add")
+        return pp
+
+    @pytest.mark.parametrize("value", [1, 10])
+    @pytest.mark.parametrize("include_outputs_from", [set(), {"source", "router", "last"}])
+    def test_run_with_execution_plan_matches_dynamic_scheduling(self, value, include_outputs_from, spying_tracer):
+        def run(pp):
+            outputs = pp.run({"source": {"value": value}}, include_outputs_from=include_outputs_from)
+            calls = [
+                (span.tags["haystack.component.name"], span.tags["haystack.component.input"])
+                for span in spying_tracer.spans
+                if span.operation_name == "haystack.component.run"
+            ]
+            spying_tracer.spans.clear()
+            return outputs, calls
+
+        pp = self._pipeline_with_optional_branch(min_value=5)
+        assert pp._get_execution_plan() is not None
+        with patch.object(Pipeline, "_run_execution_plan", wraps=pp._run_execution_plan) as run_execution_plan:
+            result = run(pp)
+        run_execution_plan.assert_called_once()
+
+        with patch.object(PipelineBase, "_get_execution_plan", return_value=None):
+            expected_result = run(self._pipeline_with_optional_branch(min_value=5))
+
+        assert result == expected_result
+
+    def test_run_with_execution_plan_failure_creates_the_same_snapshot(self):
+        @component
+        class Failing:
+            @component.output_types(value=int)
+            def run(self, value: int):
+                raise ValueError("Test error")
+
+        def run(pp):
+            pp.add_component("failing", Failing())
+            pp.connect("add_small.result", "failing.value")
+            with patch("haystack.core.pipeline.pipeline._save_pipeline_snapshot"):
+                with pytest.raises(PipelineRuntimeError) as exc_info:
+                    pp.run({"source": {"value": 1}})
+            return exc_info.value.pipeline_snapshot
+
+        snapshot = run(self._pipeline_with_optional_branch(min_value=5))
+        with patch.object(PipelineBase, "_get_execution_plan", return_value=None):
+            expected_snapshot = run(self._pipeline_with_optional_branch(min_value=5))
+
+        assert snapshot.pipeline_state == expected_snapshot.pipeline_state
+        assert snapshot.break_point.component_name == "failing"
+
+    def test_execution_plan_is_compiled_again_when_the_graph_changes(self):
+        pp = Pipeline()
+        pp.add_component("first", AddFixedValue())
+        pp.warm_up()
+        assert [[step.component_name for step in wave] for wave in pp._get_execution_plan().waves] == [["first"]]
+
+        pp.add_component("second", AddFixedValue())
+        pp.connect("first.result", "second.value")
+        assert pp.run({"first": {"value": 1}}) == {"second": {"result": 3}}
+        assert [[step.component_name for step in wave] for wave in pp._get_execution_plan().waves] == [
+            ["first"],
+            ["second"],
+        ]
+
+        pp.connect("second.result", "first.add")
+        assert pp._get_execution_plan() is None
+
+    @pytest.mark.parametrize("include_outputs_from", [None, {"source", "router", "last"}])
+    def test_run_batch_matches_run(self, include_outputs_from):
+        pp = self._pipeline_with_optional_branch(min_value=5)
+        data = [{"source": {"value": value}} for value in [1, 10, 3, 7]]
+
+        results = pp.run_batch(data, include_outputs_from=include_outputs_from)
+
+        assert results == [pp.run(run_data, include_outputs_from=include_outputs_from) for run_data in data]
+
+    def test_run_batch_runs_components_with_run_many_once(self):
+        @component
+        class BatchDouble:
+            def __init__(self):
+                self.batch_sizes = []
+
+            @component.output_types(value=int)
+            def run(self, value: int):
+                self.batch_sizes.append(1)
+                return {"value": value * 2}
+
+            def run_many(self, inputs):
+                self.batch_sizes.append(len(inputs))
+                return [{"value": run_inputs["value"] * 2} for run_inputs in inputs]
+
+        pp = Pipeline()
+        pp.add_component("source", AddFixedValue())
+        pp.add_component("double", BatchDouble())
+        pp.connect("source.result", "double.value")
+
+        results = pp.run_batch([{"source": {"value": value}} for value in range(3)])
+
+        assert results == [{"double": {"value": 2}}, {"double": {"value": 4}}, {"double": {"value": 6}}]
+        assert pp.get_component("double").batch_sizes == [3]
+
+    def test_run_batch_with_invalid_run_many_output(self):
+        @component
+        class InvalidBatch:
+            @component.output_types(value=int)
+            def run(self, value: int):
+                return {"value": value}
+
+            def run_many(self, inputs):
+                return [{"value": 1}]
+
+        pp = Pipeline()
+        pp.add_component("invalid", InvalidBatch())
+
+        with pytest.raises(PipelineRuntimeError, match="Expected a list of 2 dictionaries from run_many"):
+            pp.run_batch([{"invalid": {"value": 1}}, {"invalid": {"value": 2}}])
+
+    def test_run_batch_without_execution_plan_runs_each_request(self):
+        pp = Pipeline()
+        pp.add_component("joiner", BranchJoiner(type_=int))
+        pp.add_component("add", AddFixedValue())
+        pp.connect("joiner.value", "add.value")
+        assert pp._get_execution_plan() is None
+
+        with patch.object(Pipeline, "run", wraps=pp.run) as run:
+            results = pp.run_batch([{"joiner": {"value": 1}}, {"joiner": {"value": 2}}])
+
+        assert results == [{"add": {"result": 2}}, {"add": {"result": 3}}]
+        assert run.call_count == 2
+
+    @staticmethod
+    def _pipeline_with_independent_branches(barrier: Optional[threading.Barrier] = None) -> Pipeline:
+        @component
+        class WaitForBranches:
+            @component.output_types(value=int)
+            def run(self, value: int):
+                if barrier is not None:
+                    barrier.wait()
+                return {"value": value}
+
+        @component
+        class Sum:
+            @component.output_types(values=list[int])
+            def run(self, values: Variadic[int]):
+                return {"values": list(values)}
+
+        pp = Pipeline()
+        pp.add_component("source", AddFixedValue())
+        pp.add_component("first_branch", WaitForBranches())
+        pp.add_component("second_branch", WaitForBranches())
+        pp.add_component("double", Double())
+        pp.add_component("sum", Sum())
+        pp.connect("source.result", "first_branch.value")
+        pp.connect("source.result", "second_branch.value")
+        pp.connect("second_branch.value", "double.value")
+        pp.connect("first_branch.value", "sum.values")
+        pp.connect("double.value", "sum.values")
+        pp.connect("source.result", "sum.values")
+        return pp
+
+    def test_run_with_max_workers_runs_independent_components_concurrently(self):
+        # The branches only return once both of them are running
+        pp = self._pipeline_with_independent_branches(barrier=threading.Barrier(2, timeout=10))
+
+        result = pp.run({"source": {"value": 1}}, max_workers=2)
+
+        assert result == self._pipeline_with_independent_branches().run({"source": {"value": 1}})
+        assert result == {"sum": {"values": [2, 2, 4]}}
+
+    @pytest.mark.parametrize("include_outputs_from", [set(), {"source", "first_branch", "sum"}])
+    def test_run_with_max_workers_matches_sequential_run(self, include_outputs_from, spying_tracer):
+        def run(max_workers):
+            outputs = self._pipeline_with_independent_branches().run(
+                {"source": {"value": 3}}, include_outputs_from=include_outputs_from, max_workers=max_workers
+            )
+            calls = sorted(
+                (span.tags["haystack.component.name"], span.tags["haystack.component.visits"])
+                for span in spying_tracer.spans
+                if span.operation_name == "haystack.component.run"
+            )
+            spying_tracer.spans.clear()
+            return outputs, calls
+
+        assert run(max_workers=4) == run(max_workers=None)
+
+    def test_run_with_max_workers_failure_creates_the_same_snapshot(self):
+        @component
+        class Failing:
+            @component.output_types(value=int)
+            def run(self, value: int):
+                raise ValueError("Test error")
+
+        def run(max_workers):
+            pp = self._pipeline_with_independent_branches()
+            pp.add_component("failing", Failing())
+            pp.connect("source.result", "failing.value")
+            with patch("haystack.core.pipeline.pipeline._save_pipeline_snapshot"):
+                with pytest.raises(PipelineRuntimeError) as exc_info:
+                    pp.run({"source": {"value": 1}}, max_workers=max_workers)
+            return exc_info.value.pipeline_snapshot
+
+        snapshot = run(max_workers=4)
+        expected_snapshot = run(max_workers=None)
+
+        assert snapshot.pipeline_state == expected_snapshot.pipeline_state
+        assert snapshot.break_point.component_name == "failing"
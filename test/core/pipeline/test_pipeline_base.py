@@ -1606,6 +1606,33 @@ class TestPipelineBase:
         assert queue.pop() == (1, "comp1")
         assert queue.pop() == (2, "comp2")
 
+    @patch("haystack.core.pipeline.base.PipelineBase._calculate_priority")
+    @patch("haystack.core.pipeline.base.PipelineBase._get_component_with_graph_metadata_and_visits")
+    def test_fill_queue_with_cached_priorities(self, mock_get_metadata, mock_calc_priority):
+        pipeline = PipelineBase()
+        component_names = ["comp1", "comp2", "comp3"]
+        inputs = {"comp2": {"input2": "value2"}}
+        cached_priorities = {"comp1": ComponentPriority.BLOCKED, "comp3": ComponentPriority.READY}
+
+        mock_get_metadata.side_effect = lambda name, _: {"component": f"mock_{name}"}
+        mock_calc_priority.return_value = ComponentPriority.HIGHEST
+
+        queue = pipeline._fill_queue(
+            component_names,
+            inputs,
+            component_visits={"comp1": 0, "comp2": 1, "comp3": 0},
+            cached_priorities=cached_priorities,
+        )
+
+        # only the priority that is not cached is calculated, and it's cached
+        mock_get_metadata.assert_called_once_with("comp2", 1)
+        mock_calc_priority.assert_called_once_with({"component": "mock_comp2"}, {"input2": "value2"})
+        assert cached_priorities["comp2"] == ComponentPriority.HIGHEST
+
+        assert queue.pop() == (ComponentPriority.HIGHEST, "comp2")
+        assert queue.pop() == (ComponentPriority.READY, "comp3")
+        assert queue.pop() == (ComponentPriority.BLOCKED, "comp1")
+
     @pytest.mark.parametrize(
         "input_sockets,component_inputs,expected_consumed,expected_remaining",
         [
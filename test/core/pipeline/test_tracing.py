@@ -3,12 +3,14 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from typing import Optional
-from unittest.mock import ANY
+from unittest.mock import ANY, patch
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 
 from haystack import Pipeline, component
+from haystack.core.pipeline.base import PipelineBase
+from haystack.tracing import Span
 from haystack.tracing.tracer import tracer
 from test.tracing.utils import SpyingSpan, SpyingTracer
 
@@ -146,3 +148,33 @@ class TestTracing:
                 span_id=ANY,
             ),
         ]
+
+    def test_with_disabled_tracing(self, pipeline: Pipeline, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setattr(tracer, "is_content_tracing_enabled", True)
+
+        with (
+            patch("haystack.core.pipeline.pipeline._deepcopy_with_exceptions") as deepcopy_inputs,
+            patch.object(PipelineBase, "_create_component_span", wraps=PipelineBase._create_component_span) as span,
+        ):
+            result = pipeline.run(data={"word": "world"})
+
+        assert result == {"hello2": {"output": "Hello, Hello, world!!"}}
+        assert span.call_count == 2
+        # the inputs are not copied for the discarded content tags
+        deepcopy_inputs.assert_not_called()
+
+    def test_with_enabled_tracing_and_disabled_content_tracing(
+        self, spying_tracer: SpyingTracer, monkeypatch: MonkeyPatch, pipeline: Pipeline
+    ) -> None:
+        class ContentlessSpyingSpan(SpyingSpan):
+            set_content_tag = Span.set_content_tag
+
+        monkeypatch.setattr(tracer, "is_content_tracing_enabled", False)
+        monkeypatch.setattr("test.tracing.utils.SpyingSpan", ContentlessSpyingSpan)
+
+        with patch("haystack.core.pipeline.pipeline._deepcopy_with_exceptions") as deepcopy_inputs:
+            pipeline.run(data={"word": "world"})
+
+        deepcopy_inputs.assert_not_called()
+        assert "haystack.component.input_spec" in spying_tracer.spans[1].tags
+        assert "haystack.component.input" not in spying_tracer.spans[1].tags
@@ -4,16 +4,29 @@
 
 import asyncio
 import gc
+import json
 import logging
+import math
+import os
 import tempfile
+import threading
+from collections import Counter
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from haystack import Document
+from haystack.components.joiners import DocumentJoiner
+from haystack.dataclasses import SparseEmbedding
 from haystack.document_stores.errors import DocumentStoreError, DuplicateDocumentError
-from haystack.document_stores.in_memory import InMemoryDocumentStore
+from haystack.document_stores.in_memory import BM25Tokenizer, InMemoryDocumentStore
+from haystack.document_stores.in_memory import document_store as document_store_module
+from haystack.document_stores.in_memory.write_ahead_log import WriteAheadLog
+from haystack.document_stores.types import DuplicatePolicy
+from haystack.errors import FilterError
 from haystack.testing.document_store import DocumentStoreBaseTests
+from haystack.utils.filters import compile_filter
 
 
 class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
@@ -44,6 +57,15 @@ class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
                 "embedding_similarity_function": "dot_product",
                 "index": store.index,
                 "return_embedding": True,
+                "embedding_index_type": "flat",
+                "embedding_index_parameters": {},
+                "metadata_indexes": {},
+                "wal_directory": None,
+                "wal_compaction_threshold": 10000,
+                "embedding_quantization": None,
+                "embedding_quantization_parameters": {},
+                "bm25_tokenization_workers": 1,
+                "bm25_tokenizer": None,
             },
         }
 
@@ -66,10 +88,19 @@ class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
                 "embedding_similarity_function": "cosine",
                 "index": "my_cool_index",
                 "return_embedding": True,
+                "embedding_index_type": "flat",
+                "embedding_index_parameters": {},
+                "metadata_indexes": {},
+                "wal_directory": None,
+                "wal_compaction_threshold": 10000,
+                "embedding_quantization": None,
+                "embedding_quantization_parameters": {},
+                "bm25_tokenization_workers": 1,
+                "bm25_tokenizer": None,
             },
         }
 
-    @patch("haystack.document_stores.in_memory.document_store.re")
+    @patch("haystack.document_stores.in_memory.bm25_tokenizer.re")
     def test_from_dict(self, mock_regex):
         data = {
             "type": "haystack.document_stores.in_memory.document_store.InMemoryDocumentStore",
@@ -83,6 +114,7 @@ class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
         store = InMemoryDocumentStore.from_dict(data)
         mock_regex.compile.assert_called_with("custom_regex")
         assert store.tokenizer
+        assert store.bm25_tokenizer is None
         assert store.bm25_algorithm == "BM25Plus"
         assert store.bm25_parameters == {"key": "value"}
         assert store.index == "my_cool_index"
@@ -99,6 +131,368 @@ class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
         assert list(document_store_loaded.storage.values()) == docs
         assert document_store_loaded.to_dict() == document_store.to_dict()
 
+    def test_save_to_disk_and_load_from_disk_binary(self, tmp_dir: str):
+        docs = [
+            Document(content="Hello world", meta={"page": 1}, embedding=[0.5, 0.25, 0.125]),
+            Document(content="Haystack supports multiple languages", embedding=[0.25, 0.5, 1.0]),
+            Document(content="No embedding here", meta={"page": 2}),
+        ]
+        document_store = InMemoryDocumentStore(bm25_algorithm="BM25Okapi")
+        document_store.write_documents(docs)
+        path = tmp_dir + "/snapshot"
+        document_store.save_to_disk(path, file_format="binary")
+        self._rename_snapshot_index(path, "test_save_to_disk_and_load_from_disk_binary")
+
+        with patch.object(InMemoryDocumentStore, "_tokenize_bm25", wraps=document_store._tokenize_bm25) as tokenize:
+            document_store_loaded = InMemoryDocumentStore.load_from_disk(path)
+        # the BM25 statistics are loaded, the Documents are not tokenized again
+        tokenize.assert_not_called()
+
+        assert document_store_loaded.filter_documents() == docs
+        # the Documents don't hold a copy of the memory-mapped embeddings
+        assert all(doc.embedding is None for doc in document_store_loaded.storage.values())
+        assert document_store_loaded._bm25_attr == document_store._bm25_attr
+        assert document_store_loaded._bm25_postings == document_store._bm25_postings
+        assert document_store_loaded._freq_vocab_for_idf == document_store._freq_vocab_for_idf
+        assert document_store_loaded._avg_doc_len == document_store._avg_doc_len
+        assert isinstance(document_store_loaded._embedding_matrix._data, np.memmap)
+
+        for query in ["languages", "hello world"]:
+            assert document_store_loaded.bm25_retrieval(query) == document_store.bm25_retrieval(query)
+        query_embedding = [0.1, 0.2, 0.3]
+        assert document_store_loaded.embedding_retrieval(query_embedding) == document_store.embedding_retrieval(
+            query_embedding
+        )
+
+        # the loaded store can be modified without changing the snapshot
+        document_store_loaded.delete_documents([docs[0].id])
+        document_store_loaded.write_documents([Document(content="Hello again", embedding=[1.0, 0.0, 0.0])])
+        assert [doc.content for doc in document_store_loaded.embedding_retrieval([1.0, 0.0, 0.0], top_k=1)] == [
+            "Hello again"
+        ]
+        np.testing.assert_array_equal(
+            np.load(path + "/embeddings.npy"), np.array([docs[0].embedding, docs[1].embedding], dtype=np.float32)
+        )
+
+    def test_load_from_disk_binary_with_mismatched_embeddings(self, tmp_dir: str):
+        docs = [Document(content="a", embedding=[1.0, 0.0]), Document(content="b", embedding=[1.0, 0.0, 0.0])]
+        document_store = InMemoryDocumentStore()
+        document_store.write_documents(docs)
+        path = tmp_dir + "/snapshot"
+        document_store.save_to_disk(path, file_format="binary")
+        self._rename_snapshot_index(path, "test_load_from_disk_binary_with_mismatched_embeddings")
+
+        document_store_loaded = InMemoryDocumentStore.load_from_disk(path)
+        assert document_store_loaded.filter_documents() == docs
+        assert document_store_loaded._embedding_matrix.mismatched_ids == {docs[1].id}
+
+    def test_load_from_disk_binary_into_used_index(self, tmp_dir: str):
+        document_store = InMemoryDocumentStore(index="test_load_from_disk_binary_into_used_index")
+        document_store.write_documents([Document(content="Hello world")])
+        path = tmp_dir + "/snapshot"
+        document_store.save_to_disk(path, file_format="binary")
+        document_store.write_documents([Document(content="Written after saving")])
+
+        # the index is shared with the original store, the Documents of the snapshot are written to it
+        document_store_loaded = InMemoryDocumentStore.load_from_disk(path)
+        assert document_store_loaded.count_documents() == 2
+
+    def test_save_to_disk_with_unsupported_format(self, tmp_dir: str):
+        with pytest.raises(ValueError, match="File format 'xml' is not supported"):
+            InMemoryDocumentStore().save_to_disk(tmp_dir + "/store.xml", file_format="xml")
+
+    def test_write_ahead_log(self, tmp_dir: str):
+        wal_directory = tmp_dir + "/wal"
+        store = InMemoryDocumentStore(
+            index="test_write_ahead_log", wal_directory=wal_directory, wal_compaction_threshold=100
+        )
+        docs = [Document(content=f"Document {i}", meta={"i": i}, embedding=[float(i), 1.0]) for i in range(5)]
+        store.write_documents(docs)
+        store.delete_documents([docs[1].id])
+        store.write_documents(
+            [Document(id=docs[2].id, content="Updated", embedding=[0.0, 1.0])], DuplicatePolicy.OVERWRITE
+        )
+        with pytest.raises(DuplicateDocumentError):
+            store.write_documents([Document(content="Written before the failure"), docs[0]])
+
+        with open(wal_directory + "/wal.jsonl") as f:
+            assert [json.loads(line)["operation"] for line in f] == ["write", "delete", "write", "write"]
+
+        expected_documents = store.filter_documents()
+        expected_retrieved = store.embedding_retrieval([1.0, 1.0])
+        self._forget_index("test_write_ahead_log")
+        loaded_store = InMemoryDocumentStore.load_from_disk(wal_directory)
+        assert loaded_store.wal_directory == wal_directory
+        assert loaded_store.filter_documents() == expected_documents
+        assert loaded_store.embedding_retrieval([1.0, 1.0]) == expected_retrieved
+        assert loaded_store.bm25_retrieval("failure", top_k=1)[0].content == "Written before the failure"
+
+        # the loaded store keeps logging its operations
+        loaded_store.delete_documents([docs[0].id])
+        self._forget_index("test_write_ahead_log")
+        assert InMemoryDocumentStore.load_from_disk(wal_directory).count_documents() == 4
+
+    def test_write_ahead_log_with_delete_and_update_by_filter(self, tmp_dir: str):
+        wal_directory = tmp_dir + "/wal"
+        store = InMemoryDocumentStore(
+            index="test_write_ahead_log_with_delete_and_update_by_filter",
+            wal_directory=wal_directory,
+            metadata_indexes={"meta.i": "sorted"},
+        )
+        store.write_documents([Document(content=f"Document {i}", meta={"i": i}) for i in range(5)])
+        assert store.delete_by_filter({"field": "meta.i", "operator": "<", "value": 2}) == 2
+        assert store.update_by_filter({"field": "meta.i", "operator": ">=", "value": 3}, meta={"i": 0}) == 2
+
+        with open(wal_directory + "/wal.jsonl") as f:
+            assert [json.loads(line)["operation"] for line in f] == ["write", "delete", "update"]
+
+        expected_documents = store.filter_documents()
+        self._forget_index("test_write_ahead_log_with_delete_and_update_by_filter")
+        loaded_store = InMemoryDocumentStore.load_from_disk(wal_directory)
+        assert loaded_store.filter_documents() == expected_documents
+        assert [doc.meta["i"] for doc in loaded_store.filter_documents()] == [2, 0, 0]
+        assert loaded_store.count_documents({"field": "meta.i", "operator": "==", "value": 0}) == 2
+
+    def test_write_ahead_log_compaction(self, tmp_dir: str):
+        wal_directory = tmp_dir + "/wal"
+        store = InMemoryDocumentStore(
+            index="test_write_ahead_log_compaction", wal_directory=wal_directory, wal_compaction_threshold=3
+        )
+        assert sorted(os.listdir(wal_directory)) == ["snapshot-0", "wal.jsonl"]
+
+        store.write_documents([Document(content="a"), Document(content="b")])
+        store.write_documents([Document(content="c")])
+        # the log is compacted into a snapshot once it contains 3 changes
+        assert sorted(os.listdir(wal_directory)) == ["snapshot-2", "wal.jsonl"]
+        assert os.path.getsize(wal_directory + "/wal.jsonl") == 0
+
+        store.delete_documents([Document(content="a").id])
+        self._forget_index("test_write_ahead_log_compaction")
+        loaded_store = InMemoryDocumentStore.load_from_disk(wal_directory)
+        assert sorted(doc.content for doc in loaded_store.filter_documents()) == ["b", "c"]
+
+    def test_write_ahead_log_discards_incomplete_entry(self, tmp_dir: str):
+        wal_directory = tmp_dir + "/wal"
+        store = InMemoryDocumentStore(
+            index="test_write_ahead_log_discards_incomplete_entry", wal_directory=wal_directory
+        )
+        store.write_documents([Document(content="a")])
+        with open(wal_directory + "/wal.jsonl", "a") as f:
+            f.write('{"sequence": 2, "operation": "wri')
+
+        self._forget_index("test_write_ahead_log_discards_incomplete_entry")
+        loaded_store = InMemoryDocumentStore.load_from_disk(wal_directory)
+        assert [doc.content for doc in loaded_store.filter_documents()] == ["a"]
+        loaded_store.write_documents([Document(content="b")])
+        with open(wal_directory + "/wal.jsonl") as f:
+            assert [json.loads(line)["sequence"] for line in f] == [1, 2]
+
+    def test_write_ahead_log_operations_are_logged_before_being_applied(self, tmp_dir: str):
+        wal_directory = tmp_dir + "/wal"
+        store = InMemoryDocumentStore(
+            index="test_write_ahead_log_operations_are_logged_before_being_applied", wal_directory=wal_directory
+        )
+        store.write_documents([Document(content="a")])
+
+        with patch.object(WriteAheadLog, "append", side_effect=OSError("No space left on device")):
+            with pytest.raises(OSError):
+                store.write_documents([Document(content="b")])
+            with pytest.raises(OSError):
+                store.delete_documents([Document(content="a").id])
+            with pytest.raises(OSError):
+                store.update_by_filter({"field": "content", "operator": "==", "value": "a"}, meta={"updated": True})
+        assert store.filter_documents() == [Document(content="a")]
+
+    def test_load_from_disk_with_write_ahead_log_reads_the_snapshot_once(self, tmp_dir: str):
+        wal_directory = tmp_dir + "/wal"
+        store = InMemoryDocumentStore(
+            index="test_load_from_disk_with_write_ahead_log_reads_the_snapshot_once", wal_directory=wal_directory
+        )
+        store.write_documents([Document(content="a")])
+
+        self._forget_index("test_load_from_disk_with_write_ahead_log_reads_the_snapshot_once")
+        with patch.object(
+            document_store_module, "read_snapshot", wraps=document_store_module.read_snapshot
+        ) as read_snapshot:
+            loaded_store = InMemoryDocumentStore.load_from_disk(wal_directory)
+        read_snapshot.assert_called_once()
+        assert [doc.content for doc in loaded_store.filter_documents()] == ["a"]
+
+    def test_write_ahead_log_compaction_keeps_later_operations(self, tmp_dir: str):
+        wal = WriteAheadLog(tmp_dir + "/wal")
+        wal.append("delete", document_ids=["a"])
+        wal.append("delete", document_ids=["b", "c"])
+        # an operation logged while the snapshot including the first one was written
+        wal.compacted(1)
+
+        assert sorted(os.listdir(tmp_dir + "/wal")) == ["wal.jsonl"]
+        assert [entry["document_ids"] for entry in wal.entries()] == [["b", "c"]]
+        assert wal.pending_changes == 2
+
+    @staticmethod
+    def _forget_index(index: str) -> None:
+        # simulates a new process, where the data of the index is not in memory anymore
+        for storages in (
+            document_store_module._STORAGES,
+            document_store_module._BM25_STATS_STORAGES,
+            document_store_module._AVERAGE_DOC_LEN_STORAGES,
+            document_store_module._FREQ_VOCAB_FOR_IDF_STORAGES,
+            document_store_module._BM25_POSTINGS_STORAGES,
+            document_store_module._EMBEDDING_MATRIX_STORAGES,
+            document_store_module._METADATA_INDEX_STORAGES,
+        ):
+            storages.pop(index, None)
+
+    @staticmethod
+    def _rename_snapshot_index(path: str, index: str) -> None:
+        # a new index name makes sure the loaded store doesn't share its data with the original one
+        with open(path + "/manifest.json") as f:
+            manifest = json.load(f)
+        manifest["store"]["init_parameters"]["index"] = index
+        with open(path + "/manifest.json", "w") as f:
+            json.dump(manifest, f)
+
+    def test_sparse_embedding_retrieval(self):
+        store = InMemoryDocumentStore()
+        docs = [
+            Document(
+                content="a", meta={"lang": "en"}, sparse_embedding=SparseEmbedding(indices=[0, 1], values=[1.0, 1.0])
+            ),
+            Document(content="b", meta={"lang": "de"}, sparse_embedding=SparseEmbedding(indices=[1], values=[2.0])),
+            Document(content="c", meta={"lang": "en"}, sparse_embedding=SparseEmbedding(indices=[1], values=[1.0])),
+            Document(content="d", meta={"lang": "en"}, sparse_embedding=SparseEmbedding(indices=[5], values=[1.0])),
+            Document(content="e", meta={"lang": "en"}),
+        ]
+        store.write_documents(docs)
+        query = SparseEmbedding(indices=[1, 2], values=[1.0, 3.0])
+
+        results = store.sparse_embedding_retrieval(query)
+        # Documents with the same score are returned in write order, "d" and "e" don't share any dimension
+        assert [(doc.content, doc.score) for doc in results] == [("b", 2.0), ("a", 1.0), ("c", 1.0)]
+        assert results[0].sparse_embedding is None
+
+        results = store.sparse_embedding_retrieval(
+            query, filters={"field": "meta.lang", "operator": "==", "value": "en"}, top_k=1, scale_score=True
+        )
+        assert [doc.content for doc in results] == ["a"]
+        assert results[0].score == pytest.approx(0.5025, abs=1e-4)
+
+        store.delete_documents([docs[1].id])
+        store.write_documents(
+            [Document(id=docs[0].id, content="a2", sparse_embedding=SparseEmbedding([2], [1.0]))],
+            DuplicatePolicy.OVERWRITE,
+        )
+        results = store.sparse_embedding_retrieval(query, return_embedding=True)
+        assert [(doc.content, doc.score) for doc in results] == [("a2", 3.0), ("c", 1.0)]
+        assert results[0].sparse_embedding == SparseEmbedding(indices=[2], values=[1.0])
+
+    def test_sparse_embedding_retrieval_without_sparse_embeddings(self, caplog):
+        store = InMemoryDocumentStore()
+        store.write_documents([Document(content="a")])
+        with caplog.at_level(logging.WARNING):
+            assert store.sparse_embedding_retrieval(SparseEmbedding(indices=[0], values=[1.0])) == []
+        assert "No Documents found with sparse embeddings" in caplog.text
+
+        with pytest.raises(ValueError, match="non-empty SparseEmbedding"):
+            store.sparse_embedding_retrieval(SparseEmbedding(indices=[], values=[]))
+
+    def test_load_from_disk_binary_with_sparse_embeddings(self, tmp_dir: str):
+        store = InMemoryDocumentStore()
+        store.write_documents([Document(content="a", sparse_embedding=SparseEmbedding(indices=[3], values=[0.5]))])
+        path = tmp_dir + "/snapshot"
+        store.save_to_disk(path, file_format="binary")
+        self._rename_snapshot_index(path, "test_load_from_disk_binary_with_sparse_embeddings")
+
+        loaded_store = InMemoryDocumentStore.load_from_disk(path)
+        results = loaded_store.sparse_embedding_retrieval(SparseEmbedding(indices=[3], values=[2.0]))
+        assert [(doc.content, doc.score) for doc in results] == [("a", 1.0)]
+
+    def test_filter_documents_with_metadata_indexes(self):
+        store = InMemoryDocumentStore(metadata_indexes={"meta.source_id": "hash", "meta.page": "sorted"})
+        docs = [Document(content=f"{i}", meta={"source_id": f"source_{i % 3}", "page": i}) for i in range(30)]
+        store.write_documents(docs)
+        store.delete_documents([docs[0].id])
+
+        evaluated = []
+
+        def counting_compile_filter(filters):
+            predicate = compile_filter(filters)
+            return lambda doc: evaluated.append(doc.id) or predicate(doc)
+
+        with patch(
+            "haystack.document_stores.in_memory.document_store.compile_filter", side_effect=counting_compile_filter
+        ):
+            result = store.filter_documents(
+                filters={
+                    "operator": "AND",
+                    "conditions": [
+                        {"field": "meta.source_id", "operator": "==", "value": "source_0"},
+                        {"field": "meta.page", "operator": "<", "value": 10},
+                    ],
+                }
+            )
+
+        assert [doc.content for doc in result] == ["3", "6", "9"]
+        # the indexes know which Documents match, none of them is evaluated
+        assert evaluated == []
+
+        store.write_documents([Document(content="unhashable", meta={"source_id": ["source_0"], "page": 1})])
+        with patch(
+            "haystack.document_stores.in_memory.document_store.compile_filter", side_effect=counting_compile_filter
+        ):
+            result = store.filter_documents(
+                filters={
+                    "operator": "AND",
+                    "conditions": [
+                        {"field": "meta.source_id", "operator": "==", "value": "source_0"},
+                        {"field": "meta.page", "operator": "<", "value": 10},
+                    ],
+                }
+            )
+        assert [doc.content for doc in result] == ["3", "6", "9"]
+        # only the Documents the indexes can't resolve are evaluated
+        assert len(evaluated) == 1
+
+        result = store.filter_documents(filters={"field": "source_id", "operator": "in", "value": ["source_2"]})
+        assert [doc.content for doc in result] == [str(i) for i in range(2, 30, 3)]
+
+    def test_filter_documents_with_metadata_indexes_raises_on_invalid_filter_values(self):
+        docs = [Document(content="a", meta={"source_id": "source_0", "page": 1})]
+        store_without_indexes = InMemoryDocumentStore()
+        store_without_indexes.write_documents(docs)
+        store = InMemoryDocumentStore(metadata_indexes={"meta.source_id": "hash"})
+        store.write_documents(docs)
+        invalid_filters = {
+            "operator": "AND",
+            "conditions": [
+                {"field": "meta.page", "operator": "in", "value": 1},
+                # no Document matches, but the invalid condition must still raise the same error as without indexes
+                {"field": "meta.source_id", "operator": "==", "value": "source_1"},
+            ],
+        }
+
+        with pytest.raises(FilterError):
+            store_without_indexes.filter_documents(filters=invalid_filters)
+        with pytest.raises(FilterError):
+            store.filter_documents(filters=invalid_filters)
+        with pytest.raises(FilterError):
+            store.count_documents(filters=invalid_filters)
+
+    def test_metadata_indexes_are_shared_by_stores_using_the_same_index(self):
+        index = "test_metadata_indexes_are_shared_by_stores_using_the_same_index"
+        store_1 = InMemoryDocumentStore(index=index)
+        store_1.write_documents([Document(content="a", meta={"source_id": "1"})])
+        store_2 = InMemoryDocumentStore(index=index, metadata_indexes={"meta.source_id": "hash"})
+        store_1.write_documents([Document(content="b", meta={"source_id": "1"})])
+
+        filters = {"field": "meta.source_id", "operator": "==", "value": "1"}
+        assert [doc.content for doc in store_1.filter_documents(filters)] == ["a", "b"]
+        assert [doc.content for doc in store_2.filter_documents(filters)] == ["a", "b"]
+
+    def test_invalid_metadata_index_type(self):
+        with pytest.raises(ValueError, match="Metadata index type 'btree' is not supported"):
+            InMemoryDocumentStore(metadata_indexes={"meta.source_id": "btree"})
+
     def test_invalid_bm25_algorithm(self):
         with pytest.raises(ValueError, match="BM25 algorithm 'invalid' is not supported"):
             InMemoryDocumentStore(bm25_algorithm="invalid")
@@ -109,6 +503,250 @@ class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
         with pytest.raises(DuplicateDocumentError):
             document_store.write_documents(docs)
 
+    @staticmethod
+    def _assert_same_bm25_statistics(store: InMemoryDocumentStore, other_store: InMemoryDocumentStore) -> None:
+        assert list(store.storage.values()) == list(other_store.storage.values())
+        assert store._bm25_attr == other_store._bm25_attr
+        assert store._bm25_postings == other_store._bm25_postings
+        assert store._freq_vocab_for_idf == other_store._freq_vocab_for_idf
+        assert store._avg_doc_len == pytest.approx(other_store._avg_doc_len)
+
+    def test_write_documents_updates_bm25_statistics_like_writing_one_document_at_a_time(self):
+        docs = [
+            Document(id="1", content="Hello world"),
+            Document(id="2", content="Haystack supports multiple languages"),
+            Document(id="3"),
+            Document(id="1", content="Hello again, world"),
+            Document(id="4", content="multiple words in multiple languages"),
+        ]
+        bulk_store = InMemoryDocumentStore()
+        bulk_store.write_documents([Document(id="4", content="Stored before")])
+        assert bulk_store.write_documents(docs, policy=DuplicatePolicy.OVERWRITE) == 5
+        store = InMemoryDocumentStore()
+        store.write_documents([Document(id="4", content="Stored before")])
+        for doc in docs:
+            store.write_documents([doc], policy=DuplicatePolicy.OVERWRITE)
+
+        self._assert_same_bm25_statistics(bulk_store, store)
+        assert bulk_store.bm25_retrieval("multiple languages") == store.bm25_retrieval("multiple languages")
+
+    def test_average_document_length(self, document_store: InMemoryDocumentStore):
+        document_store.write_documents([Document(id="1", content="one two three"), Document(id="2", content="one")])
+        assert document_store._avg_doc_len == pytest.approx(2.0)
+        document_store.write_documents([Document(id="3", content="one two three four five")])
+        assert document_store._avg_doc_len == pytest.approx(3.0)
+        document_store.delete_documents(["1"])
+        assert document_store._avg_doc_len == pytest.approx(3.0)
+        document_store.delete_documents(["2", "3"])
+        assert document_store._avg_doc_len == 0
+
+    def test_write_documents_with_duplicates_in_the_batch(self):
+        docs = [Document(id="1", content="Hello world"), Document(id="1", content="Hello again")]
+        document_store = InMemoryDocumentStore()
+        assert document_store.write_documents(docs, policy=DuplicatePolicy.SKIP) == 1
+        assert document_store.storage["1"].content == "Hello world"
+
+        document_store = InMemoryDocumentStore()
+        with pytest.raises(DuplicateDocumentError):
+            document_store.write_documents([Document(id="0", content="First")] + docs)
+        # the Documents before the duplicate are written
+        assert list(document_store.storage) == ["0", "1"]
+        assert document_store.storage["1"].content == "Hello world"
+        assert list(document_store._bm25_attr) == ["0", "1"]
+        assert document_store._avg_doc_len == pytest.approx(1.5)
+
+    def test_count_documents_with_filters(self):
+        store = InMemoryDocumentStore(metadata_indexes={"meta.page": "sorted"})
+        store.write_documents([Document(content=f"{i}", meta={"page": i, "source_id": i % 3}) for i in range(30)])
+        assert store.count_documents({"field": "meta.page", "operator": "<", "value": 10}) == 10
+        assert store.count_documents({"field": "meta.source_id", "operator": "==", "value": 0}) == 10
+        assert store.count_documents({}) == 30
+        with pytest.raises(ValueError, match="Invalid filter syntax"):
+            store.count_documents({"field": "meta.page"})
+
+    @pytest.mark.parametrize("metadata_indexes", [None, {"meta.source_id": "hash"}])
+    def test_delete_by_filter_updates_bm25_statistics_like_delete_documents(self, metadata_indexes):
+        docs = [
+            Document(content=f"Document {i} about topic {i % 7}", meta={"source_id": f"source_{i % 3}"})
+            for i in range(30)
+        ]
+        store = InMemoryDocumentStore(metadata_indexes=metadata_indexes)
+        store.write_documents(docs)
+        other_store = InMemoryDocumentStore()
+        other_store.write_documents(docs)
+
+        filters = {"field": "meta.source_id", "operator": "in", "value": ["source_0", "source_2"]}
+        assert store.delete_by_filter(filters) == 20
+        for doc in docs:
+            if doc.meta["source_id"] != "source_1":
+                other_store.delete_documents([doc.id])
+
+        self._assert_same_bm25_statistics(store, other_store)
+        assert store.bm25_retrieval("topic 3") == other_store.bm25_retrieval("topic 3")
+        assert store.count_documents(filters) == 0
+        assert store.delete_by_filter(filters) == 0
+
+    def test_update_by_filter(self):
+        store = InMemoryDocumentStore(metadata_indexes={"meta.source_id": "hash", "meta.version": "sorted"})
+        docs = [Document(content=f"{i}", meta={"source_id": f"source_{i % 3}", "version": 1}) for i in range(9)]
+        store.write_documents(docs)
+        returned_before = store.filter_documents()
+
+        filters = {"field": "meta.source_id", "operator": "==", "value": "source_1"}
+        assert store.update_by_filter(filters, meta={"version": 2, "stale": False}) == 3
+
+        # the updated Documents keep their ids and position, and the indexes are updated
+        assert list(store.storage) == [doc.id for doc in docs]
+        updated = store.filter_documents({"field": "meta.version", "operator": ">", "value": 1})
+        assert [doc.content for doc in updated] == ["1", "4", "7"]
+        assert all(doc.meta == {"source_id": "source_1", "version": 2, "stale": False} for doc in updated)
+        assert store.count_documents({"field": "meta.version", "operator": "==", "value": 1}) == 6
+        # the Documents returned before the update are not modified
+        assert all(doc.meta["version"] == 1 for doc in returned_before)
+
+    def test_delete_and_update_by_filter_invalid_filters(self):
+        store = InMemoryDocumentStore()
+        with pytest.raises(ValueError, match="Invalid filter syntax"):
+            store.delete_by_filter({})
+        with pytest.raises(ValueError, match="Invalid filter syntax"):
+            store.update_by_filter({"field": "meta.page"}, meta={"page": 1})
+        with pytest.raises(ValueError, match="meta must be a dictionary"):
+            store.update_by_filter({"field": "meta.page", "operator": "==", "value": 1}, meta=None)  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_delete_and_update_by_filter_async(self):
+        store = InMemoryDocumentStore()
+        await store.write_documents_async([Document(content=f"{i}", meta={"page": i}) for i in range(5)])
+        assert (
+            await store.update_by_filter_async({"field": "meta.page", "operator": ">", "value": 2}, {"tag": "x"}) == 2
+        )
+        assert await store.count_documents_async({"field": "meta.tag", "operator": "==", "value": "x"}) == 2
+        assert await store.delete_by_filter_async({"field": "meta.tag", "operator": "==", "value": "x"}) == 2
+        assert await store.count_documents_async() == 3
+
+    def test_write_documents_with_tokenization_workers(self):
+        docs = [Document(content=f"Document number {i} about topic {i % 7}") for i in range(20)]
+        document_store = InMemoryDocumentStore(bm25_tokenization_workers=2)
+        with patch.object(document_store_module, "PARALLEL_TOKENIZATION_MIN_DOCUMENTS", 10):
+            document_store.write_documents(docs)
+        assert document_store._tokenization_pool is not None
+        document_store.shutdown()
+        assert document_store._tokenization_pool is None
+
+        store = InMemoryDocumentStore()
+        store.write_documents(docs)
+        self._assert_same_bm25_statistics(document_store, store)
+
+    def test_bm25_retrieval_with_custom_tokenizer(self, tmp_dir: str):
+        tokenizer = BM25Tokenizer(stop_words=["the", "of"])
+        docs = [
+            Document(content="The Lord of the Rings"),
+            Document(content="The history of the Rings and of their Lord"),
+            Document(content="The end of the story of the world"),
+        ]
+        store = InMemoryDocumentStore(
+            index="test_bm25_retrieval_with_custom_tokenizer", bm25_tokenizer=tokenizer, bm25_tokenization_workers=2
+        )
+        with patch.object(document_store_module, "PARALLEL_TOKENIZATION_MIN_DOCUMENTS", 2):
+            store.write_documents(docs)
+        assert "the" not in store._bm25_postings
+        assert [doc.content for doc in store.bm25_retrieval("the lord", top_k=2)] == [
+            "The Lord of the Rings",
+            "The history of the Rings and of their Lord",
+        ]
+        # stop words alone match no Document
+        assert all(doc.score == 0.0 for doc in store.bm25_retrieval("the of"))
+
+        data = store.to_dict()
+        assert data["init_parameters"]["bm25_tokenizer"] == tokenizer.to_dict()
+        loaded_store = InMemoryDocumentStore.from_dict(data)
+        assert loaded_store.bm25_tokenizer.to_dict() == tokenizer.to_dict()
+
+        # the BM25 statistics of a snapshot are reused when it's loaded with the same tokenizer
+        store.save_to_disk(tmp_dir + "/snapshot", file_format="binary")
+        expected = store.bm25_retrieval("the lord")
+        store.shutdown()
+        self._forget_index("test_bm25_retrieval_with_custom_tokenizer")
+        with patch.object(InMemoryDocumentStore, "_count_bm25_tokens") as count_bm25_tokens:
+            loaded_store = InMemoryDocumentStore.load_from_disk(tmp_dir + "/snapshot")
+        count_bm25_tokens.assert_not_called()
+        assert loaded_store.bm25_retrieval("the lord") == expected
+
+    def test_bm25_retrieval_reuses_query_tokens(self, document_store: InMemoryDocumentStore):
+        document_store.write_documents([Document(content="Hello world"), Document(content="Hello again")])
+        with patch.object(BM25Tokenizer, "tokenize", side_effect=BM25Tokenizer.tokenize, autospec=True) as tokenize:
+            first = document_store.bm25_retrieval("hello world")
+            second = document_store.bm25_retrieval("hello world")
+        assert first == second
+        assert tokenize.call_count == 1
+
+    def test_invalid_bm25_tokenization_workers(self):
+        with pytest.raises(ValueError, match="bm25_tokenization_workers must be a positive integer"):
+            InMemoryDocumentStore(bm25_tokenization_workers=0)
+
+    @pytest.mark.parametrize("bm25_algorithm", ["BM25Okapi", "BM25L", "BM25Plus"])
+    def test_bm25_idf_cache_is_invalidated_when_the_corpus_changes(self, bm25_algorithm):
+        index = f"test_bm25_idf_cache_{bm25_algorithm}"
+        document_store = InMemoryDocumentStore(index=index, bm25_algorithm=bm25_algorithm)
+        other_store = InMemoryDocumentStore(index=index, bm25_algorithm=bm25_algorithm)
+        document_store.write_documents(
+            [
+                Document(id="1", content="Hello world"),
+                Document(id="2", content="Haystack supports multiple languages"),
+                Document(id="3", content="Languages of the world"),
+            ]
+        )
+
+        def assert_idf_is_up_to_date():
+            # a new instance doesn't have any cached IDF yet
+            fresh_store = InMemoryDocumentStore(index=index, bm25_algorithm=bm25_algorithm)
+            for query in ["world languages", "hello haystack", "missing"]:
+                assert document_store.bm25_retrieval(query, scale_score=True) == fresh_store.bm25_retrieval(
+                    query, scale_score=True
+                )
+            assert document_store._idf_cache[0] == document_store._corpus_version
+            assert document_store._idf_cache[1] == fresh_store._idf_cache[1]
+
+        assert_idf_is_up_to_date()
+        assert set(document_store._idf_cache[1]) == {"world", "languages", "hello", "haystack"}
+        # the other instance changes the corpus of the shared index
+        other_store.write_documents([Document(id="4", content="Another world")])
+        assert_idf_is_up_to_date()
+        other_store.delete_documents(["1"])
+        assert_idf_is_up_to_date()
+
+    @pytest.mark.parametrize("bm25_algorithm", ["BM25Okapi", "BM25L", "BM25Plus"])
+    def test_bm25_retrieval_after_deleting_all_documents(self, bm25_algorithm):
+        document_store = InMemoryDocumentStore(bm25_algorithm=bm25_algorithm)
+        docs = [Document(content="alpha beta"), Document(content="alpha gamma")]
+        document_store.write_documents(docs)
+        document_store.delete_documents([doc.id for doc in docs])
+        # the deleted tokens are not part of the vocabulary anymore
+        assert document_store._freq_vocab_for_idf == Counter()
+
+        document_store.write_documents([Document(meta={"no": "content"})])
+        assert document_store.bm25_retrieval("alpha") == []
+        assert document_store.bm25_retrieval("alpha", scale_score=True) == []
+
+    def test_bm25okapi_idf_floor_is_computed_once_per_corpus_version(self):
+        document_store = InMemoryDocumentStore(bm25_algorithm="BM25Okapi")
+        # "world" is in most documents, its IDF is negative and replaced by the floor
+        document_store.write_documents(
+            [Document(content="Hello world"), Document(content="Other world"), Document(content="Hello")]
+        )
+
+        results = document_store.bm25_retrieval("world")
+        floor_cache = document_store._okapi_idf_floor_cache
+        # epsilon times the average IDF of "hello", "world" and "other"
+        expected_floor = 0.25 * (2 * math.log(1.5 / 2.5) + math.log(2.5 / 1.5)) / 3
+        assert floor_cache == (document_store._corpus_version, pytest.approx(expected_floor))
+        assert document_store._idf_cache[1] == {"world": pytest.approx(expected_floor)}
+        scores = {doc.content: doc.score for doc in results}
+        assert scores["Hello world"] == pytest.approx(expected_floor * 2.5 / (1 + 1.5 * (0.25 + 0.75 * 2 / (5 / 3))))
+
+        document_store.bm25_retrieval("hello world")
+        assert document_store._okapi_idf_floor_cache is floor_cache
+
     def test_bm25_retrieval(self, document_store: InMemoryDocumentStore):
         # Tests if the bm25_retrieval method returns the correct document based on the input query.
         docs = [Document(content="Hello world"), Document(content="Haystack supports multiple languages")]
@@ -247,6 +885,51 @@ class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
         assert len(results2) == 3
         assert all(0.0 <= res.score <= 1.0 for res in results2)
 
+    def test_bm25_postings_are_updated_on_write_and_delete(self, document_store: InMemoryDocumentStore):
+        docs = [Document(id="1", content="Python is popular"), Document(id="2", content="Java is popular popular")]
+        document_store.write_documents(docs)
+        assert document_store._bm25_postings["popular"] == {"1": 1, "2": 2}
+        assert document_store._bm25_postings["python"] == {"1": 1}
+
+        document_store.write_documents([Document(id="1", content="Ruby")], policy=DuplicatePolicy.OVERWRITE)
+        assert document_store._bm25_postings["popular"] == {"2": 2}
+        assert "python" not in document_store._bm25_postings
+        assert document_store._bm25_postings["ruby"] == {"1": 1}
+
+        document_store.delete_documents(["2"])
+        assert document_store._bm25_postings == {"ruby": {"1": 1}}
+
+    def test_bm25_retrieval_only_scores_documents_containing_query_tokens(self):
+        document_store = InMemoryDocumentStore(bm25_algorithm="BM25Okapi")
+        docs = [
+            Document(content="Java is a popular programming language"),
+            Document(content="Python is a popular programming language"),
+            Document(content="Gardening"),
+        ]
+        document_store.write_documents(docs)
+
+        with patch.object(
+            document_store, "bm25_algorithm_inst", wraps=document_store.bm25_algorithm_inst
+        ) as mock_scoring:
+            results = document_store.bm25_retrieval(query="Python", top_k=3)
+
+        scored_documents = mock_scoring.call_args.args[1]
+        assert [doc.content for doc in scored_documents] == ["Python is a popular programming language"]
+        assert results[0].content == "Python is a popular programming language"
+
+    def test_bm25_retrieval_returns_non_matching_documents_with_same_scores(self, document_store):
+        docs = [
+            Document(content="Hello world"),
+            Document(content="Haystack supports multiple languages"),
+            Document(content="Python is a popular programming language"),
+        ]
+        document_store.write_documents(docs)
+
+        results = document_store.bm25_retrieval(query="languages", top_k=3)
+        assert results[0].content == "Haystack supports multiple languages"
+        assert results[1].score == results[2].score
+        assert results[0].score > results[1].score
+
     def test_bm25_retrieval_default_filter(self, document_store: InMemoryDocumentStore):
         docs = [Document(), Document(content="Gardening"), Document(content="Bird watching")]
         document_store.write_documents(docs)
@@ -335,6 +1018,80 @@ class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
         docstore.embedding_retrieval(query_embedding=[0.1, 0.1, 0.1, 0.1])
         assert "Skipping some Documents that don't have an embedding." in caplog.text
 
+    @pytest.mark.parametrize("join_mode", ["reciprocal_rank_fusion", "merge", "distribution_based_rank_fusion"])
+    @pytest.mark.parametrize("weights", [None, [0.3, 0.7]])
+    @pytest.mark.parametrize("filters", [None, {"field": "meta.number", "operator": ">=", "value": 10}])
+    def test_hybrid_retrieval_like_joined_retrievals(self, join_mode, weights, filters):
+        rng = np.random.default_rng(42)
+        words = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta"]
+        docs = [
+            Document(
+                content=" ".join(rng.choice(words, size=int(rng.integers(1, 6)))),
+                embedding=rng.random(4).tolist(),
+                meta={"number": i},
+            )
+            for i in range(40)
+        ]
+        docstore = InMemoryDocumentStore()
+        docstore.write_documents(docs)
+
+        results = docstore.hybrid_retrieval(
+            query="alpha beta",
+            query_embedding=[0.1, 0.2, 0.3, 0.4],
+            filters=filters,
+            top_k=5,
+            join_mode=join_mode,
+            weights=weights,
+        )
+
+        joiner = DocumentJoiner(join_mode=join_mode, weights=weights, top_k=5, sort_by_score=True)
+        expected = joiner.run(
+            [
+                docstore.bm25_retrieval(query="alpha beta", filters=filters, top_k=5),
+                docstore.embedding_retrieval(query_embedding=[0.1, 0.2, 0.3, 0.4], filters=filters, top_k=5),
+            ]
+        )["documents"]
+        assert [doc.id for doc in results] == [doc.id for doc in expected]
+        assert [doc.score for doc in results] == pytest.approx([doc.score for doc in expected])
+        assert all(doc.embedding is None for doc in results)
+        if filters:
+            assert all(doc.meta["number"] >= 10 for doc in results)
+
+    def test_hybrid_retrieval_documents_wo_embeddings(self):
+        docstore = InMemoryDocumentStore()
+        docs = [Document(content="Hello world"), Document(content="Haystack supports multiple languages")]
+        docstore.write_documents(docs)
+        results = docstore.hybrid_retrieval(query="Haystack", query_embedding=[0.1, 0.1, 0.1, 0.1], top_k=1)
+        assert len(results) == 1
+        assert results[0].content == "Haystack supports multiple languages"
+
+    def test_hybrid_retrieval_invalid_arguments(self):
+        docstore = InMemoryDocumentStore()
+        with pytest.raises(ValueError, match="Query should be a non-empty string"):
+            docstore.hybrid_retrieval(query="", query_embedding=[0.1, 0.1])
+        with pytest.raises(ValueError, match="query_embedding should be a non-empty list of floats"):
+            docstore.hybrid_retrieval(query="Haystack", query_embedding=[])
+        with pytest.raises(ValueError, match="Unknown join mode"):
+            docstore.hybrid_retrieval(query="Haystack", query_embedding=[0.1, 0.1], join_mode="concatenate")  # type: ignore
+        with pytest.raises(ValueError, match="weights should contain two values"):
+            docstore.hybrid_retrieval(query="Haystack", query_embedding=[0.1, 0.1], weights=[1.0])
+        with pytest.raises(ValueError, match="Invalid filter syntax"):
+            docstore.hybrid_retrieval(query="Haystack", query_embedding=[0.1, 0.1], filters={"field": "meta.number"})
+
+    @pytest.mark.asyncio
+    async def test_hybrid_retrieval_async(self):
+        docstore = InMemoryDocumentStore()
+        docs = [
+            Document(content="Hello world", embedding=[0.1, 0.2, 0.3, 0.4]),
+            Document(content="Haystack supports multiple languages", embedding=[1.0, 1.0, 1.0, 1.0]),
+        ]
+        await docstore.write_documents_async(docs)
+        results = await docstore.hybrid_retrieval_async(
+            query="Haystack", query_embedding=[1.0, 1.0, 1.0, 1.0], top_k=2, return_embedding=True
+        )
+        assert [doc.content for doc in results] == ["Haystack supports multiple languages", "Hello world"]
+        assert results[0].embedding == [1.0, 1.0, 1.0, 1.0]
+
     def test_embedding_retrieval_documents_different_embedding_sizes(self):
         docstore = InMemoryDocumentStore()
         docs = [
@@ -404,6 +1161,407 @@ class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
         results = docstore.embedding_retrieval(query_embedding=[0.1, 0.1, 0.1, 0.1], top_k=1, return_embedding=True)
         assert results[0].embedding == [1.0, 1.0, 1.0, 1.0]
 
+    @pytest.mark.parametrize("embedding_index_type", ["flat", "ivf"])
+    def test_embedding_retrieval_batch(self, embedding_index_type):
+        docstore = InMemoryDocumentStore(
+            embedding_similarity_function="cosine", embedding_index_type=embedding_index_type
+        )
+        rng = np.random.default_rng(42)
+        docs = [
+            Document(content=f"Document {i}", meta={"even": i % 2 == 0}, embedding=rng.random(8).tolist())
+            for i in range(300)
+        ]
+        docstore.write_documents(docs)
+        # queries are scored by batches, there must be more than one batch
+        queries = rng.random((document_store_module.QUERY_BATCH_SIZE + 10, 8)).tolist()
+
+        for filters in (None, {"field": "meta.even", "operator": "==", "value": True}):
+            results = docstore.embedding_retrieval_batch(query_embeddings=queries, filters=filters, top_k=5)
+            assert len(results) == len(queries)
+            for query, query_results in zip(queries, results):
+                expected = docstore.embedding_retrieval(query_embedding=query, filters=filters, top_k=5)
+                assert [doc.id for doc in query_results] == [doc.id for doc in expected]
+                assert [doc.score for doc in query_results] == pytest.approx([doc.score for doc in expected])
+
+    @pytest.mark.parametrize("prefilter_max_selectivity", [0.0, 1.0])
+    @pytest.mark.parametrize("similarity", ["dot_product", "cosine"])
+    def test_filtered_embedding_retrieval_with_pre_and_post_filtering(self, similarity, prefilter_max_selectivity):
+        store = InMemoryDocumentStore(embedding_similarity_function=similarity, metadata_indexes={"meta.n": "sorted"})
+        rng = np.random.default_rng(42)
+        docs = [Document(content=f"Document {i}", meta={"n": i}, embedding=rng.random(8).tolist()) for i in range(200)]
+        docs.append(Document(content="No embedding", meta={"n": 0}))
+        store.write_documents(docs)
+        store.delete_documents([doc.id for doc in docs[:10]])
+        queries = rng.random((3, 8)).tolist()
+
+        for filters in (
+            {"field": "meta.n", "operator": "<", "value": 30},
+            {"field": "meta.n", "operator": ">=", "value": 20},
+        ):
+            expected_store = InMemoryDocumentStore(embedding_similarity_function=similarity)
+            expected_store.write_documents(store.filter_documents(filters=filters))
+            with patch.object(document_store_module, "PREFILTER_MAX_SELECTIVITY", prefilter_max_selectivity):
+                batch_results = store.embedding_retrieval_batch(query_embeddings=queries, filters=filters, top_k=5)
+                for query, query_results in zip(queries, batch_results):
+                    results = store.embedding_retrieval(query_embedding=query, filters=filters, top_k=5)
+                    expected = expected_store.embedding_retrieval(query_embedding=query, top_k=5)
+                    assert [doc.id for doc in results] == [doc.id for doc in expected]
+                    assert [doc.id for doc in query_results] == [doc.id for doc in expected]
+                    assert [doc.score for doc in results] == pytest.approx([doc.score for doc in expected])
+
+            # fewer matching Documents than top_k
+            with patch.object(document_store_module, "PREFILTER_MAX_SELECTIVITY", prefilter_max_selectivity):
+                results = store.embedding_retrieval(
+                    query_embedding=queries[0], filters={"field": "meta.n", "operator": "==", "value": 50}, top_k=5
+                )
+            assert [doc.meta["n"] for doc in results] == [50]
+
+    def test_filtered_embedding_retrieval_with_ivf_index_searches_more_clusters(self):
+        rng = np.random.default_rng(42)
+        docs = [
+            Document(content=f"Document {i}", meta={"even": i % 2 == 0}, embedding=rng.normal(size=4).tolist())
+            for i in range(400)
+        ]
+        filters = {"field": "meta.even", "operator": "==", "value": True}
+        ivf_store = InMemoryDocumentStore(
+            embedding_index_type="ivf", embedding_index_parameters={"n_lists": 4, "nprobe": 2, "min_training_size": 100}
+        )
+        ivf_store.write_documents(docs)
+        flat_store = InMemoryDocumentStore()
+        flat_store.write_documents(docs)
+
+        query = rng.normal(size=4).tolist()
+        results = ivf_store.embedding_retrieval(query_embedding=query, filters=filters, top_k=10)
+        assert ivf_store._embedding_matrix.ivf.is_trained
+        assert all(doc.meta["even"] for doc in results)
+        # half of the Documents match the filters, so twice as many clusters are searched: all of them
+        expected = flat_store.embedding_retrieval(query_embedding=query, filters=filters, top_k=10)
+        assert [doc.id for doc in results] == [doc.id for doc in expected]
+
+    def test_embedding_retrieval_batch_with_different_embedding_sizes(self):
+        docstore = InMemoryDocumentStore()
+        docs = [
+            Document(content="Hello world", embedding=[0.1, 0.2, 0.3, 0.4]),
+            Document(content="Hello world, again", embedding=[1.0, 1.0, 1.0]),
+        ]
+        docstore.write_documents(docs)
+        with pytest.raises(DocumentStoreError, match="The embedding size of all Documents should be the same."):
+            docstore.embedding_retrieval_batch(query_embeddings=[[0.1, 0.1, 0.1, 0.1], [0.1, 0.1, 0.1, 0.1]])
+
+    def test_embedding_retrieval_batch_invalid_query(self):
+        docstore = InMemoryDocumentStore()
+        with pytest.raises(ValueError, match="query_embedding should be a non-empty list of floats"):
+            docstore.embedding_retrieval_batch(query_embeddings=[[0.1, 0.1], []])
+
+    def test_embedding_retrieval_batch_no_embeddings(self, caplog):
+        docstore = InMemoryDocumentStore()
+        docstore.write_documents([Document(content="Hello world")])
+        with caplog.at_level(logging.WARNING):
+            results = docstore.embedding_retrieval_batch(query_embeddings=[[0.1, 0.1], [0.2, 0.2]])
+        assert results == [[], []]
+        assert caplog.text.count("No Documents found with embeddings.") == 1
+
+    def test_bm25_retrieval_batch(self, document_store: InMemoryDocumentStore):
+        docs = [
+            Document(content="Hello world", meta={"lang": "en"}),
+            Document(content="Haystack supports multiple languages", meta={"lang": "en"}),
+            Document(content="Hallo Welt", meta={"lang": "de"}),
+            Document(content="Hello Haystack", meta={"lang": "de"}),
+        ]
+        document_store.write_documents(docs)
+        queries = ["hello", "haystack", "welt"]
+
+        for filters in (None, {"field": "meta.lang", "operator": "==", "value": "de"}):
+            results = document_store.bm25_retrieval_batch(queries=queries, filters=filters, top_k=2)
+            expected = [document_store.bm25_retrieval(query=query, filters=filters, top_k=2) for query in queries]
+            assert results == expected
+
+    def test_bm25_retrieval_batch_empty_query(self, document_store: InMemoryDocumentStore):
+        with pytest.raises(ValueError, match="Query should be a non-empty string"):
+            document_store.bm25_retrieval_batch(queries=["hello", ""])
+
+    @pytest.mark.asyncio
+    async def test_retrieval_batch_async(self, document_store: InMemoryDocumentStore):
+        docs = [
+            Document(content="Hello world", embedding=[1.0, 0.0]),
+            Document(content="Hello Haystack", embedding=[0.0, 1.0]),
+        ]
+        await document_store.write_documents_async(docs)
+
+        results = await document_store.bm25_retrieval_batch_async(queries=["world", "haystack"], top_k=1)
+        assert [[doc.content for doc in docs] for docs in results] == [["Hello world"], ["Hello Haystack"]]
+
+        results = await document_store.embedding_retrieval_batch_async(
+            query_embeddings=[[0.0, 1.0], [1.0, 0.0]], top_k=1
+        )
+        assert [[doc.content for doc in docs] for docs in results] == [["Hello Haystack"], ["Hello world"]]
+
+    @pytest.mark.parametrize("quantization", ["float16", "int8", "binary"])
+    @pytest.mark.parametrize("similarity", ["dot_product", "cosine"])
+    def test_embedding_retrieval_with_quantization(self, quantization, similarity):
+        rng = np.random.default_rng(42)
+        docs = [Document(content=f"Document {i}", embedding=rng.normal(size=16).tolist()) for i in range(200)]
+        exact_store = InMemoryDocumentStore(embedding_similarity_function=similarity)
+        exact_store.write_documents(docs)
+        store = InMemoryDocumentStore(
+            embedding_similarity_function=similarity,
+            embedding_quantization=quantization,
+            embedding_quantization_parameters={"rescore_factor": 200, "min_training_size": 100},
+        )
+        store.write_documents(docs)
+        assert store._embedding_matrix.is_quantized
+
+        for query in rng.normal(size=(5, 16)).tolist():
+            # all the Documents are rescored, so the results are exact
+            expected = exact_store.embedding_retrieval(query_embedding=query, top_k=5, return_embedding=True)
+            results = store.embedding_retrieval(query_embedding=query, top_k=5, return_embedding=True)
+            assert [doc.id for doc in results] == [doc.id for doc in expected]
+            assert [doc.score for doc in results] == pytest.approx([doc.score for doc in expected], rel=1e-5)
+            # the original embeddings are returned, with float32 precision
+            for doc, expected_doc in zip(results, expected):
+                assert doc.embedding == pytest.approx(expected_doc.embedding, rel=1e-6)
+
+    def test_embedding_retrieval_with_quantization_without_rescoring(self):
+        store = InMemoryDocumentStore(
+            embedding_quantization="float16", embedding_quantization_parameters={"rescore_factor": None}
+        )
+        store.write_documents(
+            [Document(content="a", embedding=[0.1, 0.2, 0.3]), Document(content="b", embedding=[1.0, 1.0, 1.0])]
+        )
+
+        results = store.embedding_retrieval(query_embedding=[1.0, 1.0, 1.0], top_k=2, return_embedding=True)
+        assert [doc.content for doc in results] == ["b", "a"]
+        assert [doc.score for doc in results] == pytest.approx([3.0, 0.6], rel=1e-3)
+        assert results[0].embedding == [1.0, 1.0, 1.0]
+
+    def test_save_to_disk_and_load_from_disk_with_quantization(self, tmp_dir: str):
+        rng = np.random.default_rng(42)
+        docs = [Document(content=f"Document {i}", embedding=rng.normal(size=8).tolist()) for i in range(20)]
+        store = InMemoryDocumentStore(
+            embedding_quantization="int8", embedding_quantization_parameters={"min_training_size": 10}
+        )
+        store.write_documents(docs)
+        query = rng.normal(size=8).tolist()
+        expected = store.embedding_retrieval(query_embedding=query, top_k=3)
+
+        for file_format in ("json", "binary"):
+            path = f"{tmp_dir}/store_{file_format}"
+            store.save_to_disk(path, file_format=file_format)
+            if file_format == "json":
+                with open(path) as f:
+                    data = json.load(f)
+                data["init_parameters"]["index"] = "test_save_to_disk_and_load_from_disk_with_quantization"
+                with open(path, "w") as f:
+                    json.dump(data, f)
+            else:
+                self._rename_snapshot_index(path, "test_save_to_disk_and_load_from_disk_with_quantization_binary")
+
+            loaded_store = InMemoryDocumentStore.load_from_disk(path)
+            loaded_quantizer = loaded_store._embedding_matrix.quantizer
+            assert loaded_store._embedding_matrix.is_quantized
+            np.testing.assert_array_equal(loaded_quantizer.offset, store._embedding_matrix.quantizer.offset)
+            # the embeddings of the Documents are saved instead of the lossy quantized ones
+            for loaded_doc, doc in zip(loaded_store.filter_documents(), docs):
+                assert loaded_doc.embedding == pytest.approx(doc.embedding, rel=1e-6)
+            results = loaded_store.embedding_retrieval(query_embedding=query, top_k=3)
+            assert [doc.id for doc in results] == [doc.id for doc in expected]
+            assert [doc.score for doc in results] == pytest.approx([doc.score for doc in expected], rel=1e-5)
+
+    @pytest.mark.parametrize("quantization", ["float16", "binary"])
+    def test_quantized_store_after_filter_documents_without_embeddings(self, quantization, tmp_dir: str):
+        rng = np.random.default_rng(42)
+        docs = [Document(content=f"Document {i}", embedding=rng.normal(size=8).tolist()) for i in range(20)]
+        exact_store = InMemoryDocumentStore()
+        exact_store.write_documents(docs)
+        store = InMemoryDocumentStore(
+            return_embedding=False,
+            embedding_quantization=quantization,
+            embedding_quantization_parameters={"rescore_factor": 20},
+        )
+        store.write_documents(docs)
+        # the embedding matrix is the only copy of the embeddings, and the written Documents are left untouched
+        assert all(doc.embedding is None for doc in store.storage.values())
+        assert all(doc.embedding is not None for doc in docs)
+
+        assert all(doc.embedding is None for doc in store.filter_documents())
+        query = rng.normal(size=8).tolist()
+        expected = exact_store.embedding_retrieval(query_embedding=query, top_k=3)
+        results = store.embedding_retrieval(query_embedding=query, top_k=3)
+        assert [doc.id for doc in results] == [doc.id for doc in expected]
+        assert [doc.score for doc in results] == pytest.approx([doc.score for doc in expected], rel=1e-5)
+
+        path = tmp_dir + "/snapshot"
+        store.save_to_disk(path, file_format="binary")
+        np.testing.assert_allclose(np.load(path + "/embeddings.npy"), [doc.embedding for doc in docs], rtol=1e-6)
+        store.return_embedding = True
+        for doc, original in zip(store.filter_documents(), docs):
+            assert doc.embedding == pytest.approx(original.embedding, rel=1e-6)
+
+    def test_concurrent_writes_and_retrievals(self, document_store: InMemoryDocumentStore):
+        batches = [
+            [Document(content=" ".join(["word"] * (batch + 1)), embedding=[1.0, float(i)]) for i in range(50)]
+            for batch in range(10)
+        ]
+        errors = []
+
+        def write():
+            for docs in batches:
+                document_store.write_documents(docs)
+
+        def read():
+            try:
+                while writer.is_alive():
+                    with document_store._lock.read():
+                        n_docs = document_store.count_documents()
+                        # Documents are written by batches of 50, with statistics matching the written Documents
+                        assert n_docs % 50 == 0
+                        assert len(document_store._bm25_attr) == n_docs
+                        assert len(document_store._bm25_postings.get("word", {})) == n_docs
+                        assert document_store._freq_vocab_for_idf["word"] == n_docs
+                        assert len(document_store._embedding_matrix) == n_docs
+                    document_store.bm25_retrieval(query="word", top_k=5)
+                    document_store.embedding_retrieval(query_embedding=[1.0, 1.0], top_k=5)
+            except AssertionError as e:
+                errors.append(e)
+
+        writer = threading.Thread(target=write)
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        writer.start()
+        for reader in readers:
+            reader.start()
+        writer.join()
+        for reader in readers:
+            reader.join()
+
+        assert errors == []
+        assert document_store.count_documents() == 500
+
+    def test_retrieval_results_are_copies_of_stored_documents(self, document_store: InMemoryDocumentStore):
+        doc = Document(id="1", content="Hello world", meta={"score": "meta", "tags": ["a"]}, embedding=[1.0, 0.0])
+        document_store.write_documents([doc])
+
+        with patch.object(Document, "to_dict", side_effect=AssertionError("Documents should not be serialized")):
+            bm25_results = document_store.bm25_retrieval(query="hello", top_k=1)
+            embedding_results = document_store.embedding_retrieval(
+                query_embedding=[1.0, 0.0], top_k=1, return_embedding=True
+            )
+
+        for result in (bm25_results[0], embedding_results[0]):
+            assert result is not doc
+            assert result.id == "1"
+            assert result.meta == {"score": "meta", "tags": ["a"]}
+            assert doc.score is None
+            result.meta["new_key"] = "value"
+            assert "new_key" not in doc.meta
+        assert embedding_results[0].embedding == [1.0, 0.0]
+        assert document_store.filter_documents()[0].meta == {"score": "meta", "tags": ["a"]}
+
+    def test_embedding_matrix_is_updated_on_write_and_delete(self, document_store: InMemoryDocumentStore):
+        docs = [
+            Document(id="1", embedding=[1.0, 0.0]),
+            Document(id="2", embedding=[0.0, 1.0]),
+            Document(id="3", content="no embedding"),
+        ]
+        document_store.write_documents(docs)
+        assert len(document_store._embedding_matrix) == 2
+
+        document_store.write_documents([Document(id="1", embedding=[0.5, 0.5])], policy=DuplicatePolicy.OVERWRITE)
+        document_store.delete_documents(["2"])
+        assert len(document_store._embedding_matrix) == 1
+
+        results = document_store.embedding_retrieval(query_embedding=[1.0, 1.0], top_k=5)
+        assert [doc.id for doc in results] == ["1"]
+        assert results[0].score == pytest.approx(1.0)
+
+    def test_embedding_retrieval_keeps_write_order_for_equal_scores(self, document_store: InMemoryDocumentStore):
+        docs = [Document(content=str(i), embedding=[1.0, 1.0]) for i in range(5)]
+        document_store.write_documents(docs)
+        results = document_store.embedding_retrieval(query_embedding=[1.0, 1.0], top_k=5)
+        assert [doc.content for doc in results] == ["0", "1", "2", "3", "4"]
+
+    def test_invalid_embedding_index_type(self):
+        with pytest.raises(ValueError, match="Embedding index type 'hnsw' is not supported"):
+            InMemoryDocumentStore(embedding_index_type="hnsw")
+
+    @pytest.mark.parametrize("similarity", ["dot_product", "cosine"])
+    def test_embedding_retrieval_with_ivf_index(self, similarity):
+        rng = np.random.default_rng(0)
+        docs = [Document(content=str(i), embedding=rng.normal(size=8).tolist()) for i in range(200)]
+        flat_store = InMemoryDocumentStore(embedding_similarity_function=similarity)
+        ivf_store = InMemoryDocumentStore(
+            embedding_similarity_function=similarity,
+            embedding_index_type="ivf",
+            embedding_index_parameters={"n_lists": 4, "nprobe": 4, "min_training_size": 100},
+        )
+        flat_store.write_documents(docs)
+        ivf_store.write_documents(docs)
+
+        query = rng.normal(size=8).tolist()
+        ivf_results = ivf_store.embedding_retrieval(query_embedding=query, top_k=5)
+        assert ivf_store._embedding_matrix.ivf.is_trained
+        # probing all the clusters is equivalent to an exact search
+        assert [doc.id for doc in ivf_results] == [
+            doc.id for doc in flat_store.embedding_retrieval(query_embedding=query, top_k=5)
+        ]
+
+        # new documents are assigned to a cluster on write
+        ivf_store.write_documents([Document(content="new", embedding=query)])
+        assert ivf_store.embedding_retrieval(query_embedding=query, top_k=1)[0].content == "new"
+
+    def test_ivf_index_is_trained_on_write(self):
+        rng = np.random.default_rng(0)
+        store = InMemoryDocumentStore(
+            embedding_index_type="ivf", embedding_index_parameters={"n_lists": 4, "min_training_size": 100}
+        )
+        store.write_documents([Document(content=str(i), embedding=rng.normal(size=8).tolist()) for i in range(99)])
+        ivf = store._embedding_matrix.ivf
+        assert not ivf.is_trained
+
+        store.write_documents([Document(content="99", embedding=rng.normal(size=8).tolist())])
+        assert ivf.is_trained
+        centroids = ivf.centroids
+        # queries only read the index, concurrent queries can't retrain it
+        with patch.object(ivf, "train", side_effect=AssertionError("trained by a query")):
+            store.embedding_retrieval(query_embedding=rng.normal(size=8).tolist(), top_k=5)
+        assert ivf.centroids is centroids
+
+    def test_embedding_retrieval_with_ivf_index_probes_closest_clusters(self):
+        docs = [Document(content=f"a{i}", embedding=[1.0, 0.01 * i]) for i in range(10)]
+        docs += [Document(content=f"b{i}", embedding=[-1.0, 0.01 * i]) for i in range(10)]
+        store = InMemoryDocumentStore(
+            embedding_similarity_function="cosine",
+            embedding_index_type="ivf",
+            embedding_index_parameters={"n_lists": 2, "nprobe": 1, "min_training_size": 10},
+        )
+        store.write_documents(docs)
+
+        results = store.embedding_retrieval(query_embedding=[1.0, 0.0], top_k=20)
+        assert len(results) == 10
+        assert all(doc.content.startswith("a") for doc in results)
+
+    def test_save_to_disk_and_load_from_disk_with_ivf_index(self, tmp_dir: str):
+        rng = np.random.default_rng(0)
+        docs = [Document(content=str(i), embedding=rng.normal(size=4).tolist()) for i in range(20)]
+        store = InMemoryDocumentStore(
+            embedding_index_type="ivf", embedding_index_parameters={"n_lists": 2, "min_training_size": 10}
+        )
+        store.write_documents(docs)
+        store.embedding_retrieval(query_embedding=[0.1, 0.2, 0.3, 0.4])
+        path = tmp_dir + "/document_store.json"
+        store.save_to_disk(path)
+        # a new index name makes sure the loaded store doesn't share the IVF index with the original one
+        with open(path) as f:
+            data = json.load(f)
+        data["init_parameters"]["index"] = "loaded_ivf_index"
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+        loaded_store = InMemoryDocumentStore.load_from_disk(path)
+        loaded_ivf = loaded_store._embedding_matrix.ivf
+        assert loaded_store.embedding_index_type == "ivf"
+        assert loaded_ivf.is_trained
+        np.testing.assert_array_equal(loaded_ivf.centroids, store._embedding_matrix.ivf.centroids)
+
     def test_compute_cosine_similarity_scores(self):
         docstore = InMemoryDocumentStore(embedding_similarity_function="cosine")
         docs = [
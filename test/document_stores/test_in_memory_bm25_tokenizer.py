@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pickle
+
+import pytest
+
+from haystack.document_stores.in_memory import BM25Tokenizer
+from haystack.document_stores.in_memory.bm25_tokenizer import deserialize_bm25_tokenizer_in_init_params
+
+
+class SuffixStrippingTokenizer(BM25Tokenizer):
+    def tokenize(self, text):
+        return [token.rstrip("s") for token in super().tokenize(text)]
+
+
+class TestBM25Tokenizer:
+    def test_tokenize(self):
+        tokenizer = BM25Tokenizer()
+        assert tokenizer.tokenize("Haystack supports Multiple languages, a lot!") == [
+            "haystack",
+            "supports",
+            "multiple",
+            "languages",
+            "lot",
+        ]
+        assert tokenizer.tokenize_batch(["Hello world", "", "Hello again"]) == [
+            ["hello", "world"],
+            [],
+            ["hello", "again"],
+        ]
+
+    def test_tokenize_with_options(self):
+        tokenizer = BM25Tokenizer(regex=r"\w+", lowercase=False, stop_words=["The", "of"])
+        assert tokenizer.tokenize("The Lord of the Rings") == ["Lord", "the", "Rings"]
+
+        tokenizer = BM25Tokenizer(stop_words=["The", "of"])
+        assert tokenizer.tokenize("The Lord of the Rings") == ["lord", "rings"]
+
+    def test_tokenize_query_is_cached(self):
+        tokenizer = BM25Tokenizer(query_cache_size=2)
+        tokens = tokenizer.tokenize_query("Hello world")
+        assert tokens == ["hello", "world"]
+        # the cached tokens can't be modified through the returned list
+        tokens.append("again")
+        assert tokenizer.tokenize_query("Hello world") == ["hello", "world"]
+        assert tokenizer._tokenize_query.cache_info().hits == 1
+
+        tokenizer.tokenize_query("Other query")
+        tokenizer.tokenize_query("Third query")
+        assert tokenizer._tokenize_query.cache_info().currsize == 2
+
+    def test_invalid_query_cache_size(self):
+        with pytest.raises(ValueError, match="query_cache_size must be a non-negative integer"):
+            BM25Tokenizer(query_cache_size=-1)
+
+    def test_stemming(self):
+        pytest.importorskip("nltk")
+        tokenizer = BM25Tokenizer(stemmer_language="english")
+        assert tokenizer.tokenize("running runs") == ["run", "run"]
+
+    def test_pickle(self):
+        tokenizer = BM25Tokenizer(stop_words=["the"])
+        tokenizer.tokenize_query("the query")
+        unpickled = pickle.loads(pickle.dumps(tokenizer))
+        assert unpickled.to_dict() == tokenizer.to_dict()
+        assert unpickled.tokenize("The Rings") == ["rings"]
+        assert unpickled._tokenize_query.cache_info().currsize == 0
+
+    def test_to_dict_and_from_dict(self):
+        tokenizer = BM25Tokenizer(stop_words=["the"], query_cache_size=10)
+        data = tokenizer.to_dict()
+        assert data == {
+            "type": "haystack.document_stores.in_memory.bm25_tokenizer.BM25Tokenizer",
+            "init_parameters": {
+                "regex": r"(?u)\b\w\w+\b",
+                "lowercase": True,
+                "stop_words": ["the"],
+                "stemmer_language": None,
+                "query_cache_size": 10,
+            },
+        }
+        assert BM25Tokenizer.from_dict(data).to_dict() == data
+
+    def test_deserialize_bm25_tokenizer_in_init_params(self):
+        init_params = {"bm25_tokenizer": SuffixStrippingTokenizer().to_dict(), "bm25_algorithm": "BM25L"}
+        deserialized = deserialize_bm25_tokenizer_in_init_params(init_params)
+        assert isinstance(deserialized["bm25_tokenizer"], SuffixStrippingTokenizer)
+        assert deserialized["bm25_tokenizer"].tokenize("Rings") == ["ring"]
+        assert deserialized["bm25_algorithm"] == "BM25L"
+        # the init parameters are not modified
+        assert isinstance(init_params["bm25_tokenizer"], dict)
+        assert deserialize_bm25_tokenizer_in_init_params({"bm25_tokenizer": None}) == {"bm25_tokenizer": None}
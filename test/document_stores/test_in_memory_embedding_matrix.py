@@ -0,0 +1,193 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+
+from haystack.document_stores.errors import DocumentStoreError
+from haystack.document_stores.in_memory.embedding_matrix import EmbeddingMatrix
+from haystack.document_stores.in_memory.quantization import EmbeddingQuantizer
+
+
+class TestEmbeddingMatrix:
+    def test_add_and_remove(self):
+        matrix = EmbeddingMatrix(initial_capacity=2)
+        matrix.add("a", [1.0, 0.0])
+        matrix.add("b", [0.0, 2.0])
+        matrix.add("c", [1.0, 1.0])
+        assert len(matrix) == 3
+        assert matrix.dim == 2
+        assert "b" in matrix
+
+        matrix.remove("b")
+        assert len(matrix) == 2
+        assert "b" not in matrix
+        assert matrix.ids(matrix.rows(["a", "b", "c"])) == ["a", "c"]
+
+    def test_mask(self):
+        matrix = EmbeddingMatrix()
+        for doc_id in "abcd":
+            matrix.add(doc_id, [1.0, 0.0])
+        matrix.remove("b")
+
+        mask = matrix.mask(["c", "a", "b", "missing"])
+        assert mask.tolist() == [True, False, True, False]
+
+    def test_removing_all_rows_resets_the_dimension(self):
+        matrix = EmbeddingMatrix()
+        matrix.add("a", [1.0, 0.0])
+        matrix.remove("a")
+        assert matrix.dim is None
+        assert matrix.size == 0
+
+        matrix.add("a", [1.0, 0.0, 0.0])
+        assert matrix.dim == 3
+
+    def test_compaction_keeps_row_order(self):
+        matrix = EmbeddingMatrix(initial_capacity=2)
+        for i in range(10):
+            matrix.add(str(i), [float(i), 1.0])
+        for i in range(0, 10, 3):
+            matrix.remove(str(i))
+        for i in range(1, 10, 3):
+            matrix.remove(str(i))
+
+        assert len(matrix) == 3
+        assert matrix.size < 10
+        assert matrix.ids(matrix.rows(["2", "5", "8"])) == ["2", "5", "8"]
+        assert list(matrix.rows(["2", "5", "8"])) == sorted(matrix.rows(["2", "5", "8"]))
+
+        scores = matrix.similarity_scores([1.0, 0.0], "dot_product")
+        assert scores[np.isfinite(scores)].tolist() == [2.0, 5.0, 8.0]
+
+    def test_load(self):
+        embeddings = np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 4.0]], dtype=np.float32)
+        matrix = EmbeddingMatrix()
+        matrix.load(["a", "b", "c"], embeddings)
+        assert len(matrix) == 3
+        assert matrix.dim == 2
+        np.testing.assert_array_equal(matrix.vectors(matrix.rows(["c", "a"])), embeddings[[2, 0]])
+        np.testing.assert_allclose(matrix.similarity_scores([1.0, 1.0], "cosine"), [0.7071068, 0.7071068, 0.9899495])
+
+        matrix.add("d", [1.0, 1.0])
+        matrix.remove("a")
+        assert matrix.ids(matrix.rows(["a", "b", "c", "d"])) == ["b", "c", "d"]
+
+    def test_load_into_non_empty_matrix(self):
+        matrix = EmbeddingMatrix()
+        matrix.add("a", [1.0, 0.0])
+        with pytest.raises(ValueError, match="empty EmbeddingMatrix"):
+            matrix.load(["b"], np.array([[0.0, 1.0]], dtype=np.float32))
+
+    def test_mismatched_embedding_sizes(self):
+        matrix = EmbeddingMatrix()
+        matrix.add("a", [1.0, 0.0])
+        matrix.add("b", [1.0, 0.0, 0.0])
+        assert "b" not in matrix
+        assert matrix.mismatched_ids == {"b"}
+
+        matrix.remove("b")
+        assert matrix.mismatched_ids == set()
+
+    def test_similarity_scores(self):
+        matrix = EmbeddingMatrix()
+        matrix.add("a", [1.0, 0.0, 0.0, 0.0])
+        matrix.add("b", [1.0, 1.0, 1.0, 1.0])
+        matrix.add("c", [2.0, 2.0, 2.0, 2.0])
+        matrix.remove("c")
+
+        scores = matrix.similarity_scores([0.1, 0.1, 0.1, 0.1], "dot_product")
+        assert scores[:2] == pytest.approx([0.1, 0.4])
+        assert scores[2] == -np.inf
+
+        scores = matrix.similarity_scores([0.1, 0.1, 0.1, 0.1], "cosine", rows=np.array([1, 0]))
+        assert scores == pytest.approx([1.0, 0.5])
+
+    def test_similarity_scores_query_with_different_size(self):
+        matrix = EmbeddingMatrix()
+        matrix.add("a", [1.0, 0.0])
+        with pytest.raises(DocumentStoreError, match="The embedding size of the query should be the same"):
+            matrix.similarity_scores([1.0, 0.0, 0.0], "dot_product")
+
+    def test_similarity_scores_batch(self):
+        matrix = EmbeddingMatrix()
+        matrix.add("a", [1.0, 0.0, 0.0, 0.0])
+        matrix.add("b", [1.0, 1.0, 1.0, 1.0])
+        matrix.add("c", [2.0, 2.0, 2.0, 2.0])
+        matrix.remove("c")
+        queries = [[0.1, 0.1, 0.1, 0.1], [0.0, 1.0, 0.0, 0.0]]
+
+        scores = matrix.similarity_scores_batch(queries, "dot_product")
+        assert scores.shape == (2, 3)
+        for query, query_scores in zip(queries, scores):
+            np.testing.assert_allclose(query_scores, matrix.similarity_scores(query, "dot_product"), rtol=1e-6)
+
+        scores = matrix.similarity_scores_batch(queries, "cosine", rows=np.array([1, 0]))
+        np.testing.assert_allclose(scores, [[1.0, 0.5], [0.5, 0.0]], rtol=1e-6)
+
+    def test_similarity_scores_batch_query_with_different_size(self):
+        matrix = EmbeddingMatrix()
+        matrix.add("a", [1.0, 0.0])
+        with pytest.raises(DocumentStoreError, match="The embedding size of the query should be the same"):
+            matrix.similarity_scores_batch([[1.0, 0.0], [1.0, 0.0, 0.0]], "dot_product")
+
+    def test_quantization(self):
+        matrix = EmbeddingMatrix()
+        matrix.add("a", [1.0, 0.0, 0.0, 0.0])
+        matrix.set_quantizer(EmbeddingQuantizer("float16"))
+        assert matrix.is_quantized
+        matrix.add("b", [1.0, 1.0, 1.0, 1.0])
+
+        assert matrix._data.dtype == np.float16
+        scores = matrix.similarity_scores([0.1, 0.1, 0.1, 0.1], "dot_product")
+        assert scores == pytest.approx([0.1, 0.4], rel=1e-3)
+        np.testing.assert_allclose(matrix.vectors(np.array([1])), [[1.0, 1.0, 1.0, 1.0]])
+
+        matrix.remove("a")
+        matrix.remove("b")
+        assert not matrix.is_quantized
+        assert matrix._data.dtype == np.float32
+
+    def test_int8_quantization_is_trained_once_enough_embeddings_are_added(self):
+        matrix = EmbeddingMatrix()
+        matrix.set_quantizer(EmbeddingQuantizer("int8", min_training_size=3))
+        matrix.add("a", [1.0, 0.0])
+        matrix.add("b", [0.0, 1.0])
+        assert not matrix.is_quantized
+        assert matrix._data.dtype == np.float32
+
+        matrix.add("c", [0.5, 0.5])
+        assert matrix.is_quantized
+        assert matrix._data.dtype == np.uint8
+        scores = matrix.similarity_scores([1.0, 1.0], "cosine")
+        assert scores == pytest.approx([np.sqrt(0.5), np.sqrt(0.5), 1.0], abs=1e-2)
+
+        matrix.remove("a")
+        matrix.remove("b")
+        matrix.remove("c")
+        assert not matrix.quantizer.is_trained
+
+    def test_exact_similarity_scores(self):
+        matrix = EmbeddingMatrix()
+        matrix.set_quantizer(EmbeddingQuantizer("binary"))
+        matrix.add("a", [1.0, 0.0, 0.0, 0.0])
+        matrix.add("b", [1.0, 1.0, 1.0, 1.0])
+
+        scores = matrix.exact_similarity_scores([0.1, 0.1, 0.1, 0.1], "cosine", np.array([1, 0]))
+        assert scores == pytest.approx([1.0, 0.5])
+
+    def test_original_embeddings_are_kept_with_quantization(self):
+        matrix = EmbeddingMatrix(initial_capacity=2)
+        matrix.set_quantizer(EmbeddingQuantizer("binary", original_dtype="float16"))
+        embeddings = {str(i): [float(i), -1.0, 0.5] for i in range(5)}
+        for doc_id, embedding in embeddings.items():
+            matrix.add(doc_id, embedding)
+        for doc_id in ["0", "1", "2"]:
+            matrix.remove(doc_id)
+
+        assert matrix._originals.dtype == np.float16
+        assert matrix.embedding("3") == [3.0, -1.0, 0.5]
+        np.testing.assert_array_equal(
+            matrix.original_vectors(matrix.rows(["4", "3"])), [embeddings["4"], embeddings["3"]]
+        )
@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+
+from haystack.document_stores.in_memory.ivf_index import IVFIndex
+
+
+class TestIVFIndex:
+    def test_init_invalid_parameters(self):
+        with pytest.raises(ValueError, match="n_lists and nprobe must be positive integers"):
+            IVFIndex(similarity="dot_product", n_lists=0)
+
+    def test_needs_training(self):
+        ivf = IVFIndex(similarity="dot_product", n_lists=2, min_training_size=10)
+        assert not ivf.needs_training(9)
+        assert ivf.needs_training(10)
+
+        ivf.train(np.random.default_rng(0).normal(size=(10, 3)))
+        assert ivf.is_trained
+        assert not ivf.needs_training(19)
+        assert ivf.needs_training(20)
+
+    @pytest.mark.parametrize("similarity", ["dot_product", "cosine"])
+    def test_train_separates_clusters(self, similarity):
+        embeddings = np.array([[10.0, 0.0], [10.0, 1.0], [11.0, 0.5], [-10.0, 0.0], [-10.0, 1.0], [-11.0, 0.5]])
+        ivf = IVFIndex(similarity=similarity, n_lists=2, min_training_size=6)
+        ivf.train(embeddings)
+
+        assignments = ivf.assign(embeddings)
+        assert len(set(assignments[:3])) == 1
+        assert len(set(assignments[3:])) == 1
+        assert assignments[0] != assignments[3]
+        assert ivf.probe(np.array([9.0, 0.0]), nprobe=1).tolist() == [assignments[0]]
+
+    def test_untrained_index_raises(self):
+        ivf = IVFIndex(similarity="dot_product")
+        with pytest.raises(ValueError, match="must be trained"):
+            ivf.assign(np.ones((1, 2)))
+        with pytest.raises(ValueError, match="must be trained"):
+            ivf.probe(np.ones(2))
+
+    def test_to_dict_and_load_state(self):
+        ivf = IVFIndex(similarity="cosine", n_lists=2, min_training_size=4)
+        ivf.train(np.random.default_rng(0).normal(size=(4, 3)))
+
+        restored = IVFIndex(similarity="cosine", n_lists=2, min_training_size=4)
+        restored.load_state(ivf.to_dict())
+        assert restored.trained_size == 4
+        np.testing.assert_array_almost_equal(restored.centroids, ivf.centroids)
@@ -0,0 +1,199 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from haystack import Document
+from haystack.document_stores.in_memory.metadata_index import (
+    HashFieldIndex,
+    MetadataIndex,
+    SortedFieldIndex,
+    get_field_value,
+    normalize_field_name,
+)
+
+
+def test_normalize_field_name():
+    assert normalize_field_name("meta.source_id") == "meta.source_id"
+    assert normalize_field_name("content") == "content"
+    assert normalize_field_name("source_id") == "meta.source_id"
+
+
+def test_get_field_value():
+    doc = Document(content="test", meta={"person": {"name": "Alice"}})
+    assert get_field_value(doc, "content") == "test"
+    assert get_field_value(doc, "meta.person.name") == "Alice"
+    assert get_field_value(doc, "meta.person.age") is None
+
+
+class TestHashFieldIndex:
+    def test_candidates(self):
+        index = HashFieldIndex()
+        index.add("1", "a")
+        index.add("2", "b")
+        index.add("3", ["unhashable"])
+        index.add("4", None)
+
+        assert index.candidates("==", "a") == {"1", "3"}
+        assert index.candidates("==", None) == {"3", "4"}
+        assert index.candidates("in", ["a", "b"]) == {"1", "2", "3"}
+        assert index.candidates("!=", "a") is None
+        assert index.candidates("in", "a") is None
+        assert index.candidates("==", ["a"]) is None
+
+    def test_unverified(self):
+        index = HashFieldIndex()
+        index.add("1", "a")
+        index.add("2", ["unhashable"])
+
+        # the Documents with a value equal to the filter value match, the unindexed ones must be evaluated
+        assert index.unverified("==", "a") == {"2"}
+        assert index.unverified("in", ["a"]) == {"2"}
+
+    def test_remove(self):
+        index = HashFieldIndex()
+        index.add("1", "a")
+        index.add("2", "a")
+        index.remove("1")
+        assert index.candidates("==", "a") == {"2"}
+        index.remove("2")
+        assert index.candidates("==", "a") == set()
+
+
+class TestSortedFieldIndex:
+    def test_numbers(self):
+        index = SortedFieldIndex()
+        for i in range(5):
+            index.add(str(i), i)
+        index.add("none", None)
+
+        assert index.candidates(">", 2) == {"3", "4"}
+        assert index.candidates(">=", 2) == {"2", "3", "4"}
+        assert index.candidates("<", 2) == {"0", "1"}
+        assert index.candidates("<=", 2) == {"0", "1", "2"}
+        assert index.candidates(">", None) == set()
+        assert index.candidates("==", 2) is None
+
+        index.remove("3")
+        assert index.candidates(">", 2) == {"4"}
+
+    def test_dates(self):
+        index = SortedFieldIndex()
+        index.add("old", "2020-01-01T00:00:00")
+        index.add("new", "2024-01-01T00:00:00+02:00")
+
+        assert index.candidates(">", "2022-01-01") == {"new"}
+        assert index.candidates("<", "2022-01-01") == {"old"}
+        assert index.candidates(">", "not a date") is None
+
+    def test_values_that_cant_be_compared_are_always_candidates(self):
+        index = SortedFieldIndex()
+        index.add("number", 1)
+        index.add("date", "2020-01-01")
+        index.add("text", "not a date")
+
+        # the filters raise an error when comparing these values, so they must be evaluated
+        assert index.candidates(">", 5) == {"date", "text"}
+        assert index.candidates(">", "2021-01-01") == {"number", "text"}
+
+    def test_unverified(self):
+        index = SortedFieldIndex()
+        index.add("number", 1)
+        index.add("date", "2020-01-01")
+        index.add("text", "not a date")
+
+        assert index.unverified(">", 0) == {"date", "text"}
+        assert index.unverified(">", None) == set()
+        # dates are looked up in a widened range
+        assert index.unverified(">", "2021-01-01") is None
+
+
+class TestMetadataIndex:
+    def test_candidates(self):
+        index = MetadataIndex()
+        index.add_index("meta.type", "hash", documents=[])
+        index.add_index("meta.year", "sorted", documents=[])
+        docs = [
+            Document(id="1", meta={"type": "article", "year": 2020}),
+            Document(id="2", meta={"type": "article", "year": 2023}),
+            Document(id="3", meta={"type": "book", "year": 2023}),
+        ]
+        for doc in docs:
+            index.add(doc)
+
+        type_filter = {"field": "meta.type", "operator": "==", "value": "article"}
+        year_filter = {"field": "meta.year", "operator": ">", "value": 2021}
+        other_filter = {"field": "meta.other", "operator": "==", "value": 1}
+
+        assert index.candidates(type_filter) == {"1", "2"}
+        assert index.candidates({"operator": "AND", "conditions": [type_filter, year_filter]}) == {"2"}
+        assert index.candidates({"operator": "AND", "conditions": [type_filter, other_filter]}) == {"1", "2"}
+        assert index.candidates({"operator": "OR", "conditions": [type_filter, year_filter]}) == {"1", "2", "3"}
+        assert index.candidates({"operator": "OR", "conditions": [type_filter, other_filter]}) is None
+        assert index.candidates({"operator": "NOT", "conditions": [type_filter]}) is None
+        assert index.candidates(other_filter) is None
+
+    def test_plan(self):
+        index = MetadataIndex()
+        index.add_index("meta.type", "hash", documents=[])
+        index.add_index("meta.year", "sorted", documents=[])
+        docs = [
+            Document(id="1", meta={"type": "article", "year": 2020}),
+            Document(id="2", meta={"type": "article", "year": "2023-01-01"}),
+            Document(id="3", meta={"type": ["book"], "year": 2023}),
+        ]
+        for doc in docs:
+            index.add(doc)
+
+        type_filter = {"field": "meta.type", "operator": "==", "value": "article"}
+        year_filter = {"field": "meta.year", "operator": ">", "value": 2019}
+        other_filter = {"field": "meta.other", "operator": "==", "value": 1}
+
+        assert index.plan(type_filter) == ({"1", "2", "3"}, {"3"})
+        assert index.plan(year_filter) == ({"1", "2", "3"}, {"2"})
+        assert index.plan({"operator": "AND", "conditions": [type_filter, year_filter]}) == (
+            {"1", "2", "3"},
+            {"2", "3"},
+        )
+        # the conditions that can't be planned must be evaluated on every candidate
+        assert index.plan({"operator": "AND", "conditions": [type_filter, other_filter]}) == (
+            {"1", "2", "3"},
+            {"1", "2", "3"},
+        )
+        assert index.plan({"operator": "OR", "conditions": [type_filter, year_filter]}) == ({"1", "2", "3"}, {"2", "3"})
+        assert index.plan({"operator": "OR", "conditions": [type_filter, other_filter]}) is None
+
+    def test_invalid_filters_are_not_planned(self):
+        index = MetadataIndex()
+        index.add_index("meta.type", "hash", documents=[])
+        type_filter = {"field": "meta.type", "operator": "==", "value": "article"}
+
+        assert index.candidates({"operator": "AND", "conditions": [type_filter, {"field": "meta.type"}]}) is None
+        assert index.candidates({"operator": "XOR", "conditions": [type_filter]}) is None
+        # the filters raise an error for these values when evaluating the Documents
+        for invalid_filter in [
+            {"field": "meta.other", "operator": "in", "value": "article"},
+            {"field": "meta.other", "operator": ">", "value": [2020]},
+            {"field": "meta.other", "operator": "<=", "value": "not a date"},
+        ]:
+            assert index.candidates({"operator": "AND", "conditions": [type_filter, invalid_filter]}) is None
+
+    def test_add_index_indexes_existing_documents(self):
+        index = MetadataIndex()
+        doc = Document(id="1", meta={"type": "article"})
+        index.add(doc)
+        index.add_index("type", "hash", documents=[doc])
+        assert index.fields == {"meta.type": ["hash"]}
+        assert index.candidates({"field": "meta.type", "operator": "==", "value": "article"}) == {"1"}
+
+        with pytest.raises(ValueError, match="Metadata index type 'btree' is not supported"):
+            index.add_index("meta.type", "btree", documents=[])  # type: ignore[arg-type]
+
+    def test_sort(self):
+        index = MetadataIndex()
+        for doc_id in ["b", "c", "a"]:
+            index.add(Document(id=doc_id))
+        index.remove("b")
+        index.add(Document(id="b"))
+        assert index.sort({"a", "b", "c"}) == ["c", "a", "b"]
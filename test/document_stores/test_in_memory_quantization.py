@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+
+from haystack.document_stores.in_memory.quantization import EmbeddingQuantizer
+
+
+class TestEmbeddingQuantizer:
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError, match="Embedding quantization 'int4' is not supported"):
+            EmbeddingQuantizer("int4")
+        with pytest.raises(ValueError, match="rescore_factor must be a positive integer or None"):
+            EmbeddingQuantizer("int8", rescore_factor=0)
+
+    def test_float16(self):
+        quantizer = EmbeddingQuantizer("float16")
+        embeddings = np.array([[0.1, -0.5, 2.0], [1.0, 0.0, -1.0]], dtype=np.float32)
+
+        assert quantizer.is_trained
+        codes = quantizer.encode(embeddings)
+        assert codes.dtype == np.float16
+        assert codes.shape == (2, 3)
+        np.testing.assert_allclose(
+            quantizer.decode(codes, 3, np.linalg.norm(embeddings, axis=1)), embeddings, atol=1e-3
+        )
+
+    def test_int8(self):
+        quantizer = EmbeddingQuantizer("int8", min_training_size=2)
+        rng = np.random.default_rng(42)
+        embeddings = rng.normal(size=(100, 16)).astype(np.float32)
+
+        assert not quantizer.is_trained
+        assert not quantizer.needs_training(1)
+        assert quantizer.needs_training(2)
+        with pytest.raises(ValueError, match="The int8 quantizer must be trained"):
+            quantizer.encode(embeddings)
+
+        quantizer.train(embeddings)
+        assert quantizer.is_trained
+        codes = quantizer.encode(embeddings)
+        assert codes.dtype == np.uint8
+        assert codes.shape == (100, 16)
+        # each dimension is split in 255 steps, the error is at most half a step
+        max_error = (embeddings.max(axis=0) - embeddings.min(axis=0)) / 255 / 2
+        decoded = quantizer.decode(codes, 16, np.linalg.norm(embeddings, axis=1))
+        assert np.all(np.abs(decoded - embeddings) <= max_error + 1e-6)
+
+        # values out of the learned range are clipped
+        out_of_range = quantizer.encode(embeddings.max(axis=0, keepdims=True) + 10)
+        assert np.all(out_of_range == 255)
+
+        quantizer.reset()
+        assert not quantizer.is_trained
+
+    def test_binary(self):
+        quantizer = EmbeddingQuantizer("binary")
+        embeddings = np.array([[0.5, -0.5, 0.5, -0.5, 0.5, -0.5, 0.5, -0.5, 1.0]], dtype=np.float32)
+
+        codes = quantizer.encode(embeddings)
+        assert codes.dtype == np.uint8
+        assert codes.shape == (1, 2)
+        decoded = quantizer.decode(codes, 9, np.linalg.norm(embeddings, axis=1))
+        np.testing.assert_array_equal(np.sign(decoded), np.sign(embeddings))
+        np.testing.assert_allclose(np.linalg.norm(decoded, axis=1), np.linalg.norm(embeddings, axis=1), rtol=1e-6)
+
+    @pytest.mark.parametrize("method", ["float16", "int8", "binary"])
+    def test_dot_products(self, method):
+        quantizer = EmbeddingQuantizer(method)
+        rng = np.random.default_rng(42)
+        embeddings = rng.normal(size=(200, 64)).astype(np.float32)
+        queries = rng.normal(size=(3, 64)).astype(np.float32)
+        norms = np.linalg.norm(embeddings, axis=1)
+        quantizer.train(embeddings)
+
+        scores = quantizer.dot_products(quantizer.encode(embeddings), queries, norms)
+        exact_scores = queries @ embeddings.T
+        assert scores.shape == (3, 200)
+        # the approximate scores rank the embeddings like the exact ones
+        for query_scores, query_exact_scores in zip(scores, exact_scores):
+            assert np.corrcoef(query_scores, query_exact_scores)[0, 1] > (0.6 if method == "binary" else 0.99)
+
+    def test_to_dict_and_load_state(self):
+        quantizer = EmbeddingQuantizer("int8")
+        quantizer.train(np.array([[0.0, 1.0], [1.0, 3.0]], dtype=np.float32))
+
+        loaded = EmbeddingQuantizer("int8")
+        loaded.load_state(quantizer.to_dict())
+        assert loaded.is_trained
+        np.testing.assert_array_equal(loaded.offset, quantizer.offset)
+        np.testing.assert_array_equal(loaded.scale, quantizer.scale)
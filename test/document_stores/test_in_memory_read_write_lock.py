@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+
+import pytest
+
+from haystack.document_stores.in_memory.read_write_lock import ReadWriteLock
+
+
+class TestReadWriteLock:
+    def test_readers_run_concurrently(self):
+        lock = ReadWriteLock()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def read():
+            with lock.read():
+                # every reader waits for the others while holding the lock
+                barrier.wait()
+
+        threads = [threading.Thread(target=read) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not barrier.broken
+
+    def test_writer_excludes_readers(self):
+        lock = ReadWriteLock()
+        events = []
+        writing = threading.Event()
+
+        def read():
+            writing.wait()
+            with lock.read():
+                events.append("read")
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        with lock.write():
+            writing.set()
+            reader.join(timeout=0.1)
+            events.append("written")
+        reader.join()
+        assert events == ["written", "read"]
+
+    def test_waiting_writer_is_preferred_to_new_readers(self):
+        lock = ReadWriteLock()
+        events = []
+
+        def write():
+            with lock.write():
+                events.append("written")
+
+        def read():
+            with lock.read():
+                events.append("read")
+
+        writer = threading.Thread(target=write)
+        reader = threading.Thread(target=read)
+        with lock.read():
+            writer.start()
+            while lock._waiting_writers == 0:
+                writer.join(timeout=0.01)
+            reader.start()
+            reader.join(timeout=0.1)
+            assert events == []
+            # a thread already reading doesn't wait for the writer, which would wait for it forever
+            with lock.read():
+                pass
+        writer.join()
+        reader.join()
+        assert events == ["written", "read"]
+
+    def test_reentrancy(self):
+        lock = ReadWriteLock()
+        with lock.write():
+            with lock.write():
+                with lock.read():
+                    pass
+        with lock.read():
+            with lock.read():
+                pass
+            with pytest.raises(RuntimeError, match="can't acquire the lock for writing"):
+                with lock.write():
+                    pass
+        assert lock._readers == 0
+        assert lock._writer is None
@@ -0,0 +1,251 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from haystack import Document
+from haystack.components.retrievers.in_memory import InMemoryBM25Retriever, InMemoryEmbeddingRetriever
+from haystack.dataclasses import SparseEmbedding
+from haystack.document_stores.errors import DocumentStoreError, DuplicateDocumentError
+from haystack.document_stores.in_memory import BM25Tokenizer, InMemoryDocumentStore, ShardedInMemoryDocumentStore
+from haystack.document_stores.types import DuplicatePolicy
+from haystack.testing.document_store import DocumentStoreBaseTests
+
+
+def _documents(n: int = 200) -> list[Document]:
+    rng = random.Random(42)
+    # "common" is in most Documents, it has a negative BM25Okapi IDF
+    words = ["common"] * 10 + ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta", "iota", "kappa"]
+    return [
+        Document(
+            content=" ".join(rng.choices(words, k=rng.randint(1, 8))),
+            embedding=[rng.random() for _ in range(4)],
+            sparse_embedding=SparseEmbedding(indices=[i % 5, 5 + i % 3], values=[rng.random(), rng.random()]),
+            meta={"number": i},
+        )
+        for i in range(n)
+    ]
+
+
+class TestShardedInMemoryDocumentStore(DocumentStoreBaseTests):
+    @pytest.fixture
+    def document_store(self):
+        store = ShardedInMemoryDocumentStore(n_shards=2)
+        yield store
+        store.shutdown()
+
+    def assert_documents_are_equal(self, received: list[Document], expected: list[Document]):
+        # the Documents are returned grouped by shard
+        assert sorted(received, key=lambda doc: doc.id) == sorted(expected, key=lambda doc: doc.id)
+
+    def test_init_validation(self):
+        with pytest.raises(ValueError, match="n_shards must be a positive integer"):
+            ShardedInMemoryDocumentStore(n_shards=-1)
+        with pytest.raises(ValueError, match="BM25 algorithm 'BM25' is not supported"):
+            ShardedInMemoryDocumentStore(n_shards=2, bm25_algorithm="BM25")
+
+    def test_to_dict_and_from_dict(self, document_store):
+        data = document_store.to_dict()
+        assert data == {
+            "type": "haystack.document_stores.in_memory.sharded_document_store.ShardedInMemoryDocumentStore",
+            "init_parameters": {
+                "n_shards": 2,
+                "bm25_tokenization_regex": r"(?u)\b\w\w+\b",
+                "bm25_algorithm": "BM25L",
+                "bm25_parameters": {},
+                "embedding_similarity_function": "dot_product",
+                "return_embedding": True,
+                "embedding_index_type": "flat",
+                "embedding_index_parameters": {},
+                "metadata_indexes": {},
+                "embedding_quantization": None,
+                "embedding_quantization_parameters": {},
+                "bm25_tokenizer": None,
+            },
+        }
+        store = ShardedInMemoryDocumentStore.from_dict(data)
+        try:
+            assert store.to_dict() == data
+        finally:
+            store.shutdown()
+
+    def test_documents_are_partitioned(self, document_store):
+        documents = _documents(50)
+        assert document_store.write_documents(documents) == 50
+        shard_counts = document_store._call_all("count_documents")
+        assert sum(shard_counts) == 50
+        assert all(count > 0 for count in shard_counts)
+
+    def test_write_documents(self, document_store):
+        documents = _documents(10)
+        assert document_store.write_documents(documents) == 10
+        with pytest.raises(DuplicateDocumentError):
+            document_store.write_documents(documents[:1])
+        # the shards still answer the following calls
+        assert document_store.count_documents() == 10
+        assert document_store.write_documents(documents[:1], policy=DuplicatePolicy.SKIP) == 0
+
+    def test_write_documents_with_a_duplicate_is_partial(self, document_store):
+        documents = _documents(20)
+        document_store.write_documents(documents[:10])
+        with pytest.raises(DuplicateDocumentError):
+            document_store.write_documents(documents[10:] + documents[:1])
+        # the Documents preceding the duplicate are written, in its shard and in the other one
+        assert document_store.count_documents() == 20
+
+    def test_calls_after_shutdown(self):
+        store = ShardedInMemoryDocumentStore(n_shards=2)
+        store.shutdown()
+        with pytest.raises(DocumentStoreError, match="has been shut down"):
+            store.count_documents()
+
+    @pytest.mark.parametrize("bm25_algorithm", ["BM25Okapi", "BM25L", "BM25Plus"])
+    def test_bm25_retrieval_scores_like_a_single_store(self, bm25_algorithm):
+        documents = _documents()
+        store = InMemoryDocumentStore(bm25_algorithm=bm25_algorithm)
+        sharded_store = ShardedInMemoryDocumentStore(n_shards=3, bm25_algorithm=bm25_algorithm)
+        try:
+            store.write_documents(documents)
+            sharded_store.write_documents(documents)
+            sharded_store.delete_documents([doc.id for doc in documents[:20]])
+            store.delete_documents([doc.id for doc in documents[:20]])
+
+            queries = ["alpha beta", "kappa", "unknown alpha", "common"]
+            filters = {"field": "meta.number", "operator": ">=", "value": 100}
+            for query, results in zip(queries, sharded_store.bm25_retrieval_batch(queries, top_k=5)):
+                expected = store.bm25_retrieval(query, top_k=5)
+                assert [doc.score for doc in results] == pytest.approx([doc.score for doc in expected])
+                assert results == sharded_store.bm25_retrieval(query, top_k=5)
+
+                filtered = sharded_store.bm25_retrieval(query, filters=filters, top_k=5, scale_score=True)
+                expected = store.bm25_retrieval(query, filters=filters, top_k=5, scale_score=True)
+                assert [doc.score for doc in filtered] == pytest.approx([doc.score for doc in expected])
+                assert all(doc.meta["number"] >= 100 for doc in filtered)
+        finally:
+            sharded_store.shutdown()
+            store.shutdown()
+
+    def test_bm25_retrieval_is_not_interleaved_with_writes(self, document_store):
+        document_store.write_documents([Document(content="alpha beta"), Document(content="alpha gamma")])
+        expected = document_store.bm25_retrieval("alpha", top_k=5)
+        writers = []
+        collect_statistics = document_store._bm25_statistics
+
+        def collect_statistics_then_write(queries):
+            statistics = collect_statistics(queries)
+            # a write started between the two phases waits until the retrieval is done
+            writer = threading.Thread(
+                target=document_store.write_documents, args=([Document(content="alpha alpha alpha")],)
+            )
+            writer.start()
+            writer.join(timeout=0.2)
+            writers.append(writer)
+            return statistics
+
+        with patch.object(document_store, "_bm25_statistics", side_effect=collect_statistics_then_write):
+            results = document_store.bm25_retrieval("alpha", top_k=5)
+        writers[0].join()
+
+        assert results == expected
+        assert document_store.count_documents() == 3
+
+    def test_embedding_retrieval_like_a_single_store(self, document_store):
+        documents = _documents()
+        store = InMemoryDocumentStore()
+        try:
+            store.write_documents(documents)
+            document_store.write_documents(documents)
+
+            query_embeddings = [[1.0, 0.0, 0.0, 0.0], [0.1, 0.2, 0.3, 0.4]]
+            batch_results = document_store.embedding_retrieval_batch(query_embeddings, top_k=5)
+            for query_embedding, results in zip(query_embeddings, batch_results):
+                expected = store.embedding_retrieval(query_embedding, top_k=5)
+                assert [doc.id for doc in results] == [doc.id for doc in expected]
+                single_results = document_store.embedding_retrieval(query_embedding, top_k=5)
+                assert [doc.id for doc in single_results] == [doc.id for doc in expected]
+                assert [doc.score for doc in results] == pytest.approx([doc.score for doc in single_results])
+
+            query_sparse_embedding = SparseEmbedding(indices=[0, 6], values=[1.0, 0.5])
+            results = document_store.sparse_embedding_retrieval(query_sparse_embedding, top_k=5)
+            expected = store.sparse_embedding_retrieval(query_sparse_embedding, top_k=5)
+            assert [doc.id for doc in results] == [doc.id for doc in expected]
+        finally:
+            store.shutdown()
+
+    def test_delete_and_update_by_filter(self, document_store):
+        documents = _documents(50)
+        document_store.write_documents(documents)
+        filters = {"field": "meta.number", "operator": "<", "value": 20}
+        assert document_store.count_documents(filters) == 20
+        assert document_store.update_by_filter(filters, meta={"stale": True}) == 20
+        assert document_store.delete_by_filter({"field": "meta.stale", "operator": "==", "value": True}) == 20
+        assert document_store.count_documents() == 30
+
+        store = InMemoryDocumentStore(bm25_algorithm="BM25Okapi")
+        sharded_store = ShardedInMemoryDocumentStore(n_shards=2, bm25_algorithm="BM25Okapi")
+        try:
+            store.write_documents(documents[20:])
+            sharded_store.write_documents(documents)
+            sharded_store.delete_by_filter(filters)
+            results = sharded_store.bm25_retrieval("common alpha", top_k=5)
+            expected = store.bm25_retrieval("common alpha", top_k=5)
+            assert [doc.score for doc in results] == pytest.approx([doc.score for doc in expected])
+        finally:
+            sharded_store.shutdown()
+            store.shutdown()
+
+    def test_bm25_retrieval_with_custom_tokenizer(self):
+        documents = _documents(50)
+        tokenizer = BM25Tokenizer(stop_words=["common"])
+        store = InMemoryDocumentStore(bm25_algorithm="BM25Okapi", bm25_tokenizer=tokenizer)
+        sharded_store = ShardedInMemoryDocumentStore(n_shards=2, bm25_algorithm="BM25Okapi", bm25_tokenizer=tokenizer)
+        try:
+            store.write_documents(documents)
+            sharded_store.write_documents(documents)
+            results = sharded_store.bm25_retrieval("common alpha", top_k=5)
+            expected = store.bm25_retrieval("common alpha", top_k=5)
+            assert [doc.score for doc in results] == pytest.approx([doc.score for doc in expected])
+
+            data = sharded_store.to_dict()
+            assert data["init_parameters"]["bm25_tokenizer"] == tokenizer.to_dict()
+        finally:
+            sharded_store.shutdown()
+            store.shutdown()
+
+    def test_retrieval_errors_are_raised(self, document_store):
+        document_store.write_documents(_documents(10))
+        with pytest.raises(ValueError, match="Query should be a non-empty string"):
+            document_store.bm25_retrieval("")
+        with pytest.raises(ValueError, match="Invalid filter syntax"):
+            document_store.bm25_retrieval("alpha", filters={"field": "meta.number"})
+        assert len(document_store.bm25_retrieval("alpha", top_k=3)) == 3
+
+    def test_retrievers(self, document_store):
+        document_store.write_documents(_documents(20))
+
+        bm25_retriever = InMemoryBM25Retriever(document_store, top_k=3)
+        assert len(bm25_retriever.run(query="alpha")["documents"]) == 3
+        embedding_retriever = InMemoryEmbeddingRetriever(document_store, top_k=3)
+        assert len(embedding_retriever.run(query_embedding=[0.1, 0.2, 0.3, 0.4])["documents"]) == 3
+
+        deserialized = InMemoryBM25Retriever.from_dict(bm25_retriever.to_dict())
+        try:
+            assert isinstance(deserialized.document_store, ShardedInMemoryDocumentStore)
+            assert deserialized.document_store.n_shards == 2
+        finally:
+            deserialized.document_store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_async_methods(self, document_store):
+        documents = _documents(20)
+        assert await document_store.write_documents_async(documents) == 20
+        assert await document_store.count_documents_async() == 20
+        assert len(await document_store.bm25_retrieval_async("alpha", top_k=3)) == 3
+        assert len(await document_store.embedding_retrieval_async([0.1, 0.2, 0.3, 0.4], top_k=3)) == 3
+        await document_store.delete_documents_async([doc.id for doc in documents[:5]])
+        assert len(await document_store.filter_documents_async()) == 15
@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from haystack.dataclasses import SparseEmbedding
+from haystack.document_stores.in_memory.sparse_embedding_index import SparseEmbeddingIndex
+
+
+class TestSparseEmbeddingIndex:
+    def test_dot_product_scores(self):
+        index = SparseEmbeddingIndex()
+        index.add("a", SparseEmbedding(indices=[0, 3], values=[1.0, 2.0]))
+        index.add("b", SparseEmbedding(indices=[3, 5], values=[0.5, 1.0]))
+        index.add("c", SparseEmbedding(indices=[7], values=[1.0]))
+
+        scores = index.dot_product_scores(SparseEmbedding(indices=[3, 5], values=[2.0, 1.0]))
+        # "c" shares no dimension with the query, it's not scored
+        assert scores == pytest.approx({"a": 4.0, "b": 2.0})
+        assert index.dot_product_scores(SparseEmbedding(indices=[3], values=[1.0]), doc_ids={"b"}) == {"b": 0.5}
+
+    def test_repeated_indices_are_summed(self):
+        index = SparseEmbeddingIndex()
+        index.add("a", SparseEmbedding(indices=[1, 1], values=[1.0, 2.0]))
+        assert index.dot_product_scores(SparseEmbedding(indices=[1, 1], values=[1.0, 1.0])) == {"a": 6.0}
+
+    def test_remove(self):
+        index = SparseEmbeddingIndex()
+        index.add("a", SparseEmbedding(indices=[0, 1], values=[1.0, 1.0]))
+        index.add("b", SparseEmbedding(indices=[1], values=[1.0]))
+        index.remove("a")
+        index.remove("missing")
+
+        assert len(index) == 1
+        assert "a" not in index
+        assert index.dot_product_scores(SparseEmbedding(indices=[0, 1], values=[1.0, 1.0])) == {"b": 1.0}
+        assert index._postings == {1: {"b": 1.0}}
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import sys
+from typing import Any
 from unittest.mock import Mock
 
 import ddtrace
@@ -21,6 +22,7 @@ from haystack.tracing.tracer import (
     NullSpan,
     NullTracer,
     ProxyTracer,
+    Span,
     Tracer,
     _auto_configured_datadog_tracer,
     _auto_configured_opentelemetry_tracer,
@@ -172,3 +174,18 @@ class TestTracingContent:
         proxy_tracer = ProxyTracer(provided_tracer=SpyingTracer())
 
         assert proxy_tracer.is_content_tracing_enabled is False
+
+    def test_is_recording_content(self, monkeypatch: MonkeyPatch) -> None:
+        class MinimalSpan(Span):
+            def set_tag(self, key: str, value: Any) -> None:
+                pass
+
+        monkeypatch.setattr(tracer, "is_content_tracing_enabled", False)
+        assert MinimalSpan().is_recording_content() is False
+        # spans that override `set_content_tag` decide themselves which content tags they record
+        assert SpyingSpan("test").is_recording_content() is True
+        assert NullSpan().is_recording_content() is False
+
+        monkeypatch.setattr(tracer, "is_content_tracing_enabled", True)
+        assert MinimalSpan().is_recording_content() is True
+        assert NullSpan().is_recording_content() is False
@@ -5,8 +5,9 @@
 import pytest
 
 from haystack import Document
+from haystack.dataclasses import ByteStream
 from haystack.errors import FilterError
-from haystack.utils.filters import document_matches_filter
+from haystack.utils.filters import compile_filter, document_matches_filter
 
 document_matches_filter_data = [
     # == operator params
@@ -524,3 +525,58 @@ def test_document_matches_filter_raises_error(filters):
     with pytest.raises(FilterError):
         document = Document(meta={"page": 10})
         document_matches_filter(filters, document)
+
+
+@pytest.mark.parametrize("filters, document, expected_result", document_matches_filter_data)
+def test_compile_filter(filters, document, expected_result):
+    assert compile_filter(filters)(document) == expected_result
+
+
+@pytest.mark.parametrize("filters", document_matches_filter_raises_error_data)
+def test_compile_filter_raises_error(filters):
+    with pytest.raises(FilterError):
+        document = Document(meta={"page": 10})
+        compile_filter(filters)(document)
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        pytest.param({"operator": "AND"}, id="Missing root conditions key"),
+        pytest.param({"operator": "XOR", "conditions": []}, id="Unknown logical operator"),
+        pytest.param({"field": "meta.name", "operator": "~=", "value": "test"}, id="Unknown comparison operator"),
+        pytest.param(
+            {"operator": "OR", "conditions": [{"field": "meta.name", "operator": "=="}]}, id="Nested missing value key"
+        ),
+    ],
+)
+def test_compile_filter_validates_filters_once(filters):
+    with pytest.raises(FilterError):
+        compile_filter(filters)
+
+
+def test_compile_filter_raises_comparison_errors_only_for_documents_with_a_value():
+    predicate = compile_filter({"field": "meta.page", "operator": ">", "value": "not a date"})
+    assert predicate(Document()) is False
+    with pytest.raises(FilterError):
+        predicate(Document(meta={"page": "2024-01-01"}))
+
+
+def test_compile_filter_in_with_unhashable_values():
+    predicate = compile_filter({"field": "meta.tags", "operator": "in", "value": [["a", "b"], "c"]})
+    assert predicate(Document(meta={"tags": ["a", "b"]}))
+    assert predicate(Document(meta={"tags": "c"}))
+    assert not predicate(Document(meta={"tags": ["c"]}))
+
+
+def test_compile_filter_in_with_nan():
+    predicate = compile_filter({"field": "meta.score", "operator": "in", "value": [float("nan"), 1]})
+    assert predicate(Document(meta={"score": 1.0}))
+    assert not predicate(Document(meta={"score": float("nan")}))
+
+
+def test_compile_filter_legacy_fields_on_bytestream():
+    predicate = compile_filter({"field": "mime_type", "operator": "==", "value": "text/plain"})
+    assert predicate(ByteStream(data=b"test", mime_type="text/plain"))
+    assert predicate(Document(meta={"mime_type": "text/plain"}))
+    assert not predicate(Document(meta={"mime_type": "text/html"}))
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+
+import numpy as np
+import pytest
+
+from haystack.utils.misc import top_k_indices, top_k_items
+
+
+class TestTopKIndices:
+    def test_top_k_indices(self):
+        scores = np.array([0.1, 0.9, 0.5, 0.7, 0.3])
+        assert top_k_indices(scores, 3).tolist() == [1, 3, 2]
+
+    def test_top_k_indices_keeps_ties_in_order(self):
+        scores = np.array([0.5, 0.9, 0.5, 0.5, 0.1, 0.5])
+        assert top_k_indices(scores, 3).tolist() == [1, 0, 2]
+
+    @pytest.mark.parametrize("top_k", [None, 5, 10])
+    def test_top_k_indices_returns_all_indices(self, top_k):
+        scores = np.array([0.1, 0.9, 0.5, 0.9, 0.3])
+        assert top_k_indices(scores, top_k).tolist() == [1, 3, 2, 4, 0]
+
+    def test_top_k_indices_with_zero_top_k(self):
+        assert top_k_indices(np.array([0.1, 0.9]), 0).tolist() == []
+
+    def test_top_k_indices_with_infinite_and_nan_scores(self):
+        scores = np.array([-np.inf, 0.5, np.nan, 0.7, -np.inf])
+        for top_k in range(len(scores) + 1):
+            assert top_k_indices(scores, top_k).tolist() == np.argsort(-scores, kind="stable")[:top_k].tolist()
+
+    def test_top_k_indices_is_equivalent_to_a_stable_sort(self):
+        rng = np.random.default_rng(42)
+        for _ in range(100):
+            scores = rng.integers(0, 20, size=200).astype(np.float32)
+            top_k = int(rng.integers(1, 50))
+            expected = np.argsort(-scores, kind="stable")[:top_k]
+            assert top_k_indices(scores, top_k).tolist() == expected.tolist()
+
+
+class TestTopKItems:
+    def test_top_k_items(self):
+        items = [("a", 0.1), ("b", 0.9), ("c", 0.5), ("d", 0.9)]
+        assert top_k_items(items, 3, key=lambda x: x[1]) == [("b", 0.9), ("d", 0.9), ("c", 0.5)]
+
+    def test_top_k_items_without_top_k(self):
+        items = [("a", 0.1), ("b", 0.9), ("c", 0.5)]
+        assert top_k_items(items, None, key=lambda x: x[1]) == [("b", 0.9), ("c", 0.5), ("a", 0.1)]
+
+    def test_top_k_items_accepts_iterators(self):
+        assert top_k_items(iter([3, 1, 2]), 2, key=lambda x: x) == [3, 2]
+
+    def test_top_k_items_is_equivalent_to_a_stable_sort(self):
+        random.seed(42)
+        for _ in range(100):
+            items = [(i, random.randint(0, 20)) for i in range(200)]
+            top_k = random.randint(1, 50)
+            expected = sorted(items, key=lambda x: x[1], reverse=True)[:top_k]
+            assert top_k_items(items, top_k, key=lambda x: x[1]) == expected